@@ -0,0 +1,167 @@
+"""
+EDIF 수집 벤치마크
+
+Vivado write_edif 형식의 합성 netlist를 생성한 뒤 parse_edif(스트리밍 파싱 → Wire/CellIR)와
+build_nodes_and_edges(DKG 구축) 시간을 잽니다.
+
+실행 (코드 루트에서):
+    python -m benchmarks.edif_ingest                       # 인스턴스 100만 개
+    python -m benchmarks.edif_ingest --instances 100000 --skip-build
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable, List, TextIO, Tuple
+
+# dkg.pipeline을 먼저 import해야 builders ↔ pipeline 순환 import가 풀림 (main.py와 동일)
+from dkg.pipeline import DKGPipeline  # noqa: F401
+from dkg.builders.graph_build import build_nodes_and_edges
+from dkg.parsers.edif_parser import parse_edif
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# (셀 이름, [(포트 이름, 방향, 폭)])
+_PRIMITIVES = [
+    ("LUT2", [("I0", "INPUT", 1), ("I1", "INPUT", 1), ("O", "OUTPUT", 1)]),
+    ("FDRE", [("C", "INPUT", 1), ("CE", "INPUT", 1), ("D", "INPUT", 1),
+              ("R", "INPUT", 1), ("Q", "OUTPUT", 1)]),
+    ("CARRY4", [("CI", "INPUT", 1), ("S", "INPUT", 4), ("O", "OUTPUT", 4)]),
+    ("BUFG", [("I", "INPUT", 1), ("O", "OUTPUT", 1)]),
+    ("GND", [("G", "OUTPUT", 1)]),
+]
+
+# 인스턴스 i의 종류 (LUT2, LUT2, FDRE, CARRY4 반복)
+_PATTERN = ("LUT2", "LUT2", "FDRE", "CARRY4")
+_OUTPUT = {"LUT2": "O", "FDRE": "Q", "CARRY4": "(member O 3)"}
+_INPUTS = {"LUT2": ("I0", "I1"), "FDRE": ("D", "CE"), "CARRY4": ("(member S 0)", "CI")}
+
+# 출력 하나가 구동하는 뒤쪽 인스턴스 (fanout 2)
+_FANOUT_OFFSETS = (1, 7)
+
+
+# ============================================================================
+# Generator
+# ============================================================================
+
+
+def write_edif(f: TextIO, instances: int) -> None:
+    """인스턴스 instances개의 평면 netlist (BUFG 클럭 1개, FF 리셋은 상수 0)"""
+    w = f.write
+    w("(edif top\n  (edifversion 2 0 0)\n  (edifLevel 0)\n"
+      "  (keywordmap (keywordlevel 0))\n")
+    w("  (Library hdi_primitives\n    (edifLevel 0)\n"
+      "    (technology (numberDefinition ))\n")
+    for name, ports in _PRIMITIVES:
+        w(f"    (cell {name} (celltype GENERIC)\n      (view netlist (viewtype NETLIST)\n"
+          "        (interface\n")
+        for port, direction, width in ports:
+            if width > 1:
+                w(f'          (port (array (rename {port} "{port}[{width - 1}:0]") {width})'
+                  f" (direction {direction}))\n")
+            else:
+                w(f"          (port {port} (direction {direction}))\n")
+        w("        )\n      )\n    )\n")
+    w("  )\n")
+
+    w("  (Library work\n    (edifLevel 0)\n    (technology (numberDefinition ))\n"
+      "    (cell top (celltype GENERIC)\n      (view top (viewtype NETLIST)\n"
+      "        (interface\n          (port clk (direction INPUT))\n"
+      "          (port (array (rename din \"din[7:0]\") 8) (direction INPUT))\n"
+      "        )\n        (contents\n")
+    w("          (instance GND (viewref netlist (cellref GND (libraryref hdi_primitives))))\n")
+    w("          (instance clk_IBUF_BUFG_inst "
+      "(viewref netlist (cellref BUFG (libraryref hdi_primitives))))\n")
+    for i in range(instances):
+        kind = _PATTERN[i % len(_PATTERN)]
+        w(f'          (instance (rename u_{i}_ "u[{i}]") '
+          f"(viewref netlist (cellref {kind} (libraryref hdi_primitives)))")
+        if kind == "LUT2":
+            w(' (property INIT (string "4\'h8"))')
+        w(")\n")
+
+    ffs = [i for i in range(instances) if _PATTERN[i % len(_PATTERN)] == "FDRE"]
+    w("          (net clk (joined\n            (portref clk)\n"
+      "            (portref I (instanceref clk_IBUF_BUFG_inst))\n           )\n          )\n")
+    w("          (net clk_IBUF_BUFG (joined\n"
+      "            (portref O (instanceref clk_IBUF_BUFG_inst))\n")
+    for i in ffs:
+        w(f"            (portref C (instanceref u_{i}_))\n")
+    w("           )\n          )\n")
+    w("          (net <const0> (joined\n            (portref G (instanceref GND))\n")
+    for i in ffs:
+        w(f"            (portref R (instanceref u_{i}_))\n")
+    w("           )\n          )\n")
+
+    for i in range(instances):
+        kind = _PATTERN[i % len(_PATTERN)]
+        w(f'          (net (rename n_{i}_ "n[{i}]") (joined\n'
+          f"            (portref {_OUTPUT[kind]} (instanceref u_{i}_))\n")
+        for k, offset in enumerate(_FANOUT_OFFSETS):
+            j = i + offset
+            if j < instances:
+                pin = _INPUTS[_PATTERN[j % len(_PATTERN)]][k]
+                w(f"            (portref {pin} (instanceref u_{j}_))\n")
+        w("           )\n          )\n")
+
+    w("        )\n      )\n    )\n  )\n"
+      "  (design top\n    (cellref top (libraryref work))\n  )\n)\n")
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+
+def _timed(label: str, fn: Callable[[], object]) -> Tuple[object, float]:
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<24} {elapsed:8.2f} s")
+    return result, elapsed
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return float("nan")
+    # Linux: KB, macOS: bytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if peak > 1 << 32 else peak / 1024
+
+
+def main(argv: List[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="EDIF ingestion benchmark")
+    ap.add_argument("--instances", type=int, default=1_000_000)
+    ap.add_argument("--edif", help="생성 파일 경로 (지정 시 남겨 둠)")
+    ap.add_argument("--skip-build", action="store_true", help="build_nodes_and_edges 생략")
+    args = ap.parse_args(argv)
+
+    path = args.edif or os.path.join(tempfile.gettempdir(), f"dkg_bench_{args.instances}.edf")
+    print(f"📄 EDIF 생성: {args.instances:,} instances → {path}")
+    with open(path, "w", encoding="utf-8") as f:
+        _timed("generate", lambda: write_edif(f, args.instances))
+    size_mb = os.path.getsize(path) / (1024 * 1024)
+    print(f"  {'file size':<24} {size_mb:8.1f} MB")
+
+    try:
+        (wires, cells), parse_s = _timed("parse_edif", lambda: parse_edif(path))
+        print(f"  {'throughput':<24} {size_mb / parse_s:8.1f} MB/s "
+              f"({len(cells):,} cells, {len(wires):,} nets)")
+        if not args.skip_build:
+            (nodes, edges), _ = _timed(
+                "build_nodes_and_edges", lambda: build_nodes_and_edges(wires, cells)
+            )
+            print(f"  {'graph':<24} {len(nodes):,} nodes, {len(edges):,} edges")
+        print(f"  {'peak RSS':<24} {_peak_rss_mb():8.0f} MB")
+    finally:
+        if not args.edif:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,16 @@
 """Graph builders and transformation modules."""
 from .graph_build import *
-from .supergraph import ViewBuilder, SuperGraph, SuperNode, SuperEdge
+from .supergraph import MultiViewBuilder, ViewBuilder, SuperGraph, SuperGraphDelta, SuperNode, SuperEdge, SuperEdgeMembers
 from .graph_metadata import *
 from .graph_updater import *
 from .constraint_projector import *
 
 __all__ = [
+    "MultiViewBuilder",
     "ViewBuilder",
     "SuperGraph",
+    "SuperGraphDelta",
     "SuperNode",
     "SuperEdge",
+    "SuperEdgeMembers",
 ]
@@ -0,0 +1,285 @@
+"""
+CDC (Clock Domain Crossing) 분석
+
+순차 소자의 clock_domain을 출발 도메인 비트로 삼아 조합 논리를 따라 한 번에 전파하고,
+각 capture 소자에 도착한 비트로 launch 도메인 × capture 도메인 교차 행렬을 만듭니다.
+도메인 쌍마다 경로를 찾지 않으므로 비용은 도메인 수와 무관하게 그래프 크기에 선형입니다.
+
+- 데이터 엣지만 사용 (CLOCK_TREE, ASYNC_RESET 제외)
+- 조합 노드는 Kahn 위상 정렬 순서로 한 번씩 처리 (입력 마스크 OR)
+  조합 루프에 걸린 노드만 델타 전파로 고정점까지 반복
+- capture 소자는 자기 도메인 외의 비트를 받으면 교차점
+
+동기화기 판정 (교차점마다):
+- attributes["ASYNC_REG"]가 참 (XDC set_property ASYNC_REG TRUE)
+- 또는 2단 FF 구조: 외부 도메인 비트가 조합 논리 없이 순차 소자에서 바로 들어오고,
+  출력이 모두 같은 도메인의 순차 소자로만 이어짐
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from ..core.graph import DKGEdge, DKGNode, EdgeFlowType
+from .clock_propagation import SEQUENTIAL_CLASSES, mask_to_clocks
+
+# 데이터 경로가 아닌 엣지
+NON_DATA_FLOW_TYPES = frozenset({EdgeFlowType.CLOCK_TREE, EdgeFlowType.ASYNC_RESET})
+
+_TRUE_VALUES = frozenset({"TRUE", "YES", "1"})
+
+
+@dataclass
+class CdcCrossing:
+    """외부 도메인 데이터를 받는 capture 소자 하나"""
+
+    capture_node: str
+    capture_domain: str
+    launch_domains: List[str]
+    synchronized: bool
+    through_logic: bool  # 외부 도메인 비트가 조합 논리를 거쳐 들어옴
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "capture_node": self.capture_node,
+            "capture_domain": self.capture_domain,
+            "launch_domains": self.launch_domains,
+            "synchronized": self.synchronized,
+            "through_logic": self.through_logic,
+        }
+
+
+@dataclass
+class CdcReport:
+    """
+    교차 행렬: matrix[launch][capture] = 그 쌍의 데이터를 받는 capture 소자 수.
+    대각선(같은 도메인)도 포함하며, unsynchronized는 동기화기 없는 교차만 센 것입니다.
+    """
+
+    domains: List[str] = field(default_factory=list)
+    matrix: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    unsynchronized: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    crossings: List[CdcCrossing] = field(default_factory=list)
+
+    def unsynchronized_crossings(self) -> List[CdcCrossing]:
+        return [c for c in self.crossings if not c.synchronized]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "domains": self.domains,
+            "matrix": self.matrix,
+            "unsynchronized": self.unsynchronized,
+            "crossing_count": len(self.crossings),
+            "unsynchronized_count": sum(1 for c in self.crossings if not c.synchronized),
+        }
+
+
+class CdcAnalyzer:
+    """
+    Usage:
+        analyzer = CdcAnalyzer(nodes, edges)
+        report = analyzer.analyze()
+        path = analyzer.find_crossing_path(capture_node_id, "clk_a")
+    """
+
+    def __init__(self, nodes: Dict[str, DKGNode], edges: Dict[str, DKGEdge]):
+        self.nodes = nodes
+        self.edges = edges
+
+        self.domains: List[str] = []
+        self._bits: Dict[str, int] = {}
+        # 순차 소자 → 자기 도메인 비트 (도메인 없는 순차 소자는 전파하지 않음)
+        self._launch: Dict[str, int] = {}
+        # 조합 노드 → 도달한 출발 도메인 비트
+        self._comb_masks: Dict[str, int] = {}
+        self._report: Optional[CdcReport] = None
+
+    def analyze(self) -> CdcReport:
+        if self._report is not None:
+            return self._report
+
+        for node_id, node in self.nodes.items():
+            if node.entity_class in SEQUENTIAL_CLASSES and node.clock_domain:
+                self._launch[node_id] = self._bit(node.clock_domain)
+        self._propagate()
+
+        report = CdcReport(domains=list(self.domains))
+        for node_id, own in self._launch.items():
+            received, foreign_via_logic = self._received(node_id)
+            if not received:
+                continue
+            domain = self.nodes[node_id].clock_domain
+            launch_domains = mask_to_clocks(received, self.domains)
+            foreign = received & ~own
+
+            synchronized = True
+            if foreign:
+                synchronized = self._is_synchronizer(node_id, foreign_via_logic)
+                report.crossings.append(CdcCrossing(
+                    capture_node=node_id,
+                    capture_domain=domain,
+                    launch_domains=[d for d in launch_domains if d != domain],
+                    synchronized=synchronized,
+                    through_logic=foreign_via_logic,
+                ))
+
+            for launch in launch_domains:
+                row = report.matrix.setdefault(launch, {})
+                row[domain] = row.get(domain, 0) + 1
+                if launch != domain and not synchronized:
+                    row = report.unsynchronized.setdefault(launch, {})
+                    row[domain] = row.get(domain, 0) + 1
+
+        self._report = report
+        return report
+
+    def find_crossing_path(
+        self,
+        capture_node: str,
+        launch_domain: str,
+    ) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        launch 도메인 순차 소자 → capture_node 데이터 경로 하나 (node_ids, edge_ids).
+        전파 비트로 가지치기하며 역방향 BFS하므로 해당 도메인 비트가 있는 노드만 방문합니다.
+        """
+        self.analyze()
+        bit = self._bits.get(launch_domain)
+        if bit is None or capture_node not in self.nodes:
+            return None
+
+        # node → (다음 노드, 엣지) : capture 쪽으로 향하는 연결
+        towards: Dict[str, Tuple[str, str]] = {}
+        queue: Deque[str] = deque([capture_node])
+        seen: Set[str] = {capture_node}
+        while queue:
+            cur = queue.popleft()
+            for eid in self.nodes[cur].in_edges:
+                e = self.edges[eid]
+                src = e.src_node
+                if e.flow_type in NON_DATA_FLOW_TYPES or src in seen:
+                    continue
+                if self._launch.get(src) == bit:
+                    towards[src] = (cur, eid)
+                    return self._unwind(src, capture_node, towards)
+                if self._comb_masks.get(src, 0) & bit:
+                    seen.add(src)
+                    towards[src] = (cur, eid)
+                    queue.append(src)
+        return None
+
+    # ========================================================================
+    # Propagation
+    # ========================================================================
+
+    def _propagate(self) -> None:
+        """출발 비트를 조합 논리에 위상 순서로 한 번 전파"""
+        nodes, edges, launch = self.nodes, self.edges, self._launch
+        comb = {
+            nid for nid, n in nodes.items() if n.entity_class not in SEQUENTIAL_CLASSES
+        }
+        masks = {nid: 0 for nid in comb}
+        indegree = dict.fromkeys(comb, 0)
+
+        for e in edges.values():
+            if e.flow_type in NON_DATA_FLOW_TYPES or e.dst_node not in comb:
+                continue
+            if e.src_node in comb:
+                indegree[e.dst_node] += 1
+            else:
+                masks[e.dst_node] |= launch.get(e.src_node, 0)
+
+        ready: Deque[str] = deque(nid for nid, d in indegree.items() if d == 0)
+        done = 0
+        while ready:
+            u = ready.popleft()
+            done += 1
+            mask = masks[u]
+            for eid in nodes[u].out_edges:
+                e = edges[eid]
+                v = e.dst_node
+                if e.flow_type in NON_DATA_FLOW_TYPES or v not in comb:
+                    continue
+                masks[v] |= mask
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    ready.append(v)
+
+        if done < len(comb):
+            self._settle_cycles(masks, [nid for nid, d in indegree.items() if d > 0])
+        self._comb_masks = masks
+
+    def _settle_cycles(self, masks: Dict[str, int], pending: List[str]) -> None:
+        """조합 루프에 걸린 노드: 새 비트만 넘기며 고정점까지"""
+        nodes, edges = self.nodes, self.edges
+        queue: Deque[Tuple[str, int]] = deque((nid, masks[nid]) for nid in pending)
+        while queue:
+            u, bits = queue.popleft()
+            for eid in nodes[u].out_edges:
+                e = edges[eid]
+                v = e.dst_node
+                if e.flow_type in NON_DATA_FLOW_TYPES or v not in masks:
+                    continue
+                new = bits & ~masks[v]
+                if new:
+                    masks[v] |= new
+                    queue.append((v, new))
+
+    def _received(self, node_id: str) -> Tuple[int, bool]:
+        """capture 소자가 받은 비트, 외부 도메인 비트가 조합 논리를 거쳤는지"""
+        own = self._launch[node_id]
+        received = 0
+        via_logic = False
+        for eid in self.nodes[node_id].in_edges:
+            e = self.edges[eid]
+            if e.flow_type in NON_DATA_FLOW_TYPES:
+                continue
+            src = e.src_node
+            if src in self._comb_masks:
+                bits = self._comb_masks[src]
+                if bits & ~own:
+                    via_logic = True
+            else:
+                bits = self._launch.get(src, 0)
+            received |= bits
+        return received, via_logic
+
+    def _is_synchronizer(self, node_id: str, via_logic: bool) -> bool:
+        node = self.nodes[node_id]
+        if str(node.attributes.get("ASYNC_REG", "")).upper() in _TRUE_VALUES:
+            return True
+        if via_logic:
+            return False
+        # 2단 FF: 출력이 같은 도메인 순차 소자로만 이어져야 함
+        stages = 0
+        for eid in node.out_edges:
+            e = self.edges[eid]
+            if e.flow_type in NON_DATA_FLOW_TYPES:
+                continue
+            dst = self.nodes[e.dst_node]
+            if dst.entity_class not in SEQUENTIAL_CLASSES or dst.clock_domain != node.clock_domain:
+                return False
+            stages += 1
+        return stages > 0
+
+    def _bit(self, domain: str) -> int:
+        bit = self._bits.get(domain)
+        if bit is None:
+            bit = self._bits[domain] = 1 << len(self.domains)
+            self.domains.append(domain)
+        return bit
+
+    @staticmethod
+    def _unwind(
+        start: str,
+        capture_node: str,
+        towards: Dict[str, Tuple[str, str]],
+    ) -> Tuple[List[str], List[str]]:
+        node_path = [start]
+        edge_path: List[str] = []
+        cur = start
+        while cur != capture_node:
+            cur, eid = towards[cur]
+            node_path.append(cur)
+            edge_path.append(eid)
+        return node_path, edge_path
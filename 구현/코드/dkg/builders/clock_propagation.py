@@ -0,0 +1,245 @@
+"""
+Clock Propagation: 다중 클럭 소스 동시 전파
+
+선언된 클럭 소스(create_clock)와 추론한 클럭 net 전부에서 한 번에 출발해
+클럭이 버퍼 / MMCM / 클럭 mux를 지나 순차 소자의 클럭 핀에 닿을 때까지 전파합니다.
+
+- 클럭마다 비트 하나를 배정하고 노드 라벨은 Python int 비트마스크
+- 노드에 새로 더해진 비트(delta)만 다음 노드로 넘기므로, 같은 경로를 함께 지나는
+  클럭들은 한 번에 처리되고 노드는 비트당 최대 한 번 전개됩니다 (클럭 k개 → O(k·E))
+- 순차 소자(FF/BRAM/DSP)는 전파를 끊습니다. 클럭 핀(CLOCK_TREE 엣지)으로 도달한
+  경우에만 그 비트를 clock_domain 후보로 기록합니다
+- 비순차 노드는 도달한 클럭을 CLOCK_TREE 출력으로만 넘깁니다 (BUFG, MMCM, BUFGMUX,
+  게이팅 LUT). 데이터 출력으로는 퍼뜨리지 않아, 클럭을 데이터로 쓰는 로직 하류가
+  클럭을 통과시키는 노드로 잘못 잡혀 분주/유도 클럭 seed가 막히지 않게 합니다
+
+포트에서 바로 들어오는 net은 구동 셀이 없어 엣지가 없으므로, 그래프 구축 시
+그 net의 load 노드에 attributes["clock_inputs"](클럭으로 보이는 net) 또는
+attributes["port_inputs"](나머지)로 net 이름을 기록해 두고 seed로 씁니다.
+선언된 클럭(create_clock)은 net 이름과 무관하게 두 attribute 모두에서 seed됩니다.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from ..core.graph import DKGEdge, DKGNode, EdgeFlowType, EntityClass, RelationType
+from ..utils import split_signal_bit
+
+# 클럭 핀을 가진 순차 소자 (클럭 전파를 끊는 노드)
+SEQUENTIAL_CLASSES = frozenset({
+    EntityClass.FLIP_FLOP,
+    EntityClass.BRAM,
+    EntityClass.DSP,
+})
+
+# 구동 셀이 없는 net(최상위 포트)의 load 노드에 기록하는 attribute (공백 구분 net 이름)
+CLOCK_INPUTS_ATTR = "clock_inputs"  # 클럭으로 보이는 net (추론 클럭 seed)
+PORT_INPUTS_ATTR = "port_inputs"    # 그 밖의 net (선언된 클럭 seed로만 사용)
+
+
+@dataclass
+class ClockPropagation:
+    """
+    전파 결과.
+
+    masks는 도달한 모든 노드의 클럭 비트입니다. 순차 소자는 클럭 핀으로 받은 클럭,
+    비순차 노드는 그 노드를 지나간 클럭입니다.
+    """
+
+    clocks: List[str] = field(default_factory=list)  # 비트 i → clocks[i]
+    masks: Dict[str, int] = field(default_factory=dict)
+    # 순차 소자 → clock_domain (가장 낮은 비트 = 선언된 클럭 우선)
+    domains: Dict[str, str] = field(default_factory=dict)
+    # 둘 이상의 클럭이 도달한 노드 → 클럭 이름들
+    multi_clock: Dict[str, List[str]] = field(default_factory=dict)
+    declared_clocks: Set[str] = field(default_factory=set)
+
+    def clocks_of(self, node_id: str) -> List[str]:
+        return mask_to_clocks(self.masks.get(node_id, 0), self.clocks)
+
+
+def mask_to_clocks(mask: int, clocks: List[str]) -> List[str]:
+    names: List[str] = []
+    while mask:
+        low = mask & -mask
+        names.append(clocks[low.bit_length() - 1])
+        mask ^= low
+    return names
+
+
+def is_clock_pin_edge(edge: DKGEdge) -> bool:
+    """순차 소자의 클럭 핀으로 들어가는 엣지인지"""
+    return (
+        edge.flow_type == EdgeFlowType.CLOCK_TREE
+        or edge.relation_type == RelationType.CLOCK
+        or edge.clock_signal is not None
+    )
+
+
+class ClockPropagator:
+    """
+    Usage:
+        result = ClockPropagator(nodes, edges).propagate(
+            net_sources={"clk": "sys_clk"},      # create_clock 대상 net → 클럭 이름
+            node_sources={"N_mmcm": "clk_out1"},  # 클럭을 내보내는 노드 → 클럭 이름
+        )
+        result.domains, result.multi_clock
+    """
+
+    def __init__(
+        self,
+        nodes: Dict[str, DKGNode],
+        edges: Dict[str, DKGEdge],
+        sequential_classes: Iterable[EntityClass] = SEQUENTIAL_CLASSES,
+    ):
+        self.nodes = nodes
+        self.edges = edges
+        sequential_classes = frozenset(sequential_classes)
+        self.sequential = frozenset(
+            nid for nid, n in nodes.items() if n.entity_class in sequential_classes
+        )
+
+        self._result = ClockPropagation()
+        self._bits: Dict[str, int] = {}
+        self._queue: Deque[Tuple[str, int]] = deque()
+
+    def propagate(
+        self,
+        net_sources: Optional[Mapping[str, str]] = None,
+        node_sources: Optional[Mapping[str, str]] = None,
+        infer_roots: bool = True,
+    ) -> ClockPropagation:
+        """
+        모든 소스에서 동시에 전파.
+
+        Args:
+            net_sources: net 이름(버스 인덱스 제외) → 클럭 이름
+            node_sources: 클럭을 내보내는 노드 → 클럭 이름 (순차 소자면 그 노드만 태깅)
+            infer_roots: 선언된 클럭이 닿지 않은 클럭 net을 net 이름의 클럭으로 추가 전파
+        """
+        result = self._result
+        net_sources = dict(net_sources or {})
+        node_sources = dict(node_sources or {})
+        result.declared_clocks = set(net_sources.values()) | set(node_sources.values())
+
+        # 1) 선언된 소스 (먼저 비트를 받아 domain 선택에서 우선)
+        for node_id, clock in node_sources.items():
+            if node_id in self.nodes:
+                self._reach(node_id, self._bit(clock), True)
+        if net_sources:
+            for node_id, nets in self._clock_inputs((CLOCK_INPUTS_ATTR, PORT_INPUTS_ATTR)):
+                for net in nets:
+                    if net in net_sources:
+                        self._reach(node_id, self._bit(net_sources[net]), True)
+        for e in self.edges.values():
+            clock = e.clock_signal or net_sources.get(split_signal_bit(e.signal_name)[0])
+            if clock is not None:
+                self._reach(e.dst_node, self._bit(clock), is_clock_pin_edge(e))
+        self._drain()
+
+        # 2) 선언되지 않은 클럭 net: 포트 클럭 → 셀이 구동하는 클럭 net 순
+        if infer_roots:
+            self._seed_inferred(net_sources)
+
+        self._finish()
+        return result
+
+    # ========================================================================
+    # Seeding
+    # ========================================================================
+
+    def _seed_inferred(self, net_sources: Mapping[str, str]) -> None:
+        for node_id, nets in self._clock_inputs():
+            for net in nets:
+                if net not in net_sources:
+                    self._reach(node_id, self._bit(net), True)
+        self._drain()
+
+        # 클럭이 지나가지 않은 노드가 구동하는 CLOCK_TREE 엣지가 새 클럭의 시작점
+        # (순차 소자 출력 = 분주 클럭 포함). 구동 노드에 클럭 입력이 없는 엣지(루트 버퍼)를
+        # 먼저 seed하고, 하나 seed할 때마다 전파를 끝내 하류 클럭 net이 자기 이름으로
+        # 중복 seed되지 않게 함
+        candidates = [
+            e for e in self.edges.values()
+            if e.flow_type == EdgeFlowType.CLOCK_TREE and not self._passes_clock(e.src_node)
+        ]
+        candidates.sort(key=lambda e: self._has_clock_input(e.src_node))
+        for e in candidates:
+            if self._passes_clock(e.src_node):
+                continue
+            self._reach(e.dst_node, self._bit(split_signal_bit(e.signal_name)[0]), True)
+            self._drain()
+
+    def _clock_inputs(
+        self, attrs: Tuple[str, ...] = (CLOCK_INPUTS_ATTR,)
+    ) -> List[Tuple[str, List[str]]]:
+        found: List[Tuple[str, List[str]]] = []
+        for node_id, node in self.nodes.items():
+            nets = [net for attr in attrs for net in node.attributes.get(attr, "").split()]
+            if nets:
+                found.append((node_id, nets))
+        return found
+
+    def _passes_clock(self, node_id: str) -> bool:
+        """클럭이 이 노드를 지나 출력으로 나가는지 (순차 소자는 클럭을 통과시키지 않음)"""
+        return node_id not in self.sequential and bool(self._result.masks.get(node_id))
+
+    def _has_clock_input(self, node_id: str) -> bool:
+        node = self.nodes[node_id]
+        if node.attributes.get(CLOCK_INPUTS_ATTR):
+            return True
+        return any(
+            self.edges[eid].flow_type == EdgeFlowType.CLOCK_TREE for eid in node.in_edges
+        )
+
+    def _bit(self, clock: str) -> int:
+        bit = self._bits.get(clock)
+        if bit is None:
+            bit = self._bits[clock] = 1 << len(self._result.clocks)
+            self._result.clocks.append(clock)
+        return bit
+
+    # ========================================================================
+    # Propagation
+    # ========================================================================
+
+    def _reach(self, node_id: str, bits: int, clock_pin: bool) -> None:
+        """node_id에 bits 도달. 비순차 노드는 새 비트만 큐에 넣음"""
+        masks = self._result.masks
+        old = masks.get(node_id, 0)
+        new = bits & ~old
+        if not new:
+            return
+        if node_id in self.sequential:
+            # 데이터 핀으로 들어온 클럭은 이 소자의 클럭이 아님
+            if clock_pin:
+                masks[node_id] = old | new
+            return
+        masks[node_id] = old | new
+        self._queue.append((node_id, new))
+
+    def _drain(self) -> None:
+        nodes, edges, queue = self.nodes, self.edges, self._queue
+        while queue:
+            node_id, bits = queue.popleft()
+            for eid in nodes[node_id].out_edges:
+                e = edges[eid]
+                if self._follows_clock(e):
+                    self._reach(e.dst_node, bits, True)
+
+    def _follows_clock(self, edge: DKGEdge) -> bool:
+        """클럭 네트워크 노드의 출력 중 클럭이 따라가는 엣지 (CLOCK_TREE, 순차 소자 클럭 핀)"""
+        if edge.flow_type == EdgeFlowType.CLOCK_TREE:
+            return True
+        return edge.dst_node in self.sequential and is_clock_pin_edge(edge)
+
+    def _finish(self) -> None:
+        result = self._result
+        for node_id, mask in result.masks.items():
+            if node_id in self.sequential:
+                low = mask & -mask
+                result.domains[node_id] = result.clocks[low.bit_length() - 1]
+            if mask & (mask - 1):
+                result.multi_clock[node_id] = mask_to_clocks(mask, result.clocks)
@@ -1,7 +1,7 @@
 """
 Constraint Projector: Raw Constraint → Graph Semantic Projection
 
-이 모듈은 SDC/XDC/TCL 파서가 추출한 raw constraint를
+이 모듈은 SDC/XDC/TCL 파서가 추출한 raw constraint(IR)를
 DKG 그래프의 semantic으로 투영합니다.
 
 처리하는 제약:
@@ -10,70 +10,122 @@ DKG 그래프의 semantic으로 투영합니다.
 - Delay Constraints: set_max_delay, set_min_delay
 - I/O Timing: set_input_delay, set_output_delay
 - Physical Constraints: LOC, IOSTANDARD, pblock
+  (pblock 범위 create_pblock / resize_pblock는 노드가 아닌 PhysicalModel이 반영)
+
+모든 제약은 배치로 처리됩니다:
+1. resolve_batch: 이름/도달성 인덱스를 한 번만 구축하고 모든 레코드의 target을 매칭
+2. apply_batch: 레코드 순서대로 필드별 최종 값을 누적한 뒤 GraphUpdater 벌크 API로 반영
 """
 from __future__ import annotations
 
-import re
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
-
+from bisect import bisect_left
+from dataclasses import replace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..core.constraint_ir import (
+    ClockConstraint,
+    DelayConstraint,
+    FalsePathConstraint,
+    IOTimingConstraint,
+    MulticyclePathConstraint,
+    PblockConstraint,
+    PropertyConstraint,
+)
 from ..core.graph import DKGEdge, DKGNode
+from .clock_propagation import CLOCK_INPUTS_ATTR, PORT_INPUTS_ATTR
 from .graph_updater import GraphUpdater
+from .reachability import ReachabilityIndex
+from ..parsers.parser_utils import compile_glob
 from ..pipeline.stages import FieldSource, ParsingStage
 
+# bisect 범위 상한용 (prefix + _MAX_CHAR 보다 큰 키는 prefix로 시작하지 않음)
+_MAX_CHAR = "\U0010ffff"
 
-# ============================================================================
-# Raw Constraint Data Classes
-# ============================================================================
-
-
-@dataclass
-class ClockConstraint:
-    """create_clock 제약"""
-
-    clock_name: str
-    period: Optional[float] = None  # ns
-    waveform: Optional[List[float]] = None  # [rise_edge, fall_edge]
-    target_ports: Optional[List[str]] = None  # get_ports / get_pins
+# (value, origin_line, stage)
+_Pending = Tuple[Any, int, ParsingStage]
 
 
-@dataclass
-class FalsePathConstraint:
-    """set_false_path 제약"""
+def _exception_rank(value: Optional[str]) -> int:
+    """같은 엣지에 여러 예외가 걸리면 false path > multicycle (Vivado 우선순위)"""
+    if not value:
+        return 0
+    if value == "false_path":
+        return 2
+    if value.startswith("multicycle"):
+        return 1
+    return 0
 
-    from_targets: Optional[List[str]] = None  # -from [get_pins ...]
-    to_targets: Optional[List[str]] = None  # -to [get_pins ...]
-    through_targets: Optional[List[str]] = None  # -through [get_pins ...]
 
+# ============================================================================
+# Name Index
+# ============================================================================
 
-@dataclass
-class MulticyclePathConstraint:
-    """set_multicycle_path 제약"""
-
-    cycles: int
-    path_type: str  # "setup" or "hold"
-    from_targets: Optional[List[str]] = None
-    to_targets: Optional[List[str]] = None
-
-
-@dataclass
-class DelayConstraint:
-    """set_max_delay / set_min_delay 제약"""
-
-    constraint_type: str  # "max" or "min"
-    delay_value: float  # ns
-    from_targets: Optional[List[str]] = None
-    to_targets: Optional[List[str]] = None
 
+class NameIndex:
+    """
+    이름 → ID 인덱스 (대소문자 무시).
 
-@dataclass
-class IOTimingConstraint:
-    """set_input_delay / set_output_delay 제약"""
+    - exact: dict 조회 (없으면 빈 결과. 제약 범위를 넓히지 않도록 부분 문자열로 추측하지 않음)
+    - prefix (`abc*`): 정렬된 이름 리스트에서 bisect 범위
+    - suffix (`*abc`): 뒤집은 이름의 정렬 리스트에서 bisect 범위
+    - contains/regex: 고유 이름 리스트를 한 번 스캔
+    패턴별 결과는 메모이즈되므로 같은 패턴은 한 번만 계산됩니다.
+    """
 
-    constraint_type: str  # "input" or "output"
-    delay_value: float  # ns
-    clock_ref: Optional[str] = None
-    target_ports: Optional[List[str]] = None
+    def __init__(self, entries: Iterable[Tuple[Optional[str], str]]):
+        self._ids: Dict[str, List[str]] = {}
+        self._rank: Dict[str, int] = {}
+        for name, obj_id in entries:
+            if obj_id not in self._rank:
+                self._rank[obj_id] = len(self._rank)
+            if not name:
+                continue
+            ids = self._ids.setdefault(name.lower(), [])
+            if not ids or ids[-1] != obj_id:
+                ids.append(obj_id)
+
+        self._keys: List[str] = list(self._ids)
+        self._sorted: List[str] = sorted(self._keys)
+        self._reversed: List[str] = sorted(k[::-1] for k in self._keys)
+        self._memo: Dict[str, List[str]] = {}
+
+    def lookup(self, pattern: str) -> List[str]:
+        """패턴에 매칭되는 ID (삽입 순서)"""
+        cached = self._memo.get(pattern)
+        if cached is not None:
+            return cached
+
+        matcher = compile_glob(pattern, ignore_case=True)
+        kind = matcher.kind
+        lit = matcher.literal
+        if kind == "exact":
+            names = [lit] if lit in self._ids else []
+        elif kind == "prefix":
+            names = _prefix_range(self._sorted, lit)
+        elif kind == "suffix":
+            names = [k[::-1] for k in _prefix_range(self._reversed, lit[::-1])]
+        else:
+            names = matcher.filter(self._keys)
+
+        if len(names) == 1:
+            result = list(self._ids[names[0]])
+        else:
+            result = self._ordered(i for name in names for i in self._ids[name])
+        self._memo[pattern] = result
+        return result
+
+    def lookup_many(self, patterns: Iterable[str]) -> List[str]:
+        """여러 패턴의 합집합 (삽입 순서)"""
+        return self._ordered(i for pattern in patterns for i in self.lookup(pattern))
+
+    def _ordered(self, ids: Iterable[str]) -> List[str]:
+        return sorted(set(ids), key=self._rank.__getitem__)
+
+
+def _prefix_range(sorted_keys: List[str], prefix: str) -> List[str]:
+    lo = bisect_left(sorted_keys, prefix)
+    hi = bisect_left(sorted_keys, prefix + _MAX_CHAR, lo)
+    return sorted_keys[lo:hi]
 
 
 # ============================================================================
@@ -87,24 +139,69 @@ class ConstraintProjector:
 
     주요 기능:
     1. 제약의 target (get_ports, get_pins, get_cells)를 실제 노드/엣지에 매칭
-    2. GraphUpdater를 통해 그래프 업데이트
+    2. GraphUpdater 벌크 API를 통해 그래프 업데이트
     3. Provenance 기록
+
+    인덱스는 처음 필요할 때 한 번만 구축되므로 그래프 구조가 바뀌면
+    새 ConstraintProjector를 만들어야 합니다. resolve만 할 때는 updater가 필요 없습니다.
     """
 
     def __init__(
         self,
         nodes: Dict[str, DKGNode],
         edges: Dict[str, DKGEdge],
-        updater: GraphUpdater,
+        updater: Optional[GraphUpdater] = None,
+        source: str = "<input>",
     ):
         self.nodes = nodes
         self.edges = edges
         self.updater = updater
+        self.source = source  # 경고에 표시할 제약 파일
+
+        # lazy 인덱스
+        self._node_names: Optional[NameIndex] = None
+        self._signal_names: Optional[NameIndex] = None
+        self._port_names: Optional[NameIndex] = None
+        self._reach: Optional[ReachabilityIndex] = None
 
     # ========================================================================
     # Target Matching Utilities
     # ========================================================================
 
+    def _get_node_names(self) -> NameIndex:
+        """hier_path/local_name/canonical_name 인덱스를 한 번만 구축"""
+        if self._node_names is None:
+            self._node_names = NameIndex(
+                (name, node_id)
+                for node_id, node in self.nodes.items()
+                for name in (node.hier_path, node.local_name, node.canonical_name)
+            )
+        return self._node_names
+
+    def _get_signal_names(self) -> NameIndex:
+        """엣지 signal_name 인덱스"""
+        if self._signal_names is None:
+            self._signal_names = NameIndex(
+                (edge.signal_name, edge_id) for edge_id, edge in self.edges.items()
+            )
+        return self._signal_names
+
+    def _get_port_names(self) -> NameIndex:
+        """최상위 포트 net(구동 셀 없음) → load 노드. 엣지가 없는 포트 이름 확인용"""
+        if self._port_names is None:
+            self._port_names = NameIndex(
+                (net, node_id)
+                for node_id, node in self.nodes.items()
+                for attr in (CLOCK_INPUTS_ATTR, PORT_INPUTS_ATTR)
+                for net in node.attributes.get(attr, "").split()
+            )
+        return self._port_names
+
+    def _get_reach(self) -> ReachabilityIndex:
+        if self._reach is None:
+            self._reach = ReachabilityIndex(self.nodes, self.edges)
+        return self._reach
+
     def _match_node_by_pattern(self, pattern: str) -> List[str]:
         """
         패턴에 매칭되는 노드 ID 리스트를 반환합니다.
@@ -117,61 +214,188 @@ class ConstraintProjector:
         Returns:
             매칭된 node_id 리스트
         """
-        matched_ids: List[str] = []
+        return list(self._get_node_names().lookup(pattern))
+
+    def _match_nodes(self, patterns: Optional[List[str]]) -> Optional[List[str]]:
+        """패턴 목록 → node_id (patterns가 없으면 제한 없음을 뜻하는 None)"""
+        if not patterns:
+            return None
+        return self._get_node_names().lookup_many(patterns)
+
+    def _match_through_groups(self, record: Any) -> List[List[str]]:
+        """
+        -through 그룹별 노드 ID.
 
-        # 간단한 와일드카드 → 정규식 변환
-        regex_pattern = pattern.replace("*", ".*").replace("?", ".")
-        regex = re.compile(regex_pattern, re.IGNORECASE)
+        net 그룹은 signal 이름 인덱스로 찾은 엣지의 sink 노드 (그 net을 지나는 경로는
+        sink를 지나므로 노드 단위 cone 교집합에 그대로 쓸 수 있음)
+        """
+        types = record.through_types or []
+        groups: List[List[str]] = []
+        for i, group in enumerate(record.through_targets or []):
+            if i < len(types) and types[i] == "nets":
+                edge_ids = self._get_signal_names().lookup_many(group)
+                groups.append(list(dict.fromkeys(self.edges[e].dst_node for e in edge_ids)))
+            else:
+                groups.append(self._match_nodes(group) or [])
+        return groups
+
+    def _match_path_edges(self, record: Any) -> List[str]:
+        """-from/-through/-to 경로 위의 모든 엣지 (cone 교집합)"""
+        if not record.from_targets and not record.to_targets and not record.through_targets:
+            return []
+        return self._get_reach().match_path_edges(
+            self._match_nodes(record.from_targets),
+            self._match_through_groups(record),
+            self._match_nodes(record.to_targets),
+        )
 
-        for node_id, node in self.nodes.items():
-            # hier_path, local_name, canonical_name 모두 체크
-            candidates = [node.hier_path, node.local_name]
-            if node.canonical_name:
-                candidates.append(node.canonical_name)
+    # ========================================================================
+    # Batch Resolve
+    # ========================================================================
 
-            if any(regex.fullmatch(c) for c in candidates):
-                matched_ids.append(node_id)
+    def resolve_batch(self, records: List[Any]) -> List[Dict[str, List[str]]]:
+        """
+        모든 레코드의 target을 한 번에 매칭합니다.
 
-        return matched_ids
+        Returns:
+            레코드와 같은 순서의 {"nodes": [...], "edges": [...]} 리스트
+        """
+        resolved: List[Dict[str, List[str]]] = []
+        for record in records:
+            node_ids: List[str] = []
+            edge_ids: List[str] = []
+
+            if isinstance(record, ClockConstraint):
+                if record.target_ports:
+                    node_ids = self._get_node_names().lookup_many(record.target_ports)
+                    edge_ids = self._get_signal_names().lookup_many(record.target_ports)
+            elif isinstance(record, (FalsePathConstraint, MulticyclePathConstraint, DelayConstraint)):
+                edge_ids = self._match_path_edges(record)
+            elif isinstance(record, IOTimingConstraint):
+                node_ids = self._match_nodes(record.target_ports) or []
+            elif isinstance(record, PropertyConstraint):
+                node_ids = self._match_nodes(record.targets) or []
+            elif isinstance(record, PblockConstraint):
+                node_ids = self._match_nodes(record.cell_targets) or []
+
+            self._warn_unresolved(record)
+            resolved.append({"nodes": node_ids, "edges": edge_ids})
+        return resolved
+
+    def _warn_unresolved(self, record: Any) -> None:
+        """
+        와일드카드 없는 이름이 아무 대상에도 매칭되지 않으면 경고.
+        그 이름은 빈 매칭으로 남으므로 제약이 의도보다 넓어지지 않습니다.
+        """
+        nodes = self._get_node_names()
+        checks: List[Tuple[List[str], Tuple[NameIndex, ...]]] = []
+        if isinstance(record, ClockConstraint):
+            # create_clock은 포트 net에서 클럭 전파를 시작하므로 포트 이름도 유효한 대상
+            checks.append((record.target_ports or [], (nodes, self._get_signal_names(), self._get_port_names())))
+        elif isinstance(record, (FalsePathConstraint, MulticyclePathConstraint, DelayConstraint)):
+            checks.append((record.from_targets or [], (nodes,)))
+            checks.append((record.to_targets or [], (nodes,)))
+            types = record.through_types or []
+            for i, group in enumerate(record.through_targets or []):
+                is_net = i < len(types) and types[i] == "nets"
+                checks.append((group, (self._get_signal_names(),) if is_net else (nodes,)))
+        elif isinstance(record, IOTimingConstraint):
+            checks.append((record.target_ports or [], (nodes,)))
+        elif isinstance(record, PropertyConstraint):
+            checks.append((record.targets or [], (nodes,)))
+        elif isinstance(record, PblockConstraint):
+            checks.append((record.cell_targets or [], (nodes,)))
+
+        for patterns, indexes in checks:
+            for pattern in patterns:
+                if compile_glob(pattern, ignore_case=True).kind != "exact":
+                    continue
+                if not any(index.lookup(pattern) for index in indexes):
+                    print(
+                        f"⚠️ {self.source}:{record.origin_line}: "
+                        f"'{pattern}'와 일치하는 대상이 없어 매칭에서 제외"
+                    )
 
-    def _match_edge_by_endpoints(
-        self, from_pattern: Optional[str], to_pattern: Optional[str]
-    ) -> List[str]:
+    # ========================================================================
+    # Batch Apply
+    # ========================================================================
+
+    def apply_batch(
+        self,
+        records: List[Any],
+        resolved: List[Dict[str, List[str]]],
+        filepath: str,
+    ) -> int:
         """
-        시작점과 끝점 패턴에 매칭되는 엣지 ID 리스트를 반환합니다.
+        resolve 결과를 그래프에 반영합니다.
 
-        Args:
-            from_pattern: 시작 노드 패턴 (None이면 모든 노드)
-            to_pattern: 끝 노드 패턴 (None이면 모든 노드)
+        레코드 순서대로 필드별 최종 값을 누적한 뒤 필드마다 벌크 업데이트로 한 번에
+        반영합니다. 모든 값의 출처가 DECLARED이므로 한 건씩 적용한 결과와 같습니다.
 
         Returns:
-            매칭된 edge_id 리스트
+            실제로 업데이트된 필드 수
         """
-        matched_ids: List[str] = []
-
-        # 패턴에 매칭되는 노드들 찾기
-        from_nodes = (
-            set(self._match_node_by_pattern(from_pattern)) if from_pattern else None
-        )
-        to_nodes = (
-            set(self._match_node_by_pattern(to_pattern)) if to_pattern else None
-        )
+        if self.updater is None:
+            raise RuntimeError("apply_batch requires a GraphUpdater")
+
+        pending = _PendingUpdates(self.nodes, self.edges)
+
+        for record, targets in zip(records, resolved):
+            line = record.origin_line
+            if isinstance(record, ClockConstraint):
+                for node_id in targets["nodes"]:
+                    pending.set_node(node_id, "clock_domain", record.clock_name, line)
+                    # 클럭 주기도 attributes에 저장
+                    if record.period is not None:
+                        pending.update_attributes(node_id, {"clock_period": str(record.period)}, line)
+                for edge_id in targets["edges"]:
+                    pending.set_edge(edge_id, "clock_signal", record.clock_name, line)
+
+            elif isinstance(record, FalsePathConstraint):
+                for edge_id in targets["edges"]:
+                    pending.set_exception(edge_id, "false_path", line)
+
+            elif isinstance(record, MulticyclePathConstraint):
+                exception_value = f"multicycle_{record.cycles}_{record.path_type}"
+                for edge_id in targets["edges"]:
+                    params = pending.edge_parameters(edge_id, line)
+                    existing = params.get("multicycle")
+                    if existing is None or record.cycles > existing:
+                        params["multicycle"] = record.cycles
+                    params["multicycle_type"] = record.path_type
+                    pending.set_exception(edge_id, exception_value, line)
+
+            elif isinstance(record, DelayConstraint):
+                param_key = f"{record.constraint_type}_delay"
+                for edge_id in targets["edges"]:
+                    pending.edge_parameters(edge_id, line)[param_key] = record.delay_value
+
+            elif isinstance(record, IOTimingConstraint):
+                attr_key = f"{record.constraint_type}_delay"
+                new_values = {attr_key: str(record.delay_value)}
+                # 클럭 참조도 저장
+                if record.clock_ref:
+                    new_values[f"{attr_key}_clock"] = record.clock_ref
+                for node_id in targets["nodes"]:
+                    pending.update_attributes(node_id, new_values, line)
 
-        for edge_id, edge in self.edges.items():
-            # from_nodes가 지정되었으면 src_node가 매칭되어야 함
-            if from_nodes is not None and edge.src_node not in from_nodes:
-                continue
+            elif isinstance(record, PropertyConstraint):
+                for node_id in targets["nodes"]:
+                    pending.update_attributes(node_id, record.properties, line)
 
-            # to_nodes가 지정되었으면 dst_node가 매칭되어야 함
-            if to_nodes is not None and edge.dst_node not in to_nodes:
-                continue
+            elif isinstance(record, PblockConstraint):
+                new_values = {"pblock": record.pblock_name, "pblock_seed": record.pblock_name}
+                for node_id in targets["nodes"]:
+                    pending.update_attributes(node_id, new_values, line, ParsingStage.FLOORPLAN)
 
-            matched_ids.append(edge_id)
+        return pending.flush(self.updater, filepath)
 
-        return matched_ids
+    def project_batch(self, records: List[Any], filepath: str) -> int:
+        """resolve_batch + apply_batch"""
+        return self.apply_batch(records, self.resolve_batch(records), filepath)
 
     # ========================================================================
-    # Clock Constraint Projection
+    # Single Constraint Projection (배치 경로의 1건짜리 래퍼)
     # ========================================================================
 
     def project_clock_constraint(
@@ -185,41 +409,7 @@ class ConstraintProjector:
 
         매칭되는 모든 노드의 clock_domain 필드를 업데이트합니다.
         """
-        if not constraint.target_ports:
-            return
-
-        for port_pattern in constraint.target_ports:
-            matched_nodes = self._match_node_by_pattern(port_pattern)
-
-            for node_id in matched_nodes:
-                self.updater.update_node_field(
-                    node_id,
-                    "clock_domain",
-                    constraint.clock_name,
-                    FieldSource.DECLARED,
-                    ParsingStage.CONSTRAINTS,
-                    filepath,
-                    line_num,
-                )
-
-                # 클럭 주기도 attributes에 저장
-                if constraint.period is not None:
-                    node = self.nodes[node_id]
-                    new_attrs = dict(node.attributes)
-                    new_attrs["clock_period"] = str(constraint.period)
-                    self.updater.update_node_field(
-                        node_id,
-                        "attributes",
-                        new_attrs,
-                        FieldSource.DECLARED,
-                        ParsingStage.CONSTRAINTS,
-                        filepath,
-                        line_num,
-                    )
-
-    # ========================================================================
-    # False Path Constraint Projection
-    # ========================================================================
+        self.project_batch([replace(constraint, origin_line=line_num)], filepath)
 
     def project_false_path_constraint(
         self,
@@ -230,28 +420,9 @@ class ConstraintProjector:
         """
         set_false_path 제약을 그래프에 투영합니다.
 
-        매칭되는 엣지의 timing_exception 필드를 'false_path'로 설정합니다.
+        매칭되는 경로 위 엣지의 timing_exception 필드를 'false_path'로 설정합니다.
         """
-        # -from과 -to로 엣지 찾기
-        from_pattern = constraint.from_targets[0] if constraint.from_targets else None
-        to_pattern = constraint.to_targets[0] if constraint.to_targets else None
-
-        matched_edges = self._match_edge_by_endpoints(from_pattern, to_pattern)
-
-        for edge_id in matched_edges:
-            self.updater.update_edge_field(
-                edge_id,
-                "timing_exception",
-                "false_path",
-                FieldSource.DECLARED,
-                ParsingStage.CONSTRAINTS,
-                filepath,
-                line_num,
-            )
-
-    # ========================================================================
-    # Multicycle Path Constraint Projection
-    # ========================================================================
+        self.project_batch([replace(constraint, origin_line=line_num)], filepath)
 
     def project_multicycle_path_constraint(
         self,
@@ -265,27 +436,7 @@ class ConstraintProjector:
         매칭되는 엣지의 timing_exception을 'multicycle_{N}_{type}'으로 설정합니다.
         예: 'multicycle_2_setup'
         """
-        from_pattern = constraint.from_targets[0] if constraint.from_targets else None
-        to_pattern = constraint.to_targets[0] if constraint.to_targets else None
-
-        matched_edges = self._match_edge_by_endpoints(from_pattern, to_pattern)
-
-        exception_value = f"multicycle_{constraint.cycles}_{constraint.path_type}"
-
-        for edge_id in matched_edges:
-            self.updater.update_edge_field(
-                edge_id,
-                "timing_exception",
-                exception_value,
-                FieldSource.DECLARED,
-                ParsingStage.CONSTRAINTS,
-                filepath,
-                line_num,
-            )
-
-    # ========================================================================
-    # Delay Constraint Projection
-    # ========================================================================
+        self.project_batch([replace(constraint, origin_line=line_num)], filepath)
 
     def project_delay_constraint(
         self,
@@ -298,31 +449,7 @@ class ConstraintProjector:
 
         매칭되는 엣지의 parameters에 'max_delay' 또는 'min_delay'를 저장합니다.
         """
-        from_pattern = constraint.from_targets[0] if constraint.from_targets else None
-        to_pattern = constraint.to_targets[0] if constraint.to_targets else None
-
-        matched_edges = self._match_edge_by_endpoints(from_pattern, to_pattern)
-
-        param_key = f"{constraint.constraint_type}_delay"
-
-        for edge_id in matched_edges:
-            edge = self.edges[edge_id]
-            new_params = dict(edge.parameters)
-            new_params[param_key] = constraint.delay_value
-
-            self.updater.update_edge_field(
-                edge_id,
-                "parameters",
-                new_params,
-                FieldSource.DECLARED,
-                ParsingStage.CONSTRAINTS,
-                filepath,
-                line_num,
-            )
-
-    # ========================================================================
-    # I/O Timing Constraint Projection
-    # ========================================================================
+        self.project_batch([replace(constraint, origin_line=line_num)], filepath)
 
     def project_io_timing_constraint(
         self,
@@ -335,34 +462,99 @@ class ConstraintProjector:
 
         매칭되는 I/O 포트 노드의 attributes에 'input_delay' 또는 'output_delay'를 저장합니다.
         """
-        if not constraint.target_ports:
-            return
+        self.project_batch([replace(constraint, origin_line=line_num)], filepath)
 
-        attr_key = f"{constraint.constraint_type}_delay"
 
-        for port_pattern in constraint.target_ports:
-            matched_nodes = self._match_node_by_pattern(port_pattern)
+class _PendingUpdates:
+    """apply_batch용 필드별 누적 버퍼: {field: {id: (value, line, stage)}}"""
 
-            for node_id in matched_nodes:
-                node = self.nodes[node_id]
-                new_attrs = dict(node.attributes)
-                new_attrs[attr_key] = str(constraint.delay_value)
+    def __init__(self, nodes: Dict[str, DKGNode], edges: Dict[str, DKGEdge]):
+        self.nodes = nodes
+        self.edges = edges
+        self.node_fields: Dict[str, Dict[str, _Pending]] = {}
+        self.edge_fields: Dict[str, Dict[str, _Pending]] = {}
 
-                # 클럭 참조도 저장
-                if constraint.clock_ref:
-                    new_attrs[f"{constraint.constraint_type}_delay_clock"] = (
-                        constraint.clock_ref
-                    )
+    def set_node(
+        self,
+        node_id: str,
+        field_name: str,
+        value: Any,
+        line: int,
+        stage: ParsingStage = ParsingStage.CONSTRAINTS,
+    ) -> None:
+        if node_id in self.nodes:
+            self.node_fields.setdefault(field_name, {})[node_id] = (value, line, stage)
 
-                self.updater.update_node_field(
-                    node_id,
-                    "attributes",
-                    new_attrs,
-                    FieldSource.DECLARED,
-                    ParsingStage.CONSTRAINTS,
-                    filepath,
-                    line_num,
+    def set_edge(
+        self,
+        edge_id: str,
+        field_name: str,
+        value: Any,
+        line: int,
+        stage: ParsingStage = ParsingStage.CONSTRAINTS,
+    ) -> None:
+        if edge_id in self.edges:
+            self.edge_fields.setdefault(field_name, {})[edge_id] = (value, line, stage)
+
+    def update_attributes(
+        self,
+        node_id: str,
+        new_values: Dict[str, str],
+        line: int,
+        stage: ParsingStage = ParsingStage.CONSTRAINTS,
+    ) -> None:
+        """노드 attributes 사본에 값을 병합"""
+        node = self.nodes.get(node_id)
+        if node is None:
+            return
+        fields = self.node_fields.setdefault("attributes", {})
+        attrs = fields[node_id][0] if node_id in fields else dict(node.attributes)
+        attrs.update(new_values)
+        fields[node_id] = (attrs, line, stage)
+
+    def edge_parameters(self, edge_id: str, line: int) -> Dict[str, Any]:
+        """엣지 parameters 사본 (반환된 dict를 직접 수정)"""
+        fields = self.edge_fields.setdefault("parameters", {})
+        if edge_id in fields:
+            params = fields[edge_id][0]
+        else:
+            params = dict(self.edges[edge_id].parameters)
+        fields[edge_id] = (params, line, ParsingStage.CONSTRAINTS)
+        return params
+
+    def set_exception(self, edge_id: str, value: str, line: int) -> None:
+        fields = self.edge_fields.get("timing_exception", {})
+        if edge_id in fields:
+            current = fields[edge_id][0]
+        else:
+            current = self.edges[edge_id].timing_exception
+        if _exception_rank(value) >= _exception_rank(current):
+            self.set_edge(edge_id, "timing_exception", value, line)
+
+    def flush(self, updater: GraphUpdater, filepath: str) -> int:
+        count = 0
+        for field_name, entries in self.node_fields.items():
+            for stage, updates, lines in _group_by_stage(entries):
+                count += updater.batch_update_node_field(
+                    field_name, updates, FieldSource.DECLARED, stage, filepath, lines
                 )
+        for field_name, entries in self.edge_fields.items():
+            for stage, updates, lines in _group_by_stage(entries):
+                count += updater.batch_update_edge_field(
+                    field_name, updates, FieldSource.DECLARED, stage, filepath, lines
+                )
+        return count
+
+
+def _group_by_stage(
+    entries: Dict[str, _Pending],
+) -> List[Tuple[ParsingStage, Dict[str, Any], Dict[str, int]]]:
+    groups: Dict[ParsingStage, Tuple[Dict[str, Any], Dict[str, int]]] = {}
+    for obj_id, (value, line, stage) in entries.items():
+        updates, lines = groups.setdefault(stage, ({}, {}))
+        updates[obj_id] = value
+        lines[obj_id] = line
+    return [(stage, updates, lines) for stage, (updates, lines) in groups.items()]
 
 
 # ============================================================================
@@ -387,23 +579,12 @@ def project_constraints_to_graph(
         edges: DKG 엣지 딕셔너리
         updater: GraphUpdater
         filepath: 제약 파일 경로
-        line_num: 제약이 정의된 줄 번호
+        line_num: origin_line이 없는 제약에 기록할 줄 번호
     """
-    projector = ConstraintProjector(nodes, edges, updater)
-
-    for constraint in constraints:
-        if isinstance(constraint, ClockConstraint):
-            projector.project_clock_constraint(constraint, filepath, line_num)
-        elif isinstance(constraint, FalsePathConstraint):
-            projector.project_false_path_constraint(constraint, filepath, line_num)
-        elif isinstance(constraint, MulticyclePathConstraint):
-            projector.project_multicycle_path_constraint(
-                constraint, filepath, line_num
-            )
-        elif isinstance(constraint, DelayConstraint):
-            projector.project_delay_constraint(constraint, filepath, line_num)
-        elif isinstance(constraint, IOTimingConstraint):
-            projector.project_io_timing_constraint(constraint, filepath, line_num)
+    records = [
+        c if c.origin_line else replace(c, origin_line=line_num) for c in constraints
+    ]
+    ConstraintProjector(nodes, edges, updater).project_batch(records, filepath)
 
 
 # ============================================================================
@@ -411,29 +592,23 @@ def project_constraints_to_graph(
 # ============================================================================
 
 
+def _parse_sdc_line(line: str, record_type: type) -> Optional[Any]:
+    # parsers → builders 순환 import를 피하기 위해 지연 import
+    from ..parsers.sdc_parser import SdcParser
+
+    for record in SdcParser().parse_lines([line]):
+        if isinstance(record, record_type):
+            return record
+    return None
+
+
 def parse_sdc_create_clock(line: str) -> Optional[ClockConstraint]:
     """
     SDC의 create_clock 명령을 파싱하여 ClockConstraint를 반환합니다.
 
     예: create_clock -name clk -period 10 [get_ports clk]
     """
-    match = re.search(r"-name\s+(\w+)", line)
-    if not match:
-        return None
-
-    clock_name = match.group(1)
-
-    # Period 추출
-    period_match = re.search(r"-period\s+([\d.]+)", line)
-    period = float(period_match.group(1)) if period_match else None
-
-    # Target ports 추출
-    port_match = re.search(r"get_ports\s+(\w+)", line)
-    target_ports = [port_match.group(1)] if port_match else []
-
-    return ClockConstraint(
-        clock_name=clock_name, period=period, target_ports=target_ports
-    )
+    return _parse_sdc_line(line, ClockConstraint)
 
 
 def parse_sdc_false_path(line: str) -> Optional[FalsePathConstraint]:
@@ -442,16 +617,7 @@ def parse_sdc_false_path(line: str) -> Optional[FalsePathConstraint]:
 
     예: set_false_path -from [get_pins cpu/reset_reg/Q] -to [get_pins *]
     """
-    from_match = re.search(r"-from\s+\[get_\w+\s+([^\]]+)\]", line)
-    to_match = re.search(r"-to\s+\[get_\w+\s+([^\]]+)\]", line)
-
-    from_targets = [from_match.group(1)] if from_match else None
-    to_targets = [to_match.group(1)] if to_match else None
-
-    if not from_targets and not to_targets:
-        return None
-
-    return FalsePathConstraint(from_targets=from_targets, to_targets=to_targets)
+    return _parse_sdc_line(line, FalsePathConstraint)
 
 
 def parse_sdc_multicycle_path(line: str) -> Optional[MulticyclePathConstraint]:
@@ -460,22 +626,4 @@ def parse_sdc_multicycle_path(line: str) -> Optional[MulticyclePathConstraint]:
 
     예: set_multicycle_path 2 -setup -from [get_pins src] -to [get_pins dst]
     """
-    cycles_match = re.search(r"set_multicycle_path\s+(\d+)", line)
-    if not cycles_match:
-        return None
-
-    cycles = int(cycles_match.group(1))
-    path_type = "setup" if "-setup" in line else "hold" if "-hold" in line else "setup"
-
-    from_match = re.search(r"-from\s+\[get_\w+\s+([^\]]+)\]", line)
-    to_match = re.search(r"-to\s+\[get_\w+\s+([^\]]+)\]", line)
-
-    from_targets = [from_match.group(1)] if from_match else None
-    to_targets = [to_match.group(1)] if to_match else None
-
-    return MulticyclePathConstraint(
-        cycles=cycles,
-        path_type=path_type,
-        from_targets=from_targets,
-        to_targets=to_targets,
-    )
+    return _parse_sdc_line(line, MulticyclePathConstraint)
@@ -0,0 +1,287 @@
+"""
+Constraint Coverage: 제약이 걸리지 않은 끝점 / I/O 포트 / 클럭 핀 찾기
+
+엔티티(순차 소자 + I/O 포트)마다 제약 종류별 커버 여부를 비트 하나로 두고,
+종류별로 전체 엔티티의 비트를 Python int 하나(비트셋)에 모읍니다.
+
+- 엔티티 인덱스는 hier_path 세그먼트 순으로 정렬해 배정하므로 계층 하나의 하위 트리는
+  연속 구간 [lo, hi)이고, 계층별 집계는 시프트 + 마스크 + bit_count (O(entities/64))
+- 클럭 도메인별 집계는 도메인 마스크(첫 조회 때 구축)와 AND 후 bit_count
+- 제약 적용 시 바뀐 노드/엣지만 다시 판정하고, 바뀐 비트를 마스크 하나로 모아
+  종류마다 한 번만 OR/AND 합니다
+
+커버 판정은 그래프 상태에서 하므로 IR 제약, floorplan TCL, 캐시에서 불러온 그래프
+모두 같은 결과를 냅니다.
+- clock: 순차 소자의 clock_domain이 선언된 클럭 (create_clock이 남긴 clock_period /
+  clock_signal, 또는 파이프라인이 넘겨준 클럭 이름)
+- io_delay: attributes에 input_delay / output_delay
+- exception: 엔티티에 닿는 엣지에 timing_exception 또는 max/min_delay, multicycle 파라미터
+- loc: attributes에 LOC / PACKAGE_PIN
+- pblock: attributes에 pblock
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..core.graph import DKGEdge, DKGNode, EntityClass
+from .clock_propagation import SEQUENTIAL_CLASSES
+
+
+class CoverageKind(str, Enum):
+    CLOCK = "clock"
+    IO_DELAY = "io_delay"
+    EXCEPTION = "exception"
+    LOC = "loc"
+    PBLOCK = "pblock"
+
+
+IO_CLASSES = frozenset({EntityClass.IO_PORT})
+
+# 종류별 집계 대상 엔티티
+APPLICABLE_CLASSES: Dict[CoverageKind, frozenset] = {
+    CoverageKind.CLOCK: SEQUENTIAL_CLASSES,
+    CoverageKind.IO_DELAY: IO_CLASSES,
+    CoverageKind.EXCEPTION: SEQUENTIAL_CLASSES | IO_CLASSES,
+    CoverageKind.LOC: IO_CLASSES,
+    CoverageKind.PBLOCK: SEQUENTIAL_CLASSES,
+}
+
+_IO_DELAY_ATTRS = ("input_delay", "output_delay")
+_LOC_ATTRS = ("LOC", "PACKAGE_PIN")
+_EXCEPTION_PARAMS = ("max_delay", "min_delay", "multicycle")
+
+# 어떤 hier_path 세그먼트보다 큰 문자열 (하위 트리 구간 상한)
+_SEGMENT_MAX = "\U0010ffff"
+
+NO_DOMAIN = "(none)"
+
+
+class CoverageEngine:
+    """
+    Usage:
+        coverage = CoverageEngine(nodes, edges)      # 전체 스캔
+        coverage.update(node_ids, edge_ids)           # 제약 적용 후 바뀐 것만
+        coverage.refresh_clocks()                     # 클럭 전파 후
+        coverage.report_by_hierarchy(depth=2)
+        coverage.unconstrained(CoverageKind.LOC)
+    """
+
+    def __init__(
+        self,
+        nodes: Dict[str, DKGNode],
+        edges: Dict[str, DKGEdge],
+        declared_clocks: Iterable[str] = (),
+    ):
+        self.nodes = nodes
+        self.edges = edges
+
+        entities = [
+            nid for nid, n in nodes.items()
+            if n.entity_class in SEQUENTIAL_CLASSES or n.entity_class in IO_CLASSES
+        ]
+        entities.sort(key=lambda nid: (_hier_key(nodes[nid].hier_path), nid))
+        self.entity_ids: List[str] = entities
+        self.entity_index: Dict[str, int] = {nid: i for i, nid in enumerate(entities)}
+        self._hier_keys = [_hier_key(nodes[nid].hier_path) for nid in entities]
+
+        self.applicable: Dict[CoverageKind, int] = {
+            kind: _mask_of(
+                i for i, nid in enumerate(entities) if nodes[nid].entity_class in classes
+            )
+            for kind, classes in APPLICABLE_CLASSES.items()
+        }
+        self.covered: Dict[CoverageKind, int] = dict.fromkeys(CoverageKind, 0)
+        self.declared_clocks: Set[str] = set()
+        self._domain_masks: Optional[Dict[str, int]] = None
+
+        self.update(nodes, edges)
+        self.refresh_clocks(declared_clocks)
+
+    # ========================================================================
+    # Incremental Update
+    # ========================================================================
+
+    def update(self, node_ids: Iterable[str] = (), edge_ids: Iterable[str] = ()) -> None:
+        """
+        바뀐 노드(attributes)와 엣지(timing_exception, parameters)만 다시 판정.
+
+        exception은 엔티티에 닿는 엣지 중 하나만 있어도 커버이므로 새로 생긴 비트만 더합니다.
+        """
+        nodes, index = self.nodes, self.entity_index
+        set_bits: Dict[CoverageKind, List[int]] = {
+            kind: [] for kind in (CoverageKind.IO_DELAY, CoverageKind.LOC, CoverageKind.PBLOCK)
+        }
+        touched: List[int] = []
+        for nid in node_ids:
+            i = index.get(nid)
+            if i is None:
+                continue
+            touched.append(i)
+            attrs = nodes[nid].attributes
+            if any(attrs.get(k) for k in _IO_DELAY_ATTRS):
+                set_bits[CoverageKind.IO_DELAY].append(i)
+            if any(attrs.get(k) for k in _LOC_ATTRS):
+                set_bits[CoverageKind.LOC].append(i)
+            if attrs.get("pblock"):
+                set_bits[CoverageKind.PBLOCK].append(i)
+
+        if touched:
+            touched_mask = _mask_of(touched)
+            for kind, bits in set_bits.items():
+                self.covered[kind] = (self.covered[kind] & ~touched_mask) | _mask_of(bits)
+
+        exception_bits: List[int] = []
+        for eid in edge_ids:
+            edge = self.edges.get(eid)
+            if edge is None or not _has_exception(edge):
+                continue
+            for nid in (edge.src_node, edge.dst_node):
+                i = index.get(nid)
+                if i is not None:
+                    exception_bits.append(i)
+        if exception_bits:
+            self.covered[CoverageKind.EXCEPTION] |= _mask_of(exception_bits)
+
+    def refresh_clocks(self, declared_clocks: Iterable[str] = ()) -> None:
+        """선언된 클럭 목록과 순차 소자의 clock 비트를 다시 계산 (클럭 전파 후 호출)"""
+        nodes = self.nodes
+        self.declared_clocks.update(declared_clocks)
+        self.declared_clocks.update(
+            n.clock_domain for n in nodes.values()
+            if n.clock_domain and n.attributes.get("clock_period")
+        )
+        self.declared_clocks.update(e.clock_signal for e in self.edges.values() if e.clock_signal)
+        declared = self.declared_clocks
+        self.covered[CoverageKind.CLOCK] = self.applicable[CoverageKind.CLOCK] & _mask_of(
+            i for i, nid in enumerate(self.entity_ids) if nodes[nid].clock_domain in declared
+        )
+        self._domain_masks = None
+
+    # ========================================================================
+    # Reports
+    # ========================================================================
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """종류별 {"covered": n, "total": n} (전체 엔티티)"""
+        return self._counts(-1)
+
+    def report_by_hierarchy(self, depth: int = 1, root: str = "") -> Dict[str, Dict[str, Dict[str, int]]]:
+        """
+        root 아래 depth 단계까지의 계층별 커버리지.
+
+        Returns:
+            {hier_prefix: {kind: {"covered": n, "total": n}}}
+        """
+        root_key = _hier_key(root) if root else ()
+        prefixes: List[Tuple[str, ...]] = []
+        seen: Set[Tuple[str, ...]] = set()
+        lo, hi = self._subtree_range(root_key)
+        for key in self._hier_keys[lo:hi]:
+            for d in range(len(root_key) + 1, min(len(key), len(root_key) + depth) + 1):
+                prefix = key[:d]
+                if prefix not in seen:
+                    seen.add(prefix)
+                    prefixes.append(prefix)
+
+        report: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for prefix in prefixes:
+            lo, hi = self._subtree_range(prefix)
+            report["/".join(prefix)] = self._counts(((1 << (hi - lo)) - 1) << lo)
+        return report
+
+    def report_by_clock_domain(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """클럭 도메인별 커버리지 (도메인 없는 엔티티는 NO_DOMAIN)"""
+        return {domain: self._counts(mask) for domain, mask in self._get_domain_masks().items()}
+
+    def unconstrained(
+        self,
+        kind: CoverageKind,
+        hierarchy: Optional[str] = None,
+        clock_domain: Optional[str] = None,
+    ) -> List[str]:
+        """kind 제약이 없는 엔티티 node_id (계층 / 클럭 도메인으로 좁힐 수 있음)"""
+        mask = self.applicable[kind] & ~self.covered[kind]
+        if hierarchy:
+            lo, hi = self._subtree_range(_hier_key(hierarchy))
+            mask &= ((1 << (hi - lo)) - 1) << lo
+        if clock_domain is not None:
+            mask &= self._get_domain_masks().get(clock_domain, 0)
+        return [self.entity_ids[i] for i in _bit_indices(mask)]
+
+    def flags(self, node_id: str) -> Dict[str, bool]:
+        """엔티티 하나의 종류별 커버 여부 (집계 대상이 아닌 종류는 제외)"""
+        i = self.entity_index.get(node_id)
+        if i is None:
+            return {}
+        return {
+            kind.value: bool(self.covered[kind] >> i & 1)
+            for kind in CoverageKind
+            if self.applicable[kind] >> i & 1
+        }
+
+    def to_dict(self, depth: int = 1) -> Dict[str, Any]:
+        return {
+            "entities": len(self.entity_ids),
+            "declared_clocks": sorted(self.declared_clocks),
+            "summary": self.summary(),
+            "by_hierarchy": self.report_by_hierarchy(depth),
+            "by_clock_domain": self.report_by_clock_domain(),
+        }
+
+    # ========================================================================
+    # Internal
+    # ========================================================================
+
+    def _counts(self, group: int) -> Dict[str, Dict[str, int]]:
+        counts: Dict[str, Dict[str, int]] = {}
+        for kind in CoverageKind:
+            members = self.applicable[kind] & group
+            counts[kind.value] = {
+                "covered": (self.covered[kind] & members).bit_count(),
+                "total": members.bit_count(),
+            }
+        return counts
+
+    def _subtree_range(self, prefix: Tuple[str, ...]) -> Tuple[int, int]:
+        keys = self._hier_keys
+        return bisect_left(keys, prefix), bisect_left(keys, prefix + (_SEGMENT_MAX,))
+
+    def _get_domain_masks(self) -> Dict[str, int]:
+        if self._domain_masks is None:
+            groups: Dict[str, List[int]] = {}
+            for i, nid in enumerate(self.entity_ids):
+                groups.setdefault(self.nodes[nid].clock_domain or NO_DOMAIN, []).append(i)
+            self._domain_masks = {domain: _mask_of(bits) for domain, bits in groups.items()}
+        return self._domain_masks
+
+
+def _hier_key(hier_path: str) -> Tuple[str, ...]:
+    return tuple(hier_path.split("/")) if hier_path else ()
+
+
+def _has_exception(edge: DKGEdge) -> bool:
+    if edge.timing_exception:
+        return True
+    return any(k in edge.parameters for k in _EXCEPTION_PARAMS)
+
+
+def _mask_of(indices: Iterable[int]) -> int:
+    """비트 인덱스들 → int 비트셋 (bytearray에 모은 뒤 한 번에 변환)"""
+    buf = bytearray()
+    for i in indices:
+        byte = i >> 3
+        if byte >= len(buf):
+            buf.extend(bytes(byte + 1 - len(buf)))
+        buf[byte] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+def _bit_indices(mask: int) -> Iterator[int]:
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    for byte_index, byte in enumerate(data):
+        while byte:
+            low = byte & -byte
+            yield byte_index * 8 + low.bit_length() - 1
+            byte ^= low
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from collections import defaultdict
 from typing import Dict, Iterable, List, Optional, Tuple
 
@@ -13,6 +14,7 @@ from ..core.graph import (
 )
 from ..core.ir import CellIR, Wire
 from ..core.provenance import Provenance, add_provenance, merge_provenances_edges
+from .clock_propagation import CLOCK_INPUTS_ATTR, PORT_INPUTS_ATTR, ClockPropagator
 from ..utils import (
     is_active_low,
     is_clock_name,
@@ -60,6 +62,26 @@ def build_wires_and_cells(yosys: dict) -> Tuple[Dict[int, Wire], List[CellIR]]:
     return wires, cells
 
 
+# 합성 후 netlist(EDIF)의 Xilinx primitive 타입
+_PRIMITIVE_CLASSES = [
+    (re.compile(r"^FD[A-Z]{1,3}$"), EntityClass.FLIP_FLOP),   # FDRE, FDSE, FDCE, FDPE
+    (re.compile(r"^LUT[1-6](_2)?$"), EntityClass.LUT),
+    (re.compile(r"^MUXF[789]$"), EntityClass.MUX),
+    (re.compile(r"^RAMB(18|36)"), EntityClass.BRAM),
+    (re.compile(r"^DSP48"), EntityClass.DSP),
+]
+
+# 클럭 네트워크 primitive (MMCM/PLL, BUFG/BUFGCE/BUFGMUX/BUFGCTRL, BUFH/BUFR/BUFIO/BUFMR)와
+# 그 클럭 포트. 포트에 연결된 net은 이름과 무관하게 클럭 net (BUFGMUX의 S, LOCKED 등은 제외)
+_CLOCK_PRIMITIVE_RE = re.compile(r"^(MMCM|PLL|BUFG|BUFH|BUFR|BUFIO|BUFMR)")
+_CLOCK_PRIMITIVE_PORT_RE = re.compile(r"^(I[01]?|O|CLKIN[12]|CLKFBIN|CLKOUT\d+B?|CLKFBOUTB?)$")
+
+# primitive FF 포트: 클럭 / 비동기 리셋(CLR, PRE) / 동기 리셋(R, S)
+_PRIMITIVE_FF_CLOCK_PORTS = {"C"}
+_PRIMITIVE_FF_ASYNC_RESET_PORTS = {"CLR", "PRE"}
+_PRIMITIVE_FF_SYNC_RESET_PORTS = {"R", "S"}
+
+
 def map_cell_type(t: str) -> EntityClass:
     if t in ["$adff", "$dff"]:
         return EntityClass.FLIP_FLOP
@@ -67,6 +89,10 @@ def map_cell_type(t: str) -> EntityClass:
         return EntityClass.MUX
     if t in ["$add", "$sub", "$and", "$or"]:
         return EntityClass.RTL_BLOCK
+    if not t.startswith("$"):
+        for pattern, cls in _PRIMITIVE_CLASSES:
+            if pattern.match(t):
+                return cls
     return EntityClass.RTL_BLOCK
 
 
@@ -79,6 +105,7 @@ def cell_signature(cell: CellIR) -> str:
         [
             cell.type,
             cell.module,
+            cell.name,
             ",".join(ports),
         ]
     )
@@ -144,6 +171,8 @@ def detect_clock_reset_from_ff_cells(
     구조적 분석을 통해 신뢰도 높은 식별:
     - $dff, $adff, $sdff 등의 CLK 포트 → clock
     - ARST, SRST 포트 → reset
+    - 합성 후 primitive FF(FDRE 등)의 C 포트 → clock, CLR/PRE/R/S 포트 → reset
+    - 클럭 네트워크 primitive(MMCM/PLL/BUFG 등)의 클럭 입출력 포트 → clock
     """
     clock_nets: set[str] = set()
     reset_nets: set[str] = set()
@@ -156,6 +185,10 @@ def detect_clock_reset_from_ff_cells(
     
     for cell in cells:
         if cell.type not in ff_cell_types:
+            if map_cell_type(cell.type) == EntityClass.FLIP_FLOP:
+                _collect_primitive_ff_nets(cell, wires, clock_nets, reset_nets)
+            elif _CLOCK_PRIMITIVE_RE.match(cell.type):
+                _collect_clock_primitive_nets(cell, wires, clock_nets)
             continue
         
         # CLK 포트 찾기
@@ -189,6 +222,40 @@ def detect_clock_reset_from_ff_cells(
     return clock_nets, reset_nets
 
 
+def _collect_primitive_ff_nets(
+    cell: CellIR,
+    wires: Dict[int, Wire],
+    clock_nets: set[str],
+    reset_nets: set[str],
+) -> None:
+    for port, wids in cell.connections.items():
+        if port in _PRIMITIVE_FF_CLOCK_PORTS:
+            target = clock_nets
+        elif port in _PRIMITIVE_FF_ASYNC_RESET_PORTS or port in _PRIMITIVE_FF_SYNC_RESET_PORTS:
+            target = reset_nets
+        else:
+            continue
+        for wid in wids:
+            w = get_wire(wires, wid)
+            # 사용하지 않는 R/S 핀은 상수 net(Vivado: <const0>)에 묶여 있음
+            if w and w.name and not w.name.startswith("<const"):
+                target.add(w.name)
+
+
+def _collect_clock_primitive_nets(
+    cell: CellIR,
+    wires: Dict[int, Wire],
+    clock_nets: set[str],
+) -> None:
+    for port, wids in cell.connections.items():
+        if not _CLOCK_PRIMITIVE_PORT_RE.match(port):
+            continue
+        for wid in wids:
+            w = get_wire(wires, wid)
+            if w and w.name and not w.name.startswith("<const"):
+                clock_nets.add(w.name)
+
+
 def detect_clock_reset_signals(
     nodes: Dict[str, DKGNode],
     edges: Dict[str, DKGEdge],
@@ -252,19 +319,44 @@ def assign_edge_flow_types(
             e.flow_type = EdgeFlowType.COMBINATIONAL
 
 
-def assign_clock_domains(
+def mark_clock_inputs(
     nodes: Dict[str, DKGNode],
-    edges: Dict[str, DKGEdge],
+    wires: Dict[int, Wire],
     clock_nets: set[str],
 ) -> None:
-    for n in nodes.values():
-        if n.entity_class != EntityClass.FLIP_FLOP:
+    """
+    구동 셀이 없는 net(최상위 포트)은 엣지가 생기지 않으므로
+    load 노드의 attributes에 net 이름을 남겨 클럭 전파의 seed로 씀.
+
+    클럭으로 보이는 net은 clock_inputs(추론 클럭 seed), 나머지는 port_inputs에 기록합니다.
+    create_clock은 이름과 무관하게 두 attribute 모두에서 seed를 찾습니다.
+    """
+    inputs: Dict[str, Dict[str, set[str]]] = {
+        CLOCK_INPUTS_ATTR: defaultdict(set),
+        PORT_INPUTS_ATTR: defaultdict(set),
+    }
+    for w in wires.values():
+        if w.drivers or not w.loads or not w.name:
             continue
-        for eid in n.in_edges:
-            e = edges[eid]
-            if e.signal_name in clock_nets:
-                n.clock_domain = e.signal_name
-                break
+        attr = CLOCK_INPUTS_ATTR if w.name in clock_nets or is_clock_name(w.name) else PORT_INPUTS_ATTR
+        for node_id in w.loads:
+            inputs[attr][node_id].add(w.name)
+    for attr, by_node in inputs.items():
+        for node_id, nets in by_node.items():
+            nodes[node_id].attributes[attr] = " ".join(sorted(nets))
+
+
+def assign_clock_domains(
+    nodes: Dict[str, DKGNode],
+    edges: Dict[str, DKGEdge],
+) -> None:
+    """
+    클럭 net 루트(포트 클럭, 셀이 구동하는 클럭 net)에서 버퍼/MMCM/mux를 지나
+    순차 소자 클럭 핀까지 전파하여 clock_domain 지정 (CLOCK_TREE flow 지정 후 호출)
+    """
+    result = ClockPropagator(nodes, edges).propagate()
+    for node_id, clock in result.domains.items():
+        nodes[node_id].clock_domain = clock
 
 
 def merge_bit_edges_to_bus(edges: Dict[str, DKGEdge]) -> Dict[str, DKGEdge]:
@@ -440,7 +532,8 @@ def build_nodes_and_edges(
     reindex_node_edges(nodes, edges)
 
     clock_nets, reset_nets = detect_clock_reset_signals(nodes, edges, cells, wires)
-    assign_clock_domains(nodes, edges, clock_nets)
+    mark_clock_inputs(nodes, wires, clock_nets)
     assign_edge_flow_types(nodes, edges, clock_nets, reset_nets)
+    assign_clock_domains(nodes, edges)
 
     return nodes, edges
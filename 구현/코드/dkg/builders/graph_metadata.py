@@ -56,7 +56,7 @@ class NodeMetadata:
     
     def should_update(self, field_name: str, new_source: FieldSource) -> bool:
         """필드를 업데이트해야 하는지 판단"""
-        from .stages import should_update_field
+        from ..pipeline.stages import should_update_field
         
         current_source = self.get_source(field_name)
         return should_update_field(current_source, new_source)
@@ -96,7 +96,7 @@ class EdgeMetadata:
         )
     
     def should_update(self, field_name: str, new_source: FieldSource) -> bool:
-        from .stages import should_update_field
+        from ..pipeline.stages import should_update_field
         
         current_source = self.get_source(field_name)
         return should_update_field(current_source, new_source)
@@ -1,16 +1,47 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..core.graph import DKGEdge, DKGNode
-from .graph_metadata import EdgeMetadata, NodeMetadata
-from ..pipeline.stages import FieldSource, ParsingStage
+from .graph_metadata import EdgeMetadata, FieldMetadata, NodeMetadata
+from ..pipeline.stages import FieldSource, ParsingStage, get_priority
+
+
+class ChangeKind(str, Enum):
+    NODE_FIELD = "node_field"
+    EDGE_FIELD = "edge_field"
+    NODE_ADDED = "node_added"
+    NODE_REMOVED = "node_removed"
+    EDGE_ADDED = "edge_added"
+    EDGE_REMOVED = "edge_removed"
+
+
+@dataclass
+class GraphChange:
+    """
+    리스너에 전달되는 변경 하나 (필드 갱신은 실제로 바뀐 id만, batch는 한 번에).
+
+    엣지 추가/삭제는 endpoints에 (src, dst)를 담아 삭제 후에도 양 끝을 알 수 있게 합니다.
+    """
+
+    kind: ChangeKind
+    ids: List[str]
+    field_name: Optional[str] = None
+    endpoints: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+
+
+GraphListener = Callable[[GraphChange], None]
 
 
 class GraphUpdater:
     """
     그래프를 점진적으로 업데이트하는 엔진.
     각 파싱 stage가 기존 그래프에 새 정보를 merge할 때 사용.
+
+    subscribe()한 리스너(SuperGraph 증분 유지 등)는 필드 갱신과 노드/엣지 추가·삭제가
+    반영된 직후 GraphChange를 받습니다.
     """
     
     def __init__(
@@ -28,6 +59,29 @@ class GraphUpdater:
         self.edge_metadata: Dict[str, EdgeMetadata] = {
             eid: EdgeMetadata() for eid in edges
         }
+        self._listeners: List[GraphListener] = []
+
+    # ========================================================================
+    # Listeners
+    # ========================================================================
+
+    def subscribe(self, listener: GraphListener) -> None:
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: GraphListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, change: GraphChange) -> None:
+        if not change.ids:
+            return
+        for listener in list(self._listeners):
+            listener(change)
+
+    # ========================================================================
+    # Field Updates
+    # ========================================================================
     
     def update_node_field(
         self,
@@ -60,6 +114,8 @@ class GraphUpdater:
         if hasattr(self.nodes[node_id], field_name):
             setattr(self.nodes[node_id], field_name, value)
         
+        if self._listeners:
+            self._notify(GraphChange(ChangeKind.NODE_FIELD, [node_id], field_name))
         return True
     
     def update_edge_field(
@@ -86,8 +142,91 @@ class GraphUpdater:
         if hasattr(self.edges[edge_id], field_name):
             setattr(self.edges[edge_id], field_name, value)
         
+        if self._listeners:
+            self._notify(GraphChange(ChangeKind.EDGE_FIELD, [edge_id], field_name))
         return True
     
+    def batch_update_node_field(
+        self,
+        field_name: str,
+        updates: Dict[str, Any],  # node_id -> value
+        source: FieldSource,
+        stage: ParsingStage,
+        origin_file: Optional[str] = None,
+        origin_lines: Optional[Dict[str, int]] = None,
+    ) -> int:
+        """
+        여러 노드의 같은 필드를 한 번에 업데이트.
+
+        update_node_field를 반복 호출한 것과 같은 우선순위 규칙을 적용하되
+        메서드 호출/조회 오버헤드 없이 한 루프로 처리합니다.
+
+        Returns:
+            실제로 업데이트된 노드 수
+        """
+        updated = self._batch_update(
+            self.nodes, self.node_metadata, field_name, updates,
+            source, stage, origin_file, origin_lines,
+        )
+        if self._listeners:
+            self._notify(GraphChange(ChangeKind.NODE_FIELD, updated, field_name))
+        return len(updated)
+
+    def batch_update_edge_field(
+        self,
+        field_name: str,
+        updates: Dict[str, Any],  # edge_id -> value
+        source: FieldSource,
+        stage: ParsingStage,
+        origin_file: Optional[str] = None,
+        origin_lines: Optional[Dict[str, int]] = None,
+    ) -> int:
+        """여러 엣지의 같은 필드를 한 번에 업데이트 (batch_update_node_field 참고)"""
+        updated = self._batch_update(
+            self.edges, self.edge_metadata, field_name, updates,
+            source, stage, origin_file, origin_lines,
+        )
+        if self._listeners:
+            self._notify(GraphChange(ChangeKind.EDGE_FIELD, updated, field_name))
+        return len(updated)
+
+    @staticmethod
+    def _batch_update(
+        objects: Dict[str, Any],
+        metadata: Dict[str, Any],
+        field_name: str,
+        updates: Dict[str, Any],
+        source: FieldSource,
+        stage: ParsingStage,
+        origin_file: Optional[str],
+        origin_lines: Optional[Dict[str, int]],
+    ) -> List[str]:
+        """우선순위 규칙을 통과해 실제로 갱신된 id 목록"""
+        new_priority = get_priority(source)
+        lines = origin_lines or {}
+        updated: List[str] = []
+        for obj_id, value in updates.items():
+            obj = objects.get(obj_id)
+            if obj is None:
+                continue
+
+            meta = metadata[obj_id]
+            current = meta.fields.get(field_name)
+            if current is not None and new_priority < get_priority(current.source):
+                continue
+
+            meta.fields[field_name] = FieldMetadata(
+                value=value,
+                source=source,
+                stage=stage,
+                origin_file=origin_file,
+                origin_line=lines.get(obj_id),
+            )
+            if hasattr(obj, field_name):
+                setattr(obj, field_name, value)
+            updated.append(obj_id)
+        return updated
+    
     def batch_update_clock_domains(
         self,
         clock_assignments: Dict[str, str],  # node_id -> clock_domain
@@ -96,13 +235,9 @@ class GraphUpdater:
         origin_file: Optional[str] = None,
     ) -> int:
         """클럭 도메인 일괄 업데이트"""
-        count = 0
-        for node_id, clock_domain in clock_assignments.items():
-            if self.update_node_field(
-                node_id, "clock_domain", clock_domain, source, stage, origin_file
-            ):
-                count += 1
-        return count
+        return self.batch_update_node_field(
+            "clock_domain", clock_assignments, source, stage, origin_file
+        )
     
     def batch_update_timing_exceptions(
         self,
@@ -112,14 +247,95 @@ class GraphUpdater:
         origin_file: Optional[str] = None,
     ) -> int:
         """타이밍 예외 일괄 업데이트"""
-        count = 0
-        for edge_id, exception_type in exceptions.items():
-            if self.update_edge_field(
-                edge_id, "timing_exception", exception_type, source, stage, origin_file
-            ):
-                count += 1
-        return count
-    
+        return self.batch_update_edge_field(
+            "timing_exception", exceptions, source, stage, origin_file
+        )
+
+    def batch_update_node_attribute(
+        self,
+        key: str,
+        updates: Dict[str, str],  # node_id -> attributes[key] 값
+        source: FieldSource,
+        stage: ParsingStage,
+        origin_file: Optional[str] = None,
+        origin_lines: Optional[Dict[str, int]] = None,
+    ) -> int:
+        """
+        여러 노드의 attributes[key] 하나를 일괄 업데이트.
+
+        우선순위는 "attributes.<key>" 메타데이터로 키마다 따로 추적하므로
+        제약이 기록한 다른 attribute(LOC 등)의 출처와 섞이지 않습니다.
+        """
+        updated = self._batch_update(
+            self.nodes, self.node_metadata, f"attributes.{key}", updates,
+            source, stage, origin_file, origin_lines,
+        )
+        for node_id in updated:
+            self.nodes[node_id].attributes[key] = updates[node_id]
+        if self._listeners:
+            self._notify(GraphChange(ChangeKind.NODE_FIELD, updated, "attributes"))
+        return len(updated)
+
+    # ========================================================================
+    # Topology Updates
+    # ========================================================================
+
+    def add_node(self, node: DKGNode) -> None:
+        """노드 추가 (같은 id가 있으면 ValueError). 엣지는 add_edge로 따로 연결"""
+        if node.node_id in self.nodes:
+            raise ValueError(f"Node already exists: {node.node_id}")
+        self.nodes[node.node_id] = node
+        self.node_metadata[node.node_id] = NodeMetadata()
+        self._notify(GraphChange(ChangeKind.NODE_ADDED, [node.node_id]))
+
+    def add_edge(self, edge: DKGEdge) -> None:
+        """엣지 추가 후 양 끝 노드의 in_edges/out_edges 연결"""
+        if edge.edge_id in self.edges:
+            raise ValueError(f"Edge already exists: {edge.edge_id}")
+        src = self.nodes.get(edge.src_node)
+        dst = self.nodes.get(edge.dst_node)
+        if src is None or dst is None:
+            raise KeyError(f"Unknown endpoint for edge {edge.edge_id}")
+        self.edges[edge.edge_id] = edge
+        self.edge_metadata[edge.edge_id] = EdgeMetadata()
+        src.out_edges.append(edge.edge_id)
+        dst.in_edges.append(edge.edge_id)
+        self._notify(GraphChange(
+            ChangeKind.EDGE_ADDED, [edge.edge_id],
+            endpoints={edge.edge_id: (edge.src_node, edge.dst_node)},
+        ))
+
+    def remove_edge(self, edge_id: str) -> bool:
+        edge = self.edges.pop(edge_id, None)
+        if edge is None:
+            return False
+        self.edge_metadata.pop(edge_id, None)
+        for node_id, links in ((edge.src_node, "out_edges"), (edge.dst_node, "in_edges")):
+            node = self.nodes.get(node_id)
+            if node is not None and edge_id in getattr(node, links):
+                getattr(node, links).remove(edge_id)
+        self._notify(GraphChange(
+            ChangeKind.EDGE_REMOVED, [edge_id],
+            endpoints={edge_id: (edge.src_node, edge.dst_node)},
+        ))
+        return True
+
+    def remove_node(self, node_id: str) -> bool:
+        """노드 삭제 (닿는 엣지를 먼저 remove_edge로 삭제)"""
+        node = self.nodes.get(node_id)
+        if node is None:
+            return False
+        for edge_id in list(dict.fromkeys(node.in_edges + node.out_edges)):
+            self.remove_edge(edge_id)
+        del self.nodes[node_id]
+        self.node_metadata.pop(node_id, None)
+        self._notify(GraphChange(ChangeKind.NODE_REMOVED, [node_id]))
+        return True
+
+    # ========================================================================
+    # Misc
+    # ========================================================================
+
     def get_field_history(self, node_id: str, field_name: str) -> Optional[list]:
         """필드의 변경 이력 반환 (향후 확장용)"""
         # TODO: 이력 추적이 필요하면 metadata에 history 추가
@@ -0,0 +1,234 @@
+"""
+Path Delay Evaluation: set_max_delay / set_min_delay 경로 지연 검사
+
+투영 단계는 -from/-to cone 교집합 위의 엣지에 max_delay/min_delay 파라미터만 기록하므로
+실제 -from → -to 경로 지연이 제약을 만족하는지는 여기서 계산합니다.
+
+- 제약마다 ReachabilityIndex로 cone 교집합 엣지 집합을 구함 (-through 포함)
+- 모든 제약의 엣지 합집합을 한 번 위상 정렬(Kahn)하고, 한 번의 순회에서 노드마다
+  그 노드를 지나는 제약들의 도착 시간만 갱신 (max → 최장 경로, min → 최단 경로)
+- 순차 소자/I/O(경로 끝점)로 들어오는 엣지는 capture 도착 시간으로 따로 기록하고
+  전파하지 않으므로, FF를 사이에 둔 제약들이 합집합에서 순환을 만들지 않음
+- 엣지 가중치는 edge.delay (없으면 0으로 보고 missing_delays로 셈)
+- 조합 루프에 걸린 노드는 전파하지 않고 해당 제약을 cyclic으로 표시
+
+margin = 요구값 - 최장 지연 (max), 최단 지연 - 요구값 (min). 음수면 위반입니다.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+from ..core.constraint_ir import DelayConstraint
+from ..core.graph import DKGEdge, DKGNode
+from .constraint_projector import ConstraintProjector
+
+
+@dataclass
+class DelayCheck:
+    """지연 제약 하나의 검사 결과 (path_delay가 None이면 매칭된 경로 없음)"""
+
+    constraint_type: str  # "max" or "min"
+    required: float  # ns
+    from_targets: Optional[List[str]] = None
+    to_targets: Optional[List[str]] = None
+    origin_file: Optional[str] = None
+    origin_line: int = 0
+    path_delay: Optional[float] = None
+    margin: Optional[float] = None
+    # 최악 경로 (max: 최장, min: 최단)
+    path_nodes: List[str] = field(default_factory=list)
+    path_edges: List[str] = field(default_factory=list)
+    missing_delays: int = 0  # 최악 경로에서 delay가 없는 엣지 수
+    cyclic: bool = False  # cone에 조합 루프가 있어 일부 경로를 평가하지 못함
+
+    @property
+    def met(self) -> Optional[bool]:
+        return None if self.margin is None else self.margin >= 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "constraint_type": self.constraint_type,
+            "required": self.required,
+            "from": self.from_targets,
+            "to": self.to_targets,
+            "origin_file": self.origin_file,
+            "origin_line": self.origin_line,
+            "path_delay": self.path_delay,
+            "margin": self.margin,
+            "met": self.met,
+            "path_nodes": self.path_nodes,
+            "path_edges": self.path_edges,
+            "missing_delays": self.missing_delays,
+            "cyclic": self.cyclic,
+        }
+
+
+class PathDelayEvaluator:
+    """
+    Usage:
+        evaluator = PathDelayEvaluator(nodes, edges)
+        checks = evaluator.evaluate(delay_records, origin_files)
+        violations = [c for c in checks if c.met is False]
+    """
+
+    def __init__(
+        self,
+        nodes: Dict[str, DKGNode],
+        edges: Dict[str, DKGEdge],
+        projector: Optional[ConstraintProjector] = None,
+    ):
+        self.nodes = nodes
+        self.edges = edges
+        # 이름 매칭 / reachability 인덱스 재사용
+        self.projector = projector or ConstraintProjector(nodes, edges)
+
+    def evaluate(
+        self,
+        records: Sequence[DelayConstraint],
+        origin_files: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[DelayCheck]:
+        """모든 제약을 한 번의 위상 순회로 평가 (결과는 records 순서)"""
+        projector = self.projector
+        reach = projector._get_reach()
+        is_endpoint = reach.is_endpoint
+        edge_src, edge_dst = reach.edge_src, reach.edge_dst
+
+        checks = [
+            DelayCheck(
+                constraint_type=r.constraint_type,
+                required=r.delay_value,
+                from_targets=r.from_targets,
+                to_targets=r.to_targets,
+                origin_file=origin_files[k] if origin_files else None,
+                origin_line=r.origin_line,
+            )
+            for k, r in enumerate(records)
+        ]
+
+        # 1) 제약별 cone 엣지 → 엣지별 제약 목록, 시작/끝 노드
+        edge_cons: Dict[int, List[int]] = {}
+        seeds: List[Set[int]] = []
+        sinks: List[Set[int]] = []
+        for k, record in enumerate(records):
+            cone_edges: List[int] = []
+            if record.from_targets or record.to_targets or record.through_targets:
+                from_ids = projector._match_nodes(record.from_targets)
+                to_ids = projector._match_nodes(record.to_targets)
+                through_groups = projector._match_through_groups(record)
+                cone_edges = reach.match_path_edge_indices(from_ids, through_groups, to_ids)
+
+            heads = {edge_src[e] for e in cone_edges}
+            tails = {edge_dst[e] for e in cone_edges}
+            for e in cone_edges:
+                edge_cons.setdefault(e, []).append(k)
+
+            if record.from_targets:
+                seeds.append(heads & set(reach.to_indices(from_ids)))
+            else:
+                seeds.append({u for u in heads if u not in tails or is_endpoint[u]})
+            if record.to_targets:
+                sinks.append(tails & set(reach.to_indices(to_ids)))
+            else:
+                sinks.append({v for v in tails if v not in heads or is_endpoint[v]})
+
+        # 2) 합집합 위상 정렬 (끝점으로 들어오는 엣지는 capture이므로 차수에서 제외)
+        out_edges: Dict[int, List[int]] = {}
+        indegree: Dict[int, int] = {}
+        for e in edge_cons:
+            u, v = edge_src[e], edge_dst[e]
+            out_edges.setdefault(u, []).append(e)
+            indegree.setdefault(u, 0)
+            indegree.setdefault(v, 0)
+            if not is_endpoint[v]:
+                indegree[v] += 1
+
+        ready: Deque[int] = deque(u for u, d in indegree.items() if d == 0)
+        order: List[int] = []
+        while ready:
+            u = ready.popleft()
+            order.append(u)
+            for e in out_edges.get(u, ()):
+                v = edge_dst[e]
+                if is_endpoint[v]:
+                    continue
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    ready.append(v)
+
+        if len(order) < len(indegree):
+            cyclic_nodes = {u for u, d in indegree.items() if d > 0}
+            for e, cons in edge_cons.items():
+                if edge_src[e] in cyclic_nodes:
+                    for k in cons:
+                        checks[k].cyclic = True
+
+        # 3) 단일 순회: 제약별 도착 시간 (arrival: 전파용, capture: 끝점 도착)
+        n = len(records)
+        longest = [r.constraint_type != "min" for r in records]
+        arrival: List[Dict[int, float]] = [dict.fromkeys(seeds[k], 0.0) for k in range(n)]
+        capture: List[Dict[int, float]] = [{} for _ in range(n)]
+        arrival_pred: List[Dict[int, int]] = [{} for _ in range(n)]
+        capture_pred: List[Dict[int, int]] = [{} for _ in range(n)]
+
+        edge_ids, edges = reach.edge_ids, self.edges
+        for u in order:
+            for e in out_edges.get(u, ()):
+                v = edge_dst[e]
+                w = edges[edge_ids[e]].delay or 0.0
+                for k in edge_cons[e]:
+                    a = arrival[k].get(u)
+                    if a is None:
+                        continue
+                    t = a + w
+                    if is_endpoint[v]:
+                        target, pred = capture[k], capture_pred[k]
+                    else:
+                        target, pred = arrival[k], arrival_pred[k]
+                    cur = target.get(v)
+                    if cur is None or (t > cur if longest[k] else t < cur):
+                        target[v] = t
+                        pred[v] = e
+
+        # 4) 제약별 최악 끝점 → margin, 경로 복원
+        for k, check in enumerate(checks):
+            best: Optional[Tuple[float, int]] = None
+            for v in sinks[k]:
+                t = capture[k].get(v) if is_endpoint[v] else arrival[k].get(v)
+                if t is None:
+                    continue
+                if best is None or (t > best[0] if longest[k] else t < best[0]):
+                    best = (t, v)
+            if best is None:
+                continue
+
+            t, v = best
+            check.path_delay = t
+            check.margin = check.required - t if longest[k] else t - check.required
+            node_path, edge_path = self._unwind(v, is_endpoint[v], arrival_pred[k], capture_pred[k])
+            check.path_nodes = [reach.node_ids[i] for i in node_path]
+            check.path_edges = [edge_ids[e] for e in edge_path]
+            check.missing_delays = sum(1 for eid in check.path_edges if edges[eid].delay is None)
+
+        return checks
+
+    def _unwind(
+        self,
+        sink: int,
+        captured: bool,
+        arrival_pred: Dict[int, int],
+        capture_pred: Dict[int, int],
+    ) -> Tuple[List[int], List[int]]:
+        edge_src = self.projector._get_reach().edge_src
+        node_path = [sink]
+        edge_path: List[int] = []
+        e = capture_pred.get(sink) if captured else arrival_pred.get(sink)
+        while e is not None:
+            u = edge_src[e]
+            edge_path.append(e)
+            node_path.append(u)
+            e = arrival_pred.get(u)
+        node_path.reverse()
+        edge_path.reverse()
+        return node_path, edge_path
@@ -0,0 +1,413 @@
+"""
+Physical Model: LOC / pblock 제약의 사이트 그리드 표현과 공간 인덱스
+
+XDC의 LOC 값(SLICE_X3Y5, RAMB36_X1Y2)과 pblock 범위(SLICE_X0Y0:SLICE_X9Y49)를
+사이트 타입별 정수 그리드 좌표로 변환하고, 정적 R-tree로 다음 질의를 처리합니다.
+
+- nodes_in_region: 영역 안에 LOC로 배치된 노드
+- overlapping_pblocks / pblocks_in_region: 영역이 겹치는 pblock
+- edge_distance: 엣지 양 끝 노드 사이의 맨해튼 거리 (사이트 단위)
+- node_regions: 노드 → 소속 pblock (Physical 뷰의 그룹 기준)
+
+사이트 타입마다 좌표계가 다르므로(SLICE_X10과 RAMB36_X10은 다른 열) 좌표 비교는
+같은 타입끼리만 합니다. 디바이스 데이터 없이 타입 간 좌표를 맞출 수 없기 때문이며,
+RAMB18만 예외로 RAMB36 그리드(Y//2)에 합칩니다. 패키지 핀(E3 등)은 그리드가 아니므로 무시합니다.
+"""
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ..core.constraint_ir import PblockRangeConstraint
+from ..core.graph import DKGEdge, DKGNode
+
+# MMCME2_ADV_X0Y0 처럼 타입에 밑줄이 있어도 마지막 _X*Y*만 좌표로 취함
+_SITE_RE = re.compile(r"^(\w+?)_X(\d+)Y(\d+)$")
+
+# 다른 타입의 그리드로 합치는 사이트: 타입 → (대상 타입, Y 나눗수)
+_SITE_ALIASES = {"RAMB18": ("RAMB36", 2)}
+
+# (x0, y0, x1, y1, item): R-tree 항목. 내부 노드의 item은 자식 항목 리스트
+_Entry = Tuple[int, int, int, int, Any]
+
+_RTREE_FANOUT = 16
+
+
+# ============================================================================
+# Site Grid
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class SiteCoord:
+    """사이트 하나의 그리드 좌표"""
+
+    site_type: str
+    x: int
+    y: int
+
+
+@dataclass(frozen=True)
+class SiteRect:
+    """같은 사이트 타입의 직사각형 범위 (양 끝 포함)"""
+
+    site_type: str
+    x0: int
+    y0: int
+    x1: int
+    y1: int
+
+    def contains(self, coord: SiteCoord) -> bool:
+        return (
+            coord.site_type == self.site_type
+            and self.x0 <= coord.x <= self.x1
+            and self.y0 <= coord.y <= self.y1
+        )
+
+    def intersects(self, other: SiteRect) -> bool:
+        return (
+            other.site_type == self.site_type
+            and self.x0 <= other.x1 and other.x0 <= self.x1
+            and self.y0 <= other.y1 and other.y0 <= self.y1
+        )
+
+    @property
+    def area(self) -> int:
+        return (self.x1 - self.x0 + 1) * (self.y1 - self.y0 + 1)
+
+    def __str__(self) -> str:
+        return f"{self.site_type}_X{self.x0}Y{self.y0}:{self.site_type}_X{self.x1}Y{self.y1}"
+
+
+def parse_site(site: str) -> Optional[SiteCoord]:
+    """SLICE_X3Y5 → SiteCoord("SLICE", 3, 5). 그리드 사이트가 아니면 None"""
+    m = _SITE_RE.match(site.strip().upper())
+    if m is None:
+        return None
+    site_type, x, y = m.group(1), int(m.group(2)), int(m.group(3))
+    alias = _SITE_ALIASES.get(site_type)
+    if alias is not None:
+        site_type, y = alias[0], y // alias[1]
+    return SiteCoord(site_type, x, y)
+
+
+def parse_site_range(text: str) -> Optional[SiteRect]:
+    """SLICE_X0Y0:SLICE_X9Y49 (또는 사이트 하나) → SiteRect. 양 끝 타입이 다르면 None"""
+    first, _, last = text.partition(":")
+    a = parse_site(first)
+    b = parse_site(last) if last else a
+    if a is None or b is None or a.site_type != b.site_type:
+        return None
+    return SiteRect(
+        a.site_type, min(a.x, b.x), min(a.y, b.y), max(a.x, b.x), max(a.y, b.y)
+    )
+
+
+def _subtract(rect: SiteRect, cut: SiteRect) -> List[SiteRect]:
+    """rect - cut (최대 4조각: 아래/위 띠, 가운데 좌/우)"""
+    if not rect.intersects(cut):
+        return [rect]
+    pieces: List[SiteRect] = []
+    t = rect.site_type
+    if rect.y0 < cut.y0:
+        pieces.append(SiteRect(t, rect.x0, rect.y0, rect.x1, cut.y0 - 1))
+    if cut.y1 < rect.y1:
+        pieces.append(SiteRect(t, rect.x0, cut.y1 + 1, rect.x1, rect.y1))
+    mid_y0, mid_y1 = max(rect.y0, cut.y0), min(rect.y1, cut.y1)
+    if rect.x0 < cut.x0:
+        pieces.append(SiteRect(t, rect.x0, mid_y0, cut.x0 - 1, mid_y1))
+    if cut.x1 < rect.x1:
+        pieces.append(SiteRect(t, cut.x1 + 1, mid_y0, rect.x1, mid_y1))
+    return pieces
+
+
+# ============================================================================
+# Static R-tree (STR bulk load)
+# ============================================================================
+
+
+class RTree:
+    """
+    정적 R-tree. 항목을 한 번에 받아 Sort-Tile-Recursive로 패킹하므로
+    삽입/삭제는 없고, 사각형 질의는 겹치는 서브트리만 내려갑니다.
+
+    Usage:
+        tree = RTree([(x0, y0, x1, y1, payload), ...])
+        payloads = tree.search(x0, y0, x1, y1)
+    """
+
+    def __init__(self, entries: Iterable[_Entry], fanout: int = _RTREE_FANOUT):
+        level = list(entries)
+        self.size = len(level)
+        self._height = 0
+        self._root: Optional[_Entry] = None
+        if not level:
+            return
+        # 루트 하나가 남을 때까지 한 층씩 패킹
+        while True:
+            level = _str_pack(level, fanout)
+            self._height += 1
+            if len(level) == 1:
+                break
+        self._root = level[0]
+
+    def search(self, x0: int, y0: int, x1: int, y1: int) -> List[Any]:
+        """사각형과 겹치는 항목의 payload"""
+        found: List[Any] = []
+        if self._root is None:
+            return found
+        stack = [(self._root, self._height)]
+        while stack:
+            node, depth = stack.pop()
+            for e in node[4]:
+                if e[0] <= x1 and x0 <= e[2] and e[1] <= y1 and y0 <= e[3]:
+                    if depth == 1:
+                        found.append(e[4])
+                    else:
+                        stack.append((e, depth - 1))
+        return found
+
+
+def _str_pack(entries: List[_Entry], fanout: int) -> List[_Entry]:
+    """항목 → 부모 노드 리스트. x 중심으로 세로 띠를 나누고 띠 안에서 y 중심으로 묶음"""
+    pages = -(-len(entries) // fanout)
+    slab_size = fanout * -(-pages // math.ceil(math.sqrt(pages)))
+    entries.sort(key=lambda e: e[0] + e[2])
+
+    parents: List[_Entry] = []
+    for i in range(0, len(entries), slab_size):
+        slab = sorted(entries[i:i + slab_size], key=lambda e: e[1] + e[3])
+        for j in range(0, len(slab), fanout):
+            group = slab[j:j + fanout]
+            parents.append((
+                min(e[0] for e in group),
+                min(e[1] for e in group),
+                max(e[2] for e in group),
+                max(e[3] for e in group),
+                group,
+            ))
+    return parents
+
+
+# ============================================================================
+# Physical Model
+# ============================================================================
+
+
+@dataclass
+class Pblock:
+    """pblock 하나의 범위 (create_pblock / resize_pblock 누적 결과)"""
+
+    name: str
+    rects: List[SiteRect] = field(default_factory=list)
+
+
+Region = Union[str, SiteRect]
+
+
+class PhysicalModel:
+    """
+    pblock 레지스트리 + LOC 배치 인덱스.
+
+    pblock 범위는 제약 IR(PblockRangeConstraint)에서, 노드 배치와 pblock 소속은
+    노드 attributes(LOC, pblock)에서 읽습니다. 배치 인덱스는 첫 질의 때 만들고
+    제약이 추가되면 다시 만듭니다.
+
+    Usage:
+        model = PhysicalModel(nodes, edges)
+        model.apply_records(records)
+        model.nodes_in_region("SLICE_X0Y0:SLICE_X9Y49")
+        model.overlapping_pblocks("pb_core")
+        model.edge_distance(edge_id)
+    """
+
+    def __init__(self, nodes: Dict[str, DKGNode], edges: Dict[str, DKGEdge]):
+        self.nodes = nodes
+        self.edges = edges
+        self.pblocks: Dict[str, Pblock] = {}
+
+        self._placements: Optional[Dict[str, SiteCoord]] = None
+        self._placement_index: Optional[Dict[str, RTree]] = None
+        self._pblock_index: Optional[Dict[str, RTree]] = None
+
+    # ========================================================================
+    # Pblock Registry
+    # ========================================================================
+
+    def apply_records(self, records: Sequence[Any]) -> int:
+        """
+        제약 IR 중 pblock 범위 레코드를 파일 순서대로 반영합니다.
+        LOC도 바뀌었을 수 있으므로 배치 인덱스는 항상 무효화합니다.
+
+        Returns:
+            반영한 레코드 수
+        """
+        applied = 0
+        for record in records:
+            if isinstance(record, PblockRangeConstraint):
+                self.resize_pblock(
+                    record.pblock_name, record.add_ranges, record.remove_ranges, record.replace
+                )
+                applied += 1
+        self.invalidate()
+        return applied
+
+    def resize_pblock(
+        self,
+        name: str,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+        replace: bool = False,
+    ) -> Pblock:
+        """pblock 범위 수정 (없으면 생성). 해석할 수 없는 범위 문자열은 무시"""
+        pblock = self.pblocks.setdefault(name, Pblock(name))
+        if replace:
+            pblock.rects = []
+        for text in add:
+            rect = parse_site_range(text)
+            if rect is not None:
+                pblock.rects.append(rect)
+        for text in remove:
+            cut = parse_site_range(text)
+            if cut is not None:
+                pblock.rects = [p for r in pblock.rects for p in _subtract(r, cut)]
+        self._pblock_index = None
+        return pblock
+
+    def invalidate(self) -> None:
+        """노드 attributes가 바뀐 뒤 배치 인덱스 재구축 예약"""
+        self._placements = None
+        self._placement_index = None
+
+    # ========================================================================
+    # Queries
+    # ========================================================================
+
+    def placement(self, node_id: str) -> Optional[SiteCoord]:
+        """노드의 LOC 좌표 (그리드 사이트에 배치되지 않았으면 None)"""
+        return self._get_placements().get(node_id)
+
+    def nodes_in_region(self, region: Region) -> List[str]:
+        """영역(범위 문자열, SiteRect, pblock 이름) 안에 LOC로 배치된 노드"""
+        index = self._get_placement_index()
+        found: List[str] = []
+        for rect in self._region_rects(region):
+            tree = index.get(rect.site_type)
+            if tree is not None:
+                found.extend(tree.search(rect.x0, rect.y0, rect.x1, rect.y1))
+        return list(dict.fromkeys(found))
+
+    def pblocks_in_region(self, region: Region) -> List[str]:
+        """영역과 겹치는 pblock 이름"""
+        index = self._get_pblock_index()
+        found: List[str] = []
+        for rect in self._region_rects(region):
+            tree = index.get(rect.site_type)
+            if tree is not None:
+                found.extend(tree.search(rect.x0, rect.y0, rect.x1, rect.y1))
+        return list(dict.fromkeys(found))
+
+    def overlapping_pblocks(self, name: str) -> List[str]:
+        """pblock과 범위가 겹치는 다른 pblock 이름"""
+        return [other for other in self.pblocks_in_region(name) if other != name]
+
+    def pblock_at(self, site: Union[str, SiteCoord]) -> Optional[str]:
+        """사이트를 포함하는 pblock 중 가장 작은 것 (중첩 pblock이면 안쪽)"""
+        coord = parse_site(site) if isinstance(site, str) else site
+        if coord is None:
+            return None
+        tree = self._get_pblock_index().get(coord.site_type)
+        if tree is None:
+            return None
+        candidates = tree.search(coord.x, coord.y, coord.x, coord.y)
+        if not candidates:
+            return None
+        return min(candidates, key=self._pblock_area)
+
+    def edge_distance(self, edge_id: str) -> Optional[int]:
+        """엣지 양 끝의 맨해튼 거리 (둘 다 같은 타입 그리드에 배치된 경우만)"""
+        edge = self.edges.get(edge_id)
+        if edge is None:
+            return None
+        placements = self._get_placements()
+        a = placements.get(edge.src_node)
+        b = placements.get(edge.dst_node)
+        if a is None or b is None or a.site_type != b.site_type:
+            return None
+        return abs(a.x - b.x) + abs(a.y - b.y)
+
+    def node_regions(self) -> Dict[str, str]:
+        """
+        노드 → 소속 pblock 이름.
+        add_cells_to_pblock 소속(attributes["pblock"])이 우선이고,
+        없으면 LOC 좌표를 포함하는 pblock을 씁니다.
+        """
+        regions: Dict[str, str] = {}
+        placements = self._get_placements()
+        for node_id, node in self.nodes.items():
+            name = node.attributes.get("pblock")
+            if not name:
+                coord = placements.get(node_id)
+                name = self.pblock_at(coord) if coord is not None else None
+            if name:
+                regions[node_id] = name
+        return regions
+
+    def region_of(self, node_id: str) -> Optional[str]:
+        """노드 하나의 소속 pblock (node_regions와 같은 규칙, 배치 인덱스 없이 계산)"""
+        node = self.nodes.get(node_id)
+        if node is None:
+            return None
+        name = node.attributes.get("pblock")
+        if name:
+            return name
+        loc = node.attributes.get("LOC")
+        return self.pblock_at(loc) if isinstance(loc, str) else None
+
+    # ========================================================================
+    # Index Construction
+    # ========================================================================
+
+    def _get_placements(self) -> Dict[str, SiteCoord]:
+        if self._placements is None:
+            placements: Dict[str, SiteCoord] = {}
+            for node_id, node in self.nodes.items():
+                loc = node.attributes.get("LOC")
+                coord = parse_site(loc) if isinstance(loc, str) else None
+                if coord is not None:
+                    placements[node_id] = coord
+            self._placements = placements
+        return self._placements
+
+    def _get_placement_index(self) -> Dict[str, RTree]:
+        if self._placement_index is None:
+            by_type: Dict[str, List[_Entry]] = {}
+            for node_id, c in self._get_placements().items():
+                by_type.setdefault(c.site_type, []).append((c.x, c.y, c.x, c.y, node_id))
+            self._placement_index = {t: RTree(entries) for t, entries in by_type.items()}
+        return self._placement_index
+
+    def _get_pblock_index(self) -> Dict[str, RTree]:
+        if self._pblock_index is None:
+            by_type: Dict[str, List[_Entry]] = {}
+            for pblock in self.pblocks.values():
+                for r in pblock.rects:
+                    by_type.setdefault(r.site_type, []).append(
+                        (r.x0, r.y0, r.x1, r.y1, pblock.name)
+                    )
+            self._pblock_index = {t: RTree(entries) for t, entries in by_type.items()}
+        return self._pblock_index
+
+    def _region_rects(self, region: Region) -> List[SiteRect]:
+        if isinstance(region, SiteRect):
+            return [region]
+        pblock = self.pblocks.get(region)
+        if pblock is not None:
+            return pblock.rects
+        rects = [parse_site_range(text) for text in region.split()]
+        return [r for r in rects if r is not None]
+
+    def _pblock_area(self, name: str) -> int:
+        return sum(r.area for r in self.pblocks[name].rects)
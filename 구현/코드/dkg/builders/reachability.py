@@ -0,0 +1,266 @@
+"""
+Reachability Index: 타이밍 예외(-from/-through/-to) 경로 해석
+
+경로를 열거하지 않고 cone 교집합으로 "매칭 경로 위의 엣지"를 구합니다.
+
+- 노드/엣지를 정수 인덱스로 변환하고 CSR(forward/backward) 인접 배열 구성
+- cone은 노드 수 크기의 bytearray 비트맵 (0: 미도달, 1: 도달, 2: 도달+전개)
+- 순차 소자(FF/BRAM)와 I/O는 타이밍 경로의 끝점이므로 seed가 아니면 전개하지 않음
+- CLOCK_TREE 엣지는 데이터 경로가 아니므로 제외
+
+-through가 k개일 때 stage 집합 P_0=from, P_1..P_k=through, P_{k+1}=to에 대해
+forward pass로 각 stage에서 실제 도달한 지점만 남기고(R_i),
+backward pass로 이후 stage까지 이어지는 지점만 남긴 뒤(Q_i),
+segment i의 엣지 (u, v)는 u가 fwd(R_i)에서 전개되고 v가 bwd(Q_{i+1})에서 전개될 때 매칭됩니다.
+전체 비용은 각 cone 크기에 선형입니다.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from ..core.graph import DKGEdge, DKGNode, EdgeFlowType, EntityClass
+
+# 타이밍 경로를 끊는 노드 (경로의 시작/끝점)
+PATH_ENDPOINT_CLASSES = frozenset({
+    EntityClass.FLIP_FLOP,
+    EntityClass.BRAM,
+    EntityClass.IO_PORT,
+})
+
+# 데이터 경로에서 제외하는 엣지
+NON_DATA_FLOW_TYPES = frozenset({EdgeFlowType.CLOCK_TREE})
+
+_REACHED = 1
+_EXPANDED = 2
+
+
+class ReachabilityIndex:
+    """
+    DKG 그래프의 정수 인덱스 + CSR 인접 구조.
+
+    Usage:
+        index = ReachabilityIndex(nodes, edges)
+        edge_ids = index.match_path_edges(from_ids, [through_ids], to_ids)
+    """
+
+    def __init__(
+        self,
+        nodes: Dict[str, DKGNode],
+        edges: Dict[str, DKGEdge],
+        endpoint_classes: Iterable[EntityClass] = PATH_ENDPOINT_CLASSES,
+        excluded_flow_types: Iterable[EdgeFlowType] = NON_DATA_FLOW_TYPES,
+    ):
+        self.node_ids: List[str] = list(nodes)
+        self.node_index: Dict[str, int] = {nid: i for i, nid in enumerate(self.node_ids)}
+        n = len(self.node_ids)
+
+        endpoint_classes = frozenset(endpoint_classes)
+        self.is_endpoint = bytearray(
+            1 if nodes[nid].entity_class in endpoint_classes else 0
+            for nid in self.node_ids
+        )
+
+        # 데이터 엣지만 인덱싱
+        excluded = frozenset(excluded_flow_types)
+        self.edge_ids: List[str] = []
+        src_list: List[int] = []
+        dst_list: List[int] = []
+        node_index = self.node_index
+        for edge_id, edge in edges.items():
+            if edge.flow_type in excluded:
+                continue
+            u = node_index.get(edge.src_node)
+            v = node_index.get(edge.dst_node)
+            if u is None or v is None:
+                continue
+            self.edge_ids.append(edge_id)
+            src_list.append(u)
+            dst_list.append(v)
+
+        self.edge_src = array("l", src_list)
+        self.edge_dst = array("l", dst_list)
+
+        # CSR: fwd_edges[fwd_offsets[u]:fwd_offsets[u+1]] = u의 out-edge 인덱스
+        self.fwd_offsets, self.fwd_edges = _build_csr(n, src_list)
+        self.bwd_offsets, self.bwd_edges = _build_csr(n, dst_list)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    def to_indices(self, node_ids: Iterable[str]) -> List[int]:
+        index = self.node_index
+        return [index[nid] for nid in node_ids if nid in index]
+
+    def edge_pairs(self) -> Dict[Tuple[str, str], List[str]]:
+        """
+        (src node_id, dst node_id) → 두 노드 사이 edge_id 리스트 (엣지 삽입 순서).
+
+        forward CSR을 src 노드 단위로 한 번 순회해 구축합니다 (O(V + E)).
+        """
+        pairs: Dict[Tuple[str, str], List[str]] = {}
+        node_ids = self.node_ids
+        edge_ids = self.edge_ids
+        offsets = self.fwd_offsets
+        adj = self.fwd_edges
+        edge_dst = self.edge_dst
+        for u, src in enumerate(node_ids):
+            for k in range(offsets[u], offsets[u + 1]):
+                e = adj[k]
+                key = (src, node_ids[edge_dst[e]])
+                bucket = pairs.get(key)
+                if bucket is None:
+                    pairs[key] = [edge_ids[e]]
+                else:
+                    bucket.append(edge_ids[e])
+        return pairs
+
+    # ========================================================================
+    # Cone Propagation
+    # ========================================================================
+
+    def forward_cone(self, seeds: Optional[Sequence[int]]) -> bytearray:
+        """seeds에서 순방향 cone (seeds=None이면 모든 노드가 전개된 것으로 간주)"""
+        return self._cone(seeds, self.fwd_offsets, self.fwd_edges, self.edge_dst)
+
+    def backward_cone(self, seeds: Optional[Sequence[int]]) -> bytearray:
+        """seeds로 들어오는 역방향 cone"""
+        return self._cone(seeds, self.bwd_offsets, self.bwd_edges, self.edge_src)
+
+    def _cone(
+        self,
+        seeds: Optional[Sequence[int]],
+        offsets: array,
+        adj_edges: array,
+        other_end: array,
+    ) -> bytearray:
+        n = self.num_nodes
+        if seeds is None:
+            return bytearray([_EXPANDED]) * n
+
+        cone = bytearray(n)
+        is_endpoint = self.is_endpoint
+        stack = list(seeds)
+        for s in stack:
+            cone[s] = _EXPANDED
+
+        while stack:
+            u = stack.pop()
+            for k in range(offsets[u], offsets[u + 1]):
+                v = other_end[adj_edges[k]]
+                if cone[v]:
+                    continue
+                if is_endpoint[v]:
+                    # 경로 끝점: 도달만 표시하고 전개하지 않음
+                    cone[v] = _REACHED
+                else:
+                    cone[v] = _EXPANDED
+                    stack.append(v)
+        return cone
+
+    # ========================================================================
+    # Path Matching
+    # ========================================================================
+
+    def match_path_edges(
+        self,
+        from_nodes: Optional[Iterable[str]],
+        through_groups: Sequence[Iterable[str]],
+        to_nodes: Optional[Iterable[str]],
+    ) -> List[str]:
+        """
+        -from → -through(순서대로) → -to 경로 위의 모든 엣지 ID.
+
+        Args:
+            from_nodes: 시작 노드 ID (None이면 제한 없음)
+            through_groups: -through 옵션별 노드 ID 그룹
+            to_nodes: 끝 노드 ID (None이면 제한 없음)
+
+        Returns:
+            매칭된 edge_id 리스트 (엣지 삽입 순서)
+        """
+        edge_ids = self.edge_ids
+        return [edge_ids[e] for e in self.match_path_edge_indices(from_nodes, through_groups, to_nodes)]
+
+    def match_path_edge_indices(
+        self,
+        from_nodes: Optional[Iterable[str]],
+        through_groups: Sequence[Iterable[str]],
+        to_nodes: Optional[Iterable[str]],
+    ) -> List[int]:
+        """match_path_edges와 같지만 정수 엣지 인덱스(edge_src/edge_dst 기준)를 반환"""
+        stages: List[Optional[List[int]]] = [
+            None if from_nodes is None else self.to_indices(from_nodes)
+        ]
+        stages.extend(self.to_indices(group) for group in through_groups)
+        stages.append(None if to_nodes is None else self.to_indices(to_nodes))
+        k = len(stages) - 1  # segment 수
+
+        # Forward pass: R_i = P_i ∩ reached(fwd(R_{i-1}))
+        reached: List[Optional[List[int]]] = [stages[0]]
+        fwd_cones: List[bytearray] = [self.forward_cone(stages[0])]
+        for i in range(1, k + 1):
+            prev = fwd_cones[i - 1]
+            if stages[i] is None:
+                r_i = None
+            else:
+                r_i = [x for x in stages[i] if prev[x]]
+                if not r_i:
+                    return []
+            reached.append(r_i)
+            if i < k:
+                fwd_cones.append(self.forward_cone(r_i))
+
+        # Backward pass: Q_i = R_i ∩ reached(bwd(Q_{i+1}))
+        bwd_cones: List[bytearray] = [bytearray()] * k
+        q_next = reached[k]
+        for i in range(k - 1, -1, -1):
+            bwd = self.backward_cone(q_next)
+            bwd_cones[i] = bwd
+            if i == 0:
+                break
+            q_next = [x for x in reached[i] if bwd[x]]  # type: ignore[union-attr]
+            if not q_next:
+                return []
+
+        # segment i: u ∈ expanded(fwd_i), v ∈ expanded(bwd_i)
+        # (끝점 노드는 seed일 때만 전개 상태이므로 경로 중간의 FF는 자동으로 제외됨)
+        matched: Set[int] = set()
+        offsets = self.fwd_offsets
+        adj = self.fwd_edges
+        edge_dst = self.edge_dst
+        for i in range(k):
+            bwd = bwd_cones[i]
+            for u in _expanded_nodes(fwd_cones[i]):
+                for j in range(offsets[u], offsets[u + 1]):
+                    e = adj[j]
+                    if bwd[edge_dst[e]] == _EXPANDED:
+                        matched.add(e)
+
+        return sorted(matched)
+
+
+def _expanded_nodes(cone: bytearray) -> Iterable[int]:
+    find = cone.find
+    pos = find(_EXPANDED)
+    while pos >= 0:
+        yield pos
+        pos = find(_EXPANDED, pos + 1)
+
+
+def _build_csr(num_nodes: int, keys: List[int]):
+    """keys[e] = 엣지 e의 소속 노드 → (offsets, edge 인덱스 배열)"""
+    counts = [0] * (num_nodes + 1)
+    for u in keys:
+        counts[u + 1] += 1
+    for i in range(num_nodes):
+        counts[i + 1] += counts[i]
+    offsets = array("l", counts)
+
+    cursor = list(counts[:-1]) if num_nodes else []
+    adj = array("l", bytes(len(keys) * array("l").itemsize))
+    for e, u in enumerate(keys):
+        adj[cursor[u]] = e
+        cursor[u] += 1
+    return offsets, adj
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from ..core.graph import DKGEdge, DKGNode, EdgeFlowType, EntityClass, RelationType
 from ..core.provenance import Provenance
-from ..utils import stable_hash
+from ..utils import gc_paused, stable_hash
+from .graph_updater import ChangeKind, GraphChange, GraphUpdater
+from .physical import PhysicalModel
 
 
 # ============================================================================
@@ -169,17 +171,91 @@ class SuperNode:
     # analysis dict itself is mutable,
     # but each analysis bundle MUST be immutable snapshot
 
+
+# ============================================================================
+# SuperEdge Membership
+# ============================================================================
+# SuperEdge는 멤버 엣지 집합 / provenance 목록을 복사해 두지 않고
+# 멤버 수, relation/flow 비트마스크, 공유 ID 배열의 시작 위치만 가집니다.
+# member_edges / member_nodes / relation_types / flow_types / provenances는
+# 조회할 때 범위와 DKG 엣지에서 계산합니다.
+# ============================================================================
+
+_RELATION_BITS = {r: 1 << i for i, r in enumerate(RelationType)}
+_FLOW_BITS = {f: 1 << i for i, f in enumerate(EdgeFlowType)}
+
+
+def relation_mask(types: Iterable[RelationType]) -> int:
+    mask = 0
+    for r in types:
+        mask |= _RELATION_BITS[r]
+    return mask
+
+
+def flow_mask(types: Iterable[EdgeFlowType]) -> int:
+    mask = 0
+    for f in types:
+        mask |= _FLOW_BITS[f]
+    return mask
+
+
+def _decode_mask(mask: int, bits: Dict[Any, int]) -> Set[Any]:
+    return {value for value, bit in bits.items() if mask & bit}
+
+
+class SuperEdgeMembers:
+    """
+    SuperGraph 하나의 SuperEdge 멤버 엣지 ID 배열.
+
+    build는 (src, dst) 쌍으로 묶은 순서대로 ID를 이어 붙이므로 SuperEdge 하나의 멤버는
+    연속 구간입니다. 증분 갱신으로 다시 쓴 SuperEdge는 끝에 새 구간을 붙이고,
+    버려진 구간이 살아 있는 구간보다 많아지면 compacted()로 새 배열을 만듭니다
+    (이전 배열을 가리키는 해체된 SuperEdge는 그대로 읽을 수 있음).
+    """
+
+    __slots__ = ("edges", "edge_ids", "live")
+
+    def __init__(self, edges: Dict[str, DKGEdge]):
+        self.edges = edges
+        self.edge_ids: List[str] = []
+        self.live = 0  # 살아 있는 SuperEdge 구간 길이 합
+
+    def append(self, edge_ids: Iterable[str]) -> Tuple[int, int]:
+        """ID를 끝에 붙이고 (시작 위치, 개수)를 돌려줌"""
+        start = len(self.edge_ids)
+        self.edge_ids.extend(edge_ids)
+        count = len(self.edge_ids) - start
+        self.live += count
+        return start, count
+
+    def release(self, se: "SuperEdge") -> None:
+        """SuperGraph에서 빠진 SuperEdge의 구간을 버림"""
+        self.live -= se.edge_count
+
+    def needs_compaction(self) -> bool:
+        return len(self.edge_ids) > 2 * self.live + 1024
+
+    def compacted(self, super_edges: Iterable["SuperEdge"]) -> "SuperEdgeMembers":
+        """살아 있는 SuperEdge 구간만 새 배열로 옮기고 SuperEdge가 새 배열을 가리키게 함"""
+        store = SuperEdgeMembers(self.edges)
+        for se in super_edges:
+            se.start, se.edge_count = store.append(se.member_edge_ids())
+            se.members = store
+        return store
+
+
 # superedge는 DKGEdge와 달리 고유한 의미를 가지지 않고 그래프적 연결성을 나타내는 용도. 의미는 멤버 엣지들이 담당
 @dataclass
 class SuperEdge:
     edge_id: str
     src_node: str
     dst_node: str
-    member_edges: Set[str]
-    member_nodes: Set[str]
-    relation_types: Set[RelationType]
-    flow_types: Set[EdgeFlowType]
-    provenances: List[Provenance] = field(default_factory=list)
+    # 멤버 엣지 ID는 members.edge_ids[start:start + edge_count]
+    members: SuperEdgeMembers = field(repr=False, compare=False)
+    start: int = field(compare=False)
+    edge_count: int
+    relation_mask: int
+    flow_mask: int
     canonical_name: Optional[str] = None
     display_name: Optional[str] = None
     # Analysis Attachment: keyed bundle for extensibility
@@ -187,6 +263,50 @@ class SuperEdge:
     # analysis dict itself is mutable,
     # but each analysis bundle MUST be immutable snapshot
 
+    def member_edge_ids(self) -> List[str]:
+        return self.members.edge_ids[self.start:self.start + self.edge_count]
+
+    def iter_member_edges(self) -> Iterator[DKGEdge]:
+        """멤버 DKG 엣지 (그래프에서 이미 빠진 엣지는 건너뜀)"""
+        edges = self.members.edges
+        for eid in self.member_edge_ids():
+            e = edges.get(eid)
+            if e is not None:
+                yield e
+
+    @property
+    def member_edges(self) -> Set[str]:
+        return set(self.member_edge_ids())
+
+    @property
+    def member_nodes(self) -> Set[str]:
+        result: Set[str] = set()
+        for e in self.iter_member_edges():
+            result.add(e.src_node)
+            result.add(e.dst_node)
+        return result
+
+    @property
+    def relation_types(self) -> Set[RelationType]:
+        return _decode_mask(self.relation_mask, _RELATION_BITS)
+
+    @property
+    def flow_types(self) -> Set[EdgeFlowType]:
+        return _decode_mask(self.flow_mask, _FLOW_BITS)
+
+    @property
+    def provenances(self) -> List[Provenance]:
+        """멤버 엣지 provenance (같은 출처는 한 번만, 처음 나온 순서)"""
+        seen: Set[Tuple[Any, ...]] = set()
+        result: List[Provenance] = []
+        for e in self.iter_member_edges():
+            for p in e.provenances:
+                key = (p.origin_file, p.origin_line, p.tool_stage, p.confidence)
+                if key not in seen:
+                    seen.add(key)
+                    result.append(p)
+        return result
+
 
 
 @dataclass
@@ -220,9 +340,16 @@ def make_superedge_canonical_name(se: SuperEdge, super_nodes: Dict[str, SuperNod
     return f"{src} -> {dst}"
 
 
+_RELATION_DISPLAY_NAMES = {r: r.value.replace("Relation", "") for r in RelationType}
+
+
+_RELATION_BY_BIT = {bit: r for r, bit in _RELATION_BITS.items()}
+
+
 def make_superedge_display_name(se: SuperEdge) -> str:
-    if len(se.relation_types) == 1:
-        return next(iter(se.relation_types)).value.replace("Relation", "")
+    relation = _RELATION_BY_BIT.get(se.relation_mask)
+    if relation is not None:
+        return _RELATION_DISPLAY_NAMES[relation]
     return "Multiple Signals"
 
 
@@ -406,6 +533,26 @@ def select_policy_map(context: GraphContext) -> dict[GraphViewType, dict[EntityC
         return POLICY_MAP_DESIGN
 
 
+# 정책 맵에 없는 엔티티 / testbench 요소
+_ELIMINATE_POLICY = NodePolicy(NodeAction.ELIMINATE, SuperClass.ELIMINATED)
+# 시뮬레이션에서 보존하는 클럭/리셋 생성기
+_SIM_GENERATOR_POLICY = NodePolicy(NodeAction.PROMOTE, SuperClass.ATOMIC)
+
+
+def _is_testbench_hier(hier_path: str) -> bool:
+    lowered = hier_path.lower()
+    return "testbench" in lowered or "sim" in lowered
+
+
+def _is_sim_generator(node: DKGNode) -> bool:
+    name = node.local_name.lower()
+    return (
+        name.startswith("clk_gen") or
+        name.startswith("reset_gen") or
+        "initial" in node.attributes.get("verilog_construct", "").lower()
+    )
+
+
 def get_node_policy(
     node: DKGNode,
     view: GraphViewType,
@@ -435,36 +582,122 @@ def get_node_policy(
     view_policies = policy_map.get(view, {})
     
     # 3. 엔티티 클래스에 따른 기본 정책
-    base_policy = view_policies.get(
-        node.entity_class,
-        NodePolicy(NodeAction.ELIMINATE, SuperClass.ELIMINATED)
-    )
+    base_policy = view_policies.get(node.entity_class, _ELIMINATE_POLICY)
     
     # 4. 속성 기반 동적 오버라이딩 (Task 12의 핵심)
     # Design 모드에서: testbench 관련 요소는 강제 제거
     if context == GraphContext.DESIGN:
-        is_testbench = (
-            node.local_name.lower().startswith("tb_") or
-            "testbench" in node.hier_path.lower() or
-            "sim" in node.hier_path.lower()
-        )
-        if is_testbench:
-            return NodePolicy(NodeAction.ELIMINATE, SuperClass.ELIMINATED)
+        if node.local_name.lower().startswith("tb_") or _is_testbench_hier(node.hier_path):
+            return _ELIMINATE_POLICY
     
-    # Simulation 모드에서: 시뮬레이션 스큨러러스 생성기는 보존
+    # Simulation 모드에서: 클럭/리셋 생성기는 Atomic으로 상향
     if context == GraphContext.SIMULATION:
-        is_important_for_sim = (
-            node.local_name.lower().startswith("clk_gen") or
-            node.local_name.lower().startswith("reset_gen") or
-            "initial" in node.attributes.get("verilog_construct", "").lower()
-        )
-        if is_important_for_sim and base_policy.action == NodeAction.MERGE:
-            # 클럭/리셋 생성기는 Atomic으로 상향
-            return NodePolicy(NodeAction.PROMOTE, SuperClass.ATOMIC)
+        if base_policy.action == NodeAction.MERGE and _is_sim_generator(node):
+            return _SIM_GENERATOR_POLICY
     
     return base_policy
 
 
+def build_policy_table(
+    nodes: Dict[str, DKGNode],
+    view: GraphViewType,
+    context: GraphContext = GraphContext.DESIGN,
+) -> Dict[str, NodePolicy]:
+    """모든 노드의 정책을 한 번에 계산 (get_node_policy와 같은 결과)"""
+    cache = ViewBuildCache(nodes, {})
+    return dict(zip(cache.node_ids, cache.policies(view, context)))
+
+
+class ViewBuildCache:
+    """
+    여러 뷰/컨텍스트 빌드가 공유하는 정수 인덱스 배열.
+
+    - 노드 순서 / 엔티티 클래스 / 엣지 양 끝 노드 인덱스는 한 번만 구축
+    - testbench, 시뮬레이션 생성기 판정은 처음 필요한 컨텍스트에서 한 번만 계산
+      (testbench 판정은 hier_path별로 한 번)
+    - (view, context)별 정책 리스트는 엔티티 클래스 표 조회 + 위 플래그로 만들고 캐싱
+    """
+
+    def __init__(self, nodes: Dict[str, DKGNode], edges: Dict[str, DKGEdge]):
+        self.nodes = nodes
+        self.node_ids: List[str] = list(nodes)
+        self.node_index: Dict[str, int] = {nid: i for i, nid in enumerate(self.node_ids)}
+        self.entity_classes: List[EntityClass] = [n.entity_class for n in nodes.values()]
+
+        node_index = self.node_index
+        self.edge_list: List[DKGEdge] = list(edges.values())
+        self.edge_src: List[int] = [node_index[e.src_node] for e in self.edge_list]
+        self.edge_dst: List[int] = [node_index[e.dst_node] for e in self.edge_list]
+
+        self._testbench: Optional[bytearray] = None
+        self._sim_generator: Optional[bytearray] = None
+        self._policies: Dict[Tuple[GraphViewType, GraphContext], List[NodePolicy]] = {}
+
+    def policies(self, view: GraphViewType, context: GraphContext) -> List[NodePolicy]:
+        """노드 인덱스 순서의 정책 리스트"""
+        key = (view, context)
+        table = self._policies.get(key)
+        if table is not None:
+            return table
+
+        view_policies = select_policy_map(context).get(view, {})
+        table = [view_policies.get(cls, _ELIMINATE_POLICY) for cls in self.entity_classes]
+        if context == GraphContext.DESIGN:
+            for i, is_testbench in enumerate(self._get_testbench()):
+                if is_testbench:
+                    table[i] = _ELIMINATE_POLICY
+        elif context == GraphContext.SIMULATION:
+            sim_generator = self._get_sim_generator()
+            for i, policy in enumerate(table):
+                if sim_generator[i] and policy.action == NodeAction.MERGE:
+                    table[i] = _SIM_GENERATOR_POLICY
+
+        self._policies[key] = table
+        return table
+
+    def _get_testbench(self) -> bytearray:
+        if self._testbench is None:
+            hiers: Dict[str, bool] = {}
+            flags = bytearray(len(self.node_ids))
+            for i, node in enumerate(self.nodes.values()):
+                is_testbench = hiers.get(node.hier_path)
+                if is_testbench is None:
+                    is_testbench = hiers[node.hier_path] = _is_testbench_hier(node.hier_path)
+                if is_testbench or node.local_name[:3].lower() == "tb_":
+                    flags[i] = 1
+            self._testbench = flags
+        return self._testbench
+
+    def _get_sim_generator(self) -> bytearray:
+        if self._sim_generator is None:
+            self._sim_generator = bytearray(
+                1 if _is_sim_generator(node) else 0 for node in self.nodes.values()
+            )
+        return self._sim_generator
+
+
+@dataclass
+class SuperGraphDelta:
+    """
+    apply_changes 한 번의 결과.
+    멤버가 그대로라 ID가 유지된 SuperNode/SuperEdge는 added/removed에 들어가지 않습니다.
+    """
+
+    added_nodes: List[str] = field(default_factory=list)
+    removed_nodes: List[str] = field(default_factory=list)
+    rewritten_edges: List[Tuple[str, str]] = field(default_factory=list)
+    removed_edges: List[Tuple[str, str]] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.added_nodes or self.removed_nodes or self.rewritten_edges or self.removed_edges)
+
+
+# 정책 / 영역 판정에 쓰이는 노드 필드 (나머지 필드 갱신은 SuperGraph 구조와 무관)
+_STRUCTURAL_NODE_FIELDS = frozenset({"entity_class", "hier_path", "local_name", "attributes"})
+# SuperEdge 집계(relation/flow 마스크)에 쓰이는 엣지 필드 (provenance는 조회 때 멤버 엣지에서 읽음)
+_STRUCTURAL_EDGE_FIELDS = frozenset({"relation_type", "flow_type"})
+
+
 class ViewBuilder:
     def __init__(
         self,
@@ -472,171 +705,273 @@ class ViewBuilder:
         edges: Dict[str, DKGEdge],
         view: GraphViewType,
         context: GraphContext = GraphContext.DESIGN,
+        regions: Optional[Dict[str, str]] = None,
+        cache: Optional[ViewBuildCache] = None,
+        physical: Optional[PhysicalModel] = None,
     ):
         self.nodes = nodes
         self.edges = edges
         self.view = view
         self.context = context
+        # Physical 뷰의 영역 계산용 (증분 갱신 때 노드 하나씩 다시 판정)
+        self.physical = physical
+        # Physical 뷰의 노드 → 영역(pblock) 이름. 없으면 노드 attributes로 계산
+        # (증분 갱신이 수정하므로 다른 뷰와 공유하지 않도록 복사)
+        if regions is None and view == GraphViewType.Physical:
+            regions = self._get_physical().node_regions()
+        self.regions: Dict[str, str] = dict(regions) if regions else {}
+        # 다른 뷰와 공유하는 인덱스 배열 (MultiViewBuilder가 넘김)
+        self.cache = cache
 
         self.node_to_super: Dict[str, str] = {}
         self.super_nodes: Dict[str, SuperNode] = {}
         self.super_edges: Dict[Tuple[str, str], SuperEdge] = {}
+        # SuperEdge 멤버 엣지 ID 배열 (이 뷰의 SuperEdge가 공유)
+        self.edge_members = SuperEdgeMembers(edges)
+
+        # 증분 갱신 상태 (첫 apply_changes 때 구축)
+        self._node_policies: Optional[Dict[str, NodePolicy]] = None
+        self._incident: Optional[Dict[str, Set[Tuple[str, str]]]] = None
+        self._region_super: Optional[Dict[str, str]] = None
+
+    def _get_cache(self) -> ViewBuildCache:
+        if self.cache is None:
+            self.cache = ViewBuildCache(self.nodes, self.edges)
+        return self.cache
+
+    def _get_policies(self) -> List[NodePolicy]:
+        """노드 인덱스 순서의 정책 (캐시에서 (view, context)당 한 번 계산)"""
+        return self._get_cache().policies(self.view, self.context)
+
+    def _get_physical(self) -> PhysicalModel:
+        if self.physical is None:
+            self.physical = PhysicalModel(self.nodes, self.edges)
+        return self.physical
+
+    # ========================================================================
+    # SuperNode / SuperEdge Construction
+    # ========================================================================
+
+    def _region_node(self, region: str, component: Set[str]) -> SuperNode:
+        sn = SuperNode(
+            node_id=make_supernode_id(
+                view=self.view,
+                super_class=SuperClass.CONSTRAINT_GROUP,
+                member_node_ids=component,
+                policy_version="v2",
+            ),
+            super_class=SuperClass.CONSTRAINT_GROUP,
+            member_nodes=component,
+            member_edges=set(),
+            aggregated_attrs={"region": region},
+        )
+        sn.canonical_name = f"{region} : {SuperClass.CONSTRAINT_GROUP.value}"
+        sn.display_name = region
+        return sn
+
+    def _promoted_node(self, n: DKGNode, super_class: SuperClass) -> SuperNode:
+        sn = SuperNode(
+            node_id=f"SN_{n.node_id}",
+            super_class=super_class,
+            member_nodes={n.node_id},
+            member_edges=set(),
+            provenances=list(n.provenances),
+        )
+        sn.canonical_name = make_supernode_canonical_name(sn, self.nodes)
+        sn.display_name = make_supernode_display_name(sn)
+        return sn
+
+    def _merged_node(self, super_class: SuperClass, component: Set[str]) -> SuperNode:
+        sn = SuperNode(
+            node_id=make_supernode_id(
+                view=self.view,
+                super_class=super_class,
+                member_node_ids=component,
+                policy_version="v2",
+            ),
+            super_class=super_class,
+            member_nodes=component,
+            member_edges=set(),
+        )
+        sn.canonical_name = make_supernode_canonical_name(sn, self.nodes)
+        sn.display_name = make_supernode_display_name(sn)
+        return sn
+
+    def _eliminated_node(self, nid: str, node_policy: NodePolicy) -> SuperNode:
+        if node_policy.action != NodeAction.ELIMINATE:
+            raise RuntimeError(f"Unassigned node in view {self.view}: {nid}")
+
+        eliminate_class = node_policy.super_class if node_policy.super_class is not None else SuperClass.ELIMINATED
 
-    def _neighbors_1hop(self, nid: str) -> Set[str]:
-        n = self.nodes[nid]
-        nbrs = set()
-        for eid in n.in_edges + n.out_edges:
-            e = self.edges[eid]
-            nbrs.add(e.src_node)
-            nbrs.add(e.dst_node)
-        return nbrs
+        sn = SuperNode(
+            node_id=make_supernode_id(
+                view=self.view,
+                super_class=eliminate_class,
+                member_node_ids={nid},
+                policy_version="v1",
+            ),
+            super_class=eliminate_class,
+            member_nodes={nid},
+            member_edges=set(),
+        )
+        sn.canonical_name = make_supernode_canonical_name(sn, self.nodes)
+        sn.display_name = make_supernode_display_name(sn)
+        return sn
+
+    def _super_edge(self, src_sn: str, dst_sn: str, members: List[DKGEdge]) -> SuperEdge:
+        rmask = 0
+        fmask = 0
+        for e in members:
+            rmask |= _RELATION_BITS[e.relation_type]
+            fmask |= _FLOW_BITS[e.flow_type]
+        start, count = self.edge_members.append([e.edge_id for e in members])
+        se = SuperEdge(
+            edge_id=make_superedge_id(src_sn, dst_sn, set()),
+            src_node=src_sn,
+            dst_node=dst_sn,
+            members=self.edge_members,
+            start=start,
+            edge_count=count,
+            relation_mask=rmask,
+            flow_mask=fmask,
+        )
+        se.canonical_name = make_superedge_canonical_name(se, self.super_nodes)
+        se.display_name = make_superedge_display_name(se)
+        return se
+
+    # ========================================================================
+    # Build Cycles
+    # ========================================================================
+
+    def cycle0_group_regions(self) -> None:
+        """Physical 뷰: 같은 pblock에 속한 노드를 엔티티 클래스와 무관하게 하나로 묶음"""
+        if self.view != GraphViewType.Physical or not self.regions:
+            return
+
+        groups: Dict[str, Set[str]] = {}
+        for nid, region in self.regions.items():
+            if nid in self.nodes:
+                groups.setdefault(region, set()).add(nid)
+
+        for region, component in groups.items():
+            sn = self._region_node(region, component)
+            self.super_nodes[sn.node_id] = sn
+            for n in component:
+                self.node_to_super[n] = sn.node_id
 
     def cycle1_promote(self) -> None:
-        for n in self.nodes.values():
-            node_policy = get_node_policy(n, self.view, self.context)
+        policies = self._get_policies()
+        for n, node_policy in zip(self.nodes.values(), policies):
+            if n.node_id in self.node_to_super:
+                continue
             if node_policy.action != NodeAction.PROMOTE:
                 continue
             if node_policy.super_class is None:
                 continue
 
-            sn = SuperNode(
-                node_id=f"SN_{n.node_id}",
-                super_class=node_policy.super_class,
-                member_nodes={n.node_id},
-                member_edges=set(),
-                provenances=list(n.provenances),
-            )
-            sn.canonical_name = make_supernode_canonical_name(sn, self.nodes)
-            sn.display_name = make_supernode_display_name(sn)
+            sn = self._promoted_node(n, node_policy.super_class)
             self.super_nodes[sn.node_id] = sn
             self.node_to_super[n.node_id] = sn.node_id
 
     def cycle2_merge(self) -> None:
-        # 각 노드가 머지될 super_class 결정
-        node_merge_class: Dict[str, SuperClass] = {}
-        for nid, n in self.nodes.items():
-            node_policy = get_node_policy(n, self.view, self.context)
-            if node_policy.action == NodeAction.MERGE and node_policy.super_class is not None:
-                node_merge_class[nid] = node_policy.super_class
-        
-        merge_candidates = set(node_merge_class.keys())
-        visited: Set[str] = set()
-
-        for nid in merge_candidates:
-            if nid in visited:
+        """
+        같은 merge 클래스 노드끼리 이어진 연결 요소를 하나의 SuperNode로.
+
+        노드 인덱스별 merge 클래스(후보가 아니면 None)를 두고, 양 끝이 같은 클래스인
+        엣지마다 union-find로 합칩니다 (경로 반감 + 크기 기준 합치기). 엣지를 한 번만 훑습니다.
+        """
+        cache = self._get_cache()
+        node_ids = cache.node_ids
+        assigned = self.node_to_super
+        classes: List[Optional[SuperClass]] = [
+            policy.super_class
+            if policy.action == NodeAction.MERGE and node_ids[i] not in assigned
+            else None
+            for i, policy in enumerate(self._get_policies())
+        ]
+
+        parent = list(range(len(node_ids)))
+        size = [1] * len(node_ids)
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for u, v in zip(cache.edge_src, cache.edge_dst):
+            cls = classes[u]
+            if cls is None or cls is not classes[v]:
                 continue
-
-            target_class = node_merge_class[nid]
-            stack = [nid]
-            component: Set[str] = set()
-
-            while stack:
-                cur = stack.pop()
-                if cur in visited or cur not in merge_candidates:
-                    continue
-                # 같은 super_class를 가진 노드만 처리
-                if node_merge_class[cur] != target_class:
-                    continue
-
-                visited.add(cur)
-                component.add(cur)
-
-                for nb in self._neighbors_1hop(cur):
-                    if nb in merge_candidates and node_merge_class.get(nb) == target_class:
-                        stack.append(nb)
-
-            if not component:
+            ru, rv = find(u), find(v)
+            if ru == rv:
                 continue
-
-            sn_id = make_supernode_id(
-                view=self.view,
-                super_class=target_class,
-                member_node_ids=component,
-                policy_version="v2",
-            )
-
-            sn = SuperNode(
-                node_id=sn_id,
-                super_class=target_class,
-                member_nodes=component,
-                member_edges=set(),
-            )
-            sn.canonical_name = make_supernode_canonical_name(sn, self.nodes)
-            sn.display_name = make_supernode_display_name(sn)
-
+            if size[ru] < size[rv]:
+                ru, rv = rv, ru
+            parent[rv] = ru
+            size[ru] += size[rv]
+
+        components: Dict[int, Set[str]] = {}
+        for i, cls in enumerate(classes):
+            if cls is None:
+                continue
+            root = find(i)
+            component = components.get(root)
+            if component is None:
+                components[root] = {node_ids[i]}
+            else:
+                component.add(node_ids[i])
+
+        for root, component in components.items():
+            sn = self._merged_node(classes[root], component)
             self.super_nodes[sn.node_id] = sn
             for n in component:
                 self.node_to_super[n] = sn.node_id
 
     def cycle2_5_eliminate(self) -> None:
-        for nid, n in self.nodes.items():
+        policies = self._get_policies()
+        for nid, node_policy in zip(self.nodes, policies):
             if nid in self.node_to_super:
                 continue
 
-            node_policy = get_node_policy(n, self.view, self.context)
-            if node_policy.action != NodeAction.ELIMINATE:
-                raise RuntimeError(f"Unassigned node in view {self.view}: {nid}")
-
-            eliminate_class = node_policy.super_class if node_policy.super_class is not None else SuperClass.ELIMINATED
-
-            sn = SuperNode(
-                node_id=make_supernode_id(
-                    view=self.view,
-                    super_class=eliminate_class,
-                    member_node_ids={nid},
-                    policy_version="v1",
-                ),
-                super_class=eliminate_class,
-                member_nodes={nid},
-                member_edges=set(),
-            )
-            sn.canonical_name = make_supernode_canonical_name(sn, self.nodes)
-            sn.display_name = make_supernode_display_name(sn)
-
+            sn = self._eliminated_node(nid, node_policy)
             self.super_nodes[sn.node_id] = sn
             self.node_to_super[nid] = sn.node_id
 
     def cycle3_rewrite_edges(self) -> None:
-        for e in self.edges.values():
-            src_sn = self.node_to_super[e.src_node]
-            dst_sn = self.node_to_super[e.dst_node]
+        """엣지를 (src SuperNode, dst SuperNode) 쌍으로 묶은 뒤 쌍마다 SuperEdge를 한 번에 생성"""
+        cache = self._get_cache()
+        node_to_super = self.node_to_super
+        super_of = [node_to_super[nid] for nid in cache.node_ids]
+        super_nodes = self.super_nodes
+        grouped: Dict[Tuple[str, str], List[DKGEdge]] = {}
+
+        for e, u, v in zip(cache.edge_list, cache.edge_src, cache.edge_dst):
+            src_sn = super_of[u]
+            dst_sn = super_of[v]
 
             if src_sn == dst_sn:
-                self.super_nodes[src_sn].member_edges.add(e.edge_id)
+                super_nodes[src_sn].member_edges.add(e.edge_id)
                 continue
 
             key = (src_sn, dst_sn)
-            if key not in self.super_edges:
-                self.super_edges[key] = SuperEdge(
-                    edge_id=make_superedge_id(src_sn, dst_sn, set()),
-                    src_node=src_sn,
-                    dst_node=dst_sn,
-                    member_edges=set(),
-                    member_nodes=set(),
-                    relation_types=set(),
-                    flow_types=set(),
-                    provenances=[],
-                )
-                self.super_edges[key].canonical_name = make_superedge_canonical_name(
-                    self.super_edges[key],
-                    self.super_nodes,
-                )
-                self.super_edges[key].display_name = make_superedge_display_name(
-                    self.super_edges[key],
-                )
-
-            se = self.super_edges[key]
-            se.member_edges.add(e.edge_id)
-            se.member_nodes.update({e.src_node, e.dst_node})
-            se.relation_types.add(e.relation_type)
-            se.flow_types.add(e.flow_type)
-            se.provenances.extend(e.provenances)
+            bucket = grouped.get(key)
+            if bucket is None:
+                grouped[key] = [e]
+            else:
+                bucket.append(e)
+
+        for (src_sn, dst_sn), members in grouped.items():
+            self.super_edges[(src_sn, dst_sn)] = self._super_edge(src_sn, dst_sn, members)
 
     def build(self) -> SuperGraph:
-        self.cycle1_promote()
-        self.cycle2_merge()
-        self.cycle2_5_eliminate()
-        self.cycle3_rewrite_edges()
+        with gc_paused():
+            self._get_policies()
+            self.cycle0_group_regions()
+            self.cycle1_promote()
+            self.cycle2_merge()
+            self.cycle2_5_eliminate()
+            self.cycle3_rewrite_edges()
 
         return SuperGraph(
             super_nodes=self.super_nodes,
@@ -644,6 +979,430 @@ class ViewBuilder:
             node_to_super=self.node_to_super,
         )
 
+    # ========================================================================
+    # Incremental Maintenance
+    # ========================================================================
+    # build() 이후 그래프가 바뀌면 영향받은 SuperNode만 해체 후 다시 배정하고,
+    # 그 SuperNode에 닿는 SuperEdge만 다시 씁니다. SuperGraph 딕셔너리는 제자리에서
+    # 수정하므로 build()가 돌려준 SuperGraph 참조는 항상 최신입니다.
+    #
+    # - 정책/영역이 그대로인 노드의 갱신은 무시
+    # - 바뀐 노드의 기존 SuperNode, 같은 merge 클래스 이웃의 SuperNode, 새 영역 그룹을 해체
+    # - 양 끝이 같은 merge 클래스인 엣지 추가/삭제는 두 SuperNode를 해체 (합치기/쪼개기)
+    #   그 밖의 엣지 변경은 해당 SuperEdge(또는 내부 엣지 집합)만 수정
+    # - SN_/SE_ ID는 멤버 / 양 끝으로 정해지므로 멤버가 같으면 ID와 analysis가 유지됨
+    # ========================================================================
+
+    def subscribe(self, updater: GraphUpdater) -> None:
+        """updater의 필드 갱신 / 노드·엣지 추가·삭제를 받아 SuperGraph를 증분 유지"""
+        updater.subscribe(self.on_graph_change)
+
+    def unsubscribe(self, updater: GraphUpdater) -> None:
+        updater.unsubscribe(self.on_graph_change)
+
+    def on_graph_change(self, change: GraphChange) -> None:
+        kind = change.kind
+        if kind == ChangeKind.NODE_FIELD:
+            if change.field_name in _STRUCTURAL_NODE_FIELDS:
+                self.apply_changes(node_ids=change.ids)
+        elif kind == ChangeKind.EDGE_FIELD:
+            if change.field_name in _STRUCTURAL_EDGE_FIELDS:
+                self.apply_changes(changed_edges=change.ids)
+        elif kind in (ChangeKind.NODE_ADDED, ChangeKind.NODE_REMOVED):
+            self._drop_cache()
+            self.apply_changes(node_ids=change.ids)
+        elif kind in (ChangeKind.EDGE_ADDED, ChangeKind.EDGE_REMOVED):
+            self._drop_cache()
+            self.apply_changes(edge_endpoints=change.endpoints)
+
+    def _drop_cache(self) -> None:
+        """토폴로지가 바뀌면 인덱스 배열은 무효 (정책 표는 그 전에 노드 id 기준으로 옮겨 둠)"""
+        self._get_node_policies()
+        self.cache = None
+
+    def refresh_regions(self) -> SuperGraphDelta:
+        """pblock 범위가 바뀐 뒤(Physical 뷰): 영역이 달라진 노드만 다시 배정"""
+        if self.view != GraphViewType.Physical:
+            return SuperGraphDelta()
+        physical = self._get_physical()
+        physical.invalidate()
+        current = physical.node_regions()
+        old = self.regions
+        changed = [nid for nid, region in current.items() if old.get(nid) != region]
+        changed.extend(nid for nid in old if nid not in current)
+        return self.apply_changes(node_ids=changed)
+
+    def apply_changes(
+        self,
+        node_ids: Iterable[str] = (),
+        edge_endpoints: Optional[Dict[str, Tuple[str, str]]] = None,
+        changed_edges: Iterable[str] = (),
+    ) -> SuperGraphDelta:
+        """
+        바뀐 노드(필드 갱신 / 추가 / 삭제)와 추가·삭제된 엣지(edge_id → (src, dst)),
+        집계 필드가 바뀐 엣지를 SuperGraph에 반영.
+        """
+        delta = SuperGraphDelta()
+        policies = self._get_node_policies()
+        node_to_super = self.node_to_super
+
+        # 1) 정책 / 영역 재판정: 달라진 노드만 다시 배정 대상
+        reassign: List[str] = []
+        dissolve: Set[str] = set()
+        for nid in dict.fromkeys(node_ids):
+            node = self.nodes.get(nid)
+            old_sn = node_to_super.get(nid)
+            if node is None:
+                policies.pop(nid, None)
+                self.regions.pop(nid, None)
+                if old_sn is not None:
+                    dissolve.add(old_sn)
+                continue
+
+            policy = get_node_policy(node, self.view, self.context)
+            region = self._get_physical().region_of(nid) if self.view == GraphViewType.Physical else None
+            if old_sn is not None and policy == policies.get(nid) and region == self.regions.get(nid):
+                continue
+            policies[nid] = policy
+            if region is None:
+                self.regions.pop(nid, None)
+            else:
+                self.regions[nid] = region
+            reassign.append(nid)
+            if old_sn is not None:
+                dissolve.add(old_sn)
+
+        # 2) 새 클래스로 합쳐질 이웃 요소, 새 영역 그룹도 해체
+        region_super = self._get_region_super()
+        for nid in reassign:
+            region = self.regions.get(nid)
+            if region is not None:
+                if region in region_super:
+                    dissolve.add(region_super[region])
+                continue
+            cls = self._merge_class(nid)
+            if cls is None:
+                continue
+            node = self.nodes[nid]
+            for eid in node.in_edges + node.out_edges:
+                e = self.edges[eid]
+                other = e.dst_node if e.src_node == nid else e.src_node
+                if other in node_to_super and self._merge_class(other) is cls:
+                    dissolve.add(node_to_super[other])
+
+        # 3) 엣지 추가/삭제: 같은 merge 클래스 사이면 두 요소 해체, 아니면 SuperEdge만 수정
+        patched: List[str] = list(dict.fromkeys(changed_edges))
+        for eid, (u, v) in (edge_endpoints or {}).items():
+            su, sv = node_to_super.get(u), node_to_super.get(v)
+            if su is None or sv is None:
+                continue
+            cls = self._merge_class(u)
+            if cls is not None and cls is self._merge_class(v):
+                dissolve.update((su, sv))
+            else:
+                patched.append(eid)
+
+        # 4) 해체한 SuperNode의 멤버 + 다시 배정할 노드 → 새 SuperNode
+        old_nodes, old_edges = self._dissolve(dissolve)
+        members: Set[str] = set(reassign)
+        for sn in old_nodes.values():
+            members.update(n for n in sn.member_nodes if n in self.nodes)
+        new_ids = self._reassign(members, old_nodes) if members else []
+
+        # 5) 새 SuperNode에 닿는 엣지만 다시 묶어 SuperEdge 재작성
+        rewritten = self._rewrite_incident_edges(members, old_edges)
+        for eid in patched:
+            e = self.edges.get(eid)
+            if e is not None:
+                u, v = e.src_node, e.dst_node
+            elif edge_endpoints and eid in edge_endpoints:
+                u, v = edge_endpoints[eid]
+            else:
+                continue
+            if u in members or v in members:
+                continue
+            key = self._patch_edge(eid, u, v)
+            if key is not None:
+                rewritten.add(key)
+
+        if self.edge_members.needs_compaction():
+            self.edge_members = self.edge_members.compacted(self.super_edges.values())
+
+        delta.added_nodes = [sn_id for sn_id in new_ids if sn_id not in old_nodes]
+        delta.removed_nodes = [sn_id for sn_id in old_nodes if sn_id not in self.super_nodes]
+        delta.rewritten_edges = [key for key in rewritten if key in self.super_edges]
+        delta.removed_edges = [
+            key for key in set(old_edges) | rewritten if key not in self.super_edges
+        ]
+        return delta
+
+    def _get_node_policies(self) -> Dict[str, NodePolicy]:
+        """build 때의 노드별 정책 (이후 apply_changes가 갱신)"""
+        if self._node_policies is None:
+            if self.cache is not None:
+                self._node_policies = dict(zip(self.cache.node_ids, self._get_policies()))
+            else:
+                self._node_policies = {
+                    nid: get_node_policy(n, self.view, self.context)
+                    for nid, n in self.nodes.items()
+                }
+        return self._node_policies
+
+    def _get_incident(self) -> Dict[str, Set[Tuple[str, str]]]:
+        """SuperNode → 닿는 SuperEdge 키"""
+        if self._incident is None:
+            incident: Dict[str, Set[Tuple[str, str]]] = {}
+            for key in self.super_edges:
+                incident.setdefault(key[0], set()).add(key)
+                incident.setdefault(key[1], set()).add(key)
+            self._incident = incident
+        return self._incident
+
+    def _get_region_super(self) -> Dict[str, str]:
+        """영역 이름 → 영역 그룹 SuperNode"""
+        if self._region_super is None:
+            self._region_super = {
+                sn.aggregated_attrs["region"]: sn_id
+                for sn_id, sn in self.super_nodes.items()
+                if "region" in sn.aggregated_attrs
+            }
+        return self._region_super
+
+    def _merge_class(self, nid: str) -> Optional[SuperClass]:
+        """cycle2_merge 후보면 merge 클래스 (영역 그룹에 속하면 후보가 아님)"""
+        if nid in self.regions:
+            return None
+        policy = self._get_node_policies().get(nid)
+        if policy is None or policy.action != NodeAction.MERGE:
+            return None
+        return policy.super_class
+
+    def _dissolve(
+        self,
+        sn_ids: Set[str],
+    ) -> Tuple[Dict[str, SuperNode], Dict[Tuple[str, str], SuperEdge]]:
+        """SuperNode와 닿는 SuperEdge 제거 (해체한 SuperNode, SuperEdge를 돌려줌)"""
+        region_super = self._get_region_super()
+        incident = self._get_incident()
+        old_nodes: Dict[str, SuperNode] = {}
+        old_edges: Dict[Tuple[str, str], SuperEdge] = {}
+        for sn_id in sn_ids:
+            sn = self.super_nodes.pop(sn_id, None)
+            if sn is None:
+                continue
+            old_nodes[sn_id] = sn
+            region = sn.aggregated_attrs.get("region")
+            if region is not None and region_super.get(region) == sn_id:
+                del region_super[region]
+            for n in sn.member_nodes:
+                if self.node_to_super.get(n) == sn_id:
+                    del self.node_to_super[n]
+            for key in incident.pop(sn_id, ()):
+                se = self.super_edges.pop(key, None)
+                if se is None:
+                    continue
+                self.edge_members.release(se)
+                old_edges[key] = se
+                other = key[1] if key[0] == sn_id else key[0]
+                if other in incident:
+                    incident[other].discard(key)
+        return old_nodes, old_edges
+
+    def _reassign(self, members: Set[str], old_nodes: Dict[str, SuperNode]) -> List[str]:
+        """cycle0 ~ cycle2_5를 members에만 적용. 만든 SuperNode ID 목록"""
+        policies = self._get_node_policies()
+        nodes = self.nodes
+        created: List[SuperNode] = []
+
+        groups: Dict[str, Set[str]] = {}
+        candidates: Dict[str, SuperClass] = {}
+        for nid in members:
+            region = self.regions.get(nid)
+            if region is not None:
+                groups.setdefault(region, set()).add(nid)
+                continue
+            policy = policies[nid]
+            if policy.action == NodeAction.PROMOTE and policy.super_class is not None:
+                created.append(self._promoted_node(nodes[nid], policy.super_class))
+            elif policy.action == NodeAction.MERGE:
+                candidates[nid] = policy.super_class
+            else:
+                created.append(self._eliminated_node(nid, policy))
+
+        for region, component in groups.items():
+            created.append(self._region_node(region, component))
+
+        # merge 후보끼리 union-find (같은 클래스 이웃은 2)에서 이미 해체되어 members 안에 있음)
+        parent = {nid: nid for nid in candidates}
+
+        def find(x: str) -> str:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for nid, cls in candidates.items():
+            for eid in nodes[nid].out_edges:
+                v = self.edges[eid].dst_node
+                if candidates.get(v) is cls:
+                    ru, rv = find(nid), find(v)
+                    if ru != rv:
+                        parent[rv] = ru
+
+        components: Dict[str, Set[str]] = {}
+        for nid in candidates:
+            components.setdefault(find(nid), set()).add(nid)
+        for root, component in components.items():
+            created.append(self._merged_node(candidates[root], component))
+
+        region_super = self._get_region_super()
+        for sn in created:
+            old = old_nodes.get(sn.node_id)
+            if old is not None:
+                sn.analysis = old.analysis
+            self.super_nodes[sn.node_id] = sn
+            for n in sn.member_nodes:
+                self.node_to_super[n] = sn.node_id
+            if "region" in sn.aggregated_attrs:
+                region_super[sn.aggregated_attrs["region"]] = sn.node_id
+        return [sn.node_id for sn in created]
+
+    def _rewrite_incident_edges(
+        self,
+        members: Set[str],
+        old_edges: Dict[Tuple[str, str], SuperEdge],
+    ) -> Set[Tuple[str, str]]:
+        """members에 닿는 엣지를 다시 묶어 SuperEdge / 내부 엣지 집합 생성"""
+        node_to_super = self.node_to_super
+        grouped: Dict[Tuple[str, str], List[DKGEdge]] = {}
+        seen: Set[str] = set()
+        for nid in members:
+            node = self.nodes[nid]
+            for eid in node.in_edges + node.out_edges:
+                if eid in seen:
+                    continue
+                seen.add(eid)
+                e = self.edges[eid]
+                src_sn = node_to_super[e.src_node]
+                dst_sn = node_to_super[e.dst_node]
+                if src_sn == dst_sn:
+                    self.super_nodes[src_sn].member_edges.add(eid)
+                else:
+                    grouped.setdefault((src_sn, dst_sn), []).append(e)
+
+        incident = self._get_incident()
+        for key, edges in grouped.items():
+            self._set_super_edge(key, edges, old_edges.get(key), incident)
+        return set(grouped)
+
+    def _patch_edge(self, eid: str, u: str, v: str) -> Optional[Tuple[str, str]]:
+        """엣지 하나를 기존 SuperEdge / 내부 엣지 집합에 더하거나 빼기"""
+        su, sv = self.node_to_super.get(u), self.node_to_super.get(v)
+        if su is None or sv is None:
+            return None
+        exists = eid in self.edges
+        if su == sv:
+            if exists:
+                self.super_nodes[su].member_edges.add(eid)
+            else:
+                self.super_nodes[su].member_edges.discard(eid)
+            return None
+
+        key = (su, sv)
+        old = self.super_edges.get(key)
+        member_ids = set(old.member_edge_ids()) if old is not None else set()
+        if exists:
+            member_ids.add(eid)
+        else:
+            member_ids.discard(eid)
+        members = [self.edges[m] for m in member_ids if m in self.edges]
+        incident = self._get_incident()
+        if members:
+            self._set_super_edge(key, members, old, incident)
+        elif old is not None:
+            del self.super_edges[key]
+            self.edge_members.release(old)
+            incident.get(su, set()).discard(key)
+            incident.get(sv, set()).discard(key)
+        return key
+
+    def _set_super_edge(
+        self,
+        key: Tuple[str, str],
+        members: List[DKGEdge],
+        old: Optional[SuperEdge],
+        incident: Dict[str, Set[Tuple[str, str]]],
+    ) -> None:
+        current = self.super_edges.get(key)
+        if current is not None:
+            self.edge_members.release(current)
+        se = self._super_edge(key[0], key[1], members)
+        if old is not None:
+            se.analysis = old.analysis
+        self.super_edges[key] = se
+        incident.setdefault(key[0], set()).add(key)
+        incident.setdefault(key[1], set()).add(key)
+
+
+class MultiViewBuilder:
+    """
+    여러 (view, context) SuperGraph를 한 번에 구축.
+
+    인덱스 배열, 엣지 양 끝 인덱스, testbench/생성기 판정, Physical 영역은 한 번만 계산해
+    모든 뷰가 공유하고, 결과는 (view, context) → SuperGraph 딕셔너리로 돌려주므로
+    뷰 전환은 딕셔너리 조회입니다. 뷰별 ViewBuilder는 builders에 남아 증분 갱신에 씁니다.
+
+    Usage:
+        multi = MultiViewBuilder(nodes, edges)
+        graphs = multi.build()
+        graphs[(GraphViewType.Physical, GraphContext.DESIGN)]
+        multi.builders[(GraphViewType.Physical, GraphContext.DESIGN)].subscribe(updater)
+    """
+
+    def __init__(
+        self,
+        nodes: Dict[str, DKGNode],
+        edges: Dict[str, DKGEdge],
+        views: Optional[List[GraphViewType]] = None,
+        contexts: Optional[List[GraphContext]] = None,
+        regions: Optional[Dict[str, str]] = None,
+        physical: Optional[PhysicalModel] = None,
+    ):
+        self.nodes = nodes
+        self.edges = edges
+        self.views = list(views) if views is not None else list(GraphViewType)
+        self.contexts = list(contexts) if contexts is not None else list(GraphContext)
+        self.regions = regions
+        self.physical = physical
+        self.builders: Dict[Tuple[GraphViewType, GraphContext], ViewBuilder] = {}
+
+    def build(self) -> Dict[Tuple[GraphViewType, GraphContext], SuperGraph]:
+        graphs: Dict[Tuple[GraphViewType, GraphContext], SuperGraph] = {}
+        with gc_paused():
+            cache = ViewBuildCache(self.nodes, self.edges)
+            regions = self.regions
+            if GraphViewType.Physical in self.views:
+                if self.physical is None:
+                    self.physical = PhysicalModel(self.nodes, self.edges)
+                if regions is None:
+                    regions = self.physical.node_regions()
+
+            for context in self.contexts:
+                for view in self.views:
+                    physical_view = view == GraphViewType.Physical
+                    builder = ViewBuilder(
+                        self.nodes,
+                        self.edges,
+                        view,
+                        context=context,
+                        regions=regions if physical_view else None,
+                        cache=cache,
+                        physical=self.physical if physical_view else None,
+                    )
+                    graphs[(view, context)] = builder.build()
+                    self.builders[(view, context)] = builder
+        return graphs
+
 
 # ============================================================================
 # Analysis Attachment Helper Functions
@@ -0,0 +1,292 @@
+"""
+Timing Corner Store: 멀티 코너/멀티 모드 타이밍 값 저장소
+
+DKGNode.slack / arrival_time / required_time, DKGEdge.delay / arrival_time은 값 하나만 담으므로
+여러 코너의 setup/hold 리포트를 적용하면 서로의 맥락을 덮어씁니다.
+
+이 저장소는 (corner, analysis) 조합마다 필드별 float 컬럼(array('d'))을 두고
+노드/엣지를 정수 handle로 인덱싱합니다. 값이 없는 칸은 NaN입니다.
+- 같은 칸에 여러 경로가 기록되면 분석 종류에 맞는 worst 방향으로 병합
+  (setup: slack/required 최소, arrival/delay 최대 / hold: slack/arrival/delay 최소, required 최대)
+- worst_*_column(): 선택한 코너/분석의 컬럼을 원소별로 병합한 worst 뷰
+- apply_worst(): setup worst는 기존 필드(DKGNode.slack 등), hold worst는 hold_* 필드에
+  GraphUpdater 배치 업데이트(ANALYZED)로 기록
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..core.graph import DKGEdge, DKGNode
+from ..pipeline.stages import FieldSource, ParsingStage
+from .graph_updater import GraphUpdater
+
+DEFAULT_CORNER = "default"
+
+SETUP = "setup"
+HOLD = "hold"
+
+# 저장하는 필드
+NODE_TIMING_FIELDS = ("slack", "arrival_time", "required_time")
+EDGE_TIMING_FIELDS = ("delay", "arrival_time")
+
+# 분석별로 값이 작을수록 나쁜 필드 (나머지는 클수록 나쁨)
+# setup은 늦게 도착할수록, hold는 일찍 도착할수록 위반에 가까움
+MIN_IS_WORST: Dict[str, frozenset] = {
+    SETUP: frozenset({"slack", "required_time"}),
+    HOLD: frozenset({"slack", "arrival_time", "delay"}),
+}
+
+# hold 값을 기록하는 DKGNode/DKGEdge 필드 접두어 (setup 값은 접두어 없는 기존 필드)
+HOLD_FIELD_PREFIX = "hold_"
+
+_NAN = float("nan")
+
+ColumnKey = Tuple[str, str]  # (corner, analysis)
+
+
+def worst_is_min(field_name: str, analysis: Optional[str]) -> bool:
+    """analysis의 worst 방향이 최소인지 (None = setup/hold 병합 뷰, setup 방향)"""
+    return field_name in MIN_IS_WORST.get(analysis or SETUP, MIN_IS_WORST[SETUP])
+
+
+def target_field(field_name: str, analysis: str) -> str:
+    """analysis 값을 기록할 DKGNode/DKGEdge 필드 이름 (hold → hold_*)"""
+    return HOLD_FIELD_PREFIX + field_name if analysis == HOLD else field_name
+
+
+def analysis_of(path_type: Optional[str]) -> str:
+    """
+    리포트 Path Type → 분석 종류.
+    예: "max" / "Setup (Max at Slow Process Corner)" → setup, "min" / "Hold (...)" → hold
+    """
+    text = (path_type or "").strip().lower()
+    if text.startswith("min") or text.startswith("hold"):
+        return HOLD
+    return SETUP
+
+
+class TimingCornerStore:
+    """
+    (corner, analysis)별 컬럼형 타이밍 값.
+
+    Usage:
+        store = TimingCornerStore(nodes, edges)
+        store.record_node(node_id, "ss_0p72v_125c", SETUP, "slack", -0.12)
+        worst_slack = store.worst_node_column("slack", analysis=SETUP)
+        store.apply_worst(updater)
+    """
+
+    def __init__(self, nodes: Dict[str, DKGNode], edges: Dict[str, DKGEdge]):
+        self.node_ids: List[str] = list(nodes)
+        self.edge_ids: List[str] = list(edges)
+        self.node_handles: Dict[str, int] = {nid: i for i, nid in enumerate(self.node_ids)}
+        self.edge_handles: Dict[str, int] = {eid: i for i, eid in enumerate(self.edge_ids)}
+
+        # (corner, analysis) → field → 컬럼
+        self.node_columns: Dict[ColumnKey, Dict[str, array]] = {}
+        self.edge_columns: Dict[ColumnKey, Dict[str, array]] = {}
+
+    @property
+    def corners(self) -> List[str]:
+        """기록된 코너 (등록 순서)"""
+        seen: Dict[str, None] = {}
+        for corner, _ in list(self.node_columns) + list(self.edge_columns):
+            seen.setdefault(corner, None)
+        return list(seen)
+
+    # ========================================================================
+    # Record
+    # ========================================================================
+
+    def record_node(
+        self, node_id: str, corner: str, analysis: str, field_name: str, value: float
+    ) -> None:
+        """노드 칸에 값 기록 (기존 값과 worst 방향으로 병합)"""
+        handle = self.node_handles.get(node_id)
+        if handle is not None:
+            column = self.node_column(corner, analysis, field_name)
+            _merge(column, handle, value, worst_is_min(field_name, analysis))
+
+    def record_edge(
+        self, edge_id: str, corner: str, analysis: str, field_name: str, value: float
+    ) -> None:
+        """엣지 칸에 값 기록 (기존 값과 worst 방향으로 병합)"""
+        handle = self.edge_handles.get(edge_id)
+        if handle is not None:
+            column = self.edge_column(corner, analysis, field_name)
+            _merge(column, handle, value, worst_is_min(field_name, analysis))
+
+    def node_column(self, corner: str, analysis: str, field_name: str) -> array:
+        """(corner, analysis, field) 노드 컬럼 (없으면 NaN으로 생성)"""
+        return _column(self.node_columns, (corner, analysis), field_name, len(self.node_ids))
+
+    def edge_column(self, corner: str, analysis: str, field_name: str) -> array:
+        """(corner, analysis, field) 엣지 컬럼 (없으면 NaN으로 생성)"""
+        return _column(self.edge_columns, (corner, analysis), field_name, len(self.edge_ids))
+
+    # ========================================================================
+    # Worst-of-Corners Views
+    # ========================================================================
+
+    def worst_node_column(
+        self,
+        field_name: str,
+        analysis: Optional[str] = None,
+        corners: Optional[Iterable[str]] = None,
+    ) -> array:
+        """선택한 코너/분석 컬럼의 원소별 worst (None이면 전체, analysis=None은 setup 방향 병합)"""
+        return _reduce_columns(
+            _select(self.node_columns, field_name, analysis, corners),
+            len(self.node_ids),
+            worst_is_min(field_name, analysis),
+        )
+
+    def worst_edge_column(
+        self,
+        field_name: str,
+        analysis: Optional[str] = None,
+        corners: Optional[Iterable[str]] = None,
+    ) -> array:
+        """선택한 코너/분석 컬럼의 원소별 worst (None이면 전체, analysis=None은 setup 방향 병합)"""
+        return _reduce_columns(
+            _select(self.edge_columns, field_name, analysis, corners),
+            len(self.edge_ids),
+            worst_is_min(field_name, analysis),
+        )
+
+    def node_value(
+        self, node_id: str, corner: str, analysis: str, field_name: str
+    ) -> Optional[float]:
+        """한 노드의 (corner, analysis) 값 (없으면 None)"""
+        columns = self.node_columns.get((corner, analysis))
+        handle = self.node_handles.get(node_id)
+        if not columns or field_name not in columns or handle is None:
+            return None
+        return _optional(columns[field_name][handle])
+
+    def edge_value(
+        self, edge_id: str, corner: str, analysis: str, field_name: str
+    ) -> Optional[float]:
+        """한 엣지의 (corner, analysis) 값 (없으면 None)"""
+        columns = self.edge_columns.get((corner, analysis))
+        handle = self.edge_handles.get(edge_id)
+        if not columns or field_name not in columns or handle is None:
+            return None
+        return _optional(columns[field_name][handle])
+
+    def apply_worst(
+        self,
+        updater: GraphUpdater,
+        analysis: Optional[str] = None,
+        corners: Optional[Iterable[str]] = None,
+        merge_analyses: bool = False,
+        origin_file: Optional[str] = None,
+    ) -> int:
+        """
+        worst-of-corners 값을 GraphUpdater 배치 업데이트(FieldSource.ANALYZED)로 기록.
+        값이 기록된 적 없는 노드/엣지는 건드리지 않으며, 우선순위가 더 높은 값
+        (DECLARED, USER_OVERRIDE)은 유지됩니다.
+
+        Args:
+            updater: 노드/엣지 필드를 갱신할 GraphUpdater (메타데이터/리스너 반영)
+            analysis: 기록할 분석 (None이면 setup과 hold 모두)
+            corners: 병합할 코너 (None이면 전체)
+            merge_analyses: True면 setup/hold를 구분하지 않고 병합해 기존 필드에만 기록
+                            (setup 방향 worst). 기본은 setup → 기존 필드, hold → hold_* 필드
+            origin_file: 메타데이터에 남길 출처 파일
+
+        Returns:
+            갱신된 (노드/엣지, 필드) 수
+        """
+        corners = list(corners) if corners is not None else None
+        if merge_analyses:
+            return self._write_worst(updater, None, corners, SETUP, origin_file)
+        return sum(
+            self._write_worst(updater, kind, corners, kind, origin_file)
+            for kind in ((SETUP, HOLD) if analysis is None else (analysis,))
+        )
+
+    def _write_worst(
+        self,
+        updater: GraphUpdater,
+        analysis: Optional[str],
+        corners: Optional[List[str]],
+        target: str,
+        origin_file: Optional[str],
+    ) -> int:
+        updated = 0
+        for field_name in NODE_TIMING_FIELDS:
+            updated += updater.batch_update_node_field(
+                target_field(field_name, target),
+                _present(self.worst_node_column(field_name, analysis, corners), self.node_ids),
+                FieldSource.ANALYZED, ParsingStage.TIMING, origin_file,
+            )
+        for field_name in EDGE_TIMING_FIELDS:
+            updated += updater.batch_update_edge_field(
+                target_field(field_name, target),
+                _present(self.worst_edge_column(field_name, analysis, corners), self.edge_ids),
+                FieldSource.ANALYZED, ParsingStage.TIMING, origin_file,
+            )
+        return updated
+
+
+# ============================================================================
+# Column Helpers
+# ============================================================================
+
+
+def _column(
+    columns: Dict[ColumnKey, Dict[str, array]], key: ColumnKey, field_name: str, size: int
+) -> array:
+    fields = columns.setdefault(key, {})
+    column = fields.get(field_name)
+    if column is None:
+        column = fields[field_name] = array("d", [_NAN]) * size
+    return column
+
+
+def _merge(column: array, handle: int, value: float, min_is_worst: bool) -> None:
+    current = column[handle]
+    if current != current or (value < current if min_is_worst else value > current):
+        column[handle] = value
+
+
+def _select(
+    columns: Dict[ColumnKey, Dict[str, array]],
+    field_name: str,
+    analysis: Optional[str],
+    corners: Optional[Iterable[str]],
+) -> List[array]:
+    wanted = set(corners) if corners is not None else None
+    return [
+        fields[field_name]
+        for (corner, kind), fields in columns.items()
+        if field_name in fields
+        and (analysis is None or kind == analysis)
+        and (wanted is None or corner in wanted)
+    ]
+
+
+def _reduce_columns(selected: Sequence[array], size: int, min_is_worst: bool) -> array:
+    """컬럼들을 원소별로 병합 (NaN은 값 없음으로 취급)"""
+    if not selected:
+        return array("d", [_NAN]) * size
+    result = array("d", selected[0])
+    pick = min if min_is_worst else max
+    for column in selected[1:]:
+        # NaN 비교는 항상 False이므로 "a != a"로 빈 칸을 먼저 걸러냄
+        result = array("d", [
+            b if a != a else a if b != b else pick(a, b)
+            for a, b in zip(result, column)
+        ])
+    return result
+
+
+def _present(column: array, ids: List[str]) -> Dict[str, float]:
+    """값이 있는 칸만 {id: 값} (배치 업데이트 입력)"""
+    return {ids[handle]: value for handle, value in enumerate(column) if value == value}
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if value != value else value
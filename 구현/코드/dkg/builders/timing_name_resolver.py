@@ -0,0 +1,254 @@
+"""
+Timing Name Resolver: 타이밍 리포트 이름 → DKG 노드
+
+타이밍 리포트(Vivado/PrimeTime)의 셀/핀 이름과 Yosys 기반 DKG 노드 이름은 형식이 다릅니다.
+- Vivado 핀:     dp/pcreg/q_reg[3]/Q   (인스턴스 경로 + 셀 + 핀, 버스 인덱스, "_reg" 접미사)
+- Yosys 이름:    $paramod\\flopr\\WIDTH=32 (모듈), \\name (escaped), $procdff$86 (자동 생성 셀)
+- DKG 노드:      hier_path(모듈), local_name(셀), canonical_name("module.reg_q")
+
+그래프마다 한 번 인덱스를 구축하고 이름을 공통 키(소문자, escape/paramod 제거)로 정규화하여
+1. exact: node_id / hier_path / canonical_name / local_name 해시 조회
+2. hierarchy: leaf(셀) → module 2단계 trie (레지스터는 Q 출력 net 이름도 leaf로 등록)
+3. fuzzy: 정렬된 leaf 키에서 prefix bisect (후보 수 제한)
+순서로 해석합니다. 이름별 결과는 메모이즈되며 stats/match_rate()로 매칭률을 보고합니다.
+"""
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from ..core.graph import DKGEdge, DKGNode, EntityClass
+
+# 출력 net 이름을 leaf 별칭으로 등록하는 순차 소자 (Vivado는 레지스터 셀을 "<net>_reg"로 명명)
+SEQUENTIAL_CLASSES = frozenset({EntityClass.FLIP_FLOP, EntityClass.BRAM})
+
+# fuzzy 단계에서 검사하는 최대 leaf 키 수
+DEFAULT_FUZZY_LIMIT = 64
+
+# 리포트 이름의 마지막 요소가 핀인지 판단 (Q, D, CE, I0, O6, DOADO[3] 등 대문자 이름)
+_PIN_RE = re.compile(r'^[A-Z][A-Z0-9_]*(\[\d+\])?$')
+_BUS_INDEX_RE = re.compile(r'(\[\d+\])+$')
+_MAX_CHAR = "\U0010ffff"
+
+# 인스턴스 이름에서 모듈 이름을 추정할 때 제거하는 관용 접두사/접미사
+_INSTANCE_PREFIXES = ("u_", "i_", "inst_")
+_INSTANCE_SUFFIXES = ("_inst", "_i", "_u")
+
+
+# ============================================================================
+# Name Normalization
+# ============================================================================
+
+
+def normalize_component(name: str) -> str:
+    """
+    이름 한 요소를 공통 키로 정규화.
+
+    - Verilog escaped identifier: "\\data " → "data"
+    - Yosys paramod 모듈: "$paramod\\flopr\\WIDTH=32" / "$paramod$ab12\\flopr" → "flopr"
+    - 소문자
+    """
+    comp = name.strip()
+    if comp.startswith("$paramod"):
+        parts = comp.split("\\")
+        if len(parts) > 1 and parts[1]:
+            comp = parts[1]
+    elif comp.startswith("\\"):
+        comp = comp[1:]
+    return comp.lower()
+
+
+def leaf_variants(comp: str) -> List[str]:
+    """
+    정규화된 leaf 요소의 후보 키 (구체적인 것부터).
+    예: "q_reg[3]" → ["q_reg[3]", "q_reg", "q"]
+    """
+    variants = [comp]
+    base = _BUS_INDEX_RE.sub("", comp)
+    if base and base != comp:
+        variants.append(base)
+    if base.endswith("_reg") and len(base) > 4:
+        variants.append(base[:-4])
+    return variants
+
+
+def module_variants(comp: str) -> List[str]:
+    """인스턴스 이름 → 모듈 이름 후보. 예: "u_alu" → ["u_alu", "alu"]"""
+    variants = [comp]
+    for prefix in _INSTANCE_PREFIXES:
+        if comp.startswith(prefix) and len(comp) > len(prefix):
+            variants.append(comp[len(prefix):])
+    for suffix in _INSTANCE_SUFFIXES:
+        if comp.endswith(suffix) and len(comp) > len(suffix):
+            variants.append(comp[: -len(suffix)])
+    return variants
+
+
+def split_timing_name(name: str) -> Tuple[List[str], Optional[str]]:
+    """
+    리포트 이름 → (정규화된 셀 경로 요소, 핀 이름).
+    예: "dp/pcreg/q_reg[3]/Q" → (["dp", "pcreg", "q_reg[3]"], "Q")
+    """
+    parts = [p for p in name.strip().split("/") if p]
+    pin = None
+    if len(parts) >= 2 and _PIN_RE.match(parts[-1]):
+        pin = parts.pop()
+    return [normalize_component(p) for p in parts], pin
+
+
+# ============================================================================
+# Resolver
+# ============================================================================
+
+
+class TimingNameResolver:
+    """
+    타이밍 리포트 이름 → node_id 해석기 (그래프당 한 번 구축).
+
+    Usage:
+        resolver = TimingNameResolver(nodes, edges)
+        node_id = resolver.resolve("dp/pcreg/q_reg[3]/Q")
+        print(resolver.match_rate())
+    """
+
+    def __init__(
+        self,
+        nodes: Dict[str, DKGNode],
+        edges: Optional[Dict[str, DKGEdge]] = None,
+        fuzzy_limit: int = DEFAULT_FUZZY_LIMIT,
+    ):
+        self.nodes = nodes
+        self.fuzzy_limit = fuzzy_limit
+
+        # 원본 이름 그대로의 조회 (node_id > hier_path > canonical_name 순으로 먼저 등록된 것 우선)
+        self._exact: Dict[str, str] = {}
+        # 정규화된 전체 이름 조회
+        self._normalized: Dict[str, str] = {}
+        # leaf 키 → module 키 → node_id 리스트
+        self._trie: Dict[str, Dict[str, List[str]]] = {}
+
+        self._build(nodes, edges or {})
+        self._sorted_leaves: List[str] = sorted(self._trie)
+
+        self._memo: Dict[str, Tuple[Optional[str], str]] = {}
+        self.stats: Dict[str, int] = {
+            "lookups": 0,
+            "exact": 0,
+            "hierarchy": 0,
+            "fuzzy": 0,
+            "unresolved": 0,
+        }
+
+    # ========================================================================
+    # Index Build
+    # ========================================================================
+
+    def _build(self, nodes: Dict[str, DKGNode], edges: Dict[str, DKGEdge]) -> None:
+        exact = self._exact
+        for node_id in nodes:
+            exact[node_id] = node_id
+        for node_id, node in nodes.items():
+            exact.setdefault(node.hier_path, node_id)
+        for node_id, node in nodes.items():
+            if node.canonical_name:
+                exact.setdefault(node.canonical_name, node_id)
+
+        normalized = self._normalized
+        for node_id, node in nodes.items():
+            module = normalize_component(node.hier_path or "")
+            local = normalize_component(node.local_name or "")
+
+            if local:
+                normalized.setdefault(f"{module}/{local}", node_id)
+                for key in leaf_variants(local):
+                    self._add_leaf(key, module, node_id)
+            if node.canonical_name:
+                normalized.setdefault(node.canonical_name.lower(), node_id)
+
+            # 레지스터: Vivado 셀 이름은 Q 출력 net 기준 ("q" → "q_reg[3]")
+            if node.entity_class in SEQUENTIAL_CLASSES:
+                for edge_id in node.out_edges:
+                    edge = edges.get(edge_id)
+                    if edge is None or not edge.signal_name:
+                        continue
+                    net = _BUS_INDEX_RE.sub("", normalize_component(edge.signal_name))
+                    if net:
+                        self._add_leaf(net, module, node_id)
+
+    def _add_leaf(self, leaf: str, module: str, node_id: str) -> None:
+        ids = self._trie.setdefault(leaf, {}).setdefault(module, [])
+        if node_id not in ids:
+            ids.append(node_id)
+
+    # ========================================================================
+    # Resolve
+    # ========================================================================
+
+    def resolve(self, name: str) -> Optional[str]:
+        """리포트 이름 → node_id (해석 실패 시 None)"""
+        self.stats["lookups"] += 1
+        cached = self._memo.get(name)
+        if cached is None:
+            cached = self._resolve_uncached(name)
+            self._memo[name] = cached
+        node_id, kind = cached
+        self.stats[kind] += 1
+        return node_id
+
+    def match_rate(self) -> float:
+        """지금까지 조회한 이름 중 해석된 비율 (조회가 없으면 1.0)"""
+        lookups = self.stats["lookups"]
+        if not lookups:
+            return 1.0
+        return 1.0 - self.stats["unresolved"] / lookups
+
+    def _resolve_uncached(self, name: str) -> Tuple[Optional[str], str]:
+        node_id = self._exact.get(name)
+        if node_id is not None:
+            return node_id, "exact"
+
+        comps, _pin = split_timing_name(name)
+        if not comps:
+            return None, "unresolved"
+
+        node_id = self._normalized.get("/".join(comps)) or self._normalized.get(name.lower())
+        if node_id is not None:
+            return node_id, "exact"
+
+        leaf, ancestors = comps[-1], comps[:-1]
+        for key in leaf_variants(leaf):
+            modules = self._trie.get(key)
+            if modules:
+                return self._pick_module(modules, ancestors), "hierarchy"
+
+        node_id = self._fuzzy(leaf, ancestors)
+        if node_id is not None:
+            return node_id, "fuzzy"
+        return None, "unresolved"
+
+    def _pick_module(self, modules: Dict[str, List[str]], ancestors: List[str]) -> str:
+        """leaf 후보가 여러 모듈에 있으면 가까운 상위 인스턴스 이름으로 좁힘"""
+        if len(modules) > 1:
+            for comp in reversed(ancestors):
+                for key in module_variants(comp):
+                    ids = modules.get(key)
+                    if ids:
+                        return ids[0]
+        return next(iter(modules.values()))[0]
+
+    def _fuzzy(self, leaf: str, ancestors: List[str]) -> Optional[str]:
+        """leaf 기본 이름으로 시작하는 키 중 가장 짧은 것 (검사 수 fuzzy_limit로 제한)"""
+        base = leaf_variants(leaf)[-1]
+        if not base:
+            return None
+
+        keys = self._sorted_leaves
+        lo = bisect_left(keys, base)
+        hi = min(bisect_left(keys, base + _MAX_CHAR, lo), lo + self.fuzzy_limit)
+        if lo >= hi:
+            return None
+
+        best = min(keys[lo:hi], key=len)
+        return self._pick_module(self._trie[best], ancestors)
+
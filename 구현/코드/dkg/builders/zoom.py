@@ -0,0 +1,397 @@
+"""
+Zoom Pyramid: 다단계 SuperGraph (계층적 줌 / hop 기반 펼치기용)
+
+레벨 0은 DKG 자체이고, 위 레벨은 바로 아래 레벨을 묶어 한 번의 bottom-up 패스로 만듭니다.
+레벨마다 원소 → 부모/자식 맵, DKG 노드 수, 집계 엣지 가중치(묶인 DKG 엣지 수)를 둡니다.
+
+묶는 기준 (ZoomMode):
+- HIERARCHY: hier_path 깊이. 레벨 L은 hier_path를 (최대 깊이 - L + 1) 세그먼트까지 자른
+  prefix로 묶고, 최상위가 여러 개면 root 레벨 하나를 더 둠
+- CLUSTER: heavy-edge matching. 아래 레벨에서 아직 짝이 없는 원소를 가장 무거운 엣지의
+  이웃과 묶으므로 레벨마다 원소 수가 최대 절반으로 줄고, 더 줄지 않으면 멈춤
+
+위 레벨의 엣지는 아래 레벨의 집계 엣지를 부모 쌍으로 다시 더해서 만들므로 DKG 엣지는
+레벨 1을 만들 때 한 번만 훑습니다.
+
+조회 비용은 보이는 원소 수에 비례합니다.
+- get_level(L): 레벨 L 원소와 엣지
+- children(x, top_k): 자식 중 DKG 노드 수 상위 K개 + 숨긴 개수 ("+N more")
+- subgraph(elements): 서로 다른 레벨 원소가 섞인 펼침 상태. 원소마다 자기 레벨 엣지의
+  반대쪽 끝을 부모 방향으로 올려 보이는 원소를 찾음 (더 세밀한 쪽에서 한 번만 셈)
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..core.graph import DKGEdge, DKGNode
+from ..utils import gc_paused
+from .graph_updater import ChangeKind, GraphChange, GraphUpdater
+
+
+class ZoomMode(str, Enum):
+    HIERARCHY = "hierarchy"
+    CLUSTER = "cluster"
+
+
+# 레벨 구조를 바꾸는 노드 필드
+_ZOOM_NODE_FIELDS = frozenset({"hier_path"})
+
+ROOT_LABEL = "(root)"
+
+
+@dataclass
+class ZoomLevel:
+    """
+    피라미드의 한 레벨.
+
+    레벨 0(DKG)은 elements / parent만 채우고 엣지는 DKG의 in_edges/out_edges를 씁니다.
+    """
+
+    level: int
+    elements: List[str] = field(default_factory=list)
+    parent: Dict[str, str] = field(default_factory=dict)  # 이 레벨 원소 → 위 레벨 원소
+    children: Dict[str, List[str]] = field(default_factory=dict)  # 이 레벨 원소 → 아래 레벨 원소
+    sizes: Dict[str, int] = field(default_factory=dict)  # 묶인 DKG 노드 수
+    labels: Dict[str, str] = field(default_factory=dict)
+    # 집계 엣지: src → {dst: 묶인 DKG 엣지 수} (in_edges는 역방향 같은 값)
+    out_edges: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    in_edges: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(targets) for targets in self.out_edges.values())
+
+
+class ZoomPyramid:
+    """
+    Usage:
+        pyramid = ZoomPyramid(nodes, edges, ZoomMode.HIERARCHY).build()
+        top = pyramid.get_level(pyramid.top_level)
+        shown, hidden = pyramid.children("Z2:top/cpu", top_k=10)
+        pyramid.subgraph(["Z2:top/mem", *shown])
+    """
+
+    def __init__(
+        self,
+        nodes: Dict[str, DKGNode],
+        edges: Dict[str, DKGEdge],
+        mode: ZoomMode = ZoomMode.HIERARCHY,
+        max_levels: int = 32,
+        min_reduction: float = 0.1,
+    ):
+        self.nodes = nodes
+        self.edges = edges
+        self.mode = ZoomMode(mode)
+        self.max_levels = max_levels
+        # CLUSTER: 원소 수가 이 비율 이상 줄지 않으면 레벨 추가 중단
+        self.min_reduction = min_reduction
+
+        self.levels: List[ZoomLevel] = []
+        self._level_of: Dict[str, int] = {}
+        # 그래프가 바뀌어 다시 만들어야 함 (subscribe 후 구조 변경 시)
+        self.stale = False
+
+    @property
+    def top_level(self) -> int:
+        return len(self.levels) - 1
+
+    # ========================================================================
+    # Build (bottom-up)
+    # ========================================================================
+
+    def build(self) -> "ZoomPyramid":
+        with gc_paused():
+            base = ZoomLevel(level=0, elements=list(self.nodes))
+            self.levels = [base]
+            if self.mode == ZoomMode.HIERARCHY:
+                self._build_hierarchy()
+            else:
+                self._build_clusters()
+
+            self._level_of = {}
+            for zl in self.levels[1:]:
+                for x in zl.elements:
+                    self._level_of[x] = zl.level
+        self.stale = False
+        return self
+
+    def _build_hierarchy(self) -> None:
+        nodes = self.nodes
+        keys: Dict[str, Tuple[str, ...]] = {}
+        for hier in {n.hier_path for n in nodes.values()}:
+            keys[hier] = tuple(hier.split("/")) if hier else ()
+        max_depth = max((len(k) for k in keys.values()), default=0)
+
+        # 레벨 1: 전체 hier_path, 이후 한 세그먼트씩 자름
+        assignment = {nid: keys[n.hier_path] for nid, n in nodes.items()}
+        self._add_level(assignment, self._hier_label)
+        for depth in range(max_depth - 1, 0, -1):
+            if len(self.levels) > self.max_levels:
+                break
+            below = self.levels[-1]
+            prefix_of = {x: self._hier_key(x)[:depth] for x in below.elements}
+            self._add_level(prefix_of, self._hier_label)
+
+        if len(self.levels[-1].elements) > 1:
+            self._add_level({x: () for x in self.levels[-1].elements}, self._hier_label)
+
+    def _build_clusters(self) -> None:
+        while len(self.levels) <= self.max_levels:
+            below = self.levels[-1]
+            count = len(below.elements)
+            if count <= 1:
+                break
+            groups = self._match(below)
+            if count - len(set(groups.values())) < max(1, count * self.min_reduction):
+                break
+            self._add_level(groups, None)
+
+    def _match(self, below: ZoomLevel) -> Dict[str, Tuple[str, ...]]:
+        """heavy-edge matching: 차수가 낮은 원소부터 가장 무거운 엣지의 짝 없는 이웃과 묶음"""
+        weights: Dict[str, Dict[str, int]] = {}
+        for x in below.elements:
+            acc: Dict[str, int] = {}
+            for y, w in self._neighbors(below.level, x):
+                if y != x:
+                    acc[y] = acc.get(y, 0) + w
+            weights[x] = acc
+
+        order = sorted(below.elements, key=lambda x: (len(weights[x]), x))
+        group: Dict[str, Tuple[str, ...]] = {}
+        for x in order:
+            if x in group:
+                continue
+            best: Optional[str] = None
+            best_w = 0
+            for y, w in weights[x].items():
+                if y not in group and (w > best_w or (w == best_w and y < best)):
+                    best, best_w = y, w
+            key = (x,) if best is None else (x, best)
+            group[x] = key
+            if best is not None:
+                group[best] = key
+        return group
+
+    def _add_level(self, assignment: Dict[str, Tuple[str, ...]], label_fn) -> None:
+        """아래 레벨 원소 → 그룹 키. 새 레벨의 부모/자식 맵, 크기, 집계 엣지를 채움"""
+        below = self.levels[-1]
+        level = len(self.levels)
+        zl = ZoomLevel(level=level)
+
+        ids: Dict[Tuple[str, ...], str] = {}
+        for x in below.elements:
+            key = assignment[x]
+            pid = ids.get(key)
+            if pid is None:
+                pid = ids[key] = (
+                    f"Z{level}:{'/'.join(key)}" if label_fn is not None else f"Z{level}:c{len(ids)}"
+                )
+                zl.elements.append(pid)
+                zl.children[pid] = []
+                zl.sizes[pid] = 0
+                zl.labels[pid] = label_fn(key) if label_fn is not None else ""
+            below.parent[x] = pid
+            zl.children[pid].append(x)
+            zl.sizes[pid] += below.sizes.get(x, 1)
+
+        if label_fn is None:
+            for pid in zl.elements:
+                zl.labels[pid] = f"cluster ({zl.sizes[pid]} nodes)"
+
+        parent = below.parent
+        out_edges, in_edges = zl.out_edges, zl.in_edges
+        for x in below.elements:
+            px = parent[x]
+            for y, w in self._out(below.level, x):
+                py = parent[y]
+                if px == py:
+                    continue
+                targets = out_edges.setdefault(px, {})
+                targets[py] = targets.get(py, 0) + w
+        for px, targets in out_edges.items():
+            for py, w in targets.items():
+                in_edges.setdefault(py, {})[px] = w
+        self.levels.append(zl)
+
+    @staticmethod
+    def _hier_label(key: Tuple[str, ...]) -> str:
+        return key[-1] if key else ROOT_LABEL
+
+    @staticmethod
+    def _hier_key(element_id: str) -> Tuple[str, ...]:
+        path = element_id.split(":", 1)[1]
+        return tuple(path.split("/")) if path else ()
+
+    # ========================================================================
+    # Adjacency
+    # ========================================================================
+
+    def _out(self, level: int, x: str) -> Iterator[Tuple[str, int]]:
+        if level == 0:
+            edges = self.edges
+            for eid in self.nodes[x].out_edges:
+                yield edges[eid].dst_node, 1
+        else:
+            yield from self.levels[level].out_edges.get(x, {}).items()
+
+    def _in(self, level: int, x: str) -> Iterator[Tuple[str, int]]:
+        if level == 0:
+            edges = self.edges
+            for eid in self.nodes[x].in_edges:
+                yield edges[eid].src_node, 1
+        else:
+            yield from self.levels[level].in_edges.get(x, {}).items()
+
+    def _neighbors(self, level: int, x: str) -> Iterator[Tuple[str, int]]:
+        yield from self._out(level, x)
+        yield from self._in(level, x)
+
+    # ========================================================================
+    # Queries
+    # ========================================================================
+
+    def level_of(self, element_id: str) -> Optional[int]:
+        if element_id in self._level_of:
+            return self._level_of[element_id]
+        return 0 if element_id in self.nodes else None
+
+    def parent_of(self, element_id: str) -> Optional[str]:
+        level = self.level_of(element_id)
+        if level is None:
+            return None
+        return self.levels[level].parent.get(element_id)
+
+    def children(self, element_id: str, top_k: Optional[int] = None) -> Tuple[List[str], int]:
+        """
+        자식 원소 (DKG 노드 수 내림차순). top_k를 주면 상위 K개와 숨긴 개수를 돌려줌.
+        """
+        level = self.level_of(element_id)
+        if not level:
+            return [], 0
+        below = self.levels[level - 1]
+        kids = self.levels[level].children.get(element_id, [])
+        ranked = sorted(kids, key=lambda x: (-below.sizes.get(x, 1), x))
+        if top_k is None or len(ranked) <= top_k:
+            return ranked, 0
+        return ranked[:top_k], len(ranked) - top_k
+
+    def get_level(self, level: int) -> Dict[str, Any]:
+        """레벨 하나의 원소와 집계 엣지 (레벨 0은 DKG라 엣지를 노드별로 모음)"""
+        zl = self.levels[level]
+        return {
+            "level": level,
+            "elements": [self.element_to_dict(x, level) for x in zl.elements],
+            "edges": [
+                {"src": x, "dst": y, "weight": w}
+                for x in zl.elements
+                for y, w in self._aggregate(self._out(level, x)).items()
+                if y != x
+            ],
+        }
+
+    def subgraph(self, elements: Iterable[str]) -> Dict[str, Any]:
+        """
+        여러 레벨 원소가 섞인 펼침 상태의 원소와 엣지.
+
+        보이는 원소끼리 겹치면(조상-자손) 안 됩니다. 엣지는 원소 자기 레벨의 엣지 반대쪽 끝을
+        부모 방향으로 올려 보이는 원소를 찾고, 레벨이 다르면 더 세밀한 원소 쪽에서만 셉니다.
+        """
+        visible: Dict[str, int] = {}
+        for x in elements:
+            level = self.level_of(x)
+            if level is not None:
+                visible[x] = level
+
+        weights: Dict[Tuple[str, str], int] = {}
+        for x, level in visible.items():
+            for y, w in self._out(level, x):
+                rep = self._lift(y, level, visible)
+                if rep is not None and rep != x and visible[rep] >= level:
+                    weights[(x, rep)] = weights.get((x, rep), 0) + w
+            for y, w in self._in(level, x):
+                rep = self._lift(y, level, visible)
+                if rep is not None and rep != x and visible[rep] > level:
+                    weights[(rep, x)] = weights.get((rep, x), 0) + w
+
+        return {
+            "elements": [self.element_to_dict(x, level) for x, level in visible.items()],
+            "edges": [{"src": s, "dst": d, "weight": w} for (s, d), w in weights.items()],
+        }
+
+    def expand(self, element_id: str, top_k: Optional[int] = None) -> Dict[str, Any]:
+        """원소 하나를 펼친 자식들(상위 K개)과 그 사이 엣지"""
+        shown, hidden = self.children(element_id, top_k)
+        result = self.subgraph(shown)
+        result["parent"] = element_id
+        result["hidden_children"] = hidden
+        return result
+
+    def element_to_dict(self, element_id: str, level: Optional[int] = None) -> Dict[str, Any]:
+        if level is None:
+            level = self.level_of(element_id)
+        if level == 0:
+            node = self.nodes[element_id]
+            return {
+                "id": element_id,
+                "level": 0,
+                "label": node.local_name,
+                "size": 1,
+                "child_count": 0,
+                "parent": self.levels[0].parent.get(element_id),
+            }
+        zl = self.levels[level]
+        return {
+            "id": element_id,
+            "level": level,
+            "label": zl.labels[element_id],
+            "size": zl.sizes[element_id],
+            "child_count": len(zl.children[element_id]),
+            "parent": zl.parent.get(element_id),
+        }
+
+    def summary(self) -> List[Dict[str, int]]:
+        return [
+            {
+                "level": zl.level,
+                "elements": len(zl.elements),
+                "edges": len(self.edges) if zl.level == 0 else zl.edge_count,
+            }
+            for zl in self.levels
+        ]
+
+    def _lift(self, element_id: str, level: int, visible: Dict[str, int]) -> Optional[str]:
+        """element_id(레벨 level)에서 부모 방향으로 올라가며 처음 만나는 보이는 원소"""
+        x: Optional[str] = element_id
+        while x is not None:
+            if x in visible:
+                return x
+            x = self.levels[level].parent.get(x)
+            level += 1
+        return None
+
+    @staticmethod
+    def _aggregate(pairs: Iterable[Tuple[str, int]]) -> Dict[str, int]:
+        acc: Dict[str, int] = {}
+        for y, w in pairs:
+            acc[y] = acc.get(y, 0) + w
+        return acc
+
+    # ========================================================================
+    # Staleness
+    # ========================================================================
+
+    def subscribe(self, updater: GraphUpdater) -> None:
+        """노드/엣지 추가·삭제나 hier_path 변경이 오면 stale 표시 (다음 조회 전에 다시 build)"""
+        updater.subscribe(self.on_graph_change)
+
+    def unsubscribe(self, updater: GraphUpdater) -> None:
+        updater.unsubscribe(self.on_graph_change)
+
+    def on_graph_change(self, change: GraphChange) -> None:
+        if change.kind == ChangeKind.NODE_FIELD:
+            if change.field_name in _ZOOM_NODE_FIELDS:
+                self.stale = True
+        elif change.kind != ChangeKind.EDGE_FIELD:
+            self.stale = True
@@ -1,8 +1,11 @@
 """Graph caching and snapshot modules."""
+from .constraint_cache import PARSER_VERSION, ConstraintCache
 from .graph_version import GraphVersion
 from .snapshot import GraphSnapshot, load_snapshot, save_snapshot
 
 __all__ = [
+    "ConstraintCache",
+    "PARSER_VERSION",
     "GraphVersion",
     "GraphSnapshot",
     "load_snapshot",
@@ -0,0 +1,144 @@
+"""
+제약 파일 IR 디스크 캐시
+
+- IR 캐시: (파서 종류, 파일 해시, PARSER_VERSION) → 파싱된 IR 레코드
+  파일 내용이 같으면 다시 파싱하지 않고 바로 resolve/apply 단계로 진행.
+- Target 캐시: (파서 종류, 파일 해시, 그래프 버전) → 레코드별 매칭 node/edge ID
+  RTL이 바뀌지 않았다면 패턴 매칭도 건너뜀.
+
+파서의 IR 의미론이 바뀌면 PARSER_VERSION을 올려 기존 캐시를 무효화합니다.
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..core.constraint_ir import constraint_from_dict, constraint_to_dict
+
+# IR 형식/파싱 의미론 버전 (변경 시 증가)
+PARSER_VERSION = 9
+
+
+class ConstraintCache:
+    """
+    제약 IR / resolve 결과 캐시.
+
+    Usage:
+        cache = ConstraintCache(".dkg_cache")
+        records = cache.load_ir("sdc", file_hash)
+        if records is None:
+            records = parser.parse_constraints(path)
+            cache.save_ir("sdc", file_hash, records)
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.stats: Dict[str, int] = {
+            "ir_hits": 0,
+            "ir_misses": 0,
+            "target_hits": 0,
+            "target_misses": 0,
+        }
+
+    # ========================================================================
+    # IR Cache
+    # ========================================================================
+
+    def ir_path(self, parser_kind: str, file_hash: str) -> Path:
+        return self.cache_dir / f"ir_{parser_kind}_{file_hash}_v{PARSER_VERSION}.json"
+
+    def load_ir(self, parser_kind: str, file_hash: str) -> Optional[List[Any]]:
+        """캐시된 IR 레코드 (없거나 손상되었으면 None)"""
+        data = self._read_json(self.ir_path(parser_kind, file_hash))
+        if data is None or data.get("parser_version") != PARSER_VERSION:
+            self.stats["ir_misses"] += 1
+            return None
+
+        try:
+            records = [constraint_from_dict(item) for item in data["records"]]
+        except (KeyError, TypeError, ValueError):
+            self.stats["ir_misses"] += 1
+            return None
+
+        self.stats["ir_hits"] += 1
+        return records
+
+    def save_ir(self, parser_kind: str, file_hash: str, records: List[Any]) -> None:
+        self._write_json(
+            self.ir_path(parser_kind, file_hash),
+            {
+                "parser_version": PARSER_VERSION,
+                "parser_kind": parser_kind,
+                "file_hash": file_hash,
+                "records": [constraint_to_dict(r) for r in records],
+            },
+        )
+
+    # ========================================================================
+    # Resolved Target Cache
+    # ========================================================================
+
+    def targets_path(self, parser_kind: str, file_hash: str, graph_key: str) -> Path:
+        return (
+            self.cache_dir
+            / f"targets_{parser_kind}_{file_hash}_{graph_key}_v{PARSER_VERSION}.json"
+        )
+
+    def load_targets(
+        self,
+        parser_kind: str,
+        file_hash: str,
+        graph_key: str,
+        record_count: int,
+    ) -> Optional[List[Dict[str, List[str]]]]:
+        """캐시된 레코드별 매칭 결과 (레코드 수가 다르면 None)"""
+        data = self._read_json(self.targets_path(parser_kind, file_hash, graph_key))
+        resolved = data.get("resolved") if data else None
+        if not isinstance(resolved, list) or len(resolved) != record_count:
+            self.stats["target_misses"] += 1
+            return None
+
+        self.stats["target_hits"] += 1
+        return resolved
+
+    def save_targets(
+        self,
+        parser_kind: str,
+        file_hash: str,
+        graph_key: str,
+        resolved: List[Dict[str, List[str]]],
+    ) -> None:
+        self._write_json(
+            self.targets_path(parser_kind, file_hash, graph_key),
+            {
+                "parser_version": PARSER_VERSION,
+                "graph_key": graph_key,
+                "resolved": resolved,
+            },
+        )
+
+    # ========================================================================
+    # IO Helpers
+    # ========================================================================
+
+    @staticmethod
+    def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]) -> None:
+        # 동시 실행 중인 파이프라인이 반쯤 쓴 파일을 읽지 않도록 rename으로 교체
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
@@ -15,7 +15,15 @@ from typing import Any, Dict, Optional, Set, Tuple
 
 from ..core.graph import DKGEdge, DKGNode, EdgeFlowType, EntityClass, RelationType
 from ..core.provenance import Provenance
-from ..builders.supergraph import SuperClass, SuperEdge, SuperGraph, SuperNode
+from ..builders.supergraph import (
+    SuperClass,
+    SuperEdge,
+    SuperEdgeMembers,
+    SuperGraph,
+    SuperNode,
+    flow_mask,
+    relation_mask,
+)
 from .graph_version import GraphVersion
 
 
@@ -43,6 +51,9 @@ def _serialize_node(node: DKGNode) -> dict:
         "arrival_time": node.arrival_time,
         "required_time": node.required_time,
         "slack": node.slack,
+        "hold_arrival_time": node.hold_arrival_time,
+        "hold_required_time": node.hold_required_time,
+        "hold_slack": node.hold_slack,
         "in_edges": node.in_edges,
         "out_edges": node.out_edges,
         # provenance는 얕게: 기본 정보만
@@ -66,8 +77,6 @@ def _serialize_node(node: DKGNode) -> dict:
 
 def _deserialize_node(data: dict) -> DKGNode:
     """dict에서 DKGNode 복원"""
-    from ..stages import ParsingStage
-    
     # provenance 복원
     provenances = []
     if data.get("provenances"):
@@ -102,6 +111,9 @@ def _deserialize_node(data: dict) -> DKGNode:
         arrival_time=data.get("arrival_time"),
         required_time=data.get("required_time"),
         slack=data.get("slack"),
+        hold_arrival_time=data.get("hold_arrival_time"),
+        hold_required_time=data.get("hold_required_time"),
+        hold_slack=data.get("hold_slack"),
         in_edges=data.get("in_edges", []),
         out_edges=data.get("out_edges", []),
         provenances=provenances,
@@ -131,11 +143,49 @@ def _serialize_edge(edge: DKGEdge) -> dict:
         "delay": edge.delay,
         "arrival_time": edge.arrival_time,
         "required_time": edge.required_time,
+        "hold_delay": edge.hold_delay,
+        "hold_arrival_time": edge.hold_arrival_time,
+        # SuperEdge provenance는 멤버 엣지에서 계산하므로 엣지 쪽에 보존
+        "provenances": [
+            {
+                "origin_file": p.origin_file,
+                "origin_line": p.origin_line,
+                "tool_stage": p.tool_stage,
+                "confidence": p.confidence,
+            }
+            for p in edge.provenances
+        ] if edge.provenances else [],
+        "primary_provenance": {
+            "origin_file": edge.primary_provenance.origin_file,
+            "origin_line": edge.primary_provenance.origin_line,
+            "tool_stage": edge.primary_provenance.tool_stage,
+            "confidence": edge.primary_provenance.confidence,
+        } if edge.primary_provenance else None,
     }
 
 
 def _deserialize_edge(data: dict) -> DKGEdge:
     """dict에서 DKGEdge 복원"""
+    provenances = []
+    if data.get("provenances"):
+        for p in data["provenances"]:
+            provenances.append(Provenance(
+                origin_file=p.get("origin_file"),
+                origin_line=p.get("origin_line"),
+                tool_stage=p.get("tool_stage", "rtl"),
+                confidence=p.get("confidence", "exact"),
+            ))
+
+    primary_provenance = None
+    if data.get("primary_provenance"):
+        p = data["primary_provenance"]
+        primary_provenance = Provenance(
+            origin_file=p.get("origin_file"),
+            origin_line=p.get("origin_line"),
+            tool_stage=p.get("tool_stage", "rtl"),
+            confidence=p.get("confidence", "exact"),
+        )
+
     return DKGEdge(
         edge_id=data["edge_id"],
         src_node=data["src_node"],
@@ -156,6 +206,10 @@ def _deserialize_edge(data: dict) -> DKGEdge:
         delay=data.get("delay"),
         arrival_time=data.get("arrival_time"),
         required_time=data.get("required_time"),
+        hold_delay=data.get("hold_delay"),
+        hold_arrival_time=data.get("hold_arrival_time"),
+        provenances=provenances,
+        primary_provenance=primary_provenance,
     )
 
 
@@ -205,7 +259,7 @@ def _serialize_superedge(se: SuperEdge) -> dict:
         "edge_id": se.edge_id,
         "src_node": se.src_node,
         "dst_node": se.dst_node,
-        "member_edges": list(se.member_edges),
+        "member_edges": se.member_edge_ids(),
         "member_nodes": list(se.member_nodes),
         "relation_types": [rt.value for rt in se.relation_types],
         "flow_types": [ft.value for ft in se.flow_types],
@@ -214,32 +268,29 @@ def _serialize_superedge(se: SuperEdge) -> dict:
         "provenances": [
             {"origin_file": p.origin_file, "origin_line": p.origin_line, "tool_stage": p.tool_stage}
             for p in se.provenances
-        ] if se.provenances else [],
+        ],
     }
 
 
-def _deserialize_superedge(data: dict) -> SuperEdge:
-    """dict에서 SuperEdge 복원"""
-    provenances = []
-    if data.get("provenances"):
-        for p in data["provenances"]:
-            provenances.append(Provenance(
-                origin_file=p.get("origin_file"),
-                origin_line=p.get("origin_line"),
-                tool_stage=p.get("tool_stage", "rtl"),
-            ))
-    
+def _deserialize_superedge(data: dict, members: SuperEdgeMembers) -> SuperEdge:
+    """
+    dict에서 SuperEdge 복원.
+
+    멤버 엣지 ID는 members 배열에 구간으로 붙이고, provenance / member_nodes는
+    저장하지 않고 복원된 DKG 엣지에서 다시 계산합니다.
+    """
+    start, count = members.append(data["member_edges"])
     return SuperEdge(
         edge_id=data["edge_id"],
         src_node=data["src_node"],
         dst_node=data["dst_node"],
-        member_edges=set(data["member_edges"]),
-        member_nodes=set(data["member_nodes"]),
-        relation_types={RelationType(rt) for rt in data["relation_types"]},
-        flow_types={EdgeFlowType(ft) for ft in data["flow_types"]},
+        members=members,
+        start=start,
+        edge_count=count,
+        relation_mask=relation_mask(RelationType(rt) for rt in data["relation_types"]),
+        flow_mask=flow_mask(EdgeFlowType(ft) for ft in data["flow_types"]),
         canonical_name=data.get("canonical_name"),
         display_name=data.get("display_name"),
-        provenances=provenances,
     )
 
 
@@ -327,8 +378,9 @@ def load_snapshot(filepath: Path | str) -> GraphSnapshot:
             node_id: _deserialize_supernode(sn_data)
             for node_id, sn_data in sg_data["super_nodes"].items()
         }
+        members = SuperEdgeMembers(dkg_edges)
         super_edges = {
-            tuple(key.split("→")): _deserialize_superedge(se_data)
+            tuple(key.split("→")): _deserialize_superedge(se_data, members)
             for key, se_data in sg_data["super_edges"].items()
         }
         node_to_super = sg_data["node_to_super"]
@@ -0,0 +1,142 @@
+"""
+Constraint IR: 파싱된 SDC/XDC 제약의 그래프 비의존 표현
+
+파서는 파일을 이 IR 레코드 리스트로 변환하고(parse),
+이후 단계에서 그래프 노드/엣지에 매칭(resolve)하여 반영(apply)합니다.
+IR은 그래프를 참조하지 않으므로 파일 해시만으로 디스크 캐싱이 가능합니다.
+"""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+# ============================================================================
+# Raw Constraint Data Classes
+# ============================================================================
+
+
+@dataclass
+class ClockConstraint:
+    """create_clock 제약"""
+
+    clock_name: str
+    period: Optional[float] = None  # ns
+    waveform: Optional[List[float]] = None  # [rise_edge, fall_edge]
+    target_ports: Optional[List[str]] = None  # get_ports / get_pins
+    origin_line: int = 0
+
+
+@dataclass
+class FalsePathConstraint:
+    """set_false_path 제약"""
+
+    from_targets: Optional[List[str]] = None  # -from [get_pins ...]
+    to_targets: Optional[List[str]] = None  # -to [get_pins ...]
+    # -through 옵션별 target 그룹 (경로가 순서대로 모두 통과해야 함)
+    through_targets: Optional[List[List[str]]] = None
+    # 그룹별 오브젝트 타입 ("nets"면 net 이름, 그 밖에는 셀/핀/포트 이름)
+    through_types: Optional[List[str]] = None
+    origin_line: int = 0
+
+
+@dataclass
+class MulticyclePathConstraint:
+    """set_multicycle_path 제약"""
+
+    cycles: int
+    path_type: str  # "setup" or "hold"
+    from_targets: Optional[List[str]] = None
+    to_targets: Optional[List[str]] = None
+    through_targets: Optional[List[List[str]]] = None
+    through_types: Optional[List[str]] = None
+    origin_line: int = 0
+
+
+@dataclass
+class DelayConstraint:
+    """set_max_delay / set_min_delay 제약"""
+
+    constraint_type: str  # "max" or "min"
+    delay_value: float  # ns
+    from_targets: Optional[List[str]] = None
+    to_targets: Optional[List[str]] = None
+    through_targets: Optional[List[List[str]]] = None
+    through_types: Optional[List[str]] = None
+    origin_line: int = 0
+
+
+@dataclass
+class IOTimingConstraint:
+    """set_input_delay / set_output_delay 제약"""
+
+    constraint_type: str  # "input" or "output"
+    delay_value: float  # ns
+    clock_ref: Optional[str] = None
+    target_ports: Optional[List[str]] = None
+    origin_line: int = 0
+
+
+@dataclass
+class PropertyConstraint:
+    """set_property (LOC, PACKAGE_PIN, IOSTANDARD 등) 제약"""
+
+    properties: Dict[str, str] = field(default_factory=dict)
+    targets: List[str] = field(default_factory=list)
+    origin_line: int = 0
+
+
+@dataclass
+class PblockConstraint:
+    """add_cells_to_pblock 제약"""
+
+    pblock_name: str
+    cell_targets: List[str] = field(default_factory=list)
+    origin_line: int = 0
+
+
+@dataclass
+class PblockRangeConstraint:
+    """create_pblock / resize_pblock 제약 (범위는 SLICE_X0Y0:SLICE_X9Y49 형식 문자열)"""
+
+    pblock_name: str
+    add_ranges: List[str] = field(default_factory=list)
+    remove_ranges: List[str] = field(default_factory=list)
+    replace: bool = False  # resize_pblock -replace: 기존 범위를 버림
+    origin_line: int = 0
+
+
+# ============================================================================
+# Serialization
+# ============================================================================
+
+CONSTRAINT_TYPES: Dict[str, type] = {
+    cls.__name__: cls
+    for cls in (
+        ClockConstraint,
+        FalsePathConstraint,
+        MulticyclePathConstraint,
+        DelayConstraint,
+        IOTimingConstraint,
+        PropertyConstraint,
+        PblockConstraint,
+        PblockRangeConstraint,
+    )
+}
+
+
+def constraint_to_dict(constraint: Any) -> Dict[str, Any]:
+    """IR 레코드 → JSON 직렬화 가능한 dict"""
+    data = asdict(constraint)
+    data["kind"] = type(constraint).__name__
+    return data
+
+
+def constraint_from_dict(data: Dict[str, Any]) -> Any:
+    """dict → IR 레코드"""
+    payload = dict(data)
+    kind = payload.pop("kind")
+    cls = CONSTRAINT_TYPES.get(kind)
+    if cls is None:
+        raise ValueError(f"Unknown constraint kind: {kind}")
+    return cls(**payload)
@@ -63,6 +63,10 @@ class DKGNode:
     arrival_time: Optional[float] = None
     required_time: Optional[float] = None
     slack: Optional[float] = None
+    # hold(min) 분석 값 (위 필드는 setup(max) 분석)
+    hold_arrival_time: Optional[float] = None
+    hold_required_time: Optional[float] = None
+    hold_slack: Optional[float] = None
 
     in_edges: List[str] = field(default_factory=list)
     out_edges: List[str] = field(default_factory=list)
@@ -99,6 +103,9 @@ class DKGEdge:
     arrival_time: Optional[float] = None
     required_time: Optional[float] = None
     slack: Optional[float] = None
+    # hold(min) 분석 값 (위 필드는 setup(max) 분석)
+    hold_delay: Optional[float] = None
+    hold_arrival_time: Optional[float] = None
 
     attributes: Dict[str, Any] = field(default_factory=dict)
 
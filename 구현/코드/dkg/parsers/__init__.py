@@ -1,16 +1,44 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 from ..core.graph import DKGEdge, DKGNode
-from ..builders.graph_updater import GraphUpdater
-from ..pipeline.stages import ParsingStage
+from .tcl_tokenizer import TclCommand, TclTokenizer
+
+if TYPE_CHECKING:
+    # parser_utils는 builders/query_api에서도 쓰이므로 패키지 import를 가볍게 유지
+    from ..builders.graph_updater import GraphUpdater
+    from ..pipeline.stages import ParsingStage
 
 
 class ConstraintParser(ABC):
-    """제약 파일 파서 베이스 클래스"""
-    
+    """
+    제약 파일 파서 베이스 클래스.
+
+    Tcl 계열 파서는 command_handlers에 `명령 이름 → 메서드 이름`을 등록하고
+    dispatch_commands()로 파일을 한 번만 스트리밍하며 핸들러를 호출합니다.
+    핸들러 시그니처: (cmd, filepath, updater, nodes, edges) -> None
+
+    IR을 지원하는 파서(SDC/XDC)는 ir_builders에 `명령 이름 → IR 생성 메서드`를
+    등록하고 parse → resolve → apply 세 단계로 나누어 처리합니다.
+    - parse_constraints: 파일 → IR 레코드 (그래프 비의존, 파일 해시로 캐싱 가능)
+    - resolve_constraints: IR → 매칭된 node/edge ID (그래프 버전으로 캐싱 가능)
+    - apply_constraints: 매칭 결과를 GraphUpdater로 반영
+    resolve/apply는 모든 IR 파서가 ConstraintProjector의 배치 경로를 공유합니다.
+
+    토크나이즈할 수 없는 명령(괄호 불일치 등)은 warn()으로 줄 번호와 함께 알리고 건너뜁니다.
+    """
+
+    # 명령 이름 → 핸들러 메서드 이름
+    command_handlers: Dict[str, str] = {}
+
+    # 명령 이름 → IR 생성 메서드 이름 (cmd) -> Optional[IR]
+    ir_builders: Dict[str, str] = {}
+
+    # warn() 메시지에 붙일 현재 파일 이름
+    _source: str = "<input>"
+
     @abstractmethod
     def get_stage(self) -> ParsingStage:
         """이 파서가 속한 stage 반환"""
@@ -34,3 +62,122 @@ class ConstraintParser(ABC):
             edges: 기존 엣지 딕셔너리
         """
         pass
+
+    # ========================================================================
+    # Command dispatch
+    # ========================================================================
+
+    def iter_commands(self, filepath: str) -> Iterator[TclCommand]:
+        """파일을 한 번 스트리밍하며 Tcl 명령 생성"""
+        self._source = filepath
+        tokenizer = TclTokenizer()
+        with open(filepath, "r", encoding="utf-8") as f:
+            yield from tokenizer.iter_commands(f)
+        self._report_syntax_errors(tokenizer)
+
+    def warn(self, line: int, message: str) -> None:
+        """건너뛴 명령 / 버린 레코드 알림"""
+        print(f"⚠️ {self._source}:{line}: {message}")
+
+    def _report_syntax_errors(self, tokenizer: TclTokenizer) -> None:
+        for line, message in tokenizer.errors:
+            self.warn(line, f"명령 건너뜀 ({message})")
+
+    def get_command_handler(self, name: str) -> Optional[Callable[..., None]]:
+        """명령 이름에 대응하는 핸들러 (없으면 None)"""
+        method_name = self.command_handlers.get(name)
+        if method_name is None:
+            return None
+        return getattr(self, method_name)
+
+    def dispatch_commands(
+        self,
+        filepath: str,
+        updater: GraphUpdater,
+        nodes: Dict[str, DKGNode],
+        edges: Dict[str, DKGEdge],
+    ) -> int:
+        """
+        파일의 모든 명령을 핸들러 테이블로 디스패치.
+
+        Returns:
+            처리된(핸들러가 있는) 명령 수
+        """
+        handlers = {
+            name: getattr(self, method_name)
+            for name, method_name in self.command_handlers.items()
+        }
+        handled = 0
+        for cmd in self.iter_commands(filepath):
+            handler = handlers.get(cmd.name)
+            if handler is None:
+                continue
+            handler(cmd, filepath, updater, nodes, edges)
+            handled += 1
+        return handled
+
+    # ========================================================================
+    # IR (parse → resolve → apply)
+    # ========================================================================
+
+    @property
+    def supports_ir(self) -> bool:
+        return bool(self.ir_builders)
+
+    def parse_constraints(self, filepath: str) -> List[Any]:
+        """파일을 IR 레코드 리스트로 변환 (파일 순서 유지)"""
+        with open(filepath, "r", encoding="utf-8") as f:
+            return self.parse_lines(f, source=filepath)
+
+    def parse_lines(self, lines: Iterable[str], source: str = "<input>") -> List[Any]:
+        """Tcl 소스 라인 → IR 레코드 리스트"""
+        self._source = source
+        tokenizer = TclTokenizer()
+        builders = {
+            name: getattr(self, method_name)
+            for name, method_name in self.ir_builders.items()
+        }
+        records: List[Any] = []
+        for cmd in tokenizer.iter_commands(lines):
+            builder = builders.get(cmd.name)
+            if builder is None:
+                continue
+            record = builder(cmd)
+            if record is not None:
+                records.append(record)
+        self._report_syntax_errors(tokenizer)
+        return records
+
+    def resolve_constraints(
+        self,
+        records: List[Any],
+        nodes: Dict[str, DKGNode],
+        edges: Dict[str, DKGEdge],
+        source: Optional[str] = None,
+    ) -> List[Dict[str, List[str]]]:
+        """
+        IR 레코드별 매칭 결과 계산.
+
+        Args:
+            source: 매칭되지 않은 이름 경고에 표시할 파일 (None이면 마지막으로 파싱한 파일)
+
+        Returns:
+            레코드와 같은 순서의 {"nodes": [...], "edges": [...]} 리스트
+        """
+        from ..builders.constraint_projector import ConstraintProjector
+
+        return ConstraintProjector(nodes, edges, source=source or self._source).resolve_batch(records)
+
+    def apply_constraints(
+        self,
+        records: List[Any],
+        resolved: List[Dict[str, List[str]]],
+        filepath: str,
+        updater: GraphUpdater,
+        nodes: Dict[str, DKGNode],
+        edges: Dict[str, DKGEdge],
+    ) -> None:
+        """resolve 결과를 그래프에 반영 (필드별 벌크 업데이트)"""
+        from ..builders.constraint_projector import ConstraintProjector
+
+        ConstraintProjector(nodes, edges, updater).apply_batch(records, resolved, filepath)
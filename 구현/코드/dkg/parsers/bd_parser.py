@@ -1,19 +1,180 @@
+"""
+BD (Vivado block design) 파서: IP 인스턴스 그룹 seed
+
+두 가지 입력을 같은 레코드(BdDesign)로 변환한 뒤 그래프에 일괄 반영합니다.
+- .bd (JSON): components / interface_nets / nets / addressing을 멤버 단위 스트리밍
+- .tcl (write_bd_tcl): create_bd_cell, connect_bd_intf_net, connect_bd_net
+
+BD 인스턴스 → 노드 매칭은 그래프당 한 번 구축하는 BdInstanceIndex로 합니다.
+- IP 모듈 (hier_path): xci_name 일치, 또는 Vivado 명명 규칙 "<bd>_<인스턴스>_<n>"
+- 인스턴스 셀 (local_name): BD wrapper 안의 IP 인스턴스 이름 일치
+이전의 "모든 노드에 대한 부분 문자열 검사"(O(cells x nodes), "gpio_0"이 "gpio_01"에 매칭)는 쓰지 않습니다.
+
+반영 (모두 DECLARED, BOARD stage):
+- 노드 attributes: bd_ip / bd_group (VLNV), bd_cell (BD 경로), bd_base_address / bd_address_range
+- 엣지 attributes: bd_intf_net / bd_net (연결된 두 IP 사이의 엣지)
+"""
 from __future__ import annotations
 
 import re
-from typing import Dict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from ..core.graph import DKGEdge, DKGNode
 from ..builders.graph_updater import GraphUpdater
+from ..builders.timing_name_resolver import normalize_component
 from ..pipeline.stages import FieldSource, ParsingStage
 from . import ConstraintParser
+from .json_stream import iter_json_members
+from .tcl_tokenizer import TclCommand, TclQuery
+
+# .bd에서 스트리밍하는 객체
+_BD_PATHS = [
+    ("design", "design_info"),
+    ("design", "components"),
+    ("design", "interface_nets"),
+    ("design", "nets"),
+    ("design", "addressing"),
+]
+
+_BD_PIN_TYPES = ("bd_pins", "bd_ports")
+_BD_INTF_PIN_TYPES = ("bd_intf_pins", "bd_intf_ports")
+
+# Vivado IP 모듈 이름 끝의 인스턴스 번호 ("design_1_axi_gpio_0_0" → "design_1_axi_gpio_0")
+_MODULE_INDEX_RE = re.compile(r"_\d+$")
+
+
+# ============================================================================
+# Records
+# ============================================================================
+
+
+@dataclass
+class BdComponent:
+    """IP 인스턴스 (create_bd_cell -type ip / .bd components)"""
+
+    path: str                       # BD 경로 ("hier_0/axi_gpio_0")
+    vlnv: str                       # "xilinx.com:ip:axi_gpio:2.0"
+    xci_name: Optional[str] = None  # 합성 모듈 이름 ("design_1_axi_gpio_0_0")
+    origin_line: int = 0
+
+    @property
+    def leaf(self) -> str:
+        return self.path.rsplit("/", 1)[-1]
+
+
+@dataclass
+class BdConnection:
+    """interface/일반 net. endpoint는 "인스턴스 경로/핀" (상위 포트는 "/"가 없음)"""
+
+    kind: str                       # "intf" | "net"
+    name: str
+    endpoints: List[str] = field(default_factory=list)
+
+
+@dataclass
+class BdAddressSegment:
+    """주소 세그먼트 (master 주소 공간의 slave 블록 매핑)"""
+
+    master: str                     # "processing_system7_0"
+    name: str                       # "SEG_axi_gpio_0_Reg"
+    block: str                      # "axi_gpio_0/S_AXI/Reg"
+    offset: str                     # "0x41200000"
+    range: str                      # "64K"
+
+
+@dataclass
+class BdDesign:
+    name: str = ""
+    components: List[BdComponent] = field(default_factory=list)
+    connections: List[BdConnection] = field(default_factory=list)
+    segments: List[BdAddressSegment] = field(default_factory=list)
+
+
+# ============================================================================
+# Instance Index
+# ============================================================================
+
+
+class BdInstanceIndex:
+    """
+    BD 인스턴스 → 노드 ID (그래프당 한 번 구축, 모든 조회는 해시 조회).
+
+    Usage:
+        index = BdInstanceIndex(nodes)
+        node_ids = index.match(component)
+    """
+
+    def __init__(self, nodes: Dict[str, DKGNode]):
+        self._by_local: Dict[str, List[str]] = {}
+        self._by_module: Dict[str, List[str]] = {}
+        # "<bd>_<inst>_<n>" 모듈: "<bd>_<inst>" → 모듈 키, 그리고 "_" 경계 접미사 → 모듈 키
+        # (BD 이름을 모를 때만 접미사 사용)
+        self._module_bases: Dict[str, List[str]] = {}
+        self._module_suffixes: Dict[str, List[str]] = {}
+
+        for node_id, node in nodes.items():
+            if node.local_name:
+                self._by_local.setdefault(normalize_component(node.local_name), []).append(node_id)
+            if node.hier_path:
+                self._by_module.setdefault(normalize_component(node.hier_path), []).append(node_id)
+
+        for module in self._by_module:
+            base = _MODULE_INDEX_RE.sub("", module)
+            if base == module:
+                continue
+            self._module_bases.setdefault(base, []).append(module)
+            pos = base.find("_")
+            while pos >= 0:
+                self._module_suffixes.setdefault(base[pos + 1:], []).append(module)
+                pos = base.find("_", pos + 1)
+
+    def match(self, component: BdComponent, design_name: str = "") -> List[str]:
+        """IP 모듈 내부 노드 + wrapper의 인스턴스 셀 노드"""
+        leaf = normalize_component(component.leaf)
+        modules: List[str] = []
+        if component.xci_name:
+            xci = normalize_component(component.xci_name)
+            if xci in self._by_module:
+                modules.append(xci)
+        if not modules and design_name:
+            modules = self._module_bases.get(f"{normalize_component(design_name)}_{leaf}", [])
+        elif not modules:
+            modules = self._module_suffixes.get(leaf, [])
+
+        result: List[str] = []
+        for module in modules:
+            result.extend(self._by_module[module])
+        result.extend(self._by_local.get(leaf, []))
+        return list(dict.fromkeys(result))
+
+
+# ============================================================================
+# Parser
+# ============================================================================
 
 
 class BdParser(ConstraintParser):
     """
     BD (block design) parser for IP instance grouping seeds.
+
+    Usage:
+        parser = BdParser()
+        parser.parse_and_update("design_1.bd", updater, nodes, edges)   # 또는 write_bd_tcl 출력
     """
 
+    # write_bd_tcl 명령 → 레코드 (parse_constraints로 파일 순서대로 수집)
+    ir_builders = {
+        "create_bd_design": "_build_bd_design",
+        "create_bd_cell": "_build_bd_cell",
+        "set": "_build_set",
+        "connect_bd_intf_net": "_build_intf_connection",
+        "connect_bd_net": "_build_net_connection",
+    }
+
+    def __init__(self):
+        self.stats: Dict[str, int] = {}
+
     def get_stage(self) -> ParsingStage:
         return ParsingStage.BOARD
 
@@ -24,47 +185,264 @@ class BdParser(ConstraintParser):
         nodes: Dict[str, DKGNode],
         edges: Dict[str, DKGEdge],
     ) -> None:
-        with open(filepath, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        design = self.parse_design(filepath)
+        self.apply_design(design, filepath, updater, nodes, edges)
 
-        for line_num, line in enumerate(lines, start=1):
-            raw = line.strip()
-            if not raw or raw.startswith("#"):
-                continue
+    def parse_design(self, filepath: str) -> BdDesign:
+        """파일 → BdDesign (.bd는 JSON, 그 외는 Tcl)"""
+        if filepath.lower().endswith(".bd"):
+            return parse_bd_json(filepath)
+        design = BdDesign()
+        for record in self.parse_constraints(filepath):
+            if isinstance(record, BdDesign):
+                design.name = record.name
+            elif isinstance(record, BdComponent):
+                design.components.append(record)
+            else:
+                design.connections.append(record)
+        return design
+
+    # ========================================================================
+    # Tcl IR builders
+    # ========================================================================
+
+    def _build_bd_design(self, cmd: TclCommand) -> Optional[BdDesign]:
+        names = [w for w in cmd.positionals if isinstance(w, str)]
+        return BdDesign(name=names[-1]) if names else None
+
+    def _build_bd_cell(self, cmd: TclCommand) -> Optional[BdComponent]:
+        names = [w for w in cmd.positionals if isinstance(w, str)]
+        return _bd_component(cmd.options, names, cmd.line)
+
+    def _build_set(self, cmd: TclCommand) -> Optional[BdComponent]:
+        """write_bd_tcl 형식: set x [ create_bd_cell -type ip -vlnv ... x ]"""
+        value = cmd.positionals[-1] if cmd.positionals else None
+        if not isinstance(value, TclQuery) or value.command != "create_bd_cell":
+            return None
+        return _bd_component(value.options, value.patterns, cmd.line)
 
-            if raw.startswith("create_bd_cell"):
-                self._parse_create_bd_cell(raw, line_num, filepath, updater, nodes)
+    def _build_intf_connection(self, cmd: TclCommand) -> Optional[BdConnection]:
+        return _tcl_connection(cmd, "intf", _BD_INTF_PIN_TYPES)
 
-    def _parse_create_bd_cell(
+    def _build_net_connection(self, cmd: TclCommand) -> Optional[BdConnection]:
+        return _tcl_connection(cmd, "net", _BD_PIN_TYPES)
+
+    # ========================================================================
+    # Apply
+    # ========================================================================
+
+    def apply_design(
         self,
-        line: str,
-        line_num: int,
+        design: BdDesign,
         filepath: str,
         updater: GraphUpdater,
         nodes: Dict[str, DKGNode],
+        edges: Dict[str, DKGEdge],
     ) -> None:
-        match = re.search(r"create_bd_cell\s+-type\s+ip\s+-vlnv\s+(\S+)\s+(\S+)", line)
-        if not match:
-            return
+        """BdDesign을 노드/엣지 attributes에 일괄 반영"""
+        index = BdInstanceIndex(nodes)
 
-        vlnv = match.group(1)
-        inst = match.group(2)
+        # BD 경로 → 매칭된 노드
+        members: Dict[str, List[str]] = {}
+        node_attrs: Dict[str, Dict[str, Any]] = {}
+        node_lines: Dict[str, int] = {}
 
-        for node_id, node in nodes.items():
-            candidates = [node.local_name, node.hier_path, node.canonical_name]
-            if not any(inst == cand or (cand and inst in cand) for cand in candidates):
+        def attrs_of(node_id: str) -> Dict[str, Any]:
+            attrs = node_attrs.get(node_id)
+            if attrs is None:
+                attrs = node_attrs[node_id] = dict(nodes[node_id].attributes)
+            return attrs
+
+        for comp in design.components:
+            node_ids = index.match(comp, design.name)
+            members[comp.path] = node_ids
+            for node_id in node_ids:
+                attrs = attrs_of(node_id)
+                attrs["bd_ip"] = comp.vlnv
+                attrs["bd_group"] = comp.vlnv
+                attrs["bd_cell"] = comp.path
+                if comp.origin_line:
+                    node_lines[node_id] = comp.origin_line
+
+        for seg in design.segments:
+            slave = _owning_component(seg.block, members)
+            for node_id in members.get(slave, []) if slave else []:
+                attrs = attrs_of(node_id)
+                attrs["bd_base_address"] = seg.offset
+                attrs["bd_address_range"] = seg.range
+
+        edge_attrs = self._tag_connection_edges(design.connections, members, nodes, edges)
+
+        tagged_nodes = updater.batch_update_node_field(
+            "attributes", node_attrs, FieldSource.DECLARED, ParsingStage.BOARD,
+            filepath, node_lines or None,
+        )
+        tagged_edges = updater.batch_update_edge_field(
+            "attributes", edge_attrs, FieldSource.DECLARED, ParsingStage.BOARD, filepath,
+        )
+        self.stats = {
+            "components": len(design.components),
+            "matched_components": sum(1 for ids in members.values() if ids),
+            "connections": len(design.connections),
+            "segments": len(design.segments),
+            "tagged_nodes": tagged_nodes,
+            "tagged_edges": tagged_edges,
+        }
+
+    def _tag_connection_edges(
+        self,
+        connections: Iterable[BdConnection],
+        members: Dict[str, List[str]],
+        nodes: Dict[str, DKGNode],
+        edges: Dict[str, DKGEdge],
+    ) -> Dict[str, Dict[str, Any]]:
+        """연결된 IP 쌍 사이의 엣지에 net 이름 기록 (매칭 노드의 out_edges만 훑음)"""
+        edge_attrs: Dict[str, Dict[str, Any]] = {}
+        for conn in connections:
+            comps = []
+            for endpoint in conn.endpoints:
+                comp = _owning_component(endpoint, members)
+                if comp and comp not in comps:
+                    comps.append(comp)
+            if len(comps) < 2:
                 continue
 
-            new_attrs = dict(node.attributes)
-            new_attrs["bd_ip"] = vlnv
-            new_attrs["bd_group"] = vlnv
-
-            updater.update_node_field(
-                node_id,
-                "attributes",
-                new_attrs,
-                FieldSource.DECLARED,
-                ParsingStage.BOARD,
-                filepath,
-                line_num,
+            member_sets = [set(members[c]) for c in comps]
+            key = "bd_intf_net" if conn.kind == "intf" else "bd_net"
+            for i, src_ids in enumerate(member_sets):
+                dst_ids: Set[str] = set().union(*(s for j, s in enumerate(member_sets) if j != i))
+                for node_id in src_ids:
+                    for edge_id in nodes[node_id].out_edges:
+                        edge = edges.get(edge_id)
+                        if edge is None or edge.dst_node not in dst_ids:
+                            continue
+                        attrs = edge_attrs.get(edge_id)
+                        if attrs is None:
+                            attrs = edge_attrs[edge_id] = dict(edge.attributes)
+                        attrs[key] = conn.name
+        return edge_attrs
+
+
+# ============================================================================
+# Record Builders
+# ============================================================================
+
+
+def _bd_component(
+    options: Dict[str, List[Any]], names: List[str], line: int
+) -> Optional[BdComponent]:
+    """create_bd_cell -type ip -vlnv <VLNV> <이름> (계층 셀 등 IP가 아니면 None)"""
+    if options.get("-type", [None])[-1] != "ip":
+        return None
+    vlnv = options.get("-vlnv", [None])[-1]
+    if not isinstance(vlnv, str) or not names:
+        return None
+    return BdComponent(path=names[-1].strip("/"), vlnv=vlnv, origin_line=line)
+
+
+def _tcl_connection(
+    cmd: TclCommand, kind: str, object_types: Tuple[str, ...]
+) -> Optional[BdConnection]:
+    """connect_bd_intf_net [-intf_net 이름] / connect_bd_net [-net 이름] [get_bd_*pins a/M] ..."""
+    endpoints = [p.strip("/") for p in cmd.positional_targets(object_types)]
+    if len(endpoints) < 2:
+        return None
+    name = cmd.option("-intf_net" if kind == "intf" else "-net")
+    if not isinstance(name, str):
+        # -net이 없으면 Vivado처럼 첫 endpoint로 이름 생성 ("ps7_0/M_AXI_GP0" → "ps7_0_M_AXI_GP0")
+        name = endpoints[0].replace("/", "_")
+    return BdConnection(kind=kind, name=name, endpoints=endpoints)
+
+
+def parse_bd_json(filepath: str) -> BdDesign:
+    """
+    .bd 파일 → BdDesign.
+
+    design 아래 멤버를 하나씩 디코딩하므로 파일 전체를 dict로 올리지 않습니다.
+    계층 셀(하위 components를 가진 component)은 경로를 붙여 평탄화합니다.
+    """
+    design = BdDesign()
+    for path, key, value in iter_json_members(filepath, _BD_PATHS):
+        section = path[-1]
+        if section == "design_info":
+            if key == "name" and isinstance(value, str):
+                design.name = value
+        elif section == "components":
+            _add_component(design, key, value, "")
+        elif section == "interface_nets":
+            _add_connection(design, "intf", key, value, "")
+        elif section == "nets":
+            _add_connection(design, "net", key, value, "")
+        elif section == "addressing":
+            _add_address_space(design, key, value)
+    return design
+
+
+def _add_component(design: BdDesign, name: str, value: Any, prefix: str) -> None:
+    if not isinstance(value, dict):
+        return
+    path = f"{prefix}{name}"
+    vlnv = value.get("vlnv")
+    if isinstance(vlnv, str):
+        xci = value.get("xci_name")
+        design.components.append(
+            BdComponent(path=path, vlnv=vlnv, xci_name=xci if isinstance(xci, str) else None)
+        )
+
+    # 계층 셀
+    children = value.get("components")
+    if isinstance(children, dict):
+        for child_name, child in children.items():
+            _add_component(design, child_name, child, f"{path}/")
+    for section, kind in (("interface_nets", "intf"), ("nets", "net")):
+        nets = value.get(section)
+        if isinstance(nets, dict):
+            for net_name, net in nets.items():
+                _add_connection(design, kind, net_name, net, f"{path}/")
+
+
+def _add_connection(design: BdDesign, kind: str, name: str, value: Any, prefix: str) -> None:
+    """{"interface_ports": [...]} / {"ports": [...]}"""
+    if not isinstance(value, dict):
+        return
+    ports = value.get("interface_ports" if kind == "intf" else "ports")
+    if not isinstance(ports, list):
+        return
+    endpoints = [f"{prefix}{p}".strip("/") for p in ports if isinstance(p, str)]
+    if endpoints:
+        design.connections.append(BdConnection(kind=kind, name=f"{prefix}{name}", endpoints=endpoints))
+
+
+def _add_address_space(design: BdDesign, master: str, value: Any) -> None:
+    """{"/ps7_0": {"address_spaces": {"Data": {"segments": {"SEG_x": {...}}}}}}"""
+    if not isinstance(value, dict):
+        return
+    spaces = value.get("address_spaces")
+    if not isinstance(spaces, dict):
+        return
+    for space in spaces.values():
+        segments = space.get("segments") if isinstance(space, dict) else None
+        if not isinstance(segments, dict):
+            continue
+        for seg_name, seg in segments.items():
+            if not isinstance(seg, dict) or not isinstance(seg.get("address_block"), str):
+                continue
+            design.segments.append(
+                BdAddressSegment(
+                    master=master.strip("/"),
+                    name=seg_name,
+                    block=seg["address_block"].strip("/"),
+                    offset=str(seg.get("offset", "")),
+                    range=str(seg.get("range", "")),
+                )
             )
+
+
+def _owning_component(endpoint: str, members: Dict[str, List[str]]) -> Optional[str]:
+    """ "hier_0/axi_gpio_0/S_AXI/Reg" → 가장 긴 컴포넌트 경로 접두사 ("hier_0/axi_gpio_0") """
+    parts = endpoint.split("/")
+    for end in range(len(parts) - 1, 0, -1):
+        path = "/".join(parts[:end])
+        if path in members:
+            return path
+    return None
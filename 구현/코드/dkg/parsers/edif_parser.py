@@ -0,0 +1,278 @@
+"""
+EDIF netlist 파서 (Vivado write_edif)
+
+구현 후 netlist는 EDIF로만 얻을 수 있는 경우가 많고 Yosys JSON보다 훨씬 큽니다.
+파일을 s-expression 리더로 port / instance / net 단위 스트리밍하며(트리 전체를 만들지 않음)
+Yosys 경로와 같은 Wire / CellIR로 변환하므로 build_nodes_and_edges()를 그대로 씁니다.
+
+대응 관계:
+- (library L (cell C (view V (interface (port ...)))))   → 셀 C의 포트 방향/폭
+- (cell M ... (contents (instance I (viewref V (cellref C (libraryref L))))))
+                                                          → CellIR(name=I, type=C, module=M)
+- (net N (joined (portref P (instanceref I)) ...))        → Wire(name=N), connections[P][bit] = wire_id
+
+이름은 원자 또는 (rename id "표시 이름")이며 참조는 id로, CellIR/Wire에는 표시 이름을 씁니다.
+배열 포트 (port (array (rename D "D[3:0]") 4))의 (member D k)는 MSB부터 세므로
+connections 리스트(LSB부터)의 인덱스 width-1-k로 변환합니다.
+상위 셀 자신의 포트를 가리키는 portref(instanceref 없음)는 Yosys 경로와 같이 노드로 만들지 않습니다.
+"""
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from ..core.ir import CellIR, Wire
+from .sexpr import SExpr, iter_sexpr_scoped, iter_file_chunks, keyword, unquote
+
+# 스트리밍 단위. CELL은 내용이 모두 빠져나간 껍데기로 받아 셀별 인스턴스 맵을 정리하는 데만 씀
+_EMIT_KEYWORDS = ("PORT", "INSTANCE", "NET", "CELL")
+
+# EDIF 방향 → Yosys port_directions
+_DIRECTIONS = {"INPUT": "input", "OUTPUT": "output", "INOUT": "inout"}
+
+_BUS_SUFFIX_RE = re.compile(r'\[[^\[\]]*\]$')
+
+# (library id, cell id)
+CellKey = Tuple[str, str]
+
+# port id → (표시 이름(버스 접미사 제거), 폭)
+PortInfo = Tuple[str, int]
+
+
+def parse_edif(filepath: str) -> Tuple[Dict[int, Wire], List[CellIR]]:
+    """
+    EDIF 파일 → (wires, cells). build_wires_and_cells()의 EDIF 대응.
+
+    Usage:
+        wires, cells = parse_edif("impl.edf")
+        nodes, edges = build_nodes_and_edges(wires, cells)
+    """
+    builder = EdifNetlistBuilder()
+    builder.feed_file(filepath)
+    return builder.wires, builder.cells
+
+
+class EdifNetlistBuilder:
+    """
+    EDIF 스트림 → Wire / CellIR 누적기.
+
+    같은 셀 타입의 인스턴스는 port_dirs dict 하나를 공유합니다 (인스턴스 수만큼 복사하지 않음).
+    """
+
+    def __init__(self):
+        self.wires: Dict[int, Wire] = {}
+        self.cells: List[CellIR] = []
+
+        # 셀 타입별 포트: port_dirs는 CellIR에 그대로 공유, ports는 portref 해석용
+        self._port_dirs: Dict[CellKey, Dict[str, str]] = {}
+        self._ports: Dict[CellKey, Dict[str, PortInfo]] = {}
+        self._cell_names: Dict[CellKey, str] = {}
+
+        # 열려 있는 셀의 instance id → (CellIR, 타입의 ports). 셀이 닫히면 버림
+        self._instances: Dict[CellKey, Dict[str, Tuple[CellIR, Dict[str, PortInfo]]]] = {}
+        self._next_wire_id = 0
+
+        # 직계 부모(interface/contents)가 같으면 셀 문맥도 같으므로 스택 탐색 결과를 재사용
+        self._scope_parent: Optional[List[SExpr]] = None
+        self._scope_key: Optional[CellKey] = None
+        self._scope_module = ""
+
+    def feed_file(self, filepath: str) -> None:
+        for expr, stack in iter_sexpr_scoped(iter_file_chunks(filepath), _EMIT_KEYWORDS):
+            kw = expr[0].upper()
+            if kw == "NET":
+                self._add_net(expr, stack)
+            elif kw == "INSTANCE":
+                self._add_instance(expr, stack)
+            elif kw == "PORT":
+                self._add_port(expr, stack)
+            elif kw == "CELL":
+                self._close_cell(expr, stack)
+
+    def _scope(self, stack: List[List[SExpr]]) -> Optional[CellKey]:
+        """현재 셀의 (library, cell) 키 (self._scope_module에 표시 이름)"""
+        parent = stack[-1]
+        if parent is not self._scope_parent:
+            self._scope_parent = parent
+            self._scope_key = _scope(stack)
+            self._scope_module = _cell_display(stack)
+        return self._scope_key
+
+    # ========================================================================
+    # Handlers
+    # ========================================================================
+
+    def _add_port(self, expr: List[SExpr], stack: List[List[SExpr]]) -> None:
+        """(port name|(array name width) (direction INPUT))"""
+        key = self._scope(stack)
+        if key is None or len(expr) < 2:
+            return
+        spec = expr[1]
+        width = 1
+        if keyword(spec) == "ARRAY" and len(spec) >= 3:
+            width = _int(spec[2], 1)
+            spec = spec[1]
+        port_id, display = _name(spec)
+        direction = "input"
+        for item in expr[2:]:
+            if keyword(item) == "DIRECTION" and len(item) > 1:
+                direction = _DIRECTIONS.get(str(item[1]).upper(), "input")
+                break
+
+        name = _BUS_SUFFIX_RE.sub("", display) if width > 1 else display
+        self._port_dirs.setdefault(key, {})[name] = direction
+        self._ports.setdefault(key, {})[port_id] = (name, width)
+
+    def _add_instance(self, expr: List[SExpr], stack: List[List[SExpr]]) -> None:
+        """(instance name (viewref V (cellref C (libraryref L))) (property ...)*)"""
+        key = self._scope(stack)
+        if key is None or len(expr) < 2:
+            return
+        inst_id, display = _name(expr[1])
+
+        cell_ref = None
+        for item in expr[2:]:
+            if keyword(item) == "VIEWREF":
+                for sub in item[2:]:
+                    if keyword(sub) == "CELLREF":
+                        cell_ref = sub
+                        break
+                break
+        if cell_ref is None or len(cell_ref) < 2:
+            return
+
+        type_id, _ = _name(cell_ref[1])
+        library = key[0]
+        for sub in cell_ref[2:]:
+            if keyword(sub) == "LIBRARYREF" and len(sub) > 1:
+                library = _name(sub[1])[0]
+        type_key = (library, type_id)
+
+        cell = CellIR(
+            name=display,
+            type=self._cell_names.get(type_key, type_id),
+            module=self._scope_module,
+            port_dirs=self._port_dirs.setdefault(type_key, {}),
+            connections={},
+        )
+        self.cells.append(cell)
+        self._instances.setdefault(key, {})[inst_id] = (cell, self._ports.setdefault(type_key, {}))
+
+    def _add_net(self, expr: List[SExpr], stack: List[List[SExpr]]) -> None:
+        """(net name (joined (portref P|(member P k) (instanceref I)) ...))"""
+        key = self._scope(stack)
+        if key is None or len(expr) < 2:
+            return
+        _, display = _name(expr[1])
+
+        wire_id = self._next_wire_id
+        self._next_wire_id += 1
+        self.wires[wire_id] = Wire(wire_id, name=display)
+
+        instances = self._instances.get(key)
+        if not instances:
+            return
+        for item in expr[2:]:
+            if keyword(item) != "JOINED":
+                continue
+            for ref in item[1:]:
+                # (portref P (instanceref I)). instanceref가 없으면 상위 셀 자신의 포트
+                if type(ref) is not list or len(ref) < 3:
+                    continue
+                inst = ref[2]
+                if type(inst) is not list or len(inst) < 2 or inst[0].upper() != "INSTANCEREF":
+                    continue
+                inst_id = inst[1] if type(inst[1]) is str else _name(inst[1])[0]
+                entry = instances.get(inst_id)
+                if entry is not None:
+                    _connect(entry[0], entry[1], ref[1], wire_id)
+
+    def _close_cell(self, expr: List[SExpr], stack: List[List[SExpr]]) -> None:
+        """셀 정의 종료: 이름 등록, 인스턴스 맵 해제"""
+        if len(expr) < 2 or not stack:
+            return
+        library = _library(stack)
+        cell_id, display = _name(expr[1])
+        key = (library, cell_id)
+        self._cell_names[key] = display
+        self._instances.pop(key, None)
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _connect(cell: CellIR, ports: Dict[str, PortInfo], port_spec: SExpr, wire_id: int) -> None:
+    """portref 하나 → cell.connections[포트][비트] = wire_id"""
+    member = None
+    if type(port_spec) is list:
+        if keyword(port_spec) != "MEMBER" or len(port_spec) < 3:
+            return
+        member = _int(port_spec[2], 0)
+        port_spec = port_spec[1]
+    port_id = port_spec if type(port_spec) is str else _name(port_spec)[0]
+
+    info = ports.get(port_id)
+    if info is None:
+        # 선언되지 않은 포트 (라이브러리 셀 정의 누락): 입력으로 간주
+        info = ports[port_id] = (port_id, 1)
+        cell.port_dirs.setdefault(port_id, "input")
+    name, width = info
+
+    bits = cell.connections.get(name)
+    if bits is None:
+        bits = cell.connections[name] = ["x"] * width
+    index = 0 if member is None else width - 1 - member
+    if 0 <= index < len(bits):
+        bits[index] = wire_id
+
+
+def _name(spec: SExpr) -> Tuple[str, str]:
+    """이름 → (id, 표시 이름). (rename id "표시")는 표시 이름을 따로, 원자는 같은 값"""
+    if isinstance(spec, list):
+        if keyword(spec) == "RENAME" and len(spec) >= 3:
+            ident = _name(spec[1])[0]
+            return ident, unquote(spec[2]) if isinstance(spec[2], str) else ident
+        if keyword(spec) in ("NAME", "ARRAY") and len(spec) >= 2:
+            return _name(spec[1])
+        return "", ""
+    ident = unquote(spec)
+    # EDIF id의 '&' 접두사(숫자로 시작하는 이름용)는 표시 이름에서 제거
+    return ident, ident[1:] if ident.startswith("&") else ident
+
+
+def _scope(stack: List[List[SExpr]]) -> Optional[CellKey]:
+    """열린 조상 중 가장 가까운 (library, cell) 키"""
+    cell_id = None
+    for ancestor in reversed(stack):
+        kw = keyword(ancestor)
+        if kw == "CELL" and cell_id is None and len(ancestor) > 1:
+            cell_id = _name(ancestor[1])[0]
+        elif kw in ("LIBRARY", "EXTERNAL") and len(ancestor) > 1:
+            if cell_id is None:
+                return None
+            return _name(ancestor[1])[0], cell_id
+    return None
+
+
+def _cell_display(stack: List[List[SExpr]]) -> str:
+    """열린 조상 중 가장 가까운 셀의 표시 이름 (셀은 내용이 끝나야 닫히므로 스택에서 읽음)"""
+    for ancestor in reversed(stack):
+        if keyword(ancestor) == "CELL" and len(ancestor) > 1:
+            return _name(ancestor[1])[1]
+    return ""
+
+
+def _library(stack: List[List[SExpr]]) -> str:
+    for ancestor in reversed(stack):
+        if keyword(ancestor) in ("LIBRARY", "EXTERNAL") and len(ancestor) > 1:
+            return _name(ancestor[1])[0]
+    return ""
+
+
+def _int(atom: SExpr, default: int) -> int:
+    try:
+        return int(atom)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return default
@@ -0,0 +1,154 @@
+"""
+JSON 스트리밍 리더 (객체 멤버 단위)
+
+큰 JSON 파일에서 지정한 경로의 객체 멤버를 (key, value)로 하나씩 생성합니다.
+경로 밖의 값은 멤버 하나씩 디코딩한 뒤 버리고, 경로 안의 객체는 키만 읽으며 내려가므로
+메모리는 "가장 큰 멤버 값 하나" 수준으로 유지됩니다.
+
+예: .bd 파일에서 path=("design", "components")
+    {"design": {"components": {"ps7_0": {...}, "gpio_0": {...}}, ...}}
+    → ("ps7_0", {...}), ("gpio_0", {...})
+
+값 디코딩은 json.JSONDecoder.raw_decode를 쓰고, 버퍼에서 값이 잘려 있으면 파일을 더 읽어 재시도합니다.
+"""
+from __future__ import annotations
+
+import json
+from json.decoder import scanstring
+from typing import Any, Iterator, Optional, Sequence, TextIO, Tuple
+
+from .sexpr import DEFAULT_CHUNK_SIZE
+
+_WHITESPACE = " \t\n\r"
+
+JsonPath = Tuple[str, ...]
+
+
+class JsonStreamError(ValueError):
+    """JSON 구조 오류 (또는 파일이 중간에 끝남)"""
+
+
+def iter_json_members(
+    filepath: str,
+    paths: Sequence[JsonPath],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[JsonPath, str, Any]]:
+    """
+    파일을 스트리밍하며 paths에 있는 객체의 멤버를 (path, key, value)로 파일 순서대로 생성.
+
+    경로가 가리키는 값이 객체가 아니면 무시합니다.
+    """
+    with open(filepath, "r", encoding="utf-8") as f:
+        yield from _JsonStream(f, chunk_size).members({tuple(p) for p in paths})
+
+
+class _JsonStream:
+    def __init__(self, f: TextIO, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def members(self, targets: set) -> Iterator[Tuple[JsonPath, str, Any]]:
+        prefixes = {t[:i] for t in targets for i in range(len(t))}
+        if self._peek() != "{":
+            self._value()
+            return
+        yield from self._walk((), targets, prefixes)
+
+    def _walk(self, path: JsonPath, targets: set, prefixes: set) -> Iterator[Tuple[JsonPath, str, Any]]:
+        """현재 위치의 객체를 읽으며 target 멤버는 yield, prefix 멤버는 내려감"""
+        for key in self._keys():
+            child = path + (key,)
+            if child in targets and self._peek() == "{":
+                for member_key in self._keys():
+                    yield child, member_key, self._value()
+            elif child in prefixes and self._peek() == "{":
+                yield from self._walk(child, targets, prefixes)
+            else:
+                self._value()
+
+    # ========================================================================
+    # Tokens
+    # ========================================================================
+
+    def _keys(self) -> Iterator[str]:
+        """'{' 부터 '}' 까지 키를 생성 (값은 호출자가 읽음)"""
+        self._expect("{")
+        if self._peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self._string()
+            self._expect(":")
+            yield key
+            ch = self._peek()
+            self.pos += 1
+            if ch == "}":
+                return
+            if ch != ",":
+                raise JsonStreamError(f"expected ',' or '}}', got {ch!r}")
+
+    def _string(self) -> str:
+        self._expect('"')
+        while True:
+            try:
+                value, end = scanstring(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            self.pos = end
+            return value
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # 값이 버퍼 끝에서 잘렸을 수 있으므로 더 읽고 재시도
+                if not self._fill():
+                    raise
+                continue
+            # 숫자는 버퍼 끝에서 잘려도 디코딩되므로 경계에 닿았으면 더 읽고 다시 디코딩
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def _expect(self, ch: str) -> None:
+        got = self._peek()
+        if got != ch:
+            raise JsonStreamError(f"expected {ch!r}, got {got!r}")
+        self.pos += 1
+
+    def _peek(self) -> Optional[str]:
+        """공백을 건너뛴 다음 문자 (파일 끝이면 None)"""
+        while True:
+            buf, pos = self.buf, self.pos
+            n = len(buf)
+            while pos < n and buf[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < n:
+                return buf[pos]
+            if not self._fill():
+                return None
+
+    def _fill(self) -> bool:
+        """읽은 부분을 버리고 버퍼 뒤에 청크를 덧붙임 (더 읽을 것이 없으면 False).
+        잘린 값을 다시 디코딩할 때 2차 비용이 되지 않도록 청크를 버퍼 크기 이상으로 읽음"""
+        if self.eof:
+            return False
+        self.buf = self.buf[self.pos:]
+        self.pos = 0
+        data = self.f.read(max(self.chunk_size, len(self.buf)))
+        if not data:
+            self.eof = True
+            return False
+        self.buf += data
+        return True
+
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable, List
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence
+
+_GLOB_META = ("*", "?")
 
 
 def _split_target_list(raw: str) -> List[str]:
@@ -28,23 +31,150 @@ def extract_option_targets(line: str, option: str, object_types: Iterable[str])
     return targets
 
 
+# ============================================================================
+# Compiled Glob Matchers
+# ============================================================================
+# Tcl glob(`*`, `?`)을 가장 싼 매칭 방식으로 한 번만 컴파일하고 LRU 캐시로 재사용.
+# 대괄호는 Vivado 버스 인덱스(`pc_reg[0]`)이므로 문자 클래스가 아니라 리터럴로 취급.
+# ============================================================================
+
+
+class GlobMatcher:
+    """
+    컴파일된 glob 패턴.
+
+    kind:
+    - "all":      `*` (모든 문자열)
+    - "exact":    와일드카드 없음
+    - "prefix":   `abc*`
+    - "suffix":   `*abc`
+    - "contains": `*abc*`
+    - "regex":    그 외 (`a*b`, `a?c` 등)
+    """
+
+    __slots__ = ("pattern", "kind", "literal", "ignore_case", "_regex")
+
+    def __init__(self, pattern: str, ignore_case: bool = False):
+        self.pattern = pattern
+        self.ignore_case = ignore_case
+        self._regex: Optional[re.Pattern] = None
+
+        body = pattern.lower() if ignore_case else pattern
+        self.literal = body
+
+        if not any(meta in body for meta in _GLOB_META):
+            self.kind = "exact"
+            return
+
+        if "?" not in body:
+            inner = body.strip("*")
+            leading = body.startswith("*")
+            trailing = body.endswith("*")
+            if not inner:
+                self.kind = "all"
+                return
+            if "*" not in inner:
+                self.literal = inner
+                if leading and trailing:
+                    self.kind = "contains"
+                elif trailing:
+                    self.kind = "prefix"
+                else:
+                    self.kind = "suffix"
+                return
+
+        self.kind = "regex"
+        escaped = re.escape(body).replace(r"\*", ".*").replace(r"\?", ".")
+        self._regex = re.compile(escaped, re.DOTALL)
+
+    def __repr__(self) -> str:
+        return f"GlobMatcher({self.pattern!r}, kind={self.kind})"
+
+    @property
+    def is_literal(self) -> bool:
+        return self.kind == "exact"
+
+    def match(self, text: Optional[str]) -> bool:
+        """단일 문자열 매칭"""
+        if not text:
+            return False
+        if self.ignore_case:
+            text = text.lower()
+        kind = self.kind
+        if kind == "exact":
+            return text == self.literal
+        if kind == "prefix":
+            return text.startswith(self.literal)
+        if kind == "suffix":
+            return text.endswith(self.literal)
+        if kind == "contains":
+            return self.literal in text
+        if kind == "all":
+            return True
+        return self._regex.fullmatch(text) is not None
+
+    __call__ = match
+
+    def filter(self, candidates: Iterable[Optional[str]]) -> List[str]:
+        """후보 리스트 중 매칭되는 문자열만 반환 (kind별로 한 번만 분기)"""
+        cands = [c for c in candidates if c]
+        if self.ignore_case:
+            pairs = [(c, c.lower()) for c in cands]
+        else:
+            pairs = [(c, c) for c in cands]
+
+        kind = self.kind
+        lit = self.literal
+        if kind == "exact":
+            return [c for c, t in pairs if t == lit]
+        if kind == "prefix":
+            return [c for c, t in pairs if t.startswith(lit)]
+        if kind == "suffix":
+            return [c for c, t in pairs if t.endswith(lit)]
+        if kind == "contains":
+            return [c for c, t in pairs if lit in t]
+        if kind == "all":
+            return cands
+        fullmatch = self._regex.fullmatch
+        return [c for c, t in pairs if fullmatch(t) is not None]
+
+    def match_any(self, candidates: Iterable[Optional[str]]) -> bool:
+        """후보 중 하나라도 매칭되면 True"""
+        match = self.match
+        return any(match(c) for c in candidates)
+
+
+@lru_cache(maxsize=4096)
+def compile_glob(pattern: str, ignore_case: bool = False) -> GlobMatcher:
+    """Tcl glob 패턴을 컴파일 (LRU 캐시)"""
+    return GlobMatcher(pattern, ignore_case)
+
+
+def glob_filter(
+    pattern: str,
+    candidates: Sequence[Optional[str]],
+    ignore_case: bool = False,
+) -> List[str]:
+    """후보 리스트를 한 번에 매칭 (벡터화된 pattern_match)"""
+    return compile_glob(pattern, ignore_case).filter(candidates)
+
+
 def pattern_match(pattern: str, candidate: str) -> bool:
     if not pattern:
         return False
-    if "*" not in pattern and "?" not in pattern:
+    matcher = compile_glob(pattern)
+    if matcher.is_literal:
         if pattern == candidate:
             return True
         if pattern in candidate or candidate in pattern:
             return True
-    escaped = re.escape(pattern)
-    escaped = escaped.replace(r"\*", ".*").replace(r"\?", ".")
-    regex = re.compile(r"^%s$" % escaped)
-    return bool(regex.match(candidate))
+    return matcher.match(candidate)
 
 
 def match_any(patterns: Iterable[str], candidates: Iterable[str]) -> bool:
+    cands = [c for c in candidates if c]
     for pattern in patterns:
-        for cand in candidates:
-            if cand and pattern_match(pattern, cand):
+        for cand in cands:
+            if pattern_match(pattern, cand):
                 return True
     return False
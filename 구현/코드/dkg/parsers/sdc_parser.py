@@ -1,13 +1,27 @@
 from __future__ import annotations
 
-import re
-from typing import Dict
+from typing import Any, Dict, List, Optional, Tuple
 
+from ..core.constraint_ir import (
+    ClockConstraint,
+    DelayConstraint,
+    FalsePathConstraint,
+    IOTimingConstraint,
+    MulticyclePathConstraint,
+)
 from ..core.graph import DKGEdge, DKGNode
 from ..builders.graph_updater import GraphUpdater
-from ..pipeline.stages import FieldSource, ParsingStage
+from ..pipeline.stages import ParsingStage
 from . import ConstraintParser
-from .parser_utils import extract_option_targets, match_any
+from .tcl_tokenizer import TclCommand, TclQuery, split_tcl_list
+
+# 타이밍 예외 -from/-to로 인정하는 오브젝트 타입
+PATH_TARGET_TYPES = ("ports", "pins", "cells")
+# -through는 net도 인정 (net 그룹은 signal 이름으로 매칭)
+THROUGH_TARGET_TYPES = PATH_TARGET_TYPES + ("nets",)
+
+# (-from 패턴, -to 패턴, -through 그룹, 그룹별 타입). 옵션이 없으면 패턴은 None
+_PathTargets = Tuple[Optional[List[str]], Optional[List[str]], List[List[str]], List[str]]
 
 
 class SdcParser(ConstraintParser):
@@ -20,7 +34,21 @@ class SdcParser(ConstraintParser):
     - set_false_path: false path 제약
     - set_multicycle_path: multicycle 제약
     - set_max_delay / set_min_delay: 지연 제약
+
+    파서는 IR만 만들고, target 매칭/그래프 반영은 ConstraintProjector가 배치로 처리합니다.
+    타이밍 예외의 -from/-to/-through가 있는데 대상을 해석할 수 없으면(지원하지 않는
+    -filter, get_clocks 등) 제한 없음으로 넓히지 않고 경고와 함께 레코드를 버립니다.
     """
+
+    ir_builders = {
+        "create_clock": "_build_clock",
+        "set_false_path": "_build_false_path",
+        "set_multicycle_path": "_build_multicycle_path",
+        "set_max_delay": "_build_delay",
+        "set_min_delay": "_build_delay",
+        "set_input_delay": "_build_io_delay",
+        "set_output_delay": "_build_io_delay",
+    }
     
     def get_stage(self) -> ParsingStage:
         return ParsingStage.CONSTRAINTS
@@ -32,183 +60,207 @@ class SdcParser(ConstraintParser):
         nodes: Dict[str, DKGNode],
         edges: Dict[str, DKGEdge],
     ) -> None:
-        with open(filepath, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        
-        for line_num, line in enumerate(lines, start=1):
-            line = line.strip()
-            
-            # create_clock 처리
-            if line.startswith("create_clock"):
-                self._parse_create_clock(
-                    line, line_num, filepath, updater, nodes, edges
-                )
-            
-            # set_false_path 처리
-            elif line.startswith("set_false_path"):
-                self._parse_false_path(
-                    line, line_num, filepath, updater, nodes, edges
-                )
-            
-            # set_multicycle_path 처리
-            elif line.startswith("set_multicycle_path"):
-                self._parse_multicycle_path(
-                    line, line_num, filepath, updater, nodes, edges
-                )
-    
-    def _parse_create_clock(
-        self,
-        line: str,
-        line_num: int,
-        filepath: str,
-        updater: GraphUpdater,
-        nodes: Dict[str, DKGNode],
-        edges: Dict[str, DKGEdge],
-    ) -> None:
+        records = self.parse_constraints(filepath)
+        resolved = self.resolve_constraints(records, nodes, edges, source=filepath)
+        self.apply_constraints(records, resolved, filepath, updater, nodes, edges)
+
+    # ========================================================================
+    # Parse: TclCommand → IR
+    # ========================================================================
+
+    def _build_clock(self, cmd: TclCommand) -> Optional[ClockConstraint]:
         """
-        create_clock 명령 파싱.
+        create_clock 명령 → ClockConstraint.
         예: create_clock -name clk -period 10 [get_ports clk]
         """
-        # 간단한 정규식 (실제로는 더 정교해야 함)
-        match = re.search(r"-name\s+(\w+)", line)
-        if not match:
-            return
-        
-        clock_name = match.group(1)
-        
-        # get_ports로 포트 이름 추출
-        port_match = re.search(r"get_ports\s+(\w+)", line)
-        if not port_match:
-            return
-        
-        port_name = port_match.group(1)
-        
-        # 해당 포트를 가진 노드들 찾기
-        for node_id, node in nodes.items():
-            if node.local_name == port_name:
-                updater.update_node_field(
-                    node_id,
-                    "clock_domain",
-                    clock_name,
-                    FieldSource.DECLARED,
-                    ParsingStage.CONSTRAINTS,
-                    filepath,
-                    line_num,
-                )
-        
-        # 해당 신호를 가진 엣지들도 업데이트
-        for edge_id, edge in edges.items():
-            if edge.signal_name == port_name:
-                updater.update_edge_field(
-                    edge_id,
-                    "clock_signal",
-                    clock_name,
-                    FieldSource.DECLARED,
-                    ParsingStage.CONSTRAINTS,
-                    filepath,
-                    line_num,
-                )
-    
-    def _parse_false_path(
-        self,
-        line: str,
-        line_num: int,
-        filepath: str,
-        updater: GraphUpdater,
-        nodes: Dict[str, DKGNode],
-        edges: Dict[str, DKGEdge],
-    ) -> None:
+        ports = cmd.positional_targets(("ports", "pins"))
+        if not ports:
+            return None
+
+        # -name이 없으면 Vivado처럼 첫 번째 source 이름을 클럭 이름으로 사용
+        clock_name = cmd.option("-name") or ports[0]
+        if not isinstance(clock_name, str):
+            return None
+
+        waveform = cmd.option("-waveform")
+        return ClockConstraint(
+            clock_name=clock_name,
+            period=_to_float(cmd.option("-period")),
+            waveform=_to_float_list(waveform) if isinstance(waveform, str) else None,
+            target_ports=ports,
+            origin_line=cmd.line,
+        )
+
+    def _build_false_path(self, cmd: TclCommand) -> Optional[FalsePathConstraint]:
         """
-        set_false_path 명령 파싱.
-        예: set_false_path -from [get_pins src/*] -to [get_pins dst/*]
+        set_false_path 명령 → FalsePathConstraint.
+        예: set_false_path -from [get_pins src/*] -through [get_cells mux*] -to [get_pins dst/*]
         """
-        from_patterns = extract_option_targets(line, "-from", ("ports", "pins", "cells"))
-        to_patterns = extract_option_targets(line, "-to", ("ports", "pins", "cells"))
-
-        if not from_patterns and not to_patterns:
-            return
+        targets = self._path_targets(cmd)
+        if targets is None:
+            return None
+        from_patterns, to_patterns, through_groups, through_types = targets
 
-        for edge_id, edge in edges.items():
-            src_node = nodes.get(edge.src_node)
-            dst_node = nodes.get(edge.dst_node)
-            if not src_node or not dst_node:
-                continue
+        return FalsePathConstraint(
+            from_targets=from_patterns,
+            to_targets=to_patterns,
+            through_targets=through_groups or None,
+            through_types=through_types or None,
+            origin_line=cmd.line,
+        )
 
-            src_candidates = [src_node.local_name, src_node.hier_path, src_node.canonical_name]
-            dst_candidates = [dst_node.local_name, dst_node.hier_path, dst_node.canonical_name]
-
-            src_match = True if not from_patterns else match_any(from_patterns, src_candidates)
-            dst_match = True if not to_patterns else match_any(to_patterns, dst_candidates)
-
-            if src_match and dst_match:
-                updater.update_edge_field(
-                    edge_id,
-                    "timing_exception",
-                    "false_path",
-                    FieldSource.DECLARED,
-                    ParsingStage.CONSTRAINTS,
-                    filepath,
-                    line_num,
-                )
-    
-    def _parse_multicycle_path(
-        self,
-        line: str,
-        line_num: int,
-        filepath: str,
-        updater: GraphUpdater,
-        nodes: Dict[str, DKGNode],
-        edges: Dict[str, DKGEdge],
-    ) -> None:
+    def _build_multicycle_path(self, cmd: TclCommand) -> Optional[MulticyclePathConstraint]:
         """
-        set_multicycle_path 명령 파싱.
+        set_multicycle_path 명령 → MulticyclePathConstraint.
         예: set_multicycle_path 2 -from [get_pins ...] -to [get_pins ...]
         """
-        value_match = re.search(r"set_multicycle_path\s+(-?\d+)", line)
-        if not value_match:
-            return
-
-        multicycle = int(value_match.group(1))
-        mc_type = None
-        if "-hold" in line:
-            mc_type = "hold"
-        elif "-setup" in line:
-            mc_type = "setup"
-
-        from_patterns = extract_option_targets(line, "-from", ("ports", "pins", "cells"))
-        to_patterns = extract_option_targets(line, "-to", ("ports", "pins", "cells"))
-
-        if not from_patterns and not to_patterns:
-            return
-
-        for edge_id, edge in edges.items():
-            src_node = nodes.get(edge.src_node)
-            dst_node = nodes.get(edge.dst_node)
-            if not src_node or not dst_node:
+        multicycle = _first_int(cmd.positionals)
+        if multicycle is None:
+            return None
+
+        targets = self._path_targets(cmd)
+        if targets is None:
+            return None
+        from_patterns, to_patterns, through_groups, through_types = targets
+
+        # SDC 기본값은 setup
+        return MulticyclePathConstraint(
+            cycles=multicycle,
+            path_type="hold" if cmd.has_flag("-hold") else "setup",
+            from_targets=from_patterns,
+            to_targets=to_patterns,
+            through_targets=through_groups or None,
+            through_types=through_types or None,
+            origin_line=cmd.line,
+        )
+
+    def _build_delay(self, cmd: TclCommand) -> Optional[DelayConstraint]:
+        """
+        set_max_delay / set_min_delay 명령 → DelayConstraint.
+        예: set_max_delay 5.0 -datapath_only -from [get_cells a_reg] -to [get_cells b_reg]
+        """
+        delay_value = _first_float(cmd.positionals)
+        if delay_value is None:
+            return None
+
+        targets = self._path_targets(cmd)
+        if targets is None:
+            return None
+        from_patterns, to_patterns, through_groups, through_types = targets
+
+        return DelayConstraint(
+            constraint_type="max" if cmd.name == "set_max_delay" else "min",
+            delay_value=delay_value,
+            from_targets=from_patterns,
+            to_targets=to_patterns,
+            through_targets=through_groups or None,
+            through_types=through_types or None,
+            origin_line=cmd.line,
+        )
+
+    def _build_io_delay(self, cmd: TclCommand) -> Optional[IOTimingConstraint]:
+        """
+        set_input_delay / set_output_delay 명령 → IOTimingConstraint.
+        예: set_input_delay -clock [get_clocks sys_clk] -max 2.0 [get_ports din*]
+        """
+        delay_value = _first_float(cmd.positionals)
+        ports = cmd.positional_targets(("ports", "pins"))
+        if delay_value is None or not ports:
+            return None
+
+        clock = cmd.option("-clock")
+        if isinstance(clock, TclQuery):
+            clock = clock.patterns[0] if clock.patterns else None
+
+        return IOTimingConstraint(
+            constraint_type="input" if cmd.name == "set_input_delay" else "output",
+            delay_value=delay_value,
+            clock_ref=clock if isinstance(clock, str) else None,
+            target_ports=ports,
+            origin_line=cmd.line,
+        )
+
+    # ========================================================================
+    # Helpers
+    # ========================================================================
+
+    def _path_targets(self, cmd: TclCommand) -> Optional[_PathTargets]:
+        """
+        -from/-to/-through 대상.
+
+        옵션이 없으면 패턴 None(제한 없음)이고, 옵션이 있는데 패턴을 얻지 못하면
+        경고 후 None을 돌려줘 레코드를 버립니다. 셋 다 없어도 None.
+        """
+        ends: List[Optional[List[str]]] = []
+        for name in ("-from", "-to"):
+            values = cmd.option_all(name)
+            if not values:
+                ends.append(None)
                 continue
+            patterns: List[str] = []
+            for value in values:
+                group, _ = _word_patterns(value, PATH_TARGET_TYPES)
+                if not group:
+                    self.warn(cmd.line, f"{cmd.name}: {name} 대상을 해석할 수 없어 제약을 버림")
+                    return None
+                patterns.extend(group)
+            ends.append(patterns)
+
+        through_groups: List[List[str]] = []
+        through_types: List[str] = []
+        for value in cmd.option_all("-through"):
+            group, object_type = _word_patterns(value, THROUGH_TARGET_TYPES)
+            if not group:
+                self.warn(cmd.line, f"{cmd.name}: -through 대상을 해석할 수 없어 제약을 버림")
+                return None
+            through_groups.append(group)
+            through_types.append(object_type)
 
-            src_candidates = [src_node.local_name, src_node.hier_path, src_node.canonical_name]
-            dst_candidates = [dst_node.local_name, dst_node.hier_path, dst_node.canonical_name]
+        if ends[0] is None and ends[1] is None and not through_groups:
+            return None
+        return ends[0], ends[1], through_groups, through_types
 
-            src_match = True if not from_patterns else match_any(from_patterns, src_candidates)
-            dst_match = True if not to_patterns else match_any(to_patterns, dst_candidates)
 
-            if not (src_match and dst_match):
+def _word_patterns(word: Any, object_types: Tuple[str, ...]) -> Tuple[Optional[List[str]], str]:
+    """옵션 값 하나 → (이름 패턴, 오브젝트 타입). 해석할 수 없으면 패턴 None"""
+    if isinstance(word, TclQuery):
+        if word.object_type not in object_types:
+            return None, word.object_type
+        return word.name_patterns(), word.object_type
+    if isinstance(word, str):
+        return split_tcl_list(word) or None, ""
+    return None, ""
+
+
+def _first_int(words: List[object]) -> Optional[int]:
+    for word in words:
+        if isinstance(word, str):
+            try:
+                return int(word)
+            except ValueError:
                 continue
+    return None
+
+
+def _first_float(words: List[object]) -> Optional[float]:
+    for word in words:
+        value = _to_float(word)
+        if value is not None:
+            return value
+    return None
+
+
+def _to_float(word: object) -> Optional[float]:
+    if not isinstance(word, str):
+        return None
+    try:
+        return float(word)
+    except ValueError:
+        return None
+
 
-            new_params = dict(edge.parameters)
-            existing = new_params.get("multicycle")
-            if existing is None or multicycle > existing:
-                new_params["multicycle"] = multicycle
-            if mc_type:
-                new_params["multicycle_type"] = mc_type
-
-            updater.update_edge_field(
-                edge_id,
-                "parameters",
-                new_params,
-                FieldSource.DECLARED,
-                ParsingStage.CONSTRAINTS,
-                filepath,
-                line_num,
-            )
+def _to_float_list(text: str) -> Optional[List[float]]:
+    values = [_to_float(w) for w in split_tcl_list(text)]
+    if not values or any(v is None for v in values):
+        return None
+    return values  # type: ignore[return-value]
@@ -0,0 +1,318 @@
+"""
+SDF (Standard Delay Format) back-annotation 파서
+
+SDF의 셀/net 지연을 DKG 노드/엣지에 반영합니다.
+- (CELL (INSTANCE ...) (DELAY (ABSOLUTE (IOPATH in out (min:typ:max) ...))))
+  → 셀 내부 arc 지연: 인스턴스 노드의 attributes["sdf_delay_min/typ/max"]
+- (INTERCONNECT src_pin dst_pin (min:typ:max))
+  → net 지연: (src 셀, dst 셀) 엣지의 delay
+
+파일은 s-expression 리더로 arc(IOPATH/INTERCONNECT) 단위 스트리밍하고(메모리 일정),
+이름은 TimingNameResolver로 해석합니다. 지연은 노드/엣지 handle로 인덱싱한
+min/typ/max 컬럼(array('d'))에 누적한 뒤 GraphUpdater 배치 업데이트로 한 번에 반영합니다.
+"""
+from __future__ import annotations
+
+import re
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..core.graph import DKGEdge, DKGNode
+from ..builders.graph_updater import GraphUpdater
+from ..builders.reachability import ReachabilityIndex
+from ..builders.timing_name_resolver import TimingNameResolver
+from ..pipeline.stages import FieldSource, ParsingStage
+from .sexpr import SExpr, iter_sexpr_file, unquote
+
+# 지연 컬럼 (SDF triple 순서)
+DELAY_COLUMNS = ("min", "typ", "max")
+
+# TIMESCALE 단위 → ns
+_TIME_UNITS = {"s": 1e9, "ms": 1e6, "us": 1e3, "ns": 1.0, "ps": 1e-3, "fs": 1e-6}
+_TIMESCALE_RE = re.compile(r'^\s*([\d.]+)?\s*([a-z]+)\s*$', re.IGNORECASE)
+_ESCAPE_RE = re.compile(r'\\(.)')
+
+_NAN = float('nan')
+
+DelayTriple = Tuple[Optional[float], Optional[float], Optional[float]]
+
+# 스트리밍 단위. 최상위 CELL에 INTERCONNECT가 수백만 개 몰려 있으므로(Vivado write_sdf)
+# CELL이 아니라 arc 단위로 받음. 나머지(TIMINGCHECK 등)는 CELL 하나 크기로만 쌓였다가 버려짐
+_EMIT_KEYWORDS = ("CELL", "INSTANCE", "IOPATH", "INTERCONNECT", "TIMESCALE", "DIVIDER")
+
+
+# 지연 arc 하나: (종류 "IOPATH"/"INTERCONNECT", 인스턴스 경로, from 포트/핀, to 포트/핀, 지연)
+SdfArc = Tuple[str, str, str, str, DelayTriple]
+
+
+@dataclass
+class SdfDelayTable:
+    """
+    handle(노드/엣지 리스트 인덱스)로 인덱싱한 min/typ/max 지연 컬럼 (값 없음: NaN).
+    같은 칸에 여러 지연이 오면 min 컬럼은 최소, typ/max 컬럼은 최대로 병합합니다.
+    """
+    node_ids: List[str]
+    edge_ids: List[str]
+    node_columns: Dict[str, array]
+    edge_columns: Dict[str, array]
+
+    cells: int = 0
+    iopaths: int = 0
+    interconnects: int = 0
+    matched_iopaths: int = 0
+    matched_interconnects: int = 0
+
+    @classmethod
+    def empty(cls, nodes: Dict[str, DKGNode], edges: Dict[str, DKGEdge]) -> SdfDelayTable:
+        return cls(
+            node_ids=list(nodes),
+            edge_ids=list(edges),
+            node_columns={c: array('d', [_NAN]) * len(nodes) for c in DELAY_COLUMNS},
+            edge_columns={c: array('d', [_NAN]) * len(edges) for c in DELAY_COLUMNS},
+        )
+
+
+class SdfParser:
+    """
+    SDF 파서 (스트리밍).
+
+    Usage:
+        parser = SdfParser()
+        table = parser.annotate("design.sdf", nodes, edges)   # 파일 또는 iter_arcs() 결과
+        parser.apply_to_graph(table, nodes, edges, updater, column="max")
+    """
+
+    def __init__(self):
+        self.timescale = 1.0    # SDF 값 → ns 배율
+        self.divider = "/"
+        self.cells = 0          # 마지막 iter_arcs에서 읽은 CELL 수
+        # annotate에서 그래프당 한 번 구축 (매칭률 보고용으로 보관)
+        self.resolver: Optional[TimingNameResolver] = None
+
+    def get_stage(self) -> ParsingStage:
+        return ParsingStage.TIMING
+
+    def parse_and_update(
+        self,
+        filepath: str,
+        updater: GraphUpdater,
+        nodes: Dict[str, DKGNode],
+        edges: Dict[str, DKGEdge],
+    ) -> None:
+        table = self.annotate(filepath, nodes, edges)
+        self.apply_to_graph(table, nodes, edges, updater, origin_file=filepath)
+
+    # ========================================================================
+    # Parse: SDF → SdfArc
+    # ========================================================================
+
+    def iter_arcs(self, filepath: str) -> Iterator[SdfArc]:
+        """
+        파일을 스트리밍하며 지연 arc를 하나씩 생성.
+
+        INSTANCE는 같은 CELL의 DELAY보다 앞에 오므로 현재 인스턴스를 상태로 들고 가며,
+        CELL이 닫히면 초기화합니다. self.cells에 CELL 수를 셉니다.
+        """
+        self.timescale = 1.0
+        self.divider = "/"
+        self.cells = 0
+        instance = ""
+        for expr in iter_sexpr_file(filepath, _EMIT_KEYWORDS):
+            # emit된 리스트는 항상 키워드로 시작
+            kw = expr[0].upper()
+            if kw == "INTERCONNECT":
+                if len(expr) >= 3:
+                    yield (kw, instance, self._name(expr[1]), self._name(expr[2]),
+                           self._delay(expr[3:]))
+            elif kw == "IOPATH":
+                if len(expr) >= 3:
+                    yield (kw, instance, _port(expr[1]), _port(expr[2]),
+                           self._delay(expr[3:]))
+            elif kw == "INSTANCE":
+                instance = self._name(expr[1]) if len(expr) > 1 else ""
+                if instance == "*":
+                    instance = ""
+            elif kw == "CELL":
+                self.cells += 1
+                instance = ""
+            elif kw == "TIMESCALE":
+                self.timescale = _parse_timescale(expr[1:])
+            elif kw == "DIVIDER" and len(expr) > 1 and isinstance(expr[1], str):
+                self.divider = expr[1]
+
+    def _delay(self, rvalues: Iterable[SExpr]) -> DelayTriple:
+        """rvalue 리스트(rise/fall/...) → 컬럼별 최악값 (ns)"""
+        worst: List[Optional[float]] = [None, None, None]
+        scale = self.timescale
+        for rvalue in rvalues:
+            if type(rvalue) is not list or not rvalue or type(rvalue[0]) is not str:
+                continue
+            parts = rvalue[0].split(":")
+            if len(parts) == 1:
+                parts = parts * 3
+            for i in range(min(len(parts), 3)):
+                text = parts[i]
+                if not text:
+                    continue
+                try:
+                    value = float(text) * scale
+                except ValueError:
+                    continue
+                current = worst[i]
+                if current is None or (value < current if i == 0 else value > current):
+                    worst[i] = value
+        return worst[0], worst[1], worst[2]
+
+    def _name(self, atom: SExpr) -> str:
+        """SDF 경로 → 리포트 형식 경로 ("/" 구분, escape 제거)"""
+        if not isinstance(atom, str):
+            return ""
+        name = unquote(atom)
+        if self.divider != "/":
+            name = name.replace(self.divider, "/")
+        if "\\" in name:
+            name = _ESCAPE_RE.sub(r'\1', name)
+        return name
+
+    # ========================================================================
+    # Annotate: SdfArc → 컬럼
+    # ========================================================================
+
+    def annotate(
+        self,
+        source: str | Iterable[SdfArc],
+        nodes: Dict[str, DKGNode],
+        edges: Dict[str, DKGEdge],
+    ) -> SdfDelayTable:
+        """
+        SDF 파일(또는 SdfArc 스트림)의 지연을 노드/엣지 컬럼에 누적.
+
+        IOPATH는 인스턴스 셀 노드로, INTERCONNECT는 양 끝 핀을 셀로 해석한 뒤
+        (src 셀, dst 셀) 엣지로 매핑합니다 (병렬 엣지는 첫 엣지).
+        """
+        arcs = self.iter_arcs(source) if isinstance(source, str) else source
+        table = SdfDelayTable.empty(nodes, edges)
+        node_handles = {nid: i for i, nid in enumerate(table.node_ids)}
+        edge_handles = {eid: i for i, eid in enumerate(table.edge_ids)}
+        edge_pairs = ReachabilityIndex(nodes, edges, excluded_flow_types=()).edge_pairs()
+        self.resolver = TimingNameResolver(nodes, edges)
+        resolve = self.resolver.resolve
+
+        node_columns = [table.node_columns[c] for c in DELAY_COLUMNS]
+        edge_columns = [table.edge_columns[c] for c in DELAY_COLUMNS]
+
+        # 같은 인스턴스의 IOPATH는 연속으로 오므로 직전 해석 결과를 재사용
+        last_instance: Optional[str] = None
+        last_handle: Optional[int] = None
+
+        for kind, instance, src_pin, dst_pin, triple in arcs:
+            if kind == "IOPATH":
+                table.iopaths += 1
+                if instance != last_instance:
+                    node_id = resolve(instance) if instance else None
+                    last_instance = instance
+                    last_handle = node_handles.get(node_id) if node_id is not None else None
+                if last_handle is not None:
+                    table.matched_iopaths += 1
+                    _merge(node_columns, last_handle, triple)
+                continue
+
+            table.interconnects += 1
+            if instance:
+                src_pin = f"{instance}/{src_pin}"
+                dst_pin = f"{instance}/{dst_pin}"
+            src = resolve(src_pin)
+            dst = resolve(dst_pin)
+            if src is None or dst is None or src == dst:
+                continue
+            edge_ids = edge_pairs.get((src, dst))
+            if edge_ids:
+                table.matched_interconnects += 1
+                _merge(edge_columns, edge_handles[edge_ids[0]], triple)
+
+        table.cells = self.cells if isinstance(source, str) else 0
+        return table
+
+    # ========================================================================
+    # Apply: 컬럼 → 그래프
+    # ========================================================================
+
+    def apply_to_graph(
+        self,
+        table: SdfDelayTable,
+        nodes: Dict[str, DKGNode],
+        edges: Dict[str, DKGEdge],
+        updater: GraphUpdater,
+        column: str = "max",
+        origin_file: Optional[str] = None,
+    ) -> int:
+        """
+        컬럼을 그래프에 일괄 반영.
+
+        - 엣지: column 값을 DKGEdge.delay로 (GraphUpdater 배치 업데이트)
+        - 노드: min/typ/max를 attributes["sdf_delay_<column>"]에 문자열로 (키별 배치 업데이트)
+
+        Returns:
+            delay가 갱신된 엣지 수
+        """
+        if column not in DELAY_COLUMNS:
+            raise ValueError(f"Unknown SDF delay column: {column}")
+
+        edge_ids = table.edge_ids
+        delays = {
+            edge_ids[h]: value
+            for h, value in enumerate(table.edge_columns[column])
+            if value == value
+        }
+        updated = updater.batch_update_edge_field(
+            "delay", delays, FieldSource.ANALYZED, ParsingStage.TIMING, origin_file
+        )
+
+        node_ids = table.node_ids
+        for name in DELAY_COLUMNS:
+            values = {
+                node_ids[h]: f"{value:g}"
+                for h, value in enumerate(table.node_columns[name])
+                if value == value
+            }
+            updater.batch_update_node_attribute(
+                f"sdf_delay_{name}", values, FieldSource.ANALYZED, ParsingStage.TIMING, origin_file
+            )
+        return updated
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _merge(columns: List[array], handle: int, triple: DelayTriple) -> None:
+    for i, value in enumerate(triple):
+        if value is None:
+            continue
+        column = columns[i]
+        current = column[handle]
+        if current != current or (value < current if i == 0 else value > current):
+            column[handle] = value
+
+
+def _port(spec: SExpr) -> str:
+    """IOPATH 포트: "A" 또는 (posedge CLK) → 포트 이름"""
+    while isinstance(spec, list):
+        if not spec:
+            return ""
+        spec = spec[-1]
+    return unquote(spec)
+
+
+def _parse_timescale(words: List[SExpr]) -> float:
+    """TIMESCALE 1ns / 100 ps → ns 배율 (해석 불가 시 1.0)"""
+    text = "".join(w for w in words if isinstance(w, str))
+    match = _TIMESCALE_RE.match(text)
+    if not match:
+        return 1.0
+    unit = _TIME_UNITS.get(match.group(2).lower())
+    if unit is None:
+        return 1.0
+    return float(match.group(1) or 1.0) * unit
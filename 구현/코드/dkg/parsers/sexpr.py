@@ -0,0 +1,176 @@
+"""
+S-expression 스트리밍 리더 (SDF/EDIF 공용)
+
+파일을 청크 단위로 읽으며 괄호 중첩을 따라가고, emit에 지정한 키워드의 리스트가
+닫힐 때마다 그 서브트리만 yield합니다. yield된 서브트리는 부모에 붙이지 않으므로
+파일 크기와 무관하게 메모리는 "가장 큰 emit 단위 하나" 수준으로 유지됩니다.
+iter_sexpr_scoped는 열린 조상 리스트도 함께 넘겨 "어느 cell 안의 instance인지" 같은
+문맥을 트리 없이 알 수 있게 합니다.
+
+표현:
+- 리스트: Python list (첫 원소가 키워드)
+- 원자: str (따옴표 문자열은 따옴표 포함 그대로, unquote()로 제거)
+- 키워드 비교는 대소문자 무시 (emit 키워드는 대문자로 정규화)
+
+예: (CELL (CELLTYPE "LUT2") (INSTANCE u/lut1)) → ['CELL', ['CELLTYPE', '"LUT2"'], ['INSTANCE', 'u/lut1']]
+"""
+from __future__ import annotations
+
+import re
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+SExpr = Union[str, List["SExpr"]]
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# 모두 unrolled loop 형태: (a|b)* 대신 a*(b a*)* 로 써서 문자마다 그룹에 들어가지 않게 함
+_QUOTED = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_ATOM = r'(?:[^\s()"\\]|\\.)[^\s()"\\]*(?:\\.[^\s()"\\]*)*'
+# 자식이 원자뿐인 리스트: (10:20:30), (posedge CLK)
+_LEAF = r'\([^()"\\]*(?:\\.[^()"\\]*)*\)'
+# 자식이 원자/따옴표 문자열/leaf 리스트뿐인 2단 블록: (IOPATH A Y (1:2:3) (1:2:3))
+# 파일 대부분을 차지하는 이런 블록을 정규식 한 번에 토큰 하나로 잘라 Python 루프 횟수를 줄임
+# (매칭 실패 시에도 역추적이 선형)
+_BLOCK = rf'\([^()"\\]*(?:(?:\\.|{_QUOTED}|{_LEAF})[^()"\\]*)*\)'
+
+# 블록 / 괄호 / 따옴표 문자열 / 원자 (원자 안의 "\(" 같은 escape 허용)
+_TOKEN_RE = re.compile(rf'{_BLOCK}|[()]|{_QUOTED}|{_ATOM}')
+_BLOCK_ITEM_RE = re.compile(rf'{_QUOTED}|{_LEAF}|{_ATOM}')
+_ATOM_RE = re.compile(_ATOM)
+
+
+class SExprSyntaxError(ValueError):
+    """짝이 맞지 않는 괄호"""
+
+
+def iter_sexpr_file(
+    filepath: str,
+    emit: Iterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[List[SExpr]]:
+    """파일을 스트리밍하며 emit 키워드 서브트리를 순서대로 생성"""
+    return iter_sexpr(iter_file_chunks(filepath, chunk_size), emit)
+
+
+def iter_sexpr(chunks: Iterable[str], emit: Iterable[str]) -> Iterator[List[SExpr]]:
+    """텍스트 청크 → emit 키워드 서브트리 (iter_sexpr_scoped에서 조상 정보를 뺀 것)"""
+    for expr, _ in iter_sexpr_scoped(chunks, emit):
+        yield expr
+
+
+def iter_sexpr_scoped(
+    chunks: Iterable[str],
+    emit: Iterable[str],
+) -> Iterator[Tuple[List[SExpr], List[List[SExpr]]]]:
+    """
+    텍스트 청크 → (emit 키워드 서브트리, 열린 조상 리스트 스택).
+
+    조상 스택은 바깥쪽부터 직계 부모까지이며 [0]은 파일 최상위입니다. 조상은 아직 닫히지
+    않았으므로 앞쪽 원소(키워드, 이름)만 채워져 있고, 스택은 다음 yield 전에 바뀌므로
+    필요한 값은 그 자리에서 꺼내야 합니다.
+
+    청크는 토큰 중간에서 잘리지 않아야 합니다 (iter_file_chunks는 줄 단위로 자름).
+    """
+    emit_keys = frozenset(k.upper() for k in emit)
+    stack: List[List[SExpr]] = [[]]
+    cur = stack[0]
+    findall = _TOKEN_RE.findall
+
+    for chunk in chunks:
+        for tok in findall(chunk):
+            if tok[0] == "(" and len(tok) > 1:
+                # 2단 블록: 직접 리스트로 변환 (emit 키워드인 leaf 자식은 따로 yield)
+                block: List[SExpr] = []
+                for item in _iter_block_items(tok):
+                    if type(item) is str:
+                        block.append(item)
+                        continue
+                    leaf = item
+                    if leaf and leaf[0].upper() in emit_keys:
+                        stack.append(block)
+                        yield leaf, stack
+                        stack.pop()
+                    else:
+                        block.append(leaf)
+                head = block[0] if block else None
+                if type(head) is str and head.upper() in emit_keys:
+                    yield block, stack
+                else:
+                    cur.append(block)
+            elif tok == "(":
+                cur = []
+                stack.append(cur)
+            elif tok == ")":
+                if len(stack) == 1:
+                    raise SExprSyntaxError("unbalanced ')'")
+                done = stack.pop()
+                cur = stack[-1]
+                head = done[0] if done else None
+                if type(head) is str and head.upper() in emit_keys:
+                    yield done, stack
+                else:
+                    cur.append(done)
+            else:
+                cur.append(tok)
+
+    if len(stack) > 1:
+        raise SExprSyntaxError(f"{len(stack) - 1} unclosed '('")
+
+
+def _iter_block_items(tok: str) -> Iterator[SExpr]:
+    """2단 블록 토큰 → 자식 (원자는 str, leaf 리스트는 list)"""
+    if '"' in tok or "\\" in tok:
+        for item in _BLOCK_ITEM_RE.findall(tok, 1, len(tok) - 1):
+            if item[0] == "(":
+                yield _ATOM_RE.findall(item, 1, len(item) - 1)
+            else:
+                yield item
+        return
+    # 따옴표/escape가 없으면 원자는 공백으로만 구분되므로 split으로 충분
+    # (예: (portref O (instanceref u_5_)) → "portref O ( instanceref u_5_ )")
+    leaf: Optional[List[SExpr]] = None
+    for word in tok[1:-1].replace("(", " ( ").replace(")", " ) ").split():
+        if word == "(":
+            leaf = []
+        elif word == ")":
+            yield leaf
+            leaf = None
+        elif leaf is None:
+            yield word
+        else:
+            leaf.append(word)
+
+
+def unquote(atom: SExpr) -> str:
+    """따옴표 문자열 → 내용 (원자가 아니면 빈 문자열)"""
+    if not isinstance(atom, str):
+        return ""
+    if len(atom) >= 2 and atom[0] == '"' and atom[-1] == '"':
+        return atom[1:-1]
+    return atom
+
+
+def keyword(expr: SExpr) -> str:
+    """리스트의 키워드 (대문자, 리스트가 아니면 빈 문자열)"""
+    if isinstance(expr, list) and expr and isinstance(expr[0], str):
+        return expr[0].upper()
+    return ""
+
+
+def iter_file_chunks(filepath: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """파일 → 줄 경계에서 자른 청크 (토큰이 청크 사이에 걸치지 않도록)"""
+    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+        rest = ""
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                break
+            data = rest + data
+            cut = data.rfind("\n")
+            if cut < 0:
+                rest = data
+                continue
+            rest = data[cut + 1:]
+            yield data[: cut + 1]
+        if rest:
+            yield rest
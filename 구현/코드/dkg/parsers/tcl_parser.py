@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import re
 from typing import Dict, Optional
 
 from ..core.graph import DKGEdge, DKGNode
 from ..builders.graph_updater import GraphUpdater
 from ..pipeline.stages import FieldSource, ParsingStage
 from . import ConstraintParser
+from .tcl_tokenizer import TclCommand
 
 
 class TclParser(ConstraintParser):
@@ -27,19 +27,13 @@ class TclParser(ConstraintParser):
         nodes: Dict[str, DKGNode],
         edges: Dict[str, DKGEdge],
     ) -> None:
-        with open(filepath, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
         top_scope: Optional[str] = None
         design_context: Optional[str] = None
 
-        for line in lines:
-            raw = line.strip()
-            if not raw or raw.startswith("#"):
-                continue
-
-            top_scope = top_scope or self._parse_top_scope(raw)
-            design_context = design_context or self._parse_design_context(raw)
+        # 모든 명령을 보아야 하므로 핸들러 테이블 대신 직접 순회
+        for cmd in self.iter_commands(filepath):
+            top_scope = top_scope or self._parse_top_scope(cmd)
+            design_context = design_context or self._parse_design_context(cmd)
 
         if not top_scope and not design_context:
             return
@@ -64,26 +58,34 @@ class TclParser(ConstraintParser):
                 None,
             )
 
-    def _parse_top_scope(self, line: str) -> Optional[str]:
-        match = re.search(r"set_property\s+top\s+(\S+)", line)
-        if match:
-            return match.group(1)
+    def _parse_top_scope(self, cmd: TclCommand) -> Optional[str]:
+        args = cmd.positionals
+        if len(args) < 2 or not isinstance(args[0], str) or not isinstance(args[1], str):
+            return None
+
+        if cmd.name == "set_property" and args[0] == "top":
+            return args[1]
 
-        match = re.search(r"set\s+top_(?:module|scope)\s+(\S+)", line)
-        if match:
-            return match.group(1)
+        if cmd.name == "set" and args[0] in ("top_module", "top_scope"):
+            return args[1]
 
         return None
 
-    def _parse_design_context(self, line: str) -> Optional[str]:
-        if "-simset" in line or "simulation" in line.lower():
+    def _parse_design_context(self, cmd: TclCommand) -> Optional[str]:
+        text = cmd.text
+        if cmd.has_flag("-simset") or "simulation" in text.lower():
             return "sim"
-        if "-constrset" in line or "synth" in line.lower():
+        if cmd.has_flag("-constrset") or "synth" in text.lower():
             return "design"
 
-        match = re.search(r"set_property\s+design_mode\s+(\S+)", line)
-        if match:
-            value = match.group(1).lower()
+        args = cmd.positionals
+        if (
+            cmd.name == "set_property"
+            and len(args) >= 2
+            and args[0] == "design_mode"
+            and isinstance(args[1], str)
+        ):
+            value = args[1].lower()
             return "sim" if "sim" in value else "design"
 
         return None
@@ -0,0 +1,735 @@
+"""
+Tcl-subset 토크나이저 (SDC/XDC/TCL 공용)
+
+파일을 한 번만 스트리밍하면서 명령 단위 AST(TclCommand)를 생성합니다.
+
+지원 범위:
+- 줄 연속 (`\\` + 개행), 여러 줄에 걸친 중괄호/대괄호/따옴표
+- `;` 명령 구분, `#` 주석
+- `set var value` 변수 정의와 `$var` / `${var}` 치환
+- `foreach var {list} { body }` (다중 변수 포함) 본문 전개
+- 중첩 `[get_* ...]` 쿼리 → TclQuery
+- `-option value` / `-flag` 옵션 분리
+
+지원하지 않는 것: proc, if/while, expr 평가 (명령은 그대로 yield되며 핸들러가 없으면 무시됨)
+
+괄호가 맞지 않는 명령은 파일 전체를 중단하지 않고 (줄 번호, 메시지)를 errors에 남긴 뒤
+다음 최상위 줄부터 계속 읽습니다.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# 값을 받지 않는 SDC/XDC 옵션 (이 외의 -option은 다음 단어를 값으로 취함)
+FLAG_OPTIONS = frozenset({
+    "-setup", "-hold", "-rise", "-fall", "-start", "-end",
+    "-max", "-min", "-add", "-add_delay", "-clock_fall", "-level_sensitive",
+    "-datapath_only", "-quiet", "-verbose", "-hierarchical", "-hier", "-regexp", "-nocase",
+    "-asynchronous", "-physically_exclusive", "-logically_exclusive",
+    "-invert", "-combinational", "-remove", "-reset_path", "-no_latency",
+    "-network_latency_included", "-source_latency_included", "-leaf", "-filter_only",
+})
+
+# 명령별 옵션 arity (FLAG_OPTIONS보다 우선): 옵션 → 값을 받는지.
+# 같은 이름이 명령마다 다르게 쓰이는 경우 (create_clock -add는 플래그, resize_pblock -add는 범위 값)
+COMMAND_OPTION_ARITY: Dict[str, Dict[str, bool]] = {
+    "resize_pblock": {"-add": True, "-remove": True, "-replace": False},
+}
+
+# 타이밍 제약 target으로 인정하는 쿼리 오브젝트 타입 (get_<type>)
+DEFAULT_TARGET_TYPES = ("ports", "pins", "cells", "nets")
+
+TclWord = Union[str, "TclQuery"]
+
+_NUMBER_RE = re.compile(r"^-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?$")
+_VAR_RE = re.compile(r"\$(?:\{([^}]*)\}|([A-Za-z0-9_:]+))")
+_BUS_INDEX_RE = re.compile(r"\[[\d:*]*\]")
+_SPACE_RE = re.compile(r"\s*")
+_NONSPACE_RE = re.compile(r"\S+")
+# ${var}는 중괄호를 포함해도 한 단어 조각으로 취급 (치환 전에 쪼개지지 않도록)
+_BARE_RE = re.compile(r"(?:\$\{[^}]*\}|[^\s\[\]\"{};])+")
+_BRACE_SCAN_RE = re.compile(r"\\.|[{}]", re.DOTALL)
+_BRACKET_SCAN_RE = re.compile(r"\\.|[\[\]{}\"]", re.DOTALL)
+_QUOTE_SCAN_RE = re.compile(r"\\.|[\"\[]", re.DOTALL)
+_COMMAND_SPLIT_CHARS = frozenset(";\n")
+# 빠른 경로: 중괄호/따옴표/치환이 없는 줄은 findall 한 번으로 토큰화
+_FAST_TOKEN_RE = re.compile(r"[^\s\[\]]+(?:\[[\d:*]*\][^\s\[\]]*)*\[?|\[|\][^\s\[\]]?")
+_FAST_REJECT_RE = re.compile(r"[{}\"\\$;]")
+# -filter에서 해석하는 조건: NAME =~ glob / NAME == name (괄호 허용)
+_FILTER_NAME_RE = re.compile(r'^\s*\(?\s*NAME\s*(?:=~|==)\s*"?([^"\s|&()]+)"?\s*\)?\s*$', re.IGNORECASE)
+
+
+class TclSyntaxError(ValueError):
+    """닫히지 않은 괄호 등 토크나이즈 불가능한 입력"""
+
+
+# ============================================================================
+# AST
+# ============================================================================
+
+
+@dataclass
+class TclQuery:
+    """중첩 오브젝트 쿼리. 예: [get_pins -hier {a/* b/*}]"""
+
+    command: str
+    patterns: List[str] = field(default_factory=list)
+    options: Dict[str, List[Any]] = field(default_factory=dict)
+
+    @property
+    def object_type(self) -> str:
+        """get_ports → ports, all_inputs → inputs"""
+        name = self.command
+        for prefix in ("get_", "all_"):
+            if name.startswith(prefix):
+                return name[len(prefix):]
+        return name
+
+    def all_patterns(self) -> List[str]:
+        """-of_objects 중첩 쿼리까지 포함한 패턴 목록"""
+        result = list(self.patterns)
+        for value in self.options.get("-of_objects", []):
+            result.extend(word_targets(value, None))
+        return result
+
+    def name_patterns(self) -> Optional[List[str]]:
+        """
+        -filter까지 반영한 이름 패턴 (해석할 수 없으면 None).
+
+        - 패턴도 -filter도 없으면 전체 ("*")
+        - -filter는 NAME 조건을 ||로 이은 형태만 패턴으로 바꿈
+          (다른 속성 조건이나 이름 패턴과 함께 쓴 필터는 None)
+        """
+        patterns = self.all_patterns()
+        filters = self.options.get("-filter")
+        if not filters:
+            return patterns or ["*"]
+        if len(filters) != 1 or not isinstance(filters[0], str):
+            return None
+        if any(p != "*" for p in patterns):
+            return None
+        result: List[str] = []
+        for clause in filters[0].split("||"):
+            m = _FILTER_NAME_RE.match(clause)
+            if m is None:
+                return None
+            result.append(m.group(1))
+        return result
+
+
+@dataclass
+class TclCommand:
+    """한 개의 Tcl 명령"""
+
+    name: str
+    args: List[TclWord]
+    line: int
+    options: Dict[str, List[Any]] = field(default_factory=dict)
+    positionals: List[TclWord] = field(default_factory=list)
+    text: str = ""  # 원문 (휴리스틱용)
+
+    def option(self, name: str, default: Any = None) -> Any:
+        """옵션의 마지막 값 (반복 가능한 옵션은 option_all 사용)"""
+        values = self.options.get(name)
+        return values[-1] if values else default
+
+    def option_all(self, name: str) -> List[Any]:
+        return self.options.get(name, [])
+
+    def has_flag(self, name: str) -> bool:
+        return name in self.options
+
+    def option_targets(
+        self,
+        name: str,
+        object_types: Optional[Sequence[str]] = DEFAULT_TARGET_TYPES,
+    ) -> List[str]:
+        """-from/-to 같은 옵션 값에서 target 패턴 추출"""
+        targets: List[str] = []
+        for value in self.option_all(name):
+            targets.extend(word_targets(value, object_types))
+        return targets
+
+    def option_target_groups(
+        self,
+        name: str,
+        object_types: Optional[Sequence[str]] = DEFAULT_TARGET_TYPES,
+    ) -> List[List[str]]:
+        """반복 옵션(-through)의 각 occurrence별 target 그룹"""
+        groups: List[List[str]] = []
+        for value in self.option_all(name):
+            group = word_targets(value, object_types)
+            if group:
+                groups.append(group)
+        return groups
+
+    def positional_targets(
+        self,
+        object_types: Optional[Sequence[str]] = DEFAULT_TARGET_TYPES,
+    ) -> List[str]:
+        """positional 인자 중 쿼리 target 패턴 (문자열 인자는 제외)"""
+        targets: List[str] = []
+        for word in self.positionals:
+            if isinstance(word, TclQuery):
+                targets.extend(word_targets(word, object_types))
+        return targets
+
+
+def word_targets(word: Any, object_types: Optional[Sequence[str]]) -> List[str]:
+    """단어(문자열 리스트 또는 TclQuery)에서 target 패턴 추출"""
+    if isinstance(word, TclQuery):
+        if object_types is not None and word.object_type not in object_types:
+            return []
+        return word.all_patterns()
+    if isinstance(word, str):
+        return split_tcl_list(word)
+    return []
+
+
+# ============================================================================
+# Low-level scanning helpers
+# ============================================================================
+
+
+def split_tcl_list(text: str) -> List[str]:
+    """Tcl 리스트 문자열 분리 ({a b} "c d" e → ['a b', 'c d', 'e'])"""
+    text = text.strip()
+    if not text:
+        return []
+    if "{" not in text and '"' not in text:
+        return text.split()
+
+    items: List[str] = []
+    pos = 0
+    n = len(text)
+    while True:
+        pos = _SPACE_RE.match(text, pos).end()
+        if pos >= n:
+            break
+        ch = text[pos]
+        if ch == "{":
+            end = _find_brace_end(text, pos)
+            items.append(text[pos + 1:end])
+            pos = end + 1
+        elif ch == '"':
+            end = text.find('"', pos + 1)
+            if end < 0:
+                end = n
+            items.append(text[pos + 1:end])
+            pos = end + 1
+        else:
+            m = _NONSPACE_RE.match(text, pos)
+            items.append(m.group(0))
+            pos = m.end()
+    return items
+
+
+def _find_brace_end(text: str, start: int) -> int:
+    """text[start] == '{' 의 짝 '}' 인덱스"""
+    depth = 0
+    for m in _BRACE_SCAN_RE.finditer(text, start):
+        tok = m.group(0)
+        if tok == "{":
+            depth += 1
+        elif tok == "}":
+            depth -= 1
+            if depth == 0:
+                return m.start()
+    raise TclSyntaxError(f"unbalanced brace: {text[start:start + 40]!r}")
+
+
+def _find_bracket_end(text: str, start: int) -> int:
+    """text[start] == '[' 의 짝 ']' 인덱스 (내부 중괄호/따옴표 고려)"""
+    depth = 0
+    pos = start
+    while True:
+        m = _BRACKET_SCAN_RE.search(text, pos)
+        if m is None:
+            raise TclSyntaxError(f"unbalanced bracket: {text[start:start + 40]!r}")
+        tok = m.group(0)
+        if tok == "[":
+            depth += 1
+            pos = m.end()
+        elif tok == "]":
+            depth -= 1
+            if depth == 0:
+                return m.start()
+            pos = m.end()
+        elif tok == "{":
+            pos = _find_brace_end(text, m.start()) + 1
+        elif tok == '"':
+            end = text.find('"', m.end())
+            pos = (end + 1) if end >= 0 else len(text)
+        else:
+            pos = m.end()
+
+
+# 누적 버퍼의 열린 괄호 상태: (중괄호 깊이, 대괄호 깊이, 따옴표 안)
+_ScanState = Tuple[int, int, bool]
+_CLOSED: _ScanState = (0, 0, False)
+
+
+def _is_complete(text: str) -> bool:
+    """중괄호/대괄호/따옴표가 모두 닫혔는지 (한 줄 판정용)"""
+    if "\\" not in text and '"' not in text:
+        return text.count("{") <= text.count("}") and text.count("[") <= text.count("]")
+    return _scan_open(text, _CLOSED) == _CLOSED
+
+
+def _scan_open(text: str, state: _ScanState) -> _ScanState:
+    """state에서 text를 이어 읽은 뒤의 열린 괄호 상태 (여러 줄 명령을 줄마다 한 번만 스캔)"""
+    depth_brace, depth_bracket, in_quote = state
+    i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if depth_brace:
+            if ch == "{":
+                depth_brace += 1
+            elif ch == "}":
+                depth_brace -= 1
+        elif ch == '"' and not depth_bracket:
+            in_quote = not in_quote
+        elif ch == "{" and not in_quote:
+            depth_brace += 1
+        elif ch == "[":
+            depth_bracket += 1
+        elif ch == "]" and depth_bracket:
+            depth_bracket -= 1
+        i += 1
+    return depth_brace, depth_bracket, in_quote
+
+
+def _is_number(word: str) -> bool:
+    return _NUMBER_RE.match(word) is not None
+
+
+# ============================================================================
+# Tokenizer
+# ============================================================================
+
+
+class TclTokenizer:
+    """
+    스트리밍 Tcl-subset 토크나이저.
+
+    Usage:
+        tok = TclTokenizer()
+        with open("top.xdc") as f:
+            for cmd in tok.iter_commands(f):
+                ...
+    """
+
+    def __init__(self, variables: Optional[Dict[str, str]] = None):
+        self.variables: Dict[str, str] = dict(variables or {})
+        # 건너뛴 명령: (시작 줄 번호, 메시지)
+        self.errors: List[Tuple[int, str]] = []
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def iter_commands(self, lines: Iterable[str], first_line: int = 1) -> Iterator[TclCommand]:
+        """줄 iterable에서 명령을 순서대로 생성 (한 번만 순회)"""
+        for text, line_num in self._iter_logical_lines(lines, first_line):
+            try:
+                for cmd in self._iter_script(text, line_num):
+                    yield cmd
+            except TclSyntaxError as exc:
+                # 이 명령(논리 줄)만 버리고 다음 줄부터 계속
+                self.errors.append((line_num, str(exc)))
+
+    def iter_script(self, script: str, first_line: int = 1) -> Iterator[TclCommand]:
+        """문자열 스크립트에서 명령 생성"""
+        return self.iter_commands(script.splitlines(), first_line)
+
+    # ------------------------------------------------------------------
+    # Logical line assembly
+    # ------------------------------------------------------------------
+
+    def _iter_logical_lines(
+        self, lines: Iterable[str], first_line: int
+    ) -> Iterator[Tuple[str, int]]:
+        leftover = yield from self._assemble_lines(enumerate(lines, first_line))
+        while leftover:
+            leftover = yield from self._assemble_lines(leftover)
+
+    def _assemble_lines(
+        self, numbered: Iterable[Tuple[int, str]]
+    ) -> Generator[Tuple[str, int], None, Optional[List[Tuple[int, str]]]]:
+        """
+        (줄 번호, 원문) → (논리 줄, 시작 줄 번호).
+
+        파일 끝까지 닫히지 않은 명령은 시작 줄만 errors에 남기고 버리며,
+        그 다음 줄들을 돌려줘 _iter_logical_lines가 다시 조립하게 합니다.
+        """
+        buf: List[str] = []
+        buf_lines: List[Tuple[int, str]] = []
+        state = _CLOSED
+        start_line = 0
+
+        for line_num, raw in numbered:
+            line = raw.rstrip("\r\n")
+
+            if not buf:
+                stripped = line.lstrip()
+                if not stripped or stripped[0] == "#":
+                    continue
+                start_line = line_num
+                # 빠른 경로: 괄호/따옴표/연속이 없는 일반적인 한 줄 명령
+                if line[-1] != "\\" and _is_complete(line):
+                    yield line, start_line
+                    continue
+
+            buf_lines.append((line_num, raw))
+            if line.endswith("\\") and not line.endswith("\\\\"):
+                buf.append(line[:-1])
+                buf.append(" ")
+                state = _scan_open(line[:-1], state)
+                continue
+
+            buf.append(line)
+            state = _scan_open(line, state)
+            if state == _CLOSED:
+                yield "".join(buf), start_line
+                buf = []
+                buf_lines = []
+            else:
+                buf.append("\n")
+
+        if buf and "".join(buf).strip():
+            first = buf_lines[0][1].strip()
+            self.errors.append((start_line, f"unterminated command: {first[:40]!r}"))
+            return buf_lines[1:]
+        return None
+
+    # ------------------------------------------------------------------
+    # Script / command parsing
+    # ------------------------------------------------------------------
+
+    def _iter_script(self, text: str, line_num: int) -> Iterator[TclCommand]:
+        if ";" not in text and "\n" not in text:
+            yield from self._iter_command(text, line_num)
+            return
+
+        for chunk, offset in self._split_commands(text):
+            stripped = chunk.strip()
+            if not stripped or stripped[0] == "#":
+                continue
+            yield from self._iter_command(chunk, line_num + offset)
+
+    def _split_commands(self, text: str) -> Iterator[Tuple[str, int]]:
+        """depth 0의 `;`/개행으로 명령 분리 (줄 오프셋 포함)"""
+        start = 0
+        pos = 0
+        n = len(text)
+        line_offset = 0
+        chunk_offset = 0
+        while pos < n:
+            ch = text[pos]
+            if ch == "{":
+                end = _find_brace_end(text, pos)
+                line_offset += text.count("\n", pos, end)
+                pos = end + 1
+                continue
+            if ch == "[":
+                end = _find_bracket_end(text, pos)
+                line_offset += text.count("\n", pos, end)
+                pos = end + 1
+                continue
+            if ch == '"':
+                end = text.find('"', pos + 1)
+                end = n - 1 if end < 0 else end
+                line_offset += text.count("\n", pos, end)
+                pos = end + 1
+                continue
+            if ch == "\\":
+                pos += 2
+                continue
+            if ch in _COMMAND_SPLIT_CHARS:
+                yield text[start:pos], chunk_offset
+                if ch == "\n":
+                    line_offset += 1
+                start = pos + 1
+                chunk_offset = line_offset
+            pos += 1
+        if start < n:
+            yield text[start:], chunk_offset
+
+    def _iter_command(self, text: str, line_num: int) -> Iterator[TclCommand]:
+        words = self._split_words(text)
+        if not words or not isinstance(words[0], str):
+            return
+
+        name = words[0]
+        args = words[1:]
+
+        if name == "foreach":
+            # foreach 자체는 명령으로 내보내지 않고 본문을 전개
+            yield from self._expand_foreach(args, line_num)
+            return
+
+        if name == "set" and len(args) >= 2 and isinstance(args[0], str):
+            self.variables[args[0]] = _word_to_str(args[1])
+
+        options, positionals = parse_options(args, name)
+        yield TclCommand(
+            name=name,
+            args=args,
+            line=line_num,
+            options=options,
+            positionals=positionals,
+            text=text.strip(),
+        )
+
+    def _expand_foreach(self, args: List[TclWord], line_num: int) -> Iterator[TclCommand]:
+        if len(args) < 3 or not isinstance(args[-1], str):
+            return
+        body = args[-1]
+        pairs = args[:-1]
+        bindings: List[Tuple[List[str], List[str]]] = []
+        for i in range(0, len(pairs) - 1, 2):
+            var_names = split_tcl_list(_word_to_str(pairs[i]))
+            values = word_targets(pairs[i + 1], None)
+            bindings.append((var_names, values))
+        if not bindings:
+            return
+
+        iterations = max(
+            (len(values) + len(names) - 1) // len(names) if names else 0
+            for names, values in bindings
+        )
+        saved = dict(self.variables)
+        try:
+            for it in range(iterations):
+                for names, values in bindings:
+                    for k, var in enumerate(names):
+                        idx = it * len(names) + k
+                        self.variables[var] = values[idx] if idx < len(values) else ""
+                yield from self._iter_script(body, line_num)
+        finally:
+            # foreach 본문 안의 set은 바깥으로 유지 (Tcl 전역 스코프 의미론)
+            loop_vars = {v for names, _ in bindings for v in names}
+            for var in loop_vars:
+                if var in saved:
+                    self.variables[var] = saved[var]
+                else:
+                    self.variables.pop(var, None)
+
+    # ------------------------------------------------------------------
+    # Word splitting
+    # ------------------------------------------------------------------
+
+    def _split_words(self, text: str) -> List[TclWord]:
+        if _FAST_REJECT_RE.search(text) is None:
+            fast = _split_words_fast(text)
+            if fast is not None:
+                return fast
+
+        words: List[TclWord] = []
+        pos = 0
+        n = len(text)
+        while True:
+            pos = _SPACE_RE.match(text, pos).end()
+            if pos >= n:
+                break
+            ch = text[pos]
+            if ch == "{":
+                end = _find_brace_end(text, pos)
+                words.append(text[pos + 1:end])
+                pos = end + 1
+            elif ch == '"':
+                word, pos = self._scan_quoted(text, pos)
+                words.append(word)
+            elif ch == ";":
+                pos += 1
+            else:
+                word, pos = self._scan_bare(text, pos)
+                words.append(word)
+        return words
+
+    def _scan_quoted(self, text: str, start: int) -> Tuple[str, int]:
+        parts: List[str] = []
+        pos = start + 1
+        while True:
+            m = _QUOTE_SCAN_RE.search(text, pos)
+            if m is None:
+                raise TclSyntaxError(f"unterminated quote: {text[start:start + 40]!r}")
+            parts.append(text[pos:m.start()])
+            tok = m.group(0)
+            if tok == '"':
+                pos = m.end()
+                break
+            if tok == "[":
+                end = _find_bracket_end(text, m.start())
+                parts.append(_word_to_str(self._eval_bracket(text[m.start() + 1:end])))
+                pos = end + 1
+            else:
+                parts.append(tok[1:])
+                pos = m.end()
+        return self._substitute("".join(parts)), pos
+
+    def _scan_bare(self, text: str, start: int) -> Tuple[TclWord, int]:
+        """공백 전까지의 bare word (중첩 [cmd] 및 버스 인덱스 포함)"""
+        pieces: List[TclWord] = []
+        pos = start
+        n = len(text)
+        while pos < n:
+            m = _BARE_RE.match(text, pos)
+            if m is not None:
+                pieces.append(self._substitute(m.group(0)))
+                pos = m.end()
+                continue
+            ch = text[pos]
+            if ch == "[":
+                bus = _BUS_INDEX_RE.match(text, pos)
+                if bus is not None and pieces:
+                    # pc_reg[3] 같은 버스 인덱스는 명령 치환이 아니라 리터럴
+                    pieces.append(bus.group(0))
+                    pos = bus.end()
+                    continue
+                end = _find_bracket_end(text, pos)
+                pieces.append(self._eval_bracket(text[pos + 1:end]))
+                pos = end + 1
+                continue
+            if ch == "\\" and pos + 1 < n:
+                pieces.append(text[pos + 1])
+                pos += 2
+                continue
+            if ch in "]{}\"" and pieces:
+                pieces.append(ch)
+                pos += 1
+                continue
+            break
+
+        if len(pieces) == 1:
+            return pieces[0], pos
+        return "".join(_word_to_str(p) for p in pieces), pos
+
+    def _eval_bracket(self, inner: str) -> TclWord:
+        """[cmd ...] 치환: get_*/all_* 쿼리는 TclQuery, list는 문자열"""
+        words = self._split_words(inner)
+        if not words or not isinstance(words[0], str):
+            return ""
+        name = words[0]
+        args = words[1:]
+        if name == "list":
+            return " ".join(
+                "{%s}" % w if (isinstance(w, str) and (" " in w or not w)) else _word_to_str(w)
+                for w in args
+            )
+        if name == "concat":
+            return " ".join(_word_to_str(w) for w in args)
+        return _make_query(name, args)
+
+    def _substitute(self, word: str) -> str:
+        if "$" not in word:
+            return word
+        variables = self.variables
+
+        def repl(m: re.Match) -> str:
+            name = m.group(1) if m.group(1) is not None else m.group(2)
+            if name in variables:
+                return variables[name]
+            return m.group(0)
+
+        return _VAR_RE.sub(repl, word)
+
+
+def _make_query(name: str, args: Sequence[TclWord]) -> TclQuery:
+    options, positionals = parse_options(args, name)
+    patterns: List[str] = []
+    for w in positionals:
+        patterns.extend(word_targets(w, None))
+    return TclQuery(command=name, patterns=patterns, options=options)
+
+
+def _split_words_fast(text: str) -> Optional[List[TclWord]]:
+    """단순 줄 토큰화 (대괄호 중첩만 처리). 처리 불가 시 None"""
+    stack: List[List[TclWord]] = []
+    words: List[TclWord] = []
+    for tok in _FAST_TOKEN_RE.findall(text):
+        if tok == "[":
+            stack.append(words)
+            words = []
+        elif tok[0] == "]":
+            # `[cmd]suffix` 처럼 붙은 단어는 느린 경로로
+            if len(tok) > 1 or not stack or not words or not isinstance(words[0], str):
+                return None
+            name = words[0]
+            if name in ("list", "concat"):
+                return None
+            query = _make_query(name, words[1:])
+            words = stack.pop()
+            words.append(query)
+        elif tok[-1] == "[":
+            return None
+        else:
+            words.append(tok)
+    if stack:
+        return None
+    return words
+
+
+def _word_to_str(word: Any) -> str:
+    if isinstance(word, TclQuery):
+        return " ".join(word.patterns)
+    if word is True:
+        return ""
+    return str(word)
+
+
+def parse_options(
+    args: Sequence[TclWord],
+    command: Optional[str] = None,
+) -> Tuple[Dict[str, List[Any]], List[TclWord]]:
+    """인자 리스트를 옵션 dict와 positional 리스트로 분리 (command: 명령별 arity 적용)"""
+    arity = COMMAND_OPTION_ARITY.get(command, {}) if command else {}
+    options: Dict[str, List[Any]] = {}
+    positionals: List[TclWord] = []
+    i = 0
+    n = len(args)
+    while i < n:
+        word = args[i]
+        if (
+            isinstance(word, str)
+            and len(word) > 1
+            and word[0] == "-"
+            and not _is_number(word)
+        ):
+            nxt = args[i + 1] if i + 1 < n else None
+            takes_value = (
+                arity.get(word, word not in FLAG_OPTIONS)
+                and nxt is not None
+                and not (
+                    isinstance(nxt, str)
+                    and len(nxt) > 1
+                    and nxt[0] == "-"
+                    and not _is_number(nxt)
+                )
+            )
+            if takes_value:
+                options.setdefault(word, []).append(nxt)
+                i += 2
+            else:
+                options.setdefault(word, []).append(True)
+                i += 1
+            continue
+        positionals.append(word)
+        i += 1
+    return options, positionals
+
+
+def iter_tcl_file(
+    filepath: str,
+    variables: Optional[Dict[str, str]] = None,
+) -> Iterator[TclCommand]:
+    """파일을 스트리밍하며 TclCommand 생성"""
+    tokenizer = TclTokenizer(variables)
+    with open(filepath, "r", encoding="utf-8", errors="replace") as f:
+        yield from tokenizer.iter_commands(f)
@@ -12,16 +12,29 @@
 - Setup path와 Hold path가 다름
 - 여러 클럭 도메인 존재
 - 따라서 worst-case 값만 저장하고, 상세 정보는 메타데이터에 누적
+  (객체별 경로 목록은 top_k개로 제한하고 전체 개수만 세므로 스트리밍 반영도 bounded memory)
 """
 from __future__ import annotations
 
+import heapq
+import io
+from bisect import insort
+import mmap
+import os
 import re
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
+from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from ..core.graph import DKGEdge, DKGNode
 from ..builders.graph_updater import GraphUpdater
+from ..builders.reachability import ReachabilityIndex
+from ..builders.timing_corners import DEFAULT_CORNER, TimingCornerStore, analysis_of
+from ..builders.timing_name_resolver import TimingNameResolver
 
 
 @dataclass
@@ -48,180 +61,553 @@ class TimingPath:
     stages: List[TimingStage] = field(default_factory=list)
 
 
+@dataclass
+class TimingPathTable:
+    """
+    타이밍 경로의 컬럼형 표현 (샤드 병렬 파싱 결과 전달용).
+
+    TimingPath 객체 리스트를 pickle로 주고받으면 역직렬화가 파싱보다 느리므로,
+    프로세스 간에는 문자열 리스트 + array('d') 컬럼으로 전달합니다.
+    stage 컬럼은 모든 경로의 stage를 이어 붙인 것이며 경로 i의 stage는
+    stage_offsets[i]:stage_offsets[i+1] 범위입니다. 실수 컬럼의 None은 NaN으로 저장합니다.
+    """
+    startpoints: List[str] = field(default_factory=list)
+    endpoints: List[str] = field(default_factory=list)
+    clocks: List[str] = field(default_factory=list)
+    path_types: List[str] = field(default_factory=list)
+    slacks: array = field(default_factory=lambda: array('d'))
+    arrival_times: array = field(default_factory=lambda: array('d'))
+    required_times: array = field(default_factory=lambda: array('d'))
+
+    stage_offsets: array = field(default_factory=lambda: array('q', [0]))
+    stage_points: List[str] = field(default_factory=list)
+    stage_incr: array = field(default_factory=lambda: array('d'))
+    stage_cumulative: array = field(default_factory=lambda: array('d'))
+    stage_transitions: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.startpoints)
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[TimingPath]) -> TimingPathTable:
+        table = cls()
+        for path in paths:
+            table.append(path)
+        return table
+
+    def append(self, path: TimingPath) -> None:
+        self.startpoints.append(path.startpoint)
+        self.endpoints.append(path.endpoint)
+        self.clocks.append(path.clock)
+        self.path_types.append(path.path_type)
+        self.slacks.append(_NAN if path.slack is None else path.slack)
+        self.arrival_times.append(_NAN if path.arrival_time is None else path.arrival_time)
+        self.required_times.append(_NAN if path.required_time is None else path.required_time)
+
+        for stage in path.stages:
+            self.stage_points.append(stage.point)
+            self.stage_incr.append(stage.incr_delay)
+            self.stage_cumulative.append(stage.cumulative_delay)
+            self.stage_transitions.append(stage.transition)
+        self.stage_offsets.append(len(self.stage_points))
+
+    def iter_paths(self) -> Iterator[TimingPath]:
+        """컬럼 → TimingPath (원래 순서)"""
+        offsets = self.stage_offsets
+        points = self.stage_points
+        incr = self.stage_incr
+        cumulative = self.stage_cumulative
+        transitions = self.stage_transitions
+        for i in range(len(self.startpoints)):
+            lo = offsets[i]
+            hi = offsets[i + 1]
+            yield TimingPath(
+                startpoint=self.startpoints[i],
+                endpoint=self.endpoints[i],
+                clock=self.clocks[i],
+                path_type=self.path_types[i],
+                slack=_optional(self.slacks[i]),
+                arrival_time=_optional(self.arrival_times[i]),
+                required_time=_optional(self.required_times[i]),
+                stages=[
+                    TimingStage(p, a, c, t)
+                    for p, a, c, t in zip(
+                        points[lo:hi], incr[lo:hi], cumulative[lo:hi], transitions[lo:hi]
+                    )
+                ],
+            )
+
+
+_NAN = float('nan')
+_INF = float('inf')
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if value != value else value
+
+
+# ============================================================================
+# Retention
+# ============================================================================
+# parse_file이 self.paths에 남기는 경로를 정하는 정책. 요약 통계는 정책과 무관하게
+# 스트리밍 중 전체 경로로 누적하므로 TOP_K 계열은 리포트 크기와 무관한 메모리로 동작합니다.
+
+DEFAULT_TOP_K = 100
+
+
+class PathRetention(Enum):
+    """TimingReportParser.paths 보관 정책"""
+    ALL = "all"                                    # 전체 경로
+    TOP_K = "top_k"                                # 전체에서 slack 최악 K개
+    TOP_K_PER_ENDPOINT = "top_k_per_endpoint"      # endpoint별 최악 K개
+    TOP_K_PER_CLOCK = "top_k_per_clock"            # 클럭 그룹별 최악 K개
+
+
+@dataclass
+class TimingSummaryStats:
+    """스트리밍 중 누적하는 요약 통계 (보관 정책과 무관하게 전체 경로 기준)"""
+    total_paths: int = 0
+    worst_slack: Optional[float] = None
+    met_timing: int = 0
+    failed_timing: int = 0
+    clocks: Dict[str, None] = field(default_factory=dict)  # 등장 순서를 보존하는 set
+
+    def add(self, path: TimingPath) -> None:
+        self.total_paths += 1
+        slack = path.slack
+        if slack is not None:
+            if slack >= 0:
+                self.met_timing += 1
+            else:
+                self.failed_timing += 1
+            if self.worst_slack is None or slack < self.worst_slack:
+                self.worst_slack = slack
+        if path.clock:
+            self.clocks[path.clock] = None
+
+    def to_summary(self) -> Dict:
+        if not self.total_paths:
+            return {'total_paths': 0}
+        return {
+            'total_paths': self.total_paths,
+            'worst_slack': self.worst_slack,
+            'met_timing': self.met_timing,
+            'failed_timing': self.failed_timing,
+            'clocks': list(self.clocks),
+        }
+
+
+class PathRetainer:
+    """
+    보관 정책에 따라 경로를 고르는 그룹별 bounded heap.
+
+    heap 항목은 (-slack, -순번, path)이므로 root가 보관 중 가장 덜 critical한 경로
+    (slack 최대, 같으면 나중에 들어온 것)이고, heappushpop 한 번으로 교체됩니다.
+    slack이 없는 경로는 가장 덜 critical한 것으로 취급합니다.
+    """
+
+    def __init__(self, policy: PathRetention = PathRetention.ALL, top_k: int = DEFAULT_TOP_K):
+        if policy is not PathRetention.ALL and top_k < 1:
+            raise ValueError(f"top_k must be >= 1: {top_k}")
+        self.policy = policy
+        self.top_k = top_k
+        self._all: List[TimingPath] = []
+        self._heaps: Dict[Optional[str], List[Tuple[float, int, TimingPath]]] = {}
+        self._seq = 0
+
+    def add(self, path: TimingPath) -> None:
+        policy = self.policy
+        if policy is PathRetention.ALL:
+            self._all.append(path)
+            return
+
+        if policy is PathRetention.TOP_K_PER_ENDPOINT:
+            key: Optional[str] = path.endpoint
+        elif policy is PathRetention.TOP_K_PER_CLOCK:
+            key = path.clock
+        else:
+            key = None
+
+        self._seq += 1
+        slack = path.slack if path.slack is not None else _INF
+        entry = (-slack, -self._seq, path)
+        heap = self._heaps.get(key)
+        if heap is None:
+            self._heaps[key] = [entry]
+        elif len(heap) < self.top_k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    def paths(self) -> List[TimingPath]:
+        """보관된 경로 (ALL은 입력 순서, TOP_K 계열은 slack 오름차순 → 입력 순서)"""
+        if self.policy is PathRetention.ALL:
+            return self._all
+        entries = [entry for heap in self._heaps.values() for entry in heap]
+        entries.sort(key=lambda e: (-e[0], -e[1]))
+        return [entry[2] for entry in entries]
+
+
+def _keep_worst(entries: List[Dict], entry: Dict, key, limit: int) -> List[Dict]:
+    """
+    객체별 경로 메타데이터 목록에 entry를 넣고 최악 limit개만 유지 (key 오름차순 = 최악 우선).
+    같은 key는 먼저 들어온 항목을 남기므로 경로 수와 무관하게 O(limit) 메모리입니다.
+    """
+    if len(entries) >= limit and key(entry) >= key(entries[-1]):
+        return entries
+    insort(entries, entry, key=key)
+    if len(entries) > limit:
+        entries.pop()
+    return entries
+
+
+def _slack_key(entry: Dict) -> float:
+    return entry['slack']
+
+
+def _delay_key(entry: Dict) -> float:
+    return -entry['delay']
+
+
+# ============================================================================
+# Patterns
+# ============================================================================
+# 헤더/요약 필드는 섹션에서 테이블을 뺀 텍스트에 한 번씩만 적용하고,
+# 테이블 행은 MULTILINE 정규식 한 번으로 추출합니다 (줄마다 정규식을 돌리지 않음).
+
+_STARTPOINT_RE = re.compile(r'Startpoint:\s+(\S+)')
+_ENDPOINT_RE = re.compile(r'Endpoint:\s+(\S+)')
+_CLOCK_RE = re.compile(r'clocked by (\w+)')
+_PATH_TYPE_RE = re.compile(r'Path Type:\s+(\w+)')
+_SLACK_RE = re.compile(r'slack.*?([-\d.]+)', re.IGNORECASE)
+_ARRIVAL_RE = re.compile(r'data arrival time\s+([\d.]+)')
+_REQUIRED_RE = re.compile(r'data required time\s+([\d.]+)')
+
+_TABLE_HEADER_RE = re.compile(r'Point\s+Incr\s+Path\s*$')
+_TABLE_RULE_RE = re.compile(r'\s*-+\s*$')
+_TABLE_END = 'data arrival time'
+
+# 테이블 한 줄: "point [(cell)] incr path [r|f]" ('-'로 시작하는 줄은 제외)
+_TIMING_ROW_RE = re.compile(
+    r'^[ \t]*(?!-)(\S+)(?:[ \t]+\([^)\n]+\))?[ \t]+([-\d.]+)[ \t]+([-\d.]+)[ \t]*([rf])?',
+    re.MULTILINE,
+)
+_CELL_TYPE_RE = re.compile(r'\s*\([^)]+\)')
+
+# 샤드 병렬 파싱: 샤드 기본 크기와 경로 섹션 경계
+DEFAULT_SHARD_BYTES = 64 * 1024 * 1024
+_SECTION_MARKER = b'\nStartpoint:'
+
+# 경로 섹션 파싱 상태
+_HEADER = 0       # Startpoint/Endpoint/Path Type 등 헤더
+_TABLE_RULE = 1   # "Point Incr Path" 다음 구분선 대기
+_TABLE = 2        # 타이밍 테이블 ("data arrival time"에서 종료)
+_SUMMARY = 3      # required time / slack
+
+
 class TimingReportParser:
-    """타이밍 리포트 파서 (Vivado/PrimeTime 형식)"""
+    """
+    타이밍 리포트 파서 (Vivado/PrimeTime 형식).
+
+    리포트를 한 줄씩 읽는 상태 기계(header → table → summary)로 처리합니다.
+    iter_paths()는 TimingPath를 하나씩 생성하므로 GB 단위 리포트도
+    경로 하나 크기의 메모리로 처리할 수 있습니다.
+
+    parse_file 결과는 retention 정책에 따라 self.paths에 보관하고(TOP_K 계열은
+    heap으로 최악 K개만 유지), get_summary는 스트리밍 중 누적한 통계로 계산합니다.
+    """
     
-    def __init__(self):
+    def __init__(
+        self,
+        retention: PathRetention = PathRetention.ALL,
+        top_k: int = DEFAULT_TOP_K,
+    ):
+        self.retention = retention
+        self.top_k = top_k
         self.paths: List[TimingPath] = []
+        self.stats = TimingSummaryStats()
+        # apply_to_graph에서 그래프당 한 번 구축 (매칭률 보고용으로 보관)
+        self.resolver: Optional[TimingNameResolver] = None
+        self._edge_pairs: Dict[Tuple[str, str], List[str]] = {}
+        self._edge_pairs_source: Optional[Dict[str, DKGEdge]] = None
     
-    def parse_file(self, filepath: str | Path) -> List[TimingPath]:
-        """타이밍 리포트 파일 전체 파싱"""
-        filepath = Path(filepath)
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        # "Startpoint:"로 시작하는 각 경로 섹션 분리
-        # Vivado: "Startpoint: ..."
-        # PrimeTime: "Point ..."로 시작하지만 헤더가 다름
-        
-        # Vivado 형식 감지
-        if 'Startpoint:' in content:
-            return self._parse_vivado_format(content)
-        else:
-            # TODO: PrimeTime 형식 지원
-            return []
-    
+    def parse_file(
+        self,
+        filepath: str | Path,
+        max_workers: Optional[int] = 1,
+    ) -> List[TimingPath]:
+        """
+        타이밍 리포트 파일 전체 파싱 (retention 정책에 따라 self.paths에 보관)
+
+        Args:
+            filepath: 리포트 경로
+            max_workers: 프로세스 수 (1이면 현재 프로세스에서 스트리밍, None이면 CPU 수)
+        """
+        if max_workers == 1:
+            return self._collect(self.iter_paths(filepath))
+        return self._collect(self.iter_paths_parallel(filepath, max_workers))
+
+    def _collect(self, paths: Iterable[TimingPath]) -> List[TimingPath]:
+        """경로 스트림 → 요약 통계 누적 + 보관 정책 적용"""
+        stats = TimingSummaryStats()
+        retainer = PathRetainer(self.retention, self.top_k)
+        for path in paths:
+            stats.add(path)
+            retainer.add(path)
+        self.stats = stats
+        self.paths = retainer.paths()
+        return self.paths
+
+    def iter_paths(self, filepath: str | Path) -> Iterator[TimingPath]:
+        """타이밍 리포트 파일을 스트리밍하며 경로를 하나씩 생성"""
+        with open(Path(filepath), 'r', encoding='utf-8', errors='ignore') as f:
+            yield from self.iter_paths_from_lines(f)
+
+    def iter_paths_from_lines(self, lines: Iterable[str]) -> Iterator[TimingPath]:
+        """
+        줄 iterable → TimingPath.
+
+        - 경로 섹션은 줄 맨 앞의 "Startpoint:"에서 시작
+        - 헤더/요약 필드는 섹션 안에서 처음 나온 값을 사용
+        - 타이밍 테이블은 "Point Incr Path" 헤더와 구분선 다음부터 "data arrival time"까지
+          (종료 줄 없이 섹션이 끝나면 stage 없음)
+
+        줄마다 하는 일은 상태 판별과 리스트 append뿐이고, 필드/행 추출은
+        섹션이 끝날 때 정규식으로 한 번에 처리합니다.
+        """
+        state = _HEADER
+        text_lines: List[str] = []   # 테이블을 제외한 섹션 텍스트
+        table_lines: List[str] = []
+        stages: List[TimingStage] = []
+
+        for line in lines:
+            if state == _TABLE:
+                if _TABLE_END in line and line.lstrip().startswith(_TABLE_END):
+                    stages = self._parse_table(table_lines)
+                    state = _SUMMARY
+                    text_lines.append(line)
+                    continue
+                if not line.startswith('Startpoint:'):
+                    table_lines.append(line)
+                    continue
+
+            if line.startswith('Startpoint:'):
+                path = self._build_path(text_lines, stages)
+                if path is not None:
+                    yield path
+                state = _HEADER
+                text_lines = []
+                table_lines = []
+                stages = []
+            elif state == _TABLE_RULE:
+                if _TABLE_RULE_RE.match(line):
+                    state = _TABLE
+                    table_lines = []
+                    continue
+                if line.strip():
+                    state = _HEADER
+
+            if state == _HEADER and 'Incr' in line and _TABLE_HEADER_RE.search(line):
+                state = _TABLE_RULE
+            text_lines.append(line)
+
+        path = self._build_path(text_lines, stages)
+        if path is not None:
+            yield path
+
+    def iter_path_tables(
+        self,
+        filepath: str | Path,
+        max_workers: Optional[int] = None,
+        shard_bytes: int = DEFAULT_SHARD_BYTES,
+    ) -> Iterator[TimingPathTable]:
+        """
+        리포트를 "Startpoint:" 경계의 바이트 샤드로 나눠 프로세스 풀에서 파싱하고
+        샤드 순서대로 컬럼형 테이블을 생성합니다.
+
+        샤드는 경로 섹션 시작에서만 잘리므로 결과는 직렬 파싱과 동일합니다.
+        동시에 진행하는 샤드는 worker 수의 2배로 제한하여 메모리를 일정하게 유지합니다.
+
+        Args:
+            filepath: 리포트 경로
+            max_workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 파싱)
+            shard_bytes: 샤드 목표 크기 (바이트)
+        """
+        path = str(filepath)
+        ranges = find_shard_ranges(path, shard_bytes)
+        if max_workers == 1 or len(ranges) <= 1:
+            for start, end in ranges:
+                yield _parse_shard(path, start, end)
+            return
+
+        window_size = 2 * (max_workers or os.cpu_count() or 1)
+        pending = iter(ranges)
+        window: Deque[Future] = deque()
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            try:
+                for start, end in pending:
+                    window.append(pool.submit(_parse_shard, path, start, end))
+                    if len(window) >= window_size:
+                        break
+                while window:
+                    table = window.popleft().result()
+                    next_range = next(pending, None)
+                    if next_range is not None:
+                        window.append(pool.submit(_parse_shard, path, *next_range))
+                    yield table
+            finally:
+                # 소비자가 중간에 멈추면 아직 시작하지 않은 샤드는 취소
+                for future in window:
+                    future.cancel()
+
+    def iter_paths_parallel(
+        self,
+        filepath: str | Path,
+        max_workers: Optional[int] = None,
+        shard_bytes: int = DEFAULT_SHARD_BYTES,
+    ) -> Iterator[TimingPath]:
+        """iter_path_tables 결과를 TimingPath로 풀어 원래 순서대로 생성"""
+        for table in self.iter_path_tables(filepath, max_workers, shard_bytes):
+            yield from table.iter_paths()
+
     def _parse_vivado_format(self, content: str) -> List[TimingPath]:
-        """Vivado 타이밍 리포트 파싱"""
-        paths = []
-        
-        # "Startpoint:"로 구분
-        sections = re.split(r'\n(?=Startpoint:)', content)
-        
-        for section in sections:
-            if 'Startpoint:' not in section:
-                continue
-            
-            path = self._parse_single_path(section)
-            if path:
-                paths.append(path)
-        
-        self.paths = paths
-        return paths
-    
-    def _parse_single_path(self, section: str) -> Optional[TimingPath]:
-        """개별 타이밍 경로 파싱"""
+        """Vivado 타이밍 리포트 문자열 파싱"""
+        return self._collect(self.iter_paths_from_lines(content.splitlines(keepends=True)))
+
+    def _build_path(self, text_lines: List[str], stages: List[TimingStage]) -> Optional[TimingPath]:
+        """섹션 텍스트(테이블 제외) + 테이블 stage → TimingPath"""
+        if not text_lines:
+            return None
+        text = ''.join(text_lines)
+
+        # Startpoint 추출
+        # 예: "Startpoint: cpu/pc_reg[0] (rising edge-triggered flip-flop clocked by sys_clk)"
+        start_match = _STARTPOINT_RE.search(text)
+        if not start_match:
+            return None
+
         path = TimingPath(
-            startpoint='',
+            startpoint=start_match.group(1),
             endpoint='',
             clock='',
             path_type='Setup',
+            stages=stages,
         )
-        
-        # Startpoint 추출
-        # 예: "Startpoint: cpu/pc_reg[0] (rising edge-triggered flip-flop clocked by sys_clk)"
-        start_match = re.search(r'Startpoint:\s+(\S+)', section)
-        if not start_match:
-            return None
-        path.startpoint = start_match.group(1)
-        
-        # Endpoint 추출
-        end_match = re.search(r'Endpoint:\s+(\S+)', section)
+
+        end_match = _ENDPOINT_RE.search(text)
         if end_match:
             path.endpoint = end_match.group(1)
-        
-        # Clock 추출
-        clock_match = re.search(r'clocked by (\w+)', section)
+
+        clock_match = _CLOCK_RE.search(text)
         if clock_match:
             path.clock = clock_match.group(1)
-        
-        # Path Type 추출
-        type_match = re.search(r'Path Type:\s+(\w+)', section)
+
+        type_match = _PATH_TYPE_RE.search(text)
         if type_match:
             path.path_type = type_match.group(1)
-        
-        # Slack 추출
+
         # 예: "slack (MET)                                         9.37"
-        slack_match = re.search(r'slack.*?([-\d.]+)', section, re.IGNORECASE)
+        # (IGNORECASE 정규식은 리터럴 prefix 탐색을 못 하므로 시작 위치를 먼저 찾음)
+        slack_pos = text.lower().find('slack') if text.isascii() else 0
+        slack_match = _SLACK_RE.search(text, slack_pos) if slack_pos >= 0 else None
         if slack_match:
             path.slack = float(slack_match.group(1))
-        
-        # Arrival/Required time 추출
-        arrival_match = re.search(r'data arrival time\s+([\d.]+)', section)
+
+        arrival_match = _ARRIVAL_RE.search(text)
         if arrival_match:
             path.arrival_time = float(arrival_match.group(1))
-        
-        required_match = re.search(r'data required time\s+([\d.]+)', section)
+
+        required_match = _REQUIRED_RE.search(text)
         if required_match:
             path.required_time = float(required_match.group(1))
-        
-        # 타이밍 테이블 파싱
-        # 형식:
-        #   Point                                    Incr       Path
-        #   --------------------------------------------------------
-        #   cpu/pc_reg[0]/Q (DFFQX1)                 0.15       0.65 r
-        #   cpu/decode_inst/U123/Y (AND2X1)          0.08       0.73 r
-        
-        table_pattern = r'Point\s+Incr\s+Path\s*\n\s*-+\s*\n(.*?)\n\s*data arrival time'
-        table_match = re.search(table_pattern, section, re.DOTALL)
-        
-        if table_match:
-            table_content = table_match.group(1)
-            path.stages = self._parse_timing_table(table_content)
-        
+
         return path
-    
-    def _parse_timing_table(self, table_content: str) -> List[TimingStage]:
-        """타이밍 테이블 파싱"""
-        stages = []
-        lines = table_content.strip().split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('-'):
-                continue
-            
-            stage = self._parse_timing_line(line)
-            if stage:
-                stages.append(stage)
+
+    def _parse_table(self, table_lines: List[str]) -> List[TimingStage]:
+        """
+        타이밍 테이블 파싱
         
+        형식:
+          cpu/pc_reg[0]/Q (DFFQX1)                 0.15       0.65 r
+          cpu/decode_inst/U123/Y (AND2X1)          0.08       0.73 r
+        """
+        stages = []
+        # 셀 타입 "(DFFQX1)"은 캡처하지 않으므로 point 토큰 안에 괄호가 있을 때만 제거
+        for point, incr, cumulative, transition in _TIMING_ROW_RE.findall(''.join(table_lines)):
+            if '(' in point:
+                point = _CELL_TYPE_RE.sub('', point).strip()
+            stages.append(TimingStage(point, float(incr), float(cumulative), transition))
         return stages
-    
-    def _parse_timing_line(self, line: str) -> Optional[TimingStage]:
-        """타이밍 테이블의 한 줄 파싱"""
-        # 여러 형식 지원:
-        # 1. "cpu/pc_reg[0]/Q (DFFQX1)     0.15       0.65 r"
-        # 2. "clock network delay (ideal)  0.50       0.50"
-        # 3. "U123/Y (AND2X1)               0.08       0.73 r"
-        
-        # 패턴: 셀 이름, 증분 delay, 누적 delay, transition (옵션)
-        pattern = r'^\s*(\S+(?:\s+\([^)]+\))?)\s+([-\d.]+)\s+([-\d.]+)\s*([rf])?'
-        match = re.match(pattern, line)
-        
-        if not match:
-            return None
-        
-        point = match.group(1)
-        # 괄호 안의 셀 타입 제거
-        point = re.sub(r'\s*\([^)]+\)', '', point).strip()
-        
-        incr = float(match.group(2))
-        path = float(match.group(3))
-        transition = match.group(4) or ''
-        
-        return TimingStage(
-            point=point,
-            incr_delay=incr,
-            cumulative_delay=path,
-            transition=transition,
-        )
-    
+
     def apply_to_graph(
         self,
         nodes: Dict[str, DKGNode],
         edges: Dict[str, DKGEdge],
         updater: GraphUpdater,
-    ) -> None:
-        """파싱한 타이밍 정보를 DKG 그래프에 반영"""
-        from ..stages import FieldSource, ParsingStage
-        
-        for path in self.paths:
+        paths: Optional[Iterable[TimingPath]] = None,
+        corner: str = DEFAULT_CORNER,
+        store: Optional[TimingCornerStore] = None,
+    ) -> TimingCornerStore:
+        """
+        파싱한 타이밍 정보를 DKG 그래프에 반영
+
+        값은 store의 (corner, setup/hold) 컬럼에 기록한 뒤, 모든 코너의 worst 값을
+        setup은 기존 필드(DKGNode.slack 등), hold는 hold_* 필드에 다시 기록합니다. 여러 코너 리포트를 적용할 때는
+        같은 store를 넘겨야 코너 간 worst가 유지됩니다.
+        노드/엣지 메타데이터의 경로 목록(timing_slacks / timing_delays)은 top_k개로 제한되며
+        전체 경로 수는 timing_slack_count / timing_delay_count로 셉니다.
+
+        Args:
+            paths: 반영할 경로 (None이면 self.paths). iter_paths() 결과를 넘기면
+                   리포트 전체를 메모리에 올리지 않고 스트리밍으로 반영
+            corner: 리포트의 코너 라벨 (예: "ss_0p72v_125c")
+            store: 코너별 타이밍 저장소 (None이면 새로 생성)
+
+        Returns:
+            값이 기록된 store
+        """
+        if store is None:
+            store = TimingCornerStore(nodes, edges)
+        # 이름 인덱스 / 엣지 쌍 인덱스는 같은 그래프에 여러 코너를 적용할 때 재사용
+        if self.resolver is None or self.resolver.nodes is not nodes or self._edge_pairs_source is not edges:
+            self.resolver = TimingNameResolver(nodes, edges)
+            # (src 셀, dst 셀) → 엣지. 클럭 경로 핀도 리포트에 나오므로 CLOCK_TREE 포함
+            self._edge_pairs = ReachabilityIndex(nodes, edges, excluded_flow_types=()).edge_pairs()
+            self._edge_pairs_source = edges
+        edge_pairs = self._edge_pairs
+        resolve = self.resolver.resolve
+
+        for path in self.paths if paths is None else paths:
+            analysis = analysis_of(path.path_type)
+
             # 1. Startpoint/Endpoint 노드 업데이트
             self._update_node_timing(
-                path.startpoint, path, nodes, updater, is_endpoint=False
+                path.startpoint, path, nodes, updater, store, corner, analysis, is_endpoint=False
             )
             self._update_node_timing(
-                path.endpoint, path, nodes, updater, is_endpoint=True
+                path.endpoint, path, nodes, updater, store, corner, analysis, is_endpoint=True
             )
             
             # 2. 경로상 각 엣지에 delay 설정
-            for i in range(len(path.stages) - 1):
-                src_stage = path.stages[i]
-                dst_stage = path.stages[i + 1]
-                
-                self._update_edge_timing(
-                    src_stage, dst_stage, path, edges, updater
-                )
+            # 핀을 셀 노드로 해석하고, 셀이 바뀌는 stage(net arc)마다 (이전 셀, 현재 셀) 엣지에 반영.
+            # 같은 셀 안의 핀 전이(A → Y)는 셀 내부 arc이므로 엣지가 없음
+            prev_cell: Optional[str] = None
+            for stage in path.stages:
+                cell = resolve(stage.point)
+                if cell is None or cell == prev_cell:
+                    continue
+                if prev_cell is not None:
+                    edge_ids = edge_pairs.get((prev_cell, cell))
+                    if edge_ids:
+                        # 병렬 엣지(버스 비트 등)는 구분할 정보가 없으므로 첫 엣지에 반영
+                        self._update_edge_timing(
+                            edges[edge_ids[0]], stage, path, updater, store, corner, analysis
+                        )
+                prev_cell = cell
+
+        # 3. worst-of-corners 값을 기존 필드에 반영
+        store.apply_worst(updater)
+        return store
     
     def _update_node_timing(
         self,
@@ -229,15 +615,18 @@ class TimingReportParser:
         path: TimingPath,
         nodes: Dict[str, DKGNode],
         updater: GraphUpdater,
+        store: TimingCornerStore,
+        corner: str,
+        analysis: str,
         is_endpoint: bool,
     ) -> None:
         """노드의 타이밍 정보 업데이트
         
-        주의: 한 노드는 여러 경로에 나타날 수 있으므로:
-        - slack은 최악값(worst-case)만 저장
+        주의: 한 노드는 여러 경로/코너에 나타날 수 있으므로:
+        - slack/arrival/required는 (corner, analysis) 컬럼에 worst만 저장
         - 상세 정보는 메타데이터에 누적
         """
-        from ..stages import FieldSource, ParsingStage
+        from ..pipeline.stages import FieldSource, ParsingStage
         
         # 노드 이름 정규화 (hier_path 또는 canonical_name 매칭)
         node = self._find_node_by_name(node_name, nodes)
@@ -248,35 +637,37 @@ class TimingReportParser:
         
         # Slack 업데이트 (startpoint에만, 최악값만)
         if not is_endpoint and path.slack is not None:
-            # 기존 slack보다 나쁘면(작으면) 업데이트
-            if node.slack is None or path.slack < node.slack:
-                node.slack = path.slack
+            store.record_node(node_id, corner, analysis, 'slack', path.slack)
             
-            # 메타데이터에는 경로별로 누적 저장 (리스트)
+            # 메타데이터에는 slack 최악 top_k개 경로만 보관하고 전체 개수는 따로 셈
             metadata = updater.node_metadata[node_id]
-            existing_slacks = metadata.get('timing_slacks', [])
-            existing_slacks.append({
-                'slack': path.slack,
-                'path_type': path.path_type,
-                'clock': path.clock,
-                'endpoint': path.endpoint,
-            })
+            slacks = _keep_worst(
+                metadata.get('timing_slacks', []),
+                {
+                    'slack': path.slack,
+                    'path_type': path.path_type,
+                    'clock': path.clock,
+                    'endpoint': path.endpoint,
+                    'corner': corner,
+                },
+                _slack_key,
+                self.top_k,
+            )
+            metadata.set('timing_slacks', slacks, FieldSource.ANALYZED, ParsingStage.TIMING)
             metadata.set(
-                'timing_slacks',
-                existing_slacks,
+                'timing_slack_count',
+                metadata.get('timing_slack_count', 0) + 1,
                 FieldSource.ANALYZED,
                 ParsingStage.TIMING,
             )
         
-        # Arrival time - 여러 값 중 최악(최대)만 저장
+        # Arrival time - 여러 값 중 최악만 저장 (setup: 최대, hold: 최소)
         if path.arrival_time is not None:
-            if node.arrival_time is None or path.arrival_time > node.arrival_time:
-                node.arrival_time = path.arrival_time
+            store.record_node(node_id, corner, analysis, 'arrival_time', path.arrival_time)
         
-        # Required time - 여러 값 중 최선(최소)만 저장
+        # Required time - 여러 값 중 최악만 저장 (setup: 최소, hold: 최대)
         if path.required_time is not None:
-            if node.required_time is None or path.required_time < node.required_time:
-                node.required_time = path.required_time
+            store.record_node(node_id, corner, analysis, 'required_time', path.required_time)
         
         # Clock domain - 여러 클럭이 있을 수 있으므로 대표값만 저장
         # (첫 번째로 발견된 클럭 or 가장 빈번한 클럭)
@@ -285,49 +676,50 @@ class TimingReportParser:
     
     def _update_edge_timing(
         self,
-        src_stage: TimingStage,
+        edge: DKGEdge,
         dst_stage: TimingStage,
         path: TimingPath,
-        edges: Dict[str, DKGEdge],
         updater: GraphUpdater,
+        store: TimingCornerStore,
+        corner: str,
+        analysis: str,
     ) -> None:
         """엣지의 타이밍 정보 업데이트
         
-        주의: 한 엣지도 여러 경로에 나타날 수 있으므로:
-        - delay는 최악값만 저장 (일반적으로 동일해야 함)
+        주의: 한 엣지도 여러 경로/코너에 나타날 수 있으므로:
+        - delay/arrival은 (corner, analysis) 컬럼에 최악값만 저장
         - 상세 정보는 메타데이터에 누적
         """
-        from ..stages import FieldSource, ParsingStage
-        
-        # 엣지 찾기 (휴리스틱: src/dst 이름 기반)
-        edge = self._find_edge_by_pins(src_stage.point, dst_stage.point, edges)
-        if not edge:
-            return
+        from ..pipeline.stages import FieldSource, ParsingStage
         
         edge_id = edge.edge_id
         
-        # Delay 업데이트 - 최대값 저장 (보수적)
-        if edge.delay is None or dst_stage.incr_delay > edge.delay:
-            edge.delay = dst_stage.incr_delay
+        # Delay 업데이트 - 최악값 저장 (setup: 최대, hold: 최소)
+        store.record_edge(edge_id, corner, analysis, 'delay', dst_stage.incr_delay)
         
-        # 메타데이터에 경로별 delay 누적
+        # 메타데이터에는 delay 최대 top_k개 경로만 보관하고 전체 개수는 따로 셈
         metadata = updater.edge_metadata[edge_id]
-        existing_delays = metadata.get('timing_delays', [])
-        existing_delays.append({
-            'delay': dst_stage.incr_delay,
-            'path_type': path.path_type,
-            'clock': path.clock,
-        })
+        delays = _keep_worst(
+            metadata.get('timing_delays', []),
+            {
+                'delay': dst_stage.incr_delay,
+                'path_type': path.path_type,
+                'clock': path.clock,
+                'corner': corner,
+            },
+            _delay_key,
+            self.top_k,
+        )
+        metadata.set('timing_delays', delays, FieldSource.ANALYZED, ParsingStage.TIMING)
         metadata.set(
-            'timing_delays',
-            existing_delays,
+            'timing_delay_count',
+            metadata.get('timing_delay_count', 0) + 1,
             FieldSource.ANALYZED,
             ParsingStage.TIMING,
         )
         
-        # Arrival time - 최대값만 저장
-        if edge.arrival_time is None or dst_stage.cumulative_delay > edge.arrival_time:
-            edge.arrival_time = dst_stage.cumulative_delay
+        # Arrival time - 최악값만 저장 (setup: 최대, hold: 최소)
+        store.record_edge(edge_id, corner, analysis, 'arrival_time', dst_stage.cumulative_delay)
         
         # Clock domain - 첫 번째 클럭 저장 (또는 가장 빈번한 클럭)
         if path.clock and not edge.clock_domain_id:
@@ -336,59 +728,63 @@ class TimingReportParser:
     def _find_node_by_name(
         self, name: str, nodes: Dict[str, DKGNode]
     ) -> Optional[DKGNode]:
-        """이름으로 노드 찾기 (휴리스틱)"""
-        # 1. 직접 매칭
-        if name in nodes:
-            return nodes[name]
-        
-        # 2. hier_path로 매칭
-        for node in nodes.values():
-            if node.hier_path == name:
-                return node
-        
-        # 3. canonical_name으로 매칭
-        for node in nodes.values():
-            if node.canonical_name == name:
-                return node
-        
-        # 4. 부분 매칭 (마지막 시도)
-        for node in nodes.values():
-            if name in node.hier_path or node.hier_path in name:
-                return node
-        
-        return None
-    
-    def _find_edge_by_pins(
-        self, src_pin: str, dst_pin: str, edges: Dict[str, DKGEdge]
-    ) -> Optional[DKGEdge]:
-        """src/dst 핀 이름으로 엣지 찾기 (휴리스틱)"""
-        # 타이밍 리포트의 핀 이름과 DKG 엣지의 노드 이름이 다를 수 있음
-        # 예: "cpu/pc_reg[0]/Q" vs "cpu.pc_reg[0]"
-        
-        for edge in edges.values():
-            src_node_name = edge.src_node
-            dst_node_name = edge.dst_node
-            
-            # 부분 매칭 시도
-            if (src_pin in src_node_name or src_node_name in src_pin) and \
-               (dst_pin in dst_node_name or dst_node_name in dst_pin):
-                return edge
-        
-        return None
+        """이름으로 노드 찾기 (TimingNameResolver 인덱스 조회)"""
+        if self.resolver is None or self.resolver.nodes is not nodes:
+            self.resolver = TimingNameResolver(nodes)
+        node_id = self.resolver.resolve(name)
+        return nodes.get(node_id) if node_id is not None else None
     
     def get_summary(self) -> Dict:
-        """파싱 결과 요약"""
-        if not self.paths:
-            return {'total_paths': 0}
-        
-        slacks = [p.slack for p in self.paths if p.slack is not None]
-        worst_slack = min(slacks) if slacks else None
-        met_count = sum(1 for s in slacks if s >= 0)
-        
-        return {
-            'total_paths': len(self.paths),
-            'worst_slack': worst_slack,
-            'met_timing': met_count,
-            'failed_timing': len(slacks) - met_count,
-            'clocks': list(set(p.clock for p in self.paths if p.clock)),
-        }
+        """파싱 결과 요약 (보관 정책과 무관하게 파싱한 전체 경로 기준)"""
+        if not self.stats.total_paths and self.paths:
+            # self.paths를 직접 채운 경우
+            stats = TimingSummaryStats()
+            for path in self.paths:
+                stats.add(path)
+            return stats.to_summary()
+        return self.stats.to_summary()
+
+
+# ============================================================================
+# Sharding
+# ============================================================================
+
+
+def find_shard_ranges(
+    filepath: str | Path,
+    shard_bytes: int = DEFAULT_SHARD_BYTES,
+) -> List[Tuple[int, int]]:
+    """
+    mmap으로 리포트를 훑어 경로 섹션 경계(줄 맨 앞 "Startpoint:")에서 자른
+    (start, end) 바이트 범위 리스트를 반환합니다. 첫 샤드는 파일 앞부분을 포함합니다.
+    """
+    size = os.path.getsize(filepath)
+    if size == 0:
+        return []
+
+    ranges: List[Tuple[int, int]] = []
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            target = start + max(shard_bytes, 1)
+            pos = mm.find(_SECTION_MARKER, target - 1) if target < size else -1
+            if pos < 0:
+                ranges.append((start, size))
+                break
+            ranges.append((start, pos + 1))
+            start = pos + 1
+    return ranges
+
+
+def parse_report_table(filepath: str) -> TimingPathTable:
+    """프로세스 풀 작업 단위: 리포트 파일 하나 → 컬럼형 경로 테이블 (코너별 병렬 파싱용)"""
+    return TimingPathTable.from_paths(TimingReportParser().iter_paths(filepath))
+
+
+def _parse_shard(filepath: str, start: int, end: int) -> TimingPathTable:
+    """프로세스 풀 작업 단위: 바이트 범위 → 컬럼형 경로 테이블"""
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[start:end]
+    # 직렬 파싱(open(..., errors='ignore'))과 같은 디코딩/개행 처리
+    text = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', errors='ignore')
+    return TimingPathTable.from_paths(TimingReportParser().iter_paths_from_lines(text))
@@ -1,128 +1,125 @@
 from __future__ import annotations
 
-import re
-from typing import Dict
+from typing import List, Optional, Tuple
 
-from ..core.graph import DKGEdge, DKGNode
-from ..builders.graph_updater import GraphUpdater
-from ..pipeline.stages import FieldSource, ParsingStage
-from . import ConstraintParser
-from .parser_utils import extract_bracket_targets, match_any
+from ..core.constraint_ir import PblockConstraint, PblockRangeConstraint, PropertyConstraint
+from .sdc_parser import SdcParser
+from .tcl_tokenizer import TclCommand, TclQuery, split_tcl_list, word_targets
 
+# 노드 attributes로 반영하는 set_property 속성
+# (PACKAGE_PIN: 포트 핀 배치, ASYNC_REG: CDC 동기화기 표시)
+PIN_PROPERTIES = ("LOC", "PACKAGE_PIN", "IOSTANDARD", "ASYNC_REG")
 
-class XdcParser(ConstraintParser):
+
+class XdcParser(SdcParser):
     """
     XDC (Xilinx Design Constraints) 파서.
     
-    SDC와 유사하지만 Xilinx 특화 명령 포함:
-    - set_property LOC / IOSTANDARD: 핀 배치
-    - create_pblock: 물리적 블록 정의
+    SDC 타이밍 명령을 모두 처리하며 Xilinx 특화 명령 포함:
+    - set_property LOC / PACKAGE_PIN / IOSTANDARD / ASYNC_REG: 핀 배치, 동기화기 (`-dict {...}` 형식 포함)
+    - add_cells_to_pblock: 물리적 블록 할당
+    - create_pblock / resize_pblock: pblock 범위 (-add / -remove / -replace)
     """
-    
-    def get_stage(self) -> ParsingStage:
-        return ParsingStage.CONSTRAINTS
-    
-    def parse_and_update(
-        self,
-        filepath: str,
-        updater: GraphUpdater,
-        nodes: Dict[str, DKGNode],
-        edges: Dict[str, DKGEdge],
-    ) -> None:
-        with open(filepath, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        for line_num, line in enumerate(lines, start=1):
-            raw = line.strip()
-            if not raw or raw.startswith("#"):
-                continue
-
-            if raw.startswith("set_property"):
-                self._parse_set_property(raw, line_num, filepath, updater, nodes)
-            elif raw.startswith("create_pblock"):
-                self._parse_create_pblock(raw)
-            elif raw.startswith("add_cells_to_pblock"):
-                self._parse_add_cells_to_pblock(raw, line_num, filepath, updater, nodes)
-
-    def _parse_set_property(
-        self,
-        line: str,
-        line_num: int,
-        filepath: str,
-        updater: GraphUpdater,
-        nodes: Dict[str, DKGNode],
-    ) -> None:
-        match = re.search(r"set_property\s+(LOC|IOSTANDARD)\s+(\S+)", line)
-        if not match:
-            return
-
-        prop = match.group(1)
-        value = match.group(2)
-        targets = extract_bracket_targets(line, ("ports", "pins", "cells"))
+
+    ir_builders = {
+        **SdcParser.ir_builders,
+        "set_property": "_build_property",
+        "add_cells_to_pblock": "_build_pblock",
+        "create_pblock": "_build_create_pblock",
+        "resize_pblock": "_build_resize_pblock",
+    }
+
+    # ========================================================================
+    # Parse: TclCommand → IR
+    # ========================================================================
+
+    def _build_property(self, cmd: TclCommand) -> Optional[PropertyConstraint]:
+        props = {name: value for name, value in _property_pairs(cmd) if name in PIN_PROPERTIES}
+        if not props:
+            return None
+
+        targets = cmd.positional_targets(("ports", "pins", "cells"))
         if not targets:
-            return
-
-        for node_id, node in nodes.items():
-            candidates = [node.local_name, node.hier_path, node.canonical_name]
-            if not match_any(targets, candidates):
-                continue
-
-            new_attrs = dict(node.attributes)
-            new_attrs[prop] = value
-            updater.update_node_field(
-                node_id,
-                "attributes",
-                new_attrs,
-                FieldSource.DECLARED,
-                ParsingStage.CONSTRAINTS,
-                filepath,
-                line_num,
-            )
-
-    def _parse_create_pblock(self, line: str) -> None:
-        match = re.search(r"create_pblock\s+(\S+)", line)
-        if not match:
-            return
-
-    def _parse_add_cells_to_pblock(
-        self,
-        line: str,
-        line_num: int,
-        filepath: str,
-        updater: GraphUpdater,
-        nodes: Dict[str, DKGNode],
-    ) -> None:
-        pblock_name = None
-        pblock_match = re.search(r"add_cells_to_pblock\s+\[get_pblocks\s+([^\]]+)\]", line)
-        if pblock_match:
-            pblock_name = pblock_match.group(1).strip()
-        else:
-            direct = re.search(r"add_cells_to_pblock\s+(\S+)", line)
-            if direct:
-                pblock_name = direct.group(1)
+            return None
+
+        return PropertyConstraint(properties=props, targets=targets, origin_line=cmd.line)
+
+    def _build_pblock(self, cmd: TclCommand) -> Optional[PblockConstraint]:
+        if not cmd.positionals:
+            return None
 
+        pblock_name = _pblock_name(cmd.positionals[0])
         if not pblock_name:
-            return
+            return None
 
-        targets = extract_bracket_targets(line, ("cells",))
+        targets: List[str] = []
+        for word in cmd.positionals[1:]:
+            if isinstance(word, TclQuery):
+                targets.extend(word_targets(word, ("cells",)))
         if not targets:
-            return
-
-        for node_id, node in nodes.items():
-            candidates = [node.local_name, node.hier_path, node.canonical_name]
-            if not match_any(targets, candidates):
-                continue
-
-            new_attrs = dict(node.attributes)
-            new_attrs["pblock"] = pblock_name
-            new_attrs["pblock_seed"] = pblock_name
-            updater.update_node_field(
-                node_id,
-                "attributes",
-                new_attrs,
-                FieldSource.DECLARED,
-                ParsingStage.FLOORPLAN,
-                filepath,
-                line_num,
-            )
+            return None
 
+        return PblockConstraint(pblock_name=pblock_name, cell_targets=targets, origin_line=cmd.line)
+
+    def _build_create_pblock(self, cmd: TclCommand) -> Optional[PblockRangeConstraint]:
+        """create_pblock pb_core → 범위 없는 pblock 선언"""
+        pblock_name = _pblock_name(cmd.positionals[0]) if cmd.positionals else None
+        if not pblock_name:
+            return None
+        return PblockRangeConstraint(pblock_name=pblock_name, origin_line=cmd.line)
+
+    def _build_resize_pblock(self, cmd: TclCommand) -> Optional[PblockRangeConstraint]:
+        """
+        resize_pblock 명령 → PblockRangeConstraint.
+        예: resize_pblock [get_pblocks pb_core] -add {SLICE_X0Y0:SLICE_X9Y49 RAMB36_X0Y0:RAMB36_X0Y9}
+        """
+        pblock_name = _pblock_name(cmd.positionals[0]) if cmd.positionals else None
+        if not pblock_name:
+            return None
+
+        add, remove = _resize_ranges(cmd)
+        replace = cmd.has_flag("-replace")
+        if not add and not remove and not replace:
+            return None
+
+        return PblockRangeConstraint(
+            pblock_name=pblock_name,
+            add_ranges=add,
+            remove_ranges=remove,
+            replace=replace,
+            origin_line=cmd.line,
+        )
+
+
+def _property_pairs(cmd: TclCommand) -> List[Tuple[str, str]]:
+    """set_property의 (속성, 값) 목록. `-dict {K V K V}` 및 `K V [targets]` 형식"""
+    pairs: List[Tuple[str, str]] = []
+    for raw in cmd.option_all("-dict"):
+        if not isinstance(raw, str):
+            continue
+        items = split_tcl_list(raw)
+        pairs.extend((items[i], items[i + 1]) for i in range(0, len(items) - 1, 2))
+
+    plain = [w for w in cmd.positionals if isinstance(w, str)]
+    if len(plain) >= 2:
+        pairs.append((plain[0], plain[1]))
+    return pairs
+
+
+def _resize_ranges(cmd: TclCommand) -> Tuple[List[str], List[str]]:
+    """resize_pblock의 (-add 범위, -remove 범위). 옵션은 반복 가능하고 값은 Tcl 리스트"""
+    add: List[str] = []
+    remove: List[str] = []
+    for name, ranges in (("-add", add), ("-remove", remove)):
+        for value in cmd.option_all(name):
+            if isinstance(value, str):
+                ranges.extend(split_tcl_list(value))
+    return add, remove
+
+
+def _pblock_name(word: object) -> Optional[str]:
+    if isinstance(word, TclQuery):
+        return word.patterns[0] if word.patterns else None
+    if isinstance(word, str) and word:
+        return word
+    return None
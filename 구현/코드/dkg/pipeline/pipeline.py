@@ -1,24 +1,54 @@
 from __future__ import annotations
 
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Type
 from ..utils.config import YosysConfig
 from ..core.graph import DKGEdge, DKGNode
+from ..core.ir import CellIR, Wire
 from ..builders.graph_build import build_nodes_and_edges, build_wires_and_cells
 from ..builders.graph_updater import GraphUpdater
-from ..cache import GraphSnapshot, GraphVersion, load_snapshot, save_snapshot
+from ..builders.clock_propagation import ClockPropagation, ClockPropagator, SEQUENTIAL_CLASSES
+from ..builders.coverage import CoverageEngine
+from ..builders.path_delay import DelayCheck, PathDelayEvaluator
+from ..builders.physical import PhysicalModel
+from ..builders.timing_corners import DEFAULT_CORNER, TimingCornerStore
+from ..builders.zoom import ZoomMode, ZoomPyramid
+from ..core.constraint_ir import ClockConstraint, DelayConstraint
+from ..cache import ConstraintCache, GraphSnapshot, GraphVersion, load_snapshot, save_snapshot
 from ..parsers import ConstraintParser
 from ..parsers.sdc_parser import SdcParser
 from ..parsers.tcl_parser import TclParser
-from ..parsers.timing_report_parser import TimingReportParser
+from ..parsers.timing_report_parser import (
+    DEFAULT_TOP_K,
+    PathRetention,
+    TimingReportParser,
+    parse_report_table,
+)
 from ..parsers.xdc_parser import XdcParser
 from ..parsers.bd_parser import BdParser
+from ..parsers.sdf_parser import SdfParser
+from ..parsers.edif_parser import parse_edif
 from .stages import FieldSource, ParsingStage
-from ..builders.supergraph import SuperGraph, GraphContext, ViewBuilder, GraphViewType
+from ..builders.supergraph import SuperGraph, GraphContext, MultiViewBuilder, ViewBuilder, GraphViewType
 from ..utils import compute_file_hash
 from ..parsers.yosys_parser import parse_yosys
 
 
+def _parse_constraint_file(parser_type: Type[ConstraintParser], filepath: str) -> List[Any]:
+    """프로세스 풀 작업 단위: 파일 → IR (그래프 비의존, pickle 가능)"""
+    return parser_type().parse_constraints(filepath)
+
+
+def _combined_file_hash(files: List[str]) -> Optional[str]:
+    """여러 파일 해시를 하나로 결합 (파일이 없으면 None)"""
+    if not files:
+        return None
+    combined = "".join(compute_file_hash(f) for f in files)
+    return hashlib.sha256(combined.encode()).hexdigest()[:16]
+
+
 class DKGPipeline:
     """
     전체 DKG 구축 파이프라인.
@@ -32,21 +62,45 @@ class DKGPipeline:
         # Stage 2: Constraint 추가
         pipeline.add_constraints("design.sdc")
         pipeline.add_constraints("design.xdc")
+        # 또는 여러 파일을 병렬 파싱: pipeline.add_constraints_many([...])
         
         # Stage 3: 타이밍 리포트 추가
         pipeline.add_timing_report("timing.rpt")
         
         # 최종 그래프 반환
         nodes, edges = pipeline.get_graph()
+    
+    cache_dir를 지정하면 제약 파일의 파싱 IR(파일 해시 기준)과
+    매칭 결과(RTL 해시 기준)를 디스크에 캐싱하여 재실행 시 파싱을 생략합니다.
     """
     
-    def __init__(self, yosys_config: YosysConfig):
+    def __init__(self, yosys_config: YosysConfig, cache_dir: Optional[str | Path] = None):
         self.yosys_config = yosys_config
         
         self.nodes: Optional[Dict[str, DKGNode]] = None
         self.edges: Optional[Dict[str, DKGEdge]] = None
         self.updater: Optional[GraphUpdater] = None
+        # 멀티 코너 타이밍 값 (첫 타이밍 리포트 적용 시 생성)
+        self.timing_store: Optional[TimingCornerStore] = None
+        # pblock 범위 / LOC 공간 인덱스 (첫 IR 제약 적용 시 생성)
+        self.physical: Optional[PhysicalModel] = None
+        # create_clock 대상 net → 클럭 이름, 마지막 클럭 전파 결과
+        self.clock_sources: Dict[str, str] = {}
+        self.clock_propagation: Optional[ClockPropagation] = None
+        self._clocks_dirty = False
+        # set_max_delay/set_min_delay (제약 파일, 레코드), 마지막 경로 지연 검사 결과
+        self.delay_constraints: List[Tuple[str, DelayConstraint]] = []
+        self.delay_checks: List[DelayCheck] = []
+        # 제약 커버리지 비트셋 (첫 IR 제약 적용 시 생성, 이후 증분 갱신)
+        self.coverage: Optional[CoverageEngine] = None
         self.supergraph: Optional[SuperGraph] = None
+        # (view, context) → 구축한 SuperGraph. 그래프 변경은 updater를 구독한
+        # ViewBuilder가 증분 반영하므로 다시 구축하지 않음
+        self.supergraphs: Dict[Tuple[GraphViewType, GraphContext], SuperGraph] = {}
+        self._view_builders: Dict[Tuple[GraphViewType, GraphContext], ViewBuilder] = {}
+        self._supergraph_view: Optional[GraphViewType] = None
+        # 다단계 줌 피라미드 (첫 조회 때 구축, 구조가 바뀌면 다음 조회 때 다시 구축)
+        self.zoom_pyramid: Optional[ZoomPyramid] = None
         
         self.current_stage = None
         self.completed_stages: List[ParsingStage] = []
@@ -62,20 +116,59 @@ class DKGPipeline:
             "xdc": XdcParser(),
             # TODO: 추가 파서 등록
         }
+        
+        # 제약 IR / resolve 결과 디스크 캐시 (cache_dir 지정 시)
+        self.constraint_cache: Optional[ConstraintCache] = (
+            ConstraintCache(cache_dir) if cache_dir is not None else None
+        )
+        self._rtl_hash: Optional[str] = None
     
     def run_rtl_stage(self) -> None:
         """Stage 1: RTL 파싱 (Yosys)"""
         yosys = parse_yosys(self.yosys_config)
         wires, cells = build_wires_and_cells(yosys)
+        self._init_graph(wires, cells, self.yosys_config.out_json_win, ParsingStage.RTL)
+    
+    def run_edif_stage(self, filepath: str) -> None:
+        """
+        Stage 1 (대체): 합성/구현 후 EDIF netlist에서 그래프 구축.
+        
+        Yosys JSON 대신 Vivado write_edif 출력을 스트리밍 파싱하며,
+        이후 단계(제약/타이밍/SDF)는 RTL 경로와 동일하게 사용할 수 있습니다.
+        """
+        wires, cells = parse_edif(filepath)
+        self._init_graph(wires, cells, filepath, ParsingStage.SYNTHESIS)
+        print(f"🧩 EDIF 로드: {len(cells)}개 인스턴스, {len(wires)}개 net → {len(self.nodes)}개 노드")
+    
+    def _init_graph(
+        self,
+        wires: Dict[int, Wire],
+        cells: List[CellIR],
+        source_file: Optional[str],
+        stage: ParsingStage,
+    ) -> None:
+        """Wire/CellIR → 그래프 및 updater 초기화 (RTL/EDIF 공통)"""
         self.nodes, self.edges = build_nodes_and_edges(wires, cells)
         
-        # RTL 파일 추적
-        if self.yosys_config.out_json_win:
-            self.rtl_files.append(self.yosys_config.out_json_win)
+        # 구조 입력 파일 추적
+        if source_file:
+            self.rtl_files.append(source_file)
         
         self.updater = GraphUpdater(self.nodes, self.edges)
-        self.current_stage = ParsingStage.RTL
-        self.completed_stages.append(ParsingStage.RTL)
+        self.timing_store = None
+        self.physical = None
+        self.clock_sources = {}
+        self.clock_propagation = None
+        self._clocks_dirty = False
+        self.delay_constraints = []
+        self.delay_checks = []
+        self.coverage = None
+        self.supergraphs = {}
+        self._view_builders = {}
+        self.zoom_pyramid = None
+        self._rtl_hash = None
+        self.current_stage = stage
+        self.completed_stages.append(stage)
         
         # 초기 메타데이터 설정 (모두 INFERRED)
         self._mark_initial_fields_as_inferred()
@@ -86,44 +179,364 @@ class DKGPipeline:
             raise RuntimeError("RTL stage must be run first")
         
         # 파일 확장자로 파서 선택
+        kind, parser = self._get_constraint_parser(filepath)
+        
+        if self.constraint_cache is not None and parser.supports_ir:
+            file_hash = compute_file_hash(filepath)
+            records = self.constraint_cache.load_ir(kind, file_hash)
+            if records is None:
+                records = parser.parse_constraints(filepath)
+                self.constraint_cache.save_ir(kind, file_hash, records)
+            self._resolve_and_apply(parser, kind, filepath, records, file_hash)
+        elif parser.supports_ir:
+            records = parser.parse_constraints(filepath)
+            self._resolve_and_apply(parser, kind, filepath, records, None)
+        else:
+            parser.parse_and_update(filepath, self.updater, self.nodes, self.edges)
+            self.coverage = None
+        
+        self._mark_constraint_file(filepath)
+        if self._clocks_dirty:
+            self.propagate_clocks()
+
+    def add_constraints_many(
+        self,
+        filepaths: List[str],
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Stage 2: 여러 Constraint 파일을 병렬 파싱 후 순서대로 적용.
+
+        IR 파싱은 그래프를 건드리지 않으므로 프로세스 풀에서 동시에 수행하고,
+        resolve/apply는 입력 순서 그대로 진행하여 FieldSource 우선순위 결과가
+        add_constraints()를 순차 호출한 것과 동일하게 유지됩니다.
+
+        Windows(spawn)에서는 호출 스크립트에 `if __name__ == "__main__":` 가드가 필요합니다.
+
+        Args:
+            filepaths: 제약 파일 경로 리스트 (적용 순서)
+            max_workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 파싱)
+        """
+        if self.updater is None or self.nodes is None or self.edges is None:
+            raise RuntimeError("RTL stage must be run first")
+
+        # 지원하지 않는 형식은 아무것도 적용하기 전에 거부
+        jobs = [(path, *self._get_constraint_parser(path)) for path in filepaths]
+
+        # 1) IR 확보: 캐시 hit는 그대로, miss만 병렬 파싱
+        records_by_index: Dict[int, List[Any]] = {}
+        hashes: Dict[int, str] = {}
+        pending: List[int] = []
+        for index, (path, kind, parser) in enumerate(jobs):
+            if not parser.supports_ir:
+                continue
+            if self.constraint_cache is not None:
+                hashes[index] = compute_file_hash(path)
+                cached = self.constraint_cache.load_ir(kind, hashes[index])
+                if cached is not None:
+                    records_by_index[index] = cached
+                    continue
+            pending.append(index)
+
+        if pending:
+            parser_types = [type(jobs[i][2]) for i in pending]
+            paths = [jobs[i][0] for i in pending]
+            if max_workers == 1 or len(pending) == 1:
+                results = list(map(_parse_constraint_file, parser_types, paths))
+            else:
+                with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                    results = list(pool.map(_parse_constraint_file, parser_types, paths))
+
+            for index, records in zip(pending, results):
+                records_by_index[index] = records
+                if self.constraint_cache is not None:
+                    path, kind, _ = jobs[index]
+                    self.constraint_cache.save_ir(kind, hashes[index], records)
+
+        # 2) 입력 순서대로 resolve/apply
+        for index, (path, kind, parser) in enumerate(jobs):
+            if index in records_by_index:
+                self._resolve_and_apply(
+                    parser, kind, path, records_by_index[index], hashes.get(index)
+                )
+            else:
+                parser.parse_and_update(path, self.updater, self.nodes, self.edges)
+                self.coverage = None
+            self._mark_constraint_file(path)
+
+        print(f"✅ 제약 파일 {len(jobs)}개 적용 완료 (병렬 파싱 {len(pending)}개)")
+        if self._clocks_dirty:
+            self.propagate_clocks()
+
+    def _get_constraint_parser(self, filepath: str) -> Tuple[str, ConstraintParser]:
+        """확장자로 파서 선택"""
         ext = Path(filepath).suffix.lower().lstrip(".")
         
         if ext not in self.parsers:
             raise ValueError(f"Unsupported constraint format: {ext}")
         
-        parser = self.parsers[ext]
-        parser.parse_and_update(filepath, self.updater, self.nodes, self.edges)
+        return ext, self.parsers[ext]
+
+    def _resolve_and_apply(
+        self,
+        parser: ConstraintParser,
+        kind: str,
+        filepath: str,
+        records: List[Any],
+        file_hash: Optional[str],
+    ) -> None:
+        """IR 레코드를 매칭(가능하면 target 캐시 사용)하여 그래프에 반영"""
+        cache = self.constraint_cache
+        graph_key = self._graph_cache_key() if cache is not None and file_hash else None
+
+        resolved = None
+        if graph_key is not None:
+            resolved = cache.load_targets(kind, file_hash, graph_key, len(records))
+        if resolved is None:
+            resolved = parser.resolve_constraints(records, self.nodes, self.edges, source=filepath)
+            if graph_key is not None:
+                cache.save_targets(kind, file_hash, graph_key, resolved)
+
+        parser.apply_constraints(records, resolved, filepath, self.updater, self.nodes, self.edges)
+        if self._get_physical().apply_records(records):
+            self._refresh_view_regions()
+        self.get_coverage().update(
+            (node_id for targets in resolved for node_id in targets["nodes"]),
+            (edge_id for targets in resolved for edge_id in targets["edges"]),
+        )
+        for record in records:
+            if isinstance(record, ClockConstraint):
+                for port in record.target_ports or []:
+                    self.clock_sources[port] = record.clock_name
+                self._clocks_dirty = True
+            elif isinstance(record, DelayConstraint):
+                self.delay_constraints.append((filepath, record))
+
+    def propagate_clocks(self) -> ClockPropagation:
+        """
+        선언된 모든 클럭 소스에서 동시에 클럭을 전파하여 순차 소자의 clock_domain 지정.
+        
+        소스: create_clock 대상 net, create_clock에 이름이 매칭되어 clock_domain이
+        DECLARED인 비순차 노드(MMCM 출력 등). 선언된 클럭이 닿은 순차 소자만 ANALYZED로
+        갱신하므로 노드에 직접 선언된 값(DECLARED)은 유지됩니다.
+        """
+        if self.updater is None or self.nodes is None or self.edges is None:
+            raise RuntimeError("RTL stage must be run first")
+        
+        node_sources: Dict[str, str] = {}
+        for node_id, node in self.nodes.items():
+            if (
+                node.clock_domain
+                and node.entity_class not in SEQUENTIAL_CLASSES
+                and self.updater.node_metadata[node_id].get_source("clock_domain") == FieldSource.DECLARED
+            ):
+                node_sources[node_id] = node.clock_domain
+        
+        result = ClockPropagator(self.nodes, self.edges).propagate(self.clock_sources, node_sources)
+        updates = {
+            node_id: clock
+            for node_id, clock in result.domains.items()
+            if clock in result.declared_clocks
+        }
+        self.updater.batch_update_node_field(
+            "clock_domain", updates, FieldSource.ANALYZED, ParsingStage.CONSTRAINTS
+        )
+        self.clock_propagation = result
+        self._clocks_dirty = False
+        if self.coverage is not None:
+            self.coverage.refresh_clocks(result.declared_clocks)
+        print(
+            f"🕒 클럭 전파: 클럭 {len(result.clocks)}개, 순차 소자 {len(updates)}개 도메인 지정, "
+            f"다중 클럭 노드 {len(result.multi_clock)}개"
+        )
+        return result
+
+    def evaluate_delay_constraints(self) -> List[DelayCheck]:
+        """
+        적용된 모든 set_max_delay/set_min_delay의 -from → -to 경로 지연을 평가.
+        
+        제약별 cone 엣지 합집합을 한 번 위상 순회하며 최장(max)/최단(min) 경로를 구하므로
+        엣지 delay가 반영된 뒤(add_sdf, add_timing_report) 호출해야 의미가 있습니다.
+        """
+        if self.nodes is None or self.edges is None:
+            raise RuntimeError("RTL stage must be run first")
+        
+        files = [path for path, _ in self.delay_constraints]
+        records = [record for _, record in self.delay_constraints]
+        checks = PathDelayEvaluator(self.nodes, self.edges).evaluate(records, files)
+        self.delay_checks = checks
         
+        violations = sum(1 for c in checks if c.met is False)
+        unmatched = sum(1 for c in checks if c.path_delay is None)
+        print(f"⏱️ 경로 지연 검사: 제약 {len(checks)}개, 위반 {violations}개, 경로 없음 {unmatched}개")
+        return checks
+
+    def get_coverage(self) -> CoverageEngine:
+        """제약 커버리지 (없으면 현재 그래프를 스캔해 생성)"""
+        if self.nodes is None or self.edges is None:
+            raise RuntimeError("RTL stage must be run first")
+        if self.coverage is None:
+            declared = set(self.clock_sources.values())
+            if self.clock_propagation is not None:
+                declared |= self.clock_propagation.declared_clocks
+            self.coverage = CoverageEngine(self.nodes, self.edges, declared)
+        return self.coverage
+
+    def get_zoom_pyramid(self, mode: ZoomMode = ZoomMode.HIERARCHY) -> ZoomPyramid:
+        """줌 피라미드 (없거나 mode가 다르거나 그래프 구조가 바뀌었으면 다시 구축)"""
+        if self.nodes is None or self.edges is None:
+            raise RuntimeError("RTL stage must be run first")
+        pyramid = self.zoom_pyramid
+        if pyramid is not None and pyramid.mode == ZoomMode(mode) and not pyramid.stale:
+            return pyramid
+        if pyramid is None or pyramid.mode != ZoomMode(mode):
+            if pyramid is not None and self.updater is not None:
+                pyramid.unsubscribe(self.updater)
+            pyramid = ZoomPyramid(self.nodes, self.edges, mode)
+            if self.updater is not None:
+                pyramid.subscribe(self.updater)
+        pyramid.build()
+        self.zoom_pyramid = pyramid
+        print(f"🔭 줌 피라미드 ({pyramid.mode.value}): {len(pyramid.levels)}개 레벨")
+        return pyramid
+
+    def _get_physical(self) -> PhysicalModel:
+        if self.physical is None:
+            self.physical = PhysicalModel(self.nodes, self.edges)
+        return self.physical
+
+    def _mark_constraint_file(self, filepath: str) -> None:
         # 제약 파일 추적
         self.constraint_files.append(filepath)
         
         if ParsingStage.CONSTRAINTS not in self.completed_stages:
             self.completed_stages.append(ParsingStage.CONSTRAINTS)
+
+    def _graph_cache_key(self) -> Optional[str]:
+        """그래프 버전 키 (RTL 해시). RTL 파일이 없으면 None"""
+        if self._rtl_hash is None and self.rtl_files:
+            self._rtl_hash = _combined_file_hash(self.rtl_files)
+        return self._rtl_hash or None
     
-    def add_timing_report(self, filepath: str) -> None:
-        """Stage 3: 타이밍 리포트 추가"""
+    def add_timing_report(
+        self,
+        filepath: str,
+        max_workers: Optional[int] = 1,
+        corner: str = DEFAULT_CORNER,
+        retention: PathRetention = PathRetention.ALL,
+        top_k: int = DEFAULT_TOP_K,
+    ) -> None:
+        """
+        Stage 3: 타이밍 리포트 추가
+
+        Args:
+            filepath: 타이밍 리포트 경로
+            max_workers: 파싱 프로세스 수 (1이면 스트리밍 직렬 파싱, None이면 CPU 수로 샤드 병렬 파싱)
+            corner: 리포트의 코너 라벨. 값은 timing_store의 코너별 컬럼에 저장되고
+                    노드/엣지 필드에는 전체 코너의 worst 값이 반영됨 (setup → slack 등, hold → hold_* 필드)
+            retention: 그래프에 반영할 경로 보관 정책 (TOP_K 계열은 최악 K개만 메모리에 유지)
+            top_k: TOP_K 계열 정책의 K
+        """
         if self.updater is None or self.nodes is None or self.edges is None:
             raise RuntimeError("RTL stage must be run first")
         
         # 타이밍 리포트 파싱
-        parser = TimingReportParser()
-        paths = parser.parse_file(filepath)
+        parser = TimingReportParser(retention=retention, top_k=top_k)
+        parser.parse_file(filepath, max_workers=max_workers)
         
         # 그래프에 반영
-        parser.apply_to_graph(self.nodes, self.edges, self.updater)
-        
-        # 파일 추적
-        self.timing_files.append(filepath)
-        
-        if ParsingStage.TIMING not in self.completed_stages:
-            self.completed_stages.append(ParsingStage.TIMING)
+        parser.apply_to_graph(
+            self.nodes, self.edges, self.updater, corner=corner, store=self._get_timing_store()
+        )
+        self._mark_timing_file(filepath)
         
         # 요약 출력
         summary = parser.get_summary()
-        print(f"✅ 타이밍 리포트 파싱 완료: {filepath}")
+        print(f"✅ 타이밍 리포트 파싱 완료: {filepath} (corner: {corner})")
         print(f"   - 경로 수: {summary['total_paths']}")
         if summary.get('worst_slack') is not None:
             print(f"   - 최악 slack: {summary['worst_slack']:.2f} ns")
+        if parser.resolver is not None:
+            print(f"   - 이름 매칭률: {parser.resolver.match_rate():.1%}")
+
+    def add_timing_reports(
+        self,
+        reports: Dict[str, str],
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Stage 3: 여러 코너의 타이밍 리포트를 병렬 파싱 후 적용.
+
+        파싱은 그래프를 건드리지 않으므로 코너(파일)별로 프로세스 풀에서 동시에 수행하고
+        (결과는 컬럼형 TimingPathTable로 전달), 그래프 반영은 입력 순서대로 진행합니다.
+
+        Windows(spawn)에서는 호출 스크립트에 `if __name__ == "__main__":` 가드가 필요합니다.
+
+        Args:
+            reports: 코너 라벨 → 리포트 경로
+            max_workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 파싱)
+        """
+        if self.updater is None or self.nodes is None or self.edges is None:
+            raise RuntimeError("RTL stage must be run first")
+
+        corners = list(reports)
+        paths = [reports[c] for c in corners]
+        if max_workers == 1 or len(paths) <= 1:
+            tables = list(map(parse_report_table, paths))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                tables = list(pool.map(parse_report_table, paths))
+
+        # 이름/엣지 인덱스는 코너 간 공유
+        parser = TimingReportParser()
+        store = self._get_timing_store()
+        for corner, filepath, table in zip(corners, paths, tables):
+            parser.apply_to_graph(
+                self.nodes, self.edges, self.updater, table.iter_paths(), corner=corner, store=store
+            )
+            self._mark_timing_file(filepath)
+            print(f"   - {corner}: 경로 {len(table)}개 ({filepath})")
+
+        print(f"✅ 타이밍 리포트 {len(corners)}개 코너 적용 완료")
+        if parser.resolver is not None:
+            print(f"   - 이름 매칭률: {parser.resolver.match_rate():.1%}")
+
+    def add_sdf(self, filepath: str, column: str = "max") -> None:
+        """
+        Stage 3: SDF back-annotation (셀/net 지연)
+
+        Args:
+            filepath: SDF 경로
+            column: 엣지 delay로 쓸 SDF 값 ("min" / "typ" / "max")
+        """
+        if self.updater is None or self.nodes is None or self.edges is None:
+            raise RuntimeError("RTL stage must be run first")
+
+        parser = SdfParser()
+        table = parser.annotate(filepath, self.nodes, self.edges)
+        updated = parser.apply_to_graph(
+            table, self.nodes, self.edges, self.updater, column=column, origin_file=filepath
+        )
+        self._mark_timing_file(filepath)
+
+        print(f"✅ SDF 반영 완료: {filepath}")
+        print(f"   - CELL: {table.cells}, IOPATH: {table.matched_iopaths}/{table.iopaths}, "
+              f"INTERCONNECT: {table.matched_interconnects}/{table.interconnects}")
+        print(f"   - 엣지 delay 갱신: {updated}개 ({column})")
+        if parser.resolver is not None:
+            print(f"   - 이름 매칭률: {parser.resolver.match_rate():.1%}")
+
+    def _get_timing_store(self) -> TimingCornerStore:
+        if self.timing_store is None:
+            self.timing_store = TimingCornerStore(self.nodes, self.edges)
+        return self.timing_store
+
+    def _mark_timing_file(self, filepath: str) -> None:
+        # 파일 추적
+        self.timing_files.append(filepath)
+        
+        if ParsingStage.TIMING not in self.completed_stages:
+            self.completed_stages.append(ParsingStage.TIMING)
     
     def add_floorplan(self, filepath: str) -> None:
         """Stage 4: Floorplan TCL 추가"""
@@ -132,17 +545,26 @@ class DKGPipeline:
 
         parser = TclParser()
         parser.parse_and_update(filepath, self.updater, self.nodes, self.edges)
+        if self.physical is not None:
+            self.physical.invalidate()
+        self.coverage = None
+        self._sync_supergraph_context()
 
         if ParsingStage.FLOORPLAN not in self.completed_stages:
             self.completed_stages.append(ParsingStage.FLOORPLAN)
 
     def add_board(self, filepath: str) -> None:
-        """Stage 5: BD/board constraints 추가"""
+        """Stage 5: BD/board constraints 추가 (.bd JSON 또는 write_bd_tcl 출력)"""
         if self.updater is None or self.nodes is None or self.edges is None:
             raise RuntimeError("RTL stage must be run first")
 
         parser = BdParser()
         parser.parse_and_update(filepath, self.updater, self.nodes, self.edges)
+        stats = parser.stats
+        print(
+            f"🔌 BD: IP {stats['matched_components']}/{stats['components']}개 매칭, "
+            f"노드 {stats['tagged_nodes']}개 / 엣지 {stats['tagged_edges']}개 태깅"
+        )
 
         if ParsingStage.BOARD not in self.completed_stages:
             self.completed_stages.append(ParsingStage.BOARD)
@@ -191,25 +613,10 @@ class DKGPipeline:
     
     def compute_version(self) -> GraphVersion:
         """현재 상태의 GraphVersion 계산"""
-        import hashlib
-        
-        # RTL 해시 (모든 RTL 파일의 조합)
-        rtl_hash = ""
-        if self.rtl_files:
-            combined = "".join(compute_file_hash(f) for f in self.rtl_files)
-            rtl_hash = hashlib.sha256(combined.encode()).hexdigest()[:16]
-        
-        # Constraint 해시
-        constraint_hash = None
-        if self.constraint_files:
-            combined = "".join(compute_file_hash(f) for f in self.constraint_files)
-            constraint_hash = hashlib.sha256(combined.encode()).hexdigest()[:16]
-        
-        # Timing 해시
-        timing_hash = None
-        if self.timing_files:
-            combined = "".join(compute_file_hash(f) for f in self.timing_files)
-            timing_hash = hashlib.sha256(combined.encode()).hexdigest()[:16]
+        # RTL / Constraint / Timing 해시 (각 파일 해시의 조합)
+        rtl_hash = _combined_file_hash(self.rtl_files) or ""
+        constraint_hash = _combined_file_hash(self.constraint_files)
+        timing_hash = _combined_file_hash(self.timing_files)
         
         # 정책 버전 (향후 확장)
         policy_versions = {}
@@ -255,27 +662,120 @@ class DKGPipeline:
         return pipeline
 
     def build_supergraph(self, view: GraphViewType = GraphViewType.Connectivity) -> None:
+        """
+        view의 SuperGraph를 self.supergraph로 설정.
+        
+        build_supergraphs()로 미리 만든 뷰가 있으면 다시 구축하지 않고 꺼내 씁니다.
+        """
+        if self.nodes is None or self.edges is None:
+            raise RuntimeError("Run RTL stage first.")
+        
+        context = self._detect_context()
+        if context == GraphContext.SIMULATION:
+            print(f"ℹ️ Simulation context detected from node attributes.")
+        self._supergraph_view = view
+        cached = self.supergraphs.get((view, context))
+        if cached is not None:
+            self.supergraph = cached
+            return
+        
+        print(f"🏗️ Building SuperGraph (View: {view.value}, Context: {context.value})...")
+        
+        view_builder = ViewBuilder(
+            self.nodes, 
+            self.edges, 
+            view, 
+            context=context,
+            regions=self._physical_regions([view]),
+            physical=self._get_physical() if view == GraphViewType.Physical else None,
+        )
+        
+        self.supergraph = view_builder.build()
+        self.supergraphs[(view, context)] = self.supergraph
+        self._track_view_builder((view, context), view_builder)
+        print(f"✅ SuperGraph built: {len(self.supergraph.super_nodes)} nodes, {len(self.supergraph.super_edges)} edges.")
 
-            if self.nodes is None or self.edges is None:
-                raise RuntimeError("Run RTL stage first.")
-
-            context = GraphContext.DESIGN
-            
-
-            for node in self.nodes.values():
-                if node.attributes.get("design_context") == "sim":
-                    context = GraphContext.SIMULATION
-                    print(f"ℹ️ Simulation context detected from node attributes.")
-                    break
-            
-            print(f"🏗️ Building SuperGraph (View: {view.value}, Context: {context.value})...")
-            
-            view_builder = ViewBuilder(
-                self.nodes, 
-                self.edges, 
-                view, 
-                context=context  
-            )
-            
-            self.supergraph = view_builder.build()
-            print(f"✅ SuperGraph built: {len(self.supergraph.super_nodes)} nodes, {len(self.supergraph.super_edges)} edges.")
\ No newline at end of file
+    def build_supergraphs(
+        self,
+        views: Optional[List[GraphViewType]] = None,
+        contexts: Optional[List[GraphContext]] = None,
+    ) -> Dict[Tuple[GraphViewType, GraphContext], SuperGraph]:
+        """
+        여러 뷰(기본: 전체 GraphViewType × GraphContext)를 공유 인덱스로 한 번에 구축.
+        
+        self.supergraph는 감지한 컨텍스트의 첫 번째 뷰로 설정되며,
+        이후 뷰 전환은 get_supergraph()의 딕셔너리 조회입니다.
+        """
+        if self.nodes is None or self.edges is None:
+            raise RuntimeError("Run RTL stage first.")
+        
+        views = list(views) if views is not None else list(GraphViewType)
+        contexts = list(contexts) if contexts is not None else list(GraphContext)
+        print(f"🏗️ Building SuperGraphs: {len(views)}개 뷰 × {len(contexts)}개 컨텍스트...")
+        
+        multi = MultiViewBuilder(
+            self.nodes,
+            self.edges,
+            views=views,
+            contexts=contexts,
+            regions=self._physical_regions(views),
+            physical=self._get_physical() if GraphViewType.Physical in views else None,
+        )
+        built = multi.build()
+        self.supergraphs.update(built)
+        for key, view_builder in multi.builders.items():
+            self._track_view_builder(key, view_builder)
+        
+        context = self._detect_context()
+        if views and (views[0], context) in built:
+            self.supergraph = built[(views[0], context)]
+            self._supergraph_view = views[0]
+        print(f"✅ SuperGraphs built: {len(built)}개")
+        return built
+
+    def get_supergraph(
+        self,
+        view: GraphViewType,
+        context: Optional[GraphContext] = None,
+    ) -> Optional[SuperGraph]:
+        """이미 구축한 뷰 (없으면 None). context를 생략하면 노드 attributes로 감지"""
+        return self.supergraphs.get((view, context or self._detect_context()))
+
+    def _detect_context(self) -> GraphContext:
+        for node in self.nodes.values():
+            if node.attributes.get("design_context") == "sim":
+                return GraphContext.SIMULATION
+        return GraphContext.DESIGN
+
+    def _physical_regions(self, views: List[GraphViewType]) -> Optional[Dict[str, str]]:
+        # Physical 뷰는 pblock 범위까지 반영한 영역으로 그룹 (없으면 ViewBuilder가 attributes로 계산)
+        if GraphViewType.Physical in views and self.physical is not None:
+            return self.physical.node_regions()
+        return None
+
+    def _track_view_builder(
+        self,
+        key: Tuple[GraphViewType, GraphContext],
+        view_builder: ViewBuilder,
+    ) -> None:
+        """뷰를 updater에 구독시켜 이후 그래프 변경을 증분 반영 (같은 뷰의 이전 빌더는 해제)"""
+        if self.updater is None:
+            return
+        previous = self._view_builders.get(key)
+        if previous is not None:
+            previous.unsubscribe(self.updater)
+        view_builder.subscribe(self.updater)
+        self._view_builders[key] = view_builder
+
+    def _refresh_view_regions(self) -> None:
+        # pblock 범위 변경은 노드 필드 갱신이 아니므로 Physical 뷰의 영역을 직접 다시 판정
+        for (view, _), view_builder in self._view_builders.items():
+            if view == GraphViewType.Physical:
+                view_builder.refresh_regions()
+
+    def _sync_supergraph_context(self) -> None:
+        # floorplan의 design_context가 바뀌면 self.supergraph를 그 컨텍스트의 같은 뷰로 전환
+        if self.supergraph is None or self._supergraph_view is None:
+            return
+        if self.supergraphs.get((self._supergraph_view, self._detect_context())) is not self.supergraph:
+            self.build_supergraph(self._supergraph_view)
\ No newline at end of file
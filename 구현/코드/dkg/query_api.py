@@ -10,8 +10,11 @@ from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 from .core.graph import DKGEdge, DKGNode, EdgeFlowType, EntityClass, RelationType
+from .parsers.parser_utils import compile_glob
 
 if TYPE_CHECKING:
+    from .builders.cdc import CdcAnalyzer, CdcReport
+    from .builders.coverage import CoverageEngine
     from .builders.supergraph import SuperGraph, SuperNode, SuperEdge, AnalysisKind
 
 
@@ -75,11 +78,16 @@ class DKGQuery:
         self,
         nodes: Dict[str, DKGNode],
         edges: Dict[str, DKGEdge],
-        supergraph: Optional["SuperGraph"] = None
+        supergraph: Optional["SuperGraph"] = None,
+        coverage: Optional["CoverageEngine"] = None,
     ):
         self.nodes = nodes
         self.edges = edges
         self.supergraph = supergraph
+        # CDC 분석 결과 (첫 조회 시 계산 후 재사용)
+        self._cdc: Optional["CdcAnalyzer"] = None
+        # 제약 커버리지 (파이프라인이 증분 갱신한 것을 받거나 첫 조회 시 스캔)
+        self._coverage = coverage
         
         # 인덱스 구축
         self._build_indexes()
@@ -147,14 +155,19 @@ class DKGQuery:
         if hierarchy_prefix is not None:
             candidates &= set(self.nodes_by_hierarchy.get(hierarchy_prefix, []))
         
+        # 이름 패턴은 한 번만 컴파일
+        name_matcher = compile_glob(name_pattern) if name_pattern is not None else None
+        
         # 추가 필터링
         result = []
         for node_id in candidates:
             node = self.nodes[node_id]
             
             # 이름 패턴
-            if name_pattern is not None:
-                if not self._match_pattern(name_pattern, node):
+            if name_matcher is not None:
+                if not name_matcher.match_any(
+                    (node.hier_path, node.local_name, node.canonical_name)
+                ):
                     continue
             
             # 클럭 도메인
@@ -237,6 +250,8 @@ class DKGQuery:
         if relation_type is not None:
             candidates &= set(self.edges_by_relation.get(relation_type, []))
         
+        signal_matcher = compile_glob(signal_pattern) if signal_pattern is not None else None
+        
         result = []
         for edge_id in candidates:
             edge = self.edges[edge_id]
@@ -252,8 +267,8 @@ class DKGQuery:
                 continue
             
             # 신호 패턴
-            if signal_pattern is not None:
-                if not self._match_wildcard(signal_pattern, edge.signal_name):
+            if signal_matcher is not None:
+                if not signal_matcher.match(edge.signal_name):
                     continue
             
             # 사용자 정의 필터
@@ -637,6 +652,73 @@ class DKGQuery:
             return None
         return self.supergraph.node_to_super.get(node_id)
     
+    # ========================================================================
+    # CDC Query Methods
+    # ========================================================================
+    
+    def get_cdc_report(self, refresh: bool = False) -> "CdcReport":
+        """
+        클럭 도메인 교차 행렬 (launch × capture)과 교차점 목록.
+        
+        한 번 계산한 결과를 캐싱하며, clock_domain이 바뀌었으면 refresh=True로 재계산합니다.
+        """
+        return self._get_cdc(refresh).analyze()
+    
+    def find_cdc_path(self, capture_node: str, launch_domain: str) -> Optional[PathResult]:
+        """launch_domain의 순차 소자에서 capture_node까지의 데이터 경로 하나"""
+        found = self._get_cdc().find_crossing_path(capture_node, launch_domain)
+        if found is None:
+            return None
+        node_path, edge_path = found
+        return PathResult(
+            nodes=node_path,
+            edges=edge_path,
+            total_delay=self._compute_path_delay(edge_path),
+            total_slack=self._compute_path_slack(node_path),
+        )
+    
+    def _get_cdc(self, refresh: bool = False) -> "CdcAnalyzer":
+        if self._cdc is None or refresh:
+            # builders ↔ pipeline 순환 import를 피하기 위해 지연 import
+            from .builders.cdc import CdcAnalyzer
+            
+            self._cdc = CdcAnalyzer(self.nodes, self.edges)
+        return self._cdc
+    
+    # ========================================================================
+    # Constraint Coverage Methods
+    # ========================================================================
+    
+    def get_coverage_report(self, depth: int = 1, refresh: bool = False) -> Dict[str, Any]:
+        """제약 종류별 커버리지 요약 + 계층(depth 단계)별 + 클럭 도메인별"""
+        return self._get_coverage(refresh).to_dict(depth)
+    
+    def find_unconstrained(
+        self,
+        kind: str,
+        hierarchy: Optional[str] = None,
+        clock_domain: Optional[str] = None,
+    ) -> List[str]:
+        """
+        kind 제약이 없는 엔티티 (kind: clock, io_delay, exception, loc, pblock)
+        
+        예: find_unconstrained("loc") → LOC 없는 I/O 포트
+        """
+        from .builders.coverage import CoverageKind
+        
+        return self._get_coverage().unconstrained(CoverageKind(kind), hierarchy, clock_domain)
+    
+    def get_coverage_flags(self, node_id: str) -> Dict[str, bool]:
+        """노드 하나의 제약 종류별 커버 여부"""
+        return self._get_coverage().flags(node_id)
+    
+    def _get_coverage(self, refresh: bool = False) -> "CoverageEngine":
+        if self._coverage is None or refresh:
+            from .builders.coverage import CoverageEngine
+            
+            self._coverage = CoverageEngine(self.nodes, self.edges)
+        return self._coverage
+    
     # ========================================================================
     # Statistics Methods
     # ========================================================================
@@ -693,10 +775,8 @@ class DKGQuery:
         return any(self._match_wildcard(pattern, c) for c in candidates)
     
     def _match_wildcard(self, pattern: str, text: str) -> bool:
-        """와일드카드 패턴 매칭"""
-        import re
-        regex_pattern = pattern.replace('*', '.*').replace('?', '.')
-        return re.fullmatch(regex_pattern, text) is not None
+        """와일드카드 패턴 매칭 (컴파일된 패턴 캐시 사용)"""
+        return compile_glob(pattern).match(text)
     
     def _compute_path_delay(self, edge_path: List[str]) -> Optional[float]:
         """경로의 총 지연 계산"""
@@ -726,7 +806,8 @@ class DKGQuery:
 def create_query(
     nodes: Dict[str, DKGNode],
     edges: Dict[str, DKGEdge],
-    supergraph: Optional["SuperGraph"] = None
+    supergraph: Optional["SuperGraph"] = None,
+    coverage: Optional["CoverageEngine"] = None,
 ) -> DKGQuery:
     """Query API 생성 헬퍼 함수"""
-    return DKGQuery(nodes, edges, supergraph)
+    return DKGQuery(nodes, edges, supergraph, coverage)
@@ -159,7 +159,7 @@ def compute_timing_edge_metrics(
     flow_type_counts: Dict[EdgeFlowType, int] = {}
     fanout_values: List[int] = []
     
-    for edge_id in superedge.member_edges:
+    for edge_id in superedge.member_edge_ids():
         edge = edges.get(edge_id)
         if not edge:
             continue
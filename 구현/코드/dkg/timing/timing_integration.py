@@ -34,15 +34,12 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from ..builders.constraint_projector import (
-    ConstraintProjector,
-    parse_sdc_create_clock,
-    parse_sdc_false_path,
-    parse_sdc_multicycle_path,
-)
+from ..builders.constraint_projector import ConstraintProjector
 from ..core.graph import DKGEdge, DKGNode
 from ..builders.graph_updater import GraphUpdater
+from ..parsers.sdc_parser import SdcParser
 from ..parsers.timing_report_parser import TimingReportParser
+from ..parsers.xdc_parser import XdcParser
 from ..builders.supergraph import SuperGraph, TimingAlert, TimingSummary
 from .timing_aggregator import (
     aggregate_timing_to_supergraph,
@@ -147,49 +144,17 @@ class TimingAnalysisPipeline:
             print(f"Warning: Unsupported constraint file type: {file_type}")
 
     def _process_sdc_file(self, filepath: Path) -> None:
-        """SDC 파일을 파싱하고 제약을 투영합니다."""
-        with open(filepath, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        
-        constraint_count = 0
-        
-        for line_num, line in enumerate(lines, start=1):
-            line = line.strip()
-            
-            # create_clock 처리
-            if line.startswith("create_clock"):
-                constraint = parse_sdc_create_clock(line)
-                if constraint:
-                    self.constraint_projector.project_clock_constraint(
-                        constraint, str(filepath), line_num
-                    )
-                    constraint_count += 1
-            
-            # set_false_path 처리
-            elif line.startswith("set_false_path"):
-                constraint = parse_sdc_false_path(line)
-                if constraint:
-                    self.constraint_projector.project_false_path_constraint(
-                        constraint, str(filepath), line_num
-                    )
-                    constraint_count += 1
-            
-            # set_multicycle_path 처리
-            elif line.startswith("set_multicycle_path"):
-                constraint = parse_sdc_multicycle_path(line)
-                if constraint:
-                    self.constraint_projector.project_multicycle_path_constraint(
-                        constraint, str(filepath), line_num
-                    )
-                    constraint_count += 1
-        
-        print(f"Projected {constraint_count} constraints from {filepath}")
+        """SDC 파일을 IR로 파싱하고 제약을 한 번에 투영합니다."""
+        self._project_constraint_file(SdcParser(), filepath)
 
     def _process_xdc_file(self, filepath: Path) -> None:
-        """XDC 파일을 파싱하고 제약을 투영합니다."""
-        # XDC는 SDC와 유사하지만 Xilinx 특화 명령 포함
-        # 여기서는 SDC와 같은 방식으로 처리
-        self._process_sdc_file(filepath)
+        """XDC 파일을 파싱하고 제약을 투영합니다 (SDC 타이밍 명령 + Xilinx 특화 명령)."""
+        self._project_constraint_file(XdcParser(), filepath)
+
+    def _project_constraint_file(self, parser: SdcParser, filepath: Path) -> None:
+        records = parser.parse_constraints(str(filepath))
+        self.constraint_projector.project_batch(records, str(filepath))
+        print(f"Projected {len(records)} constraints from {filepath}")
 
     # ========================================================================
     # Step 3: SuperGraph에 Timing Metrics 부착
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import gc
 import hashlib
 import re
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 
 
 def is_clock_name(name: str) -> bool:
@@ -61,6 +63,23 @@ def stable_hash(s: str, length: int = 12) -> str:
     return hashlib.sha1(s.encode()).hexdigest()[:length]
 
 
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """
+    객체를 대량 생성하는 동안 순환 GC를 멈춤 (끝나면 원래 상태로 복구).
+
+    그래프가 큰 힙에서 set/dataclass를 수십만 개 만들면 세대별 GC가 반복적으로
+    전체 힙을 훑어 실제 작업보다 오래 걸리므로, 순환 참조를 만들지 않는 구축 단계에서만 사용합니다.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
 def compute_file_hash(filepath: str | Path) -> str:
     """파일 내용의 SHA-256 해시 계산"""
     filepath = Path(filepath)
@@ -0,0 +1,76 @@
+"""CdcAnalyzer: launch × capture 교차 행렬과 동기화기 판정 테스트"""
+from __future__ import annotations
+
+import dkg.pipeline  # noqa: F401  (dkg.builders ↔ dkg.pipeline 순환 import 초기화 순서)
+from dkg.builders.cdc import CdcAnalyzer
+from dkg.builders.graph_build import build_nodes_and_edges
+from dkg.core.ir import CellIR, Wire
+
+
+def _ff(name, clk, d, q):
+    return CellIR(name=name, type="$dff", module="top", port_dirs={"CLK": "input", "D": "input", "Q": "output"},
+                  connections={"CLK": [clk], "D": [d], "Q": [q]})
+
+
+def _gate(name, a, b, y):
+    return CellIR(name=name, type="$and", module="top", port_dirs={"A": "input", "B": "input", "Y": "output"},
+                  connections={"A": [a], "B": [b], "Y": [y]})
+
+
+def _design():
+    """
+    clk_a: a1, a2   clk_b: sync1 → sync2 → b1, b_bad, b2
+    - a1 → sync1 → sync2: 2단 동기화기
+    - a1, a2 → g1 → b_bad: 조합 논리를 거친 교차
+    - b1 → l1 ↔ l2 (a1 혼입) → b2: 조합 루프를 지나는 교차, b2 → a1/a2 역방향 교차
+    """
+    names = {1: "clk_a", 2: "clk_b", 10: "din", 11: "qa", 12: "s1", 13: "s2", 14: "qa2", 15: "g",
+             16: "bad", 17: "qb", 18: "loopa", 19: "loopb"}
+    wires = {k: Wire(k, name=v) for k, v in names.items()}
+    cells = [
+        _ff("a1", 1, 10, 11), _ff("a2", 1, 10, 14),
+        _ff("sync1", 2, 11, 12), _ff("sync2", 2, 12, 13),
+        _gate("g1", 11, 14, 15), _ff("b_bad", 2, 15, 16),
+        _ff("b1", 2, 13, 17), _gate("l1", 17, 19, 18), _gate("l2", 18, 11, 19), _ff("b2", 2, 19, 10),
+    ]
+    nodes, edges = build_nodes_and_edges(wires, cells)
+    return nodes, edges, {n.local_name: k for k, n in nodes.items()}
+
+
+def test_crossing_matrix_counts_per_domain_pair():
+    nodes, edges, _ = _design()
+    report = CdcAnalyzer(nodes, edges).analyze()
+
+    assert sorted(report.domains) == ["clk_a", "clk_b"]
+    assert report.matrix == {"clk_a": {"clk_b": 3}, "clk_b": {"clk_a": 2, "clk_b": 3}}
+    assert report.unsynchronized == {"clk_a": {"clk_b": 2}, "clk_b": {"clk_a": 2}}
+
+
+def test_synchronizer_and_through_logic_classification():
+    nodes, edges, _ = _design()
+    crossings = {nodes[c.capture_node].local_name: c for c in CdcAnalyzer(nodes, edges).analyze().crossings}
+
+    assert set(crossings) == {"a1", "a2", "sync1", "b_bad", "b2"}
+    assert crossings["sync1"].synchronized and not crossings["sync1"].through_logic
+    assert not crossings["b_bad"].synchronized and crossings["b_bad"].through_logic
+    assert crossings["b2"].launch_domains == ["clk_a"] and crossings["b2"].through_logic
+
+
+def test_async_reg_marks_crossing_synchronized():
+    nodes, edges, ids = _design()
+    nodes[ids["b_bad"]].attributes["ASYNC_REG"] = "TRUE"
+    crossings = {nodes[c.capture_node].local_name: c for c in CdcAnalyzer(nodes, edges).analyze().crossings}
+
+    assert crossings["b_bad"].synchronized
+
+
+def test_crossing_path_goes_through_combinational_loop():
+    nodes, edges, ids = _design()
+    analyzer = CdcAnalyzer(nodes, edges)
+    analyzer.analyze()
+
+    node_path, edge_path = analyzer.find_crossing_path(ids["b2"], "clk_a")
+
+    assert [nodes[n].local_name for n in node_path] == ["a1", "l2", "b2"]
+    assert len(edge_path) == 2
+    assert analyzer.find_crossing_path(ids["sync2"], "clk_a") is None
@@ -0,0 +1,105 @@
+"""ClockPropagator: MMCM/BUFG 클럭 트리와 create_clock 포트 seed 테스트"""
+from __future__ import annotations
+
+import dkg.pipeline  # noqa: F401  (dkg.builders ↔ dkg.pipeline 순환 import 초기화 순서)
+from dkg.builders.clock_propagation import ClockPropagator
+from dkg.builders.graph_build import build_nodes_and_edges
+from dkg.core.graph import EdgeFlowType, EntityClass
+from dkg.core.ir import CellIR, Wire
+from dkg.pipeline import DKGPipeline
+from dkg.pipeline.stages import ParsingStage
+
+FF_PORTS = {"C": "input", "CE": "input", "R": "input", "D": "input", "Q": "output"}
+
+
+def _ff(name, clk, d, q):
+    return CellIR(name=name, type="FDRE", module="top", port_dirs=FF_PORTS,
+                  connections={"C": [clk], "D": [d], "Q": [q]})
+
+
+def _mmcm_design(port_name):
+    """port → MMCME2_BASE → mmcm_out0 → BUFG → gclk → FDRE.C × 2"""
+    wires = {
+        1: Wire(1, name=port_name),
+        2: Wire(2, name="mmcm_out0"),
+        3: Wire(3, name="gclk"),
+        4: Wire(4, name="din"),
+        5: Wire(5, name="q0"),
+        6: Wire(6, name="q1"),
+        7: Wire(7, name="locked"),
+    }
+    cells = [
+        CellIR(name="mmcm", type="MMCME2_BASE", module="top",
+               port_dirs={"CLKIN1": "input", "CLKOUT0": "output", "LOCKED": "output"},
+               connections={"CLKIN1": [1], "CLKOUT0": [2], "LOCKED": [7]}),
+        CellIR(name="bufg", type="BUFG", module="top",
+               port_dirs={"I": "input", "O": "output"}, connections={"I": [2], "O": [3]}),
+        _ff("r0", 3, 4, 5),
+        _ff("r1", 3, 5, 6),
+    ]
+    return wires, cells
+
+
+def _pipeline(tmp_path, port_name, xdc):
+    wires, cells = _mmcm_design(port_name)
+    p = DKGPipeline(None)
+    p._init_graph(wires, cells, None, ParsingStage.SYNTHESIS)
+    path = tmp_path / "clk.xdc"
+    path.write_text(xdc)
+    p.add_constraints(str(path))
+    return p
+
+
+def _ff_domains(nodes):
+    return {n.local_name: n.clock_domain for n in nodes.values() if n.entity_class == EntityClass.FLIP_FLOP}
+
+
+def test_clock_primitive_outputs_are_clock_tree():
+    nodes, edges = build_nodes_and_edges(*_mmcm_design("sysin"))
+    flows = {e.signal_name: e.flow_type for e in edges.values()}
+
+    assert flows["mmcm_out0"] == EdgeFlowType.CLOCK_TREE
+    assert flows["gclk"] == EdgeFlowType.CLOCK_TREE
+    assert flows["q0"] == EdgeFlowType.SEQ_LAUNCH
+
+
+def test_inferred_root_through_mmcm_and_bufg():
+    nodes, edges = build_nodes_and_edges(*_mmcm_design("sysin"))
+    result = ClockPropagator(nodes, edges).propagate()
+
+    assert result.clocks == ["sysin"]
+    assert set(result.domains.values()) == {"sysin"}
+
+
+def test_create_clock_on_non_clock_named_port(tmp_path):
+    p = _pipeline(tmp_path, "sysin", "create_clock -name sys_clk -period 10 [get_ports sysin]\n")
+
+    assert _ff_domains(p.nodes) == {"r0": "sys_clk", "r1": "sys_clk"}
+
+
+def test_create_clock_result_independent_of_port_name(tmp_path):
+    a = _pipeline(tmp_path, "sysin", "create_clock -name sys_clk -period 10 [get_ports sysin]\n")
+    b = _pipeline(tmp_path, "clk", "create_clock -name sys_clk -period 10 [get_ports clk]\n")
+
+    assert _ff_domains(a.nodes) == _ff_domains(b.nodes)
+
+
+def test_clock_does_not_flood_data_logic():
+    # clk_a를 데이터로 쓰는 g의 출력 x는 데이터 net. h가 만든 gclk는 별도 유도 클럭
+    wires = {i: Wire(i, name=n) for i, n in enumerate(["clk_a", "d", "x", "gclk", "q", "q3", "e"], 1)}
+    cells = [
+        CellIR(name="g", type="$and", module="top", port_dirs={"A": "input", "B": "input", "Y": "output"},
+               connections={"A": [1], "B": [2], "Y": [3]}),
+        CellIR(name="h", type="$and", module="top", port_dirs={"A": "input", "B": "input", "Y": "output"},
+               connections={"A": [3], "B": [7], "Y": [4]}),
+        CellIR(name="r1", type="$dff", module="top", port_dirs={"CLK": "input", "D": "input", "Q": "output"},
+               connections={"CLK": [1], "D": [3], "Q": [5]}),
+        CellIR(name="r3", type="$dff", module="top", port_dirs={"CLK": "input", "D": "input", "Q": "output"},
+               connections={"CLK": [4], "D": [5], "Q": [6]}),
+    ]
+    nodes, edges = build_nodes_and_edges(wires, cells)
+    result = ClockPropagator(nodes, edges).propagate()
+    domains = {nodes[k].local_name: v for k, v in result.domains.items()}
+
+    assert domains == {"r1": "clk_a", "r3": "gclk"}
+    assert all(nodes[k].local_name != "h" for k in result.masks)
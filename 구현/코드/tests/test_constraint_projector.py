@@ -0,0 +1,80 @@
+"""ConstraintProjector 이름 매칭: 리터럴은 정확히, 와일드카드만 확장"""
+from __future__ import annotations
+
+import dkg.pipeline  # noqa: F401  (dkg.builders ↔ dkg.pipeline 순환 import 초기화 순서)
+from dkg.builders.constraint_projector import ConstraintProjector, NameIndex
+from dkg.core.graph import DKGEdge, DKGNode, EdgeFlowType, EntityClass, RelationType
+from dkg.parsers.xdc_parser import XdcParser
+
+
+def _graph():
+    nodes = {}
+    for nid, name, cls in (
+        ("buf", "clk_IBUF_BUFG_inst", EntityClass.RTL_BLOCK),
+        ("r0", "data_reg[0]", EntityClass.FLIP_FLOP),
+        ("r1", "data_reg[1]", EntityClass.FLIP_FLOP),
+    ):
+        nodes[nid] = DKGNode(node_id=nid, entity_class=cls, hier_path="top", local_name=name,
+                             canonical_name=f"top/{name}")
+    nodes["buf"].attributes["clock_inputs"] = "clk_IBUF"
+    edges = {}
+    for eid, dst in (("k0", "r0"), ("k1", "r1")):
+        edges[eid] = DKGEdge(edge_id=eid, src_node="buf", dst_node=dst, relation_type=RelationType.DATA,
+                             flow_type=EdgeFlowType.CLOCK_TREE, signal_name="clk_IBUF_BUFG", canonical_name=eid)
+        nodes["buf"].out_edges.append(eid)
+        nodes[dst].in_edges.append(eid)
+    edges["d"] = DKGEdge(edge_id="d", src_node="r0", dst_node="r1", relation_type=RelationType.DATA,
+                         flow_type=EdgeFlowType.SEQ_LAUNCH, signal_name="q0", canonical_name="d")
+    nodes["r0"].out_edges.append("d")
+    nodes["r1"].in_edges.append("d")
+    return nodes, edges
+
+
+def _resolve(lines):
+    nodes, edges = _graph()
+    parser = XdcParser()
+    records = parser.parse_lines(lines, source="t.xdc")
+    return parser.resolve_constraints(records, nodes, edges, source="t.xdc")
+
+
+def test_literal_without_exact_hit_matches_nothing():
+    index = NameIndex([("clk_ibuf_bufg_inst", "buf"), ("data_reg[0]", "r0")])
+
+    assert index.lookup("clk") == []
+    assert index.lookup("data_reg") == []
+    assert index.lookup("data_reg[0]") == ["r0"]
+    assert index.lookup("data_reg*") == ["r0"]
+
+
+def test_create_clock_does_not_widen_to_buffer(capsys):
+    resolved = _resolve(["create_clock -name sys_clk -period 10 [get_ports clk]"])
+
+    assert resolved == [{"nodes": [], "edges": []}]
+    assert "'clk'" in capsys.readouterr().out
+
+
+def test_clock_on_port_net_is_not_reported(capsys):
+    _resolve(["create_clock -name sys_clk -period 10 [get_ports clk_IBUF]"])
+
+    assert "⚠️" not in capsys.readouterr().out
+
+
+def test_misspelled_false_path_target_warns_and_matches_nothing(capsys):
+    resolved = _resolve(["set_false_path -from [get_cells data_rg]"])
+
+    assert resolved[0]["edges"] == []
+    out = capsys.readouterr().out
+    assert "t.xdc:1" in out and "data_rg" in out
+
+
+def test_misspelled_property_target_is_not_widened(capsys):
+    resolved = _resolve(["set_property LOC SLICE_X0Y0 [get_cells data_reg]"])
+
+    assert resolved[0]["nodes"] == []
+    assert "data_reg" in capsys.readouterr().out
+
+
+def test_glob_still_expands():
+    resolved = _resolve(["set_property ASYNC_REG TRUE [get_cells data_reg*]"])
+
+    assert sorted(resolved[0]["nodes"]) == ["r0", "r1"]
@@ -0,0 +1,85 @@
+"""PathDelayEvaluator: set_max_delay/set_min_delay 최장·최단 경로 평가 테스트"""
+from __future__ import annotations
+
+import dkg.pipeline  # noqa: F401  (dkg.builders ↔ dkg.pipeline 순환 import 초기화 순서)
+from dkg.builders.graph_build import build_nodes_and_edges
+from dkg.builders.path_delay import PathDelayEvaluator
+from dkg.core.constraint_ir import DelayConstraint
+from dkg.core.ir import CellIR, Wire
+
+
+def _ff(name, clk, d, q):
+    return CellIR(name=name, type="$dff", module="top", port_dirs={"CLK": "input", "D": "input", "Q": "output"},
+                  connections={"CLK": [clk], "D": [d], "Q": [q]})
+
+
+def _gate(name, a, b, y):
+    return CellIR(name=name, type="$and", module="top", port_dirs={"A": "input", "B": "input", "Y": "output"},
+                  connections={"A": [a], "B": [b], "Y": [y]})
+
+
+# g1 → g2 → g3가 긴 경로, g1 → g3가 짧은 경로. 나머지 엣지는 0.25
+_DELAYS = {("g1", "g2"): 1.0, ("g1", "g3"): 0.5, ("g2", "g3"): 2.0}
+
+
+def _design(with_delays=True):
+    names = {1: "clk", 10: "qa", 11: "qb", 12: "n1", 13: "n2", 14: "n3", 15: "qc"}
+    wires = {k: Wire(k, name=v) for k, v in names.items()}
+    cells = [_ff("fa", 1, 15, 10), _ff("fb", 1, 15, 11), _gate("g1", 10, 11, 12), _gate("g2", 12, 10, 13),
+             _gate("g3", 13, 12, 14), _ff("fc", 1, 14, 15)]
+    nodes, edges = build_nodes_and_edges(wires, cells)
+    if with_delays:
+        for e in edges.values():
+            e.delay = _DELAYS.get((nodes[e.src_node].local_name, nodes[e.dst_node].local_name), 0.25)
+    return nodes, edges
+
+
+def _evaluate(records, with_delays=True):
+    nodes, edges = _design(with_delays)
+    checks = PathDelayEvaluator(nodes, edges).evaluate(records, ["a.xdc"] * len(records))
+    return checks, {k: n.local_name for k, n in nodes.items()}
+
+
+def test_max_delay_uses_longest_path():
+    (check,), names = _evaluate([DelayConstraint("max", 3.0, ["fa"], ["fc"])])
+
+    assert check.path_delay == 3.5 and check.margin == -0.5 and check.met is False
+    assert [names[n] for n in check.path_nodes] == ["fa", "g1", "g2", "g3", "fc"]
+    assert len(check.path_edges) == 4
+
+
+def test_min_delay_uses_shortest_path():
+    (check,), names = _evaluate([DelayConstraint("min", 1.0, ["fb"], ["fc"])])
+
+    assert check.path_delay == 1.0 and check.margin == 0.0 and check.met is True
+    assert [names[n] for n in check.path_nodes] == ["fb", "g1", "g3", "fc"]
+
+
+def test_through_restricts_evaluated_paths():
+    (check,), names = _evaluate([DelayConstraint("min", 0.1, None, ["fc"], [["g2"]])])
+
+    assert check.path_delay == 2.5
+    assert [names[n] for n in check.path_nodes] == ["fa", "g2", "g3", "fc"]
+
+
+def test_constraints_across_registers_do_not_form_cycle():
+    checks, names = _evaluate([
+        DelayConstraint("max", 3.0, ["fa"], ["fc"]),
+        DelayConstraint("max", 5.0, ["fc"], ["fa"]),
+    ])
+
+    assert [c.cyclic for c in checks] == [False, False]
+    assert checks[1].path_delay == 0.25 and checks[1].met is True
+
+
+def test_unmatched_constraint_has_no_verdict():
+    (check,), _ = _evaluate([DelayConstraint("max", 1.0, ["nope"], ["fc"])])
+
+    assert check.path_delay is None and check.met is None and check.path_nodes == []
+
+
+def test_missing_edge_delays_are_counted():
+    (check,), _ = _evaluate([DelayConstraint("max", 3.0, ["fa"], ["fc"])], with_delays=False)
+
+    assert check.path_delay == 0.0
+    assert check.missing_delays == len(check.path_edges) > 0
@@ -0,0 +1,70 @@
+"""ReachabilityIndex: -from/-through/-to cone 교집합 엣지 매칭 테스트"""
+from __future__ import annotations
+
+import dkg.pipeline  # noqa: F401  (dkg.builders ↔ dkg.pipeline 순환 import 초기화 순서)
+from dkg.builders.reachability import ReachabilityIndex
+from dkg.core.graph import DKGEdge, DKGNode, EdgeFlowType, EntityClass, RelationType
+
+FF = EntityClass.FLIP_FLOP
+LUT = EntityClass.LUT
+
+
+def _graph():
+    """
+    a ─→ g1 ─→ g2 ─→ b ─→ g4 ─→ c
+    └──→ g3 ──┘
+    ck ══(CLOCK_TREE)══→ a, b
+    """
+    nodes = {
+        nid: DKGNode(node_id=nid, entity_class=cls, hier_path="top", local_name=nid)
+        for nid, cls in (("a", FF), ("b", FF), ("c", FF), ("g1", LUT), ("g2", LUT), ("g3", LUT),
+                         ("g4", LUT), ("ck", LUT))
+    }
+    edges = {}
+    for src, dst, flow in (
+        ("a", "g1", EdgeFlowType.SEQ_LAUNCH),
+        ("a", "g3", EdgeFlowType.SEQ_LAUNCH),
+        ("g1", "g2", EdgeFlowType.COMBINATIONAL),
+        ("g3", "g2", EdgeFlowType.COMBINATIONAL),
+        ("g2", "b", EdgeFlowType.SEQ_CAPTURE),
+        ("b", "g4", EdgeFlowType.SEQ_LAUNCH),
+        ("g4", "c", EdgeFlowType.SEQ_CAPTURE),
+        ("ck", "a", EdgeFlowType.CLOCK_TREE),
+        ("ck", "b", EdgeFlowType.CLOCK_TREE),
+    ):
+        eid = f"{src}>{dst}"
+        edges[eid] = DKGEdge(edge_id=eid, src_node=src, dst_node=dst, relation_type=RelationType.DATA,
+                             flow_type=flow, signal_name=eid, canonical_name=eid)
+    return nodes, edges
+
+
+def _match(from_nodes, through_groups, to_nodes):
+    return set(ReachabilityIndex(*_graph()).match_path_edges(from_nodes, through_groups, to_nodes))
+
+
+def test_from_to_covers_all_parallel_paths():
+    assert _match(["a"], [], ["b"]) == {"a>g1", "a>g3", "g1>g2", "g3>g2", "g2>b"}
+
+
+def test_through_restricts_to_cone():
+    assert _match(["a"], [["g1"]], ["b"]) == {"a>g1", "g1>g2", "g2>b"}
+
+
+def test_through_groups_are_ordered():
+    assert _match(None, [["g1"], ["g2"]], None) >= {"a>g1", "g1>g2", "g2>b"}
+    assert "a>g3" not in _match(None, [["g1"], ["g2"]], None)
+    assert _match(None, [["g2"], ["g1"]], None) == set()
+
+
+def test_sequential_endpoint_stops_propagation():
+    # b는 경로 끝점이므로 a → c 경로는 없음
+    assert _match(["a"], [], ["c"]) == set()
+    assert _match(["b"], [], ["c"]) == {"b>g4", "g4>c"}
+
+
+def test_clock_tree_edges_are_not_data_paths():
+    assert _match(["ck"], [], None) == set()
+
+
+def test_unreachable_through_matches_nothing():
+    assert _match(["a"], [["g4"]], None) == set()
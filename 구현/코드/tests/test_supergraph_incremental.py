@@ -0,0 +1,154 @@
+"""ViewBuilder.apply_changes: GraphUpdater 변경 후 증분 SuperGraph == 새로 구축한 SuperGraph"""
+from __future__ import annotations
+
+import random
+
+import dkg.pipeline  # noqa: F401  (dkg.builders ↔ dkg.pipeline 순환 import 초기화 순서)
+from dkg.builders.graph_updater import GraphUpdater
+from dkg.builders.physical import PhysicalModel
+from dkg.builders.supergraph import GraphViewType, MultiViewBuilder, ViewBuilder
+from dkg.core.graph import DKGEdge, DKGNode, EdgeFlowType, EntityClass, RelationType
+from dkg.pipeline.stages import FieldSource, ParsingStage
+
+CLASSES = [EntityClass.LUT] * 4 + [EntityClass.FLIP_FLOP] * 2 + [
+    EntityClass.MUX, EntityClass.IO_PORT, EntityClass.MODULE_INSTANCE, EntityClass.BRAM, EntityClass.PBLOCK,
+]
+
+
+class _Design:
+    """seed 고정 랜덤 그래프 + GraphUpdater + 모든 뷰의 증분 빌더"""
+
+    def __init__(self, seed, size):
+        self.rng = random.Random(seed)
+        self.nodes = {}
+        self.edges = {}
+        self.next_node = 0
+        self.next_edge = 0
+        for _ in range(size):
+            n = self.make_node()
+            self.nodes[n.node_id] = n
+        for _ in range(size * 2):
+            e = self.make_edge(self.pick(), self.pick())
+            self.edges[e.edge_id] = e
+            self.nodes[e.src_node].out_edges.append(e.edge_id)
+            self.nodes[e.dst_node].in_edges.append(e.edge_id)
+
+        self.updater = GraphUpdater(self.nodes, self.edges)
+        self.multi = MultiViewBuilder(self.nodes, self.edges, physical=PhysicalModel(self.nodes, self.edges))
+        self.graphs = self.multi.build()
+        for builder in self.multi.builders.values():
+            builder.subscribe(self.updater)
+
+    def pick(self):
+        return self.rng.choice(list(self.nodes))
+
+    def make_node(self):
+        i = self.next_node
+        self.next_node += 1
+        hier = "top/" + self.rng.choice(["cpu", "mem", "sim_tb", "io", "alu/x"])
+        n = DKGNode(node_id=f"n{i}", entity_class=self.rng.choice(CLASSES), hier_path=hier,
+                    local_name=self.rng.choice(["a", "tb_b", "clk_gen0", "c"]) + str(i), canonical_name=f"{hier}.n{i}")
+        if self.rng.random() < 0.1:
+            n.attributes["pblock"] = self.rng.choice(["pb0", "pb1"])
+        return n
+
+    def make_edge(self, src, dst):
+        j = self.next_edge
+        self.next_edge += 1
+        return DKGEdge(edge_id=f"e{j}", src_node=src, dst_node=dst, signal_name="s", canonical_name="s",
+                       relation_type=self.rng.choice([RelationType.DATA, RelationType.CLOCK]),
+                       flow_type=EdgeFlowType.COMBINATIONAL)
+
+    def assert_matches_rebuild(self):
+        for key in self.multi.builders:
+            inc = self.graphs[key]
+            fresh = ViewBuilder(self.nodes, self.edges, key[0], context=key[1],
+                                physical=PhysicalModel(self.nodes, self.edges)).build()
+            assert inc.node_to_super == fresh.node_to_super, key
+            assert _node_summary(inc) == _node_summary(fresh), key
+            assert _edge_summary(inc) == _edge_summary(fresh), key
+
+
+def _node_summary(graph):
+    return {k: (v.member_nodes, v.member_edges, v.super_class, v.aggregated_attrs) for k, v in graph.super_nodes.items()}
+
+
+def _edge_summary(graph):
+    return {k: (v.edge_id, v.member_edges, v.member_nodes, v.relation_types, v.flow_types)
+            for k, v in graph.super_edges.items()}
+
+
+def test_add_remove_update_match_rebuild():
+    d = _Design(seed=1, size=40)
+    up = d.updater
+
+    n = d.make_node()
+    up.add_node(n)
+    up.add_edge(d.make_edge(n.node_id, "n0"))
+    up.add_edge(d.make_edge("n1", n.node_id))
+    d.assert_matches_rebuild()
+
+    up.remove_edge("e0")
+    up.remove_node("n2")
+    d.assert_matches_rebuild()
+
+    up.update_node_field("n3", "attributes", {"pblock": "pb1"}, FieldSource.DECLARED, ParsingStage.CONSTRAINTS)
+    up.update_node_field("n4", "local_name", "tb_q", FieldSource.DECLARED, ParsingStage.CONSTRAINTS)
+    up.batch_update_node_field("entity_class", {"n5": EntityClass.FLIP_FLOP, "n6": EntityClass.LUT},
+                               FieldSource.DECLARED, ParsingStage.CONSTRAINTS)
+    up.update_edge_field("e1", "relation_type", RelationType.RESET, FieldSource.DECLARED, ParsingStage.CONSTRAINTS)
+    d.assert_matches_rebuild()
+
+
+def test_random_edit_sequence_matches_rebuild():
+    d = _Design(seed=3, size=60)
+    up = d.updater
+    rng = d.rng
+    d.assert_matches_rebuild()
+
+    for _ in range(80):
+        op = rng.choice(["attr", "cls", "name", "addn", "rmn", "adde", "rme", "rel"])
+        if op == "attr":
+            x = d.pick()
+            attrs = dict(d.nodes[x].attributes)
+            if rng.random() < 0.5:
+                attrs["pblock"] = rng.choice(["pb0", "pb1", "pb2"])
+            else:
+                attrs.pop("pblock", None)
+            up.update_node_field(x, "attributes", attrs, FieldSource.DECLARED, ParsingStage.CONSTRAINTS)
+        elif op == "cls":
+            up.batch_update_node_field("entity_class", {x: rng.choice(CLASSES) for x in rng.sample(list(d.nodes), 5)},
+                                       FieldSource.DECLARED, ParsingStage.CONSTRAINTS)
+        elif op == "name":
+            up.update_node_field(d.pick(), "local_name", rng.choice(["tb_q", "clk_genz", "plain"]),
+                                 FieldSource.DECLARED, ParsingStage.CONSTRAINTS)
+        elif op == "addn":
+            n = d.make_node()
+            up.add_node(n)
+            up.add_edge(d.make_edge(n.node_id, d.pick()))
+        elif op == "rmn":
+            up.remove_node(d.pick())
+        elif op == "adde":
+            up.add_edge(d.make_edge(d.pick(), d.pick()))
+        elif op == "rme" and d.edges:
+            up.remove_edge(rng.choice(list(d.edges)))
+        elif op == "rel" and d.edges:
+            up.update_edge_field(rng.choice(list(d.edges)), "relation_type", RelationType.RESET,
+                                 FieldSource.DECLARED, ParsingStage.CONSTRAINTS)
+        d.assert_matches_rebuild()
+
+
+def test_refresh_regions_after_pblock_resize():
+    d = _Design(seed=5, size=40)
+    physical = d.multi.physical
+    physical.resize_pblock("pb9", ["SLICE_X0Y0:SLICE_X9Y9"])
+    for x in list(d.nodes)[:10]:
+        d.nodes[x].attributes["LOC"] = "SLICE_X1Y1"
+
+    for key, builder in d.multi.builders.items():
+        if key[0] != GraphViewType.Physical:
+            continue
+        delta = builder.refresh_regions()
+        fresh = ViewBuilder(d.nodes, d.edges, key[0], context=key[1], physical=physical).build()
+        assert not delta.is_empty()
+        assert d.graphs[key].node_to_super == fresh.node_to_super
@@ -0,0 +1,128 @@
+"""SuperEdgeMembers: SuperEdge 멤버 ID 구간, 해제, 압축 테스트"""
+from __future__ import annotations
+
+import dkg.pipeline  # noqa: F401  (dkg.builders ↔ dkg.pipeline 순환 import 초기화 순서)
+from dkg.builders.graph_updater import GraphUpdater
+from dkg.builders.supergraph import (
+    GraphContext,
+    GraphViewType,
+    SuperEdge,
+    SuperEdgeMembers,
+    ViewBuilder,
+    flow_mask,
+    relation_mask,
+)
+from dkg.core.graph import DKGEdge, DKGNode, EdgeFlowType, EntityClass, RelationType
+
+
+def _edge(eid, src, dst, relation=RelationType.DATA, flow=EdgeFlowType.COMBINATIONAL):
+    return DKGEdge(edge_id=eid, src_node=src, dst_node=dst, relation_type=relation, flow_type=flow,
+                   signal_name=eid, canonical_name=eid)
+
+
+def _super_edge(store, key, edge_ids):
+    start, count = store.append(edge_ids)
+    return SuperEdge(edge_id=key, src_node=key[0], dst_node=key[-1], members=store, start=start,
+                     edge_count=count, relation_mask=relation_mask([RelationType.DATA]),
+                     flow_mask=flow_mask([EdgeFlowType.COMBINATIONAL]))
+
+
+def test_append_returns_contiguous_ranges():
+    edges = {eid: _edge(eid, "a", "b") for eid in ("e0", "e1", "e2")}
+    store = SuperEdgeMembers(edges)
+
+    assert store.append(["e0", "e1"]) == (0, 2)
+    assert store.append(iter(["e2"])) == (2, 1)
+    assert store.live == 3
+
+
+def test_member_views_read_from_range():
+    edges = {
+        "e0": _edge("e0", "a", "b"),
+        "e1": _edge("e1", "a", "c", RelationType.CLOCK, EdgeFlowType.CLOCK_TREE),
+        "e2": _edge("e2", "x", "y"),
+    }
+    store = SuperEdgeMembers(edges)
+    _super_edge(store, "XY", ["e2"])
+    se = _super_edge(store, "AB", ["e0", "e1"])
+    se.relation_mask = relation_mask(e.relation_type for e in (edges["e0"], edges["e1"]))
+
+    assert se.member_edge_ids() == ["e0", "e1"]
+    assert se.member_nodes == {"a", "b", "c"}
+    assert se.relation_types == {RelationType.DATA, RelationType.CLOCK}
+
+    # 그래프에서 빠진 엣지는 조회에서 건너뜀
+    del edges["e1"]
+    assert [e.edge_id for e in se.iter_member_edges()] == ["e0"]
+    assert se.member_nodes == {"a", "b"}
+
+
+def test_release_and_compaction():
+    edges = {f"e{i}": _edge(f"e{i}", "a", "b") for i in range(2000)}
+    store = SuperEdgeMembers(edges)
+    dead = _super_edge(store, "D", [f"e{i}" for i in range(1500)])
+    live = _super_edge(store, "L", [f"e{i}" for i in range(1500, 1510)])
+
+    assert not store.needs_compaction()
+    store.release(dead)
+    assert store.live == 10 and store.needs_compaction()
+
+    new_store = store.compacted([live])
+
+    assert new_store.edge_ids == [f"e{i}" for i in range(1500, 1510)]
+    assert (live.members, live.start, live.edge_count) == (new_store, 0, 10)
+    assert new_store.live == 10 and not new_store.needs_compaction()
+    # 해체된 SuperEdge는 이전 배열을 계속 읽음
+    assert dead.members is store and len(dead.member_edge_ids()) == 1500
+
+
+def _chain(length):
+    """FF → LUT → FF → ... 체인 (FF 사이 조합 노드가 SuperNode로 묶이도록)"""
+    nodes = {}
+    edges = {}
+    for i in range(length):
+        cls = EntityClass.FLIP_FLOP if i % 2 == 0 else EntityClass.LUT
+        nodes[f"n{i}"] = DKGNode(node_id=f"n{i}", entity_class=cls, hier_path="top", local_name=f"n{i}")
+    for i in range(length - 1):
+        for k in range(2):
+            e = _edge(f"e{i}_{k}", f"n{i}", f"n{i + 1}")
+            edges[e.edge_id] = e
+            nodes[e.src_node].out_edges.append(e.edge_id)
+            nodes[e.dst_node].in_edges.append(e.edge_id)
+    return nodes, edges
+
+
+def _assert_store_consistent(builder):
+    store = builder.edge_members
+    super_edges = list(builder.super_edges.values())
+    assert all(se.members is store for se in super_edges)
+    assert store.live == sum(se.edge_count for se in super_edges)
+    spans = sorted((se.start, se.start + se.edge_count) for se in super_edges)
+    assert all(a_end <= b_start for (_, a_end), (b_start, _) in zip(spans, spans[1:]))
+
+
+def test_build_shares_one_store_per_view():
+    nodes, edges = _chain(8)
+    builder = ViewBuilder(nodes, edges, GraphViewType.Connectivity, context=GraphContext.DESIGN)
+    graph = builder.build()
+
+    _assert_store_consistent(builder)
+    member_ids = [eid for se in graph.super_edges.values() for eid in se.member_edge_ids()]
+    internal = [eid for sn in graph.super_nodes.values() for eid in sn.member_edges]
+    assert sorted(member_ids + internal) == sorted(edges)
+
+
+def test_incremental_rewrites_keep_live_count():
+    nodes, edges = _chain(8)
+    updater = GraphUpdater(nodes, edges)
+    builder = ViewBuilder(nodes, edges, GraphViewType.Connectivity, context=GraphContext.DESIGN)
+    builder.build()
+    builder.subscribe(updater)
+
+    updater.add_edge(_edge("x0", "n0", "n1"))
+    updater.remove_edge("e2_0")
+    updater.remove_node("n5")
+    updater.add_edge(_edge("x1", "n6", "n7", RelationType.RESET))
+
+    _assert_store_consistent(builder)
+    assert len(builder.edge_members.edge_ids) > builder.edge_members.live
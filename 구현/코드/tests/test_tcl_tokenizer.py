@@ -0,0 +1,64 @@
+"""TclTokenizer: 중괄호/대괄호 중첩, 여러 줄 명령, 괄호 오류 복구 테스트"""
+from __future__ import annotations
+
+import dkg.pipeline  # noqa: F401  (dkg.builders ↔ dkg.pipeline 순환 import 초기화 순서)
+from dkg.parsers.tcl_tokenizer import TclQuery, TclTokenizer, split_tcl_list
+
+
+def _commands(script):
+    tok = TclTokenizer()
+    return list(tok.iter_script(script)), tok.errors
+
+
+def test_nested_queries_with_braced_bus_index():
+    (cmd,), errors = _commands(
+        "set_false_path -from [get_pins -hier {a/b[0]/C c/*}] -through [get_nets [get_nets {n1 n2}]] "
+        '-to [get_cells "x y"]'
+    )
+
+    assert errors == []
+    src = cmd.option("-from")
+    assert isinstance(src, TclQuery) and src.command == "get_pins"
+    assert src.patterns == ["a/b[0]/C", "c/*"] and src.options == {"-hier": [True]}
+    assert cmd.option_target_groups("-through") == [["n1", "n2"]]
+    assert cmd.option_targets("-to") == ["x", "y"]
+
+
+def test_multiline_brace_and_continuation():
+    (cmd, clock), errors = _commands(
+        "set_property -dict { PACKAGE_PIN W5\n"
+        "   IOSTANDARD LVCMOS33 } [get_ports {sw[0]}]\n"
+        "create_clock -period 10 \\\n"
+        "   [get_ports clk]\n"
+    )
+
+    assert errors == []
+    assert (cmd.line, clock.line) == (1, 3)
+    assert split_tcl_list(cmd.option("-dict")) == ["PACKAGE_PIN", "W5", "IOSTANDARD", "LVCMOS33"]
+    assert cmd.positional_targets() == ["sw[0]"]
+    assert clock.positional_targets() == ["clk"]
+
+
+def test_variables_and_foreach_body():
+    cmds, errors = _commands(
+        "set ck clk_a; create_clock -period 5 [get_ports $ck]\n"
+        "foreach p {u v} { set_property LOC X [get_ports ${p}] }\n"
+    )
+
+    assert errors == []
+    assert [c.name for c in cmds] == ["set", "create_clock", "set_property", "set_property"]
+    assert cmds[1].positional_targets() == ["clk_a"]
+    assert [c.positional_targets() for c in cmds[2:]] == [["u"], ["v"]]
+
+
+def test_unbalanced_command_is_skipped_and_parsing_resumes():
+    cmds, errors = _commands(
+        "create_clock -period 10 [get_ports clk]\n"
+        "set_max_delay 3 -from [get_cells {a_reg] -to [get_cells b]\n"
+        "set_property LOC W5 [get_ports x]\n"
+        "set_output_delay 3 [get_ports [dout]\n"
+        "create_clock -period 5 [get_ports clk2]\n"
+    )
+
+    assert [(c.line, c.name) for c in cmds] == [(1, "create_clock"), (3, "set_property"), (5, "create_clock")]
+    assert [line for line, _ in errors] == [2, 4]
@@ -0,0 +1,79 @@
+"""TimingCornerStore: 분석별 worst 방향과 GraphUpdater 반영 테스트"""
+from __future__ import annotations
+
+import dkg.pipeline  # noqa: F401  (dkg.builders ↔ dkg.pipeline 순환 import 초기화 순서)
+from dkg.builders.graph_updater import GraphUpdater, ChangeKind
+from dkg.builders.timing_corners import HOLD, SETUP, TimingCornerStore
+from dkg.core.graph import DKGEdge, DKGNode, EdgeFlowType, EntityClass, RelationType
+from dkg.pipeline.stages import FieldSource, ParsingStage
+
+
+def _graph():
+    nodes = {
+        nid: DKGNode(node_id=nid, entity_class=EntityClass.FLIP_FLOP, hier_path="top", local_name=nid)
+        for nid in ("a", "b")
+    }
+    edges = {
+        "e": DKGEdge(edge_id="e", src_node="a", dst_node="b", relation_type=RelationType.DATA,
+                     flow_type=EdgeFlowType.SEQ_LAUNCH, signal_name="q", canonical_name="a->b"),
+    }
+    return nodes, edges
+
+
+def _store(nodes, edges):
+    store = TimingCornerStore(nodes, edges)
+    for corner, setup_delay, hold_delay in (("ss", 0.40, 0.10), ("ff", 0.20, 0.05)):
+        store.record_edge("e", corner, SETUP, "delay", setup_delay)
+        store.record_edge("e", corner, HOLD, "delay", hold_delay)
+        store.record_edge("e", corner, HOLD, "arrival_time", hold_delay + 1.0)
+        store.record_node("a", corner, SETUP, "slack", setup_delay - 0.5)
+        store.record_node("a", corner, HOLD, "slack", hold_delay - 0.08)
+        store.record_node("a", corner, HOLD, "required_time", hold_delay * 10)
+    return store
+
+
+def test_worst_direction_depends_on_analysis():
+    nodes, edges = _graph()
+    store = _store(nodes, edges)
+
+    assert list(store.worst_edge_column("delay", analysis=SETUP)) == [0.40]
+    assert list(store.worst_edge_column("delay", analysis=HOLD)) == [0.05]
+    assert list(store.worst_edge_column("arrival_time", analysis=HOLD)) == [1.05]
+    assert store.worst_node_column("required_time", analysis=HOLD)[0] == 1.0
+
+
+def test_apply_worst_keeps_setup_and_hold_apart():
+    nodes, edges = _graph()
+    updater = GraphUpdater(nodes, edges)
+    _store(nodes, edges).apply_worst(updater)
+
+    assert edges["e"].delay == 0.40 and edges["e"].hold_delay == 0.05
+    assert nodes["a"].slack == -0.30 and round(nodes["a"].hold_slack, 6) == -0.03
+    assert nodes["b"].slack is None and nodes["b"].hold_slack is None
+
+
+def test_apply_worst_merged_view_on_request():
+    nodes, edges = _graph()
+    updater = GraphUpdater(nodes, edges)
+    _store(nodes, edges).apply_worst(updater, merge_analyses=True)
+
+    assert edges["e"].delay == 0.40
+    assert edges["e"].hold_delay is None
+
+
+def test_apply_worst_goes_through_updater():
+    nodes, edges = _graph()
+    updater = GraphUpdater(nodes, edges)
+    updater.update_edge_field("e", "delay", 9.9, FieldSource.USER_OVERRIDE, ParsingStage.TIMING)
+    changes = []
+    updater.subscribe(changes.append)
+
+    _store(nodes, edges).apply_worst(updater, origin_file="ss.rpt")
+
+    # 더 높은 우선순위 값은 유지, 나머지는 ANALYZED 메타데이터와 함께 기록
+    assert edges["e"].delay == 9.9
+    meta = updater.edge_metadata["e"].fields["hold_delay"]
+    assert meta.source == FieldSource.ANALYZED and meta.origin_file == "ss.rpt"
+    assert updater.node_metadata["a"].get_source("slack") == FieldSource.ANALYZED
+    assert (ChangeKind.EDGE_FIELD, "hold_delay") in {(c.kind, c.field_name) for c in changes}
+    assert (ChangeKind.EDGE_FIELD, "delay") not in {(c.kind, c.field_name) for c in changes}
@@ -0,0 +1,52 @@
+"""TimingReportParser.apply_to_graph: 스트리밍 반영 시 메타데이터 bounded memory 테스트"""
+from __future__ import annotations
+
+import dkg.pipeline  # noqa: F401  (dkg.builders ↔ dkg.pipeline 순환 import 초기화 순서)
+from dkg.builders.graph_updater import GraphUpdater
+from dkg.core.graph import DKGEdge, DKGNode, EdgeFlowType, EntityClass, RelationType
+from dkg.parsers.timing_report_parser import TimingPath, TimingReportParser, TimingStage
+
+
+def _graph():
+    nodes = {
+        "a": DKGNode(node_id="a", entity_class=EntityClass.FLIP_FLOP, hier_path="top", local_name="a_reg"),
+        "b": DKGNode(node_id="b", entity_class=EntityClass.FLIP_FLOP, hier_path="top", local_name="b_reg"),
+    }
+    edges = {
+        "e": DKGEdge(edge_id="e", src_node="a", dst_node="b", relation_type=RelationType.DATA,
+                     flow_type=EdgeFlowType.SEQ_LAUNCH, signal_name="a_q", canonical_name="a_q"),
+    }
+    nodes["a"].out_edges.append("e")
+    nodes["b"].in_edges.append("e")
+    return nodes, edges
+
+
+def _paths(count):
+    for i in range(count):
+        # slack/delay가 경로마다 달라지도록 (i * 7) % count로 섞음
+        v = ((i * 7) % count) / 100.0
+        stages = [
+            TimingStage("a_reg/Q", 0.1, 0.1, "r"),
+            TimingStage("b_reg/D", v, 0.1 + v, "r"),
+        ]
+        yield TimingPath("a_reg/C", "b_reg/D", "clk", "max", 1.0 - v, 1.0, 2.0, stages)
+
+
+def test_streaming_apply_keeps_bounded_path_metadata():
+    nodes, edges = _graph()
+    updater = GraphUpdater(nodes, edges)
+    parser = TimingReportParser(top_k=5)
+
+    parser.apply_to_graph(nodes, edges, updater, paths=_paths(1000))
+
+    node_meta = updater.node_metadata["a"]
+    slacks = [entry["slack"] for entry in node_meta.get("timing_slacks")]
+    assert len(slacks) == 5
+    assert slacks == sorted(slacks) and slacks[0] == nodes["a"].slack
+    assert node_meta.get("timing_slack_count") == 1000
+
+    edge_meta = updater.edge_metadata["e"]
+    delays = [entry["delay"] for entry in edge_meta.get("timing_delays")]
+    assert delays == sorted(delays, reverse=True) and len(delays) == 5
+    assert delays[0] == edges["e"].delay
+    assert edge_meta.get("timing_delay_count") == 1000
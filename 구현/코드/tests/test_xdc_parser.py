@@ -0,0 +1,66 @@
+"""XdcParser set_property 핀 배치 테스트"""
+from __future__ import annotations
+
+import dkg.pipeline  # noqa: F401  (dkg.builders ↔ dkg.pipeline 순환 import 초기화 순서)
+from dkg.core.constraint_ir import PblockRangeConstraint, PropertyConstraint
+from dkg.parsers.tcl_tokenizer import TclTokenizer
+from dkg.parsers.xdc_parser import XdcParser
+
+
+def _properties(lines):
+    records = XdcParser().parse_lines(lines)
+    return [r for r in records if isinstance(r, PropertyConstraint)]
+
+
+def test_package_pin_standard_form():
+    records = _properties(["set_property PACKAGE_PIN W5 [get_ports clk]"])
+
+    assert len(records) == 1
+    assert records[0].properties == {"PACKAGE_PIN": "W5"}
+    assert records[0].targets == ["clk"]
+    assert records[0].origin_line == 1
+
+
+def test_package_pin_dict_form():
+    records = _properties([
+        "set_property -dict {PACKAGE_PIN V17 IOSTANDARD LVCMOS33} [get_ports {sw[0]}]",
+    ])
+
+    assert len(records) == 1
+    assert records[0].properties == {"PACKAGE_PIN": "V17", "IOSTANDARD": "LVCMOS33"}
+    assert records[0].targets == ["sw[0]"]
+
+
+def test_unknown_property_ignored():
+    assert _properties(["set_property DRIVE 12 [get_ports led]"]) == []
+
+
+def test_resize_pblock_add_takes_value():
+    records = XdcParser().parse_lines(["resize_pblock [get_pblocks pb] -add SLICE_X0Y0:SLICE_X9Y9"])
+
+    assert records == [PblockRangeConstraint(pblock_name="pb", add_ranges=["SLICE_X0Y0:SLICE_X9Y9"], origin_line=1)]
+
+
+def test_resize_pblock_replace_add_remove_lists():
+    records = XdcParser().parse_lines([
+        "resize_pblock -replace [get_pblocks pb] -add {SLICE_X0Y0:SLICE_X1Y1 RAMB36_X0Y0:RAMB36_X0Y1} "
+        "-remove SLICE_X1Y1:SLICE_X1Y1",
+    ])
+
+    assert len(records) == 1
+    assert records[0].pblock_name == "pb"
+    assert records[0].add_ranges == ["SLICE_X0Y0:SLICE_X1Y1", "RAMB36_X0Y0:RAMB36_X0Y1"]
+    assert records[0].remove_ranges == ["SLICE_X1Y1:SLICE_X1Y1"]
+    assert records[0].replace
+
+
+def test_option_arity_is_command_specific():
+    resize, clock = TclTokenizer().iter_commands([
+        "resize_pblock pb -add SLICE_X0Y0:SLICE_X1Y1\n",
+        "create_clock -add -name c2 -period 5 [get_ports clk]\n",
+    ])
+
+    assert resize.options["-add"] == ["SLICE_X0Y0:SLICE_X1Y1"]
+    assert resize.positionals == ["pb"]
+    assert clock.options["-add"] == [True]
+    assert clock.option("-name") == "c2"
@@ -13,7 +13,8 @@ from dkg.pipeline import DKGPipeline
 from dkg.utils.config import YosysConfig
 from dkg.query_api import create_query
 from dkg.core.graph import EntityClass, RelationType, EdgeFlowType
-from dkg.builders.supergraph import GraphViewType
+from dkg.builders.supergraph import GraphContext, GraphViewType
+from dkg.builders.zoom import ZoomMode
 
 app = Flask(__name__, static_folder='web', static_url_path='')
 CORS(app)
@@ -23,10 +24,14 @@ query_api = None
 nodes = None
 edges = None
 supergraph = None
+# (view, context) → SuperGraph (시작 시 전부 구축, 뷰 전환은 조회만)
+supergraphs = {}
+# 줌 피라미드 조회용 (mode별로 pipeline이 캐싱)
+pipeline = None
 
 def initialize_graph(config: YosysConfig):
     """그래프 초기화"""
-    global query_api, nodes, edges, supergraph
+    global query_api, nodes, edges, supergraph, supergraphs, pipeline
     
     pipeline = DKGPipeline(config)
     pipeline.run_rtl_stage()
@@ -34,12 +39,15 @@ def initialize_graph(config: YosysConfig):
     # 제약 조건 추가 (파일이 있는 경우)
     # pipeline.add_constraints("path/to/constraints.sdc")
     
-    # SuperGraph 구축
+    # 모든 뷰/컨텍스트 SuperGraph 구축 (기본 표시: Connectivity)
+    pipeline.build_supergraphs()
     pipeline.build_supergraph(view=GraphViewType.Connectivity)
     
     nodes, edges = pipeline.get_graph()
     supergraph = pipeline.supergraph
-    query_api = create_query(nodes, edges, supergraph)
+    supergraphs = pipeline.supergraphs
+    query_api = create_query(nodes, edges, supergraph, pipeline.coverage)
+    pipeline.get_zoom_pyramid()
     
     print(f"✅ Graph initialized: {len(nodes)} nodes, {len(edges)} edges")
 
@@ -616,14 +624,180 @@ def get_critical_path():
         'total_slack': worst_path.total_slack
     })
 
+@app.route('/api/cdc')
+def get_cdc():
+    """클럭 도메인 교차 행렬과 동기화기 없는 교차점"""
+    if query_api is None:
+        return jsonify({'error': 'Graph not initialized'}), 500
+    
+    limit = request.args.get('limit', 100, type=int)
+    report = query_api.get_cdc_report()
+    
+    result = report.to_dict()
+    result['unsynchronized_crossings'] = [
+        c.to_dict() for c in report.unsynchronized_crossings()[:limit]
+    ]
+    return jsonify(result)
+
+@app.route('/api/cdc/path')
+def get_cdc_path():
+    """launch 도메인에서 capture 노드까지의 교차 경로"""
+    if query_api is None:
+        return jsonify({'error': 'Graph not initialized'}), 500
+    
+    node_id = request.args.get('node_id')
+    launch = request.args.get('launch')
+    
+    if not node_id or not launch:
+        return jsonify({'error': 'node_id and launch required'}), 400
+    
+    path = query_api.find_cdc_path(node_id, launch)
+    if path is None:
+        return jsonify({'error': 'No crossing path found'}), 404
+    
+    return jsonify({
+        'nodes': path.nodes,
+        'edges': path.edges,
+        'total_delay': path.total_delay,
+        'total_slack': path.total_slack
+    })
+
+@app.route('/api/coverage')
+def get_coverage():
+    """제약 종류별 커버리지 (요약, 계층별, 클럭 도메인별)"""
+    if query_api is None:
+        return jsonify({'error': 'Graph not initialized'}), 500
+    
+    depth = request.args.get('depth', 1, type=int)
+    return jsonify(query_api.get_coverage_report(depth=depth))
+
+@app.route('/api/coverage/unconstrained')
+def get_unconstrained():
+    """kind 제약이 없는 엔티티 목록"""
+    if query_api is None:
+        return jsonify({'error': 'Graph not initialized'}), 500
+    
+    kind = request.args.get('kind')
+    hierarchy = request.args.get('hierarchy')
+    domain = request.args.get('domain')
+    limit = request.args.get('limit', 100, type=int)
+    
+    if not kind:
+        return jsonify({'error': 'kind required'}), 400
+    try:
+        node_ids = query_api.find_unconstrained(kind, hierarchy, domain)
+    except ValueError:
+        return jsonify({'error': f'Unknown coverage kind: {kind}'}), 400
+    
+    return jsonify({
+        'kind': kind,
+        'count': len(node_ids),
+        'nodes': [node_to_dict(nid) for nid in node_ids[:limit]]
+    })
+
 @app.route('/api/views')
 def get_available_views():
     """사용 가능한 뷰 목록"""
     return jsonify({
         'views': ['Structural', 'Connectivity', 'Physical'],
-        'contexts': ['Design', 'Simulation']
+        'contexts': ['Design', 'Simulation'],
+        'built': [
+            {'view': view.value, 'context': context.value}
+            for view, context in supergraphs
+        ]
+    })
+
+@app.route('/api/views/<view>', methods=['POST'])
+def select_view(view):
+    """표시할 SuperGraph 전환 (미리 구축한 뷰 조회)"""
+    global supergraph
+    if query_api is None:
+        return jsonify({'error': 'Graph not initialized'}), 500
+    
+    context_name = request.args.get('context', GraphContext.DESIGN.value).lower()
+    try:
+        key = (GraphViewType(view), GraphContext(context_name))
+    except ValueError:
+        return jsonify({'error': f'Unknown view/context: {view}/{context_name}'}), 400
+    
+    if key not in supergraphs:
+        return jsonify({'error': 'View not built'}), 404
+    
+    supergraph = supergraphs[key]
+    query_api.supergraph = supergraph
+    return jsonify({
+        'view': view,
+        'context': context_name,
+        'super_nodes': len(supergraph.super_nodes),
+        'super_edges': len(supergraph.super_edges)
     })
 
+def _get_zoom_pyramid():
+    """요청의 mode(기본 hierarchy)에 맞는 줌 피라미드"""
+    mode = request.args.get('mode', ZoomMode.HIERARCHY.value)
+    return pipeline.get_zoom_pyramid(ZoomMode(mode))
+
+@app.route('/api/zoom')
+def get_zoom_levels():
+    """줌 피라미드 레벨 요약 (레벨별 원소 / 엣지 수)"""
+    if pipeline is None:
+        return jsonify({'error': 'Graph not initialized'}), 500
+    try:
+        pyramid = _get_zoom_pyramid()
+    except ValueError:
+        return jsonify({'error': 'Unknown zoom mode'}), 400
+    
+    return jsonify({
+        'mode': pyramid.mode.value,
+        'top_level': pyramid.top_level,
+        'levels': pyramid.summary()
+    })
+
+@app.route('/api/zoom/level/<int:level>')
+def get_zoom_level(level):
+    """줌 레벨 하나의 원소와 집계 엣지"""
+    if pipeline is None:
+        return jsonify({'error': 'Graph not initialized'}), 500
+    try:
+        pyramid = _get_zoom_pyramid()
+    except ValueError:
+        return jsonify({'error': 'Unknown zoom mode'}), 400
+    
+    if not 0 <= level <= pyramid.top_level:
+        return jsonify({'error': 'Level out of range'}), 404
+    return jsonify(pyramid.get_level(level))
+
+@app.route('/api/zoom/expand')
+def expand_zoom_element():
+    """원소 하나의 자식(상위 top_k개)과 그 사이 엣지"""
+    if pipeline is None:
+        return jsonify({'error': 'Graph not initialized'}), 500
+    try:
+        pyramid = _get_zoom_pyramid()
+    except ValueError:
+        return jsonify({'error': 'Unknown zoom mode'}), 400
+    
+    element_id = request.args.get('id')
+    top_k = request.args.get('top_k', type=int)
+    if not element_id:
+        return jsonify({'error': 'id required'}), 400
+    if pyramid.level_of(element_id) is None:
+        return jsonify({'error': 'Element not found'}), 404
+    return jsonify(pyramid.expand(element_id, top_k))
+
+@app.route('/api/zoom/subgraph', methods=['POST'])
+def get_zoom_subgraph():
+    """여러 레벨 원소가 섞인 펼침 상태의 엣지 ({"elements": [...]})"""
+    if pipeline is None:
+        return jsonify({'error': 'Graph not initialized'}), 500
+    try:
+        pyramid = _get_zoom_pyramid()
+    except ValueError:
+        return jsonify({'error': 'Unknown zoom mode'}), 400
+    
+    data = request.get_json(silent=True) or {}
+    return jsonify(pyramid.subgraph(data.get('elements', [])))
+
 @app.route('/api/paths')
 def get_paths():
     """두 노드 사이의 경로 찾기"""